@@ -2,14 +2,17 @@ from __future__ import annotations
 
 import json
 import os
+import shutil
 import sqlite3
 import tempfile
 from collections import defaultdict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
 
-from .models import CanonicalUnit
+from pydantic import ValidationError
+
+from .models import CanonicalUnit, Citation, SourceDocument, UnitRelationship
 from .store import RepositoryStore
 
 
@@ -27,7 +30,50 @@ def _write_json(path: Path, payload: Any) -> None:
     path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
 
 
+BUILD_STATE_FILE = "build_state.json"
+BUILD_STATE_VERSION = 1
+
+
+def _file_order(record_id: str) -> str:
+    # The store lists records in file name order; indexes keep that order.
+    return f"{record_id}.json"
+
+
+def _changed(before: Dict[str, Any], after: Dict[str, Any]) -> Set[str]:
+    return {key for key in before.keys() | after.keys() if before.get(key) != after.get(key)}
+
+
+class _Lookup:
+    """`dict.get` over store records, each read on first use."""
+
+    def __init__(self, load: Callable[[str], Any]):
+        self._load = load
+        self._loaded: Dict[str, Any] = {}
+
+    def get(self, record_id: str) -> Any:
+        if record_id not in self._loaded:
+            try:
+                self._loaded[record_id] = self._load(record_id)
+            except ValidationError:
+                raise
+            except (FileNotFoundError, ValueError):
+                # Missing, or an id no record can have.
+                self._loaded[record_id] = None
+        return self._loaded[record_id]
+
+
 class RepositoryCompiler:
+    """Validate the authoring store and publish it as an immutable build.
+
+    Every build directory carries `build_state.json`: the content hash of each
+    unit, source and citation and of `relationships.json`, what each unit
+    references, and the published unit summaries. `build(incremental=True)`
+    diffs the store against the active build's state, re-validates only the
+    records that changed and the units and citations that depend on them,
+    and patches a copy of the active build's SQLite instead of recompiling
+    the corpus. It falls back to a full build when there is no usable state.
+    """
+
     def __init__(self, store: RepositoryStore):
         self.store = store
 
@@ -45,40 +91,61 @@ class RepositoryCompiler:
             item.claim_id: item for item in self.store.list_knowledge_records("claims")
         }
         for unit in units:
-            if unit.unit_type == "passage" and not unit.primary_bible_refs:
-                findings.append(f"{unit.unit_id}: passage unit has no primary Bible reference")
-            if unit.status == "published" and not unit.citation_ids and not unit.review.source_exception_reason:
-                findings.append(f"{unit.unit_id}: published unit has no approved citation")
-            if unit.status == "published" and unit.knowledge_managed and not unit.knowledge_dependency_ids:
-                findings.append(f"{unit.unit_id}: knowledge-managed published unit has no claim dependency snapshot")
-            for dependency_id in unit.knowledge_dependency_ids:
-                dependency = dependencies.get(dependency_id)
-                if dependency is None:
-                    findings.append(f"{unit.unit_id}: missing knowledge dependency {dependency_id}")
-                    continue
-                claim = claims.get(dependency.claim_id)
-                if dependency.status != "current":
-                    findings.append(f"{unit.unit_id}: dependency {dependency_id} is invalidated")
-                elif claim is None or claim.revision != dependency.pinned_claim_revision:
-                    findings.append(f"{unit.unit_id}: dependency {dependency_id} no longer matches its claim revision")
-            for citation_id in unit.citation_ids:
-                citation = citations.get(citation_id)
-                if citation is None:
-                    findings.append(f"{unit.unit_id}: missing citation {citation_id}")
-                elif unit.status == "published" and citation.status != "approved":
-                    findings.append(f"{unit.unit_id}: citation {citation_id} is not approved")
+            findings.extend(self._unit_findings(unit, citations, dependencies, claims))
         for citation in citations.values():
-            source = sources.get(citation.source_id)
-            if source is None:
-                findings.append(f"{citation.citation_id}: missing source {citation.source_id}")
-            elif citation.status == "approved" and citation.source_sha256 != source.source_sha256:
-                findings.append(f"{citation.citation_id}: source hash is stale")
-        for relationship in self.store.list_relationships():
-            if relationship.from_unit_id not in unit_ids or relationship.to_unit_id not in unit_ids:
-                findings.append(f"{relationship.relationship_id}: relationship points to a missing unit")
+            findings.extend(self._citation_findings(citation, sources))
+        findings.extend(self._relationship_findings(self.store.list_relationships(), unit_ids))
+        return findings
+
+    @staticmethod
+    def _unit_findings(unit: CanonicalUnit, citations: Any, dependencies: Any, claims: Any) -> List[str]:
+        findings: List[str] = []
+        if unit.unit_type == "passage" and not unit.primary_bible_refs:
+            findings.append(f"{unit.unit_id}: passage unit has no primary Bible reference")
+        if unit.status == "published" and not unit.citation_ids and not unit.review.source_exception_reason:
+            findings.append(f"{unit.unit_id}: published unit has no approved citation")
+        if unit.status == "published" and unit.knowledge_managed and not unit.knowledge_dependency_ids:
+            findings.append(f"{unit.unit_id}: knowledge-managed published unit has no claim dependency snapshot")
+        for dependency_id in unit.knowledge_dependency_ids:
+            dependency = dependencies.get(dependency_id)
+            if dependency is None:
+                findings.append(f"{unit.unit_id}: missing knowledge dependency {dependency_id}")
+                continue
+            claim = claims.get(dependency.claim_id)
+            if dependency.status != "current":
+                findings.append(f"{unit.unit_id}: dependency {dependency_id} is invalidated")
+            elif claim is None or claim.revision != dependency.pinned_claim_revision:
+                findings.append(f"{unit.unit_id}: dependency {dependency_id} no longer matches its claim revision")
+        for citation_id in unit.citation_ids:
+            citation = citations.get(citation_id)
+            if citation is None:
+                findings.append(f"{unit.unit_id}: missing citation {citation_id}")
+            elif unit.status == "published" and citation.status != "approved":
+                findings.append(f"{unit.unit_id}: citation {citation_id} is not approved")
         return findings
 
-    def build(self) -> Dict[str, Any]:
+    @staticmethod
+    def _citation_findings(citation: Citation, sources: Any) -> List[str]:
+        source = sources.get(citation.source_id)
+        if source is None:
+            return [f"{citation.citation_id}: missing source {citation.source_id}"]
+        if citation.status == "approved" and citation.source_sha256 != source.source_sha256:
+            return [f"{citation.citation_id}: source hash is stale"]
+        return []
+
+    @staticmethod
+    def _relationship_findings(relationships: Iterable[UnitRelationship], unit_ids: Set[str]) -> List[str]:
+        return [
+            f"{relationship.relationship_id}: relationship points to a missing unit"
+            for relationship in relationships
+            if relationship.from_unit_id not in unit_ids or relationship.to_unit_id not in unit_ids
+        ]
+
+    def build(self, *, incremental: bool = False) -> Dict[str, Any]:
+        if incremental:
+            active = self._active_state()
+            if active is not None:
+                return self._build_incremental(*active)
         findings = self.validate()
         if findings:
             raise RepositoryValidationError(findings)
@@ -86,49 +153,245 @@ class RepositoryCompiler:
         build_id = f"BUILD-{_utc_compact()}"
         build_dir = self.store.builds_dir / build_id
         build_dir.mkdir(parents=True, exist_ok=False)
-        units = [item for item in self.store.list_units() if item.status == "published"]
+        # Hashes are taken before the records are read: a file edited in
+        # between is then seen as changed by the next incremental build.
+        hashes = {
+            "units": self.store.content_hashes(self.store.units_dir),
+            "sources": self.store.content_hashes(self.store.sources_dir),
+            "citations": self.store.content_hashes(self.store.citations_dir),
+            "relationships_sha256": self.store.content_hash(self.store.relationships_dir / "relationships.json"),
+        }
+        all_units = list(self.store.list_units())
+        units = [item for item in all_units if item.status == "published"]
         sources = list(self.store.list_sources())
         citations = list(self.store.list_citations())
         relationships = [item for item in self.store.list_relationships() if item.status == "approved"]
 
+        self._write_sqlite(build_dir / "repository.sqlite3", units, sources, citations, relationships)
+        state = {
+            "schema_version": BUILD_STATE_VERSION,
+            **hashes,
+            "relationship_count": len(relationships),
+            "unit_refs": {item.unit_id: self._unit_refs(item) for item in all_units},
+            "citation_sources": {item.citation_id: item.source_id for item in citations},
+            "dependencies": self._dependency_state(
+                {dependency_id for item in all_units for dependency_id in item.knowledge_dependency_ids}
+            ),
+            "published": {item.unit_id: self._unit_summary(item) for item in units},
+        }
+        return self._publish(build_id, build_dir, state)
+
+    def _active_state(self) -> Optional[tuple[str, Dict[str, Any]]]:
+        active = self.store.get_active_build()
+        if not active:
+            return None
+        build_dir = self.store.builds_dir / active["build_id"]
+        if not (build_dir / "repository.sqlite3").is_file():
+            return None
+        try:
+            state = json.loads((build_dir / BUILD_STATE_FILE).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(state, dict) or state.get("schema_version") != BUILD_STATE_VERSION:
+            return None
+        return active["build_id"], state
+
+    def _build_incremental(self, previous_build_id: str, previous: Dict[str, Any]) -> Dict[str, Any]:
+        store = self.store
+        unit_hashes = store.content_hashes(store.units_dir)
+        source_hashes = store.content_hashes(store.sources_dir)
+        citation_hashes = store.content_hashes(store.citations_dir)
+        relationships_sha = store.content_hash(store.relationships_dir / "relationships.json")
+        changed_units = _changed(previous["units"], unit_hashes)
+        changed_sources = _changed(previous["sources"], source_hashes)
+        changed_citations = _changed(previous["citations"], citation_hashes)
+        dependency_state = dict(previous["dependencies"])
+        changed_dependencies = {
+            dependency_id
+            for dependency_id, item in dependency_state.items()
+            if self._knowledge_hash("product_dependencies", dependency_id) != item["sha256"]
+            or (item["claim_id"] and self._knowledge_hash("claims", item["claim_id"]) != item["claim_sha256"])
+        }
+
+        units = _Lookup(store.get_unit)
+        sources = _Lookup(store.get_source)
+        citations = _Lookup(store.get_citation)
+        dependencies = _Lookup(lambda item_id: store.get_knowledge_record("product_dependencies", item_id))
+        claims = _Lookup(lambda item_id: store.get_knowledge_record("claims", item_id))
+
+        unit_refs = dict(previous["unit_refs"])
+        for unit_id in changed_units:
+            unit = units.get(unit_id) if unit_id in unit_hashes else None
+            if unit is None:
+                unit_refs.pop(unit_id, None)
+            else:
+                unit_refs[unit_id] = self._unit_refs(unit)
+        citation_sources = dict(previous["citation_sources"])
+        for citation_id in changed_citations:
+            citation = citations.get(citation_id) if citation_id in citation_hashes else None
+            if citation is None:
+                citation_sources.pop(citation_id, None)
+            else:
+                citation_sources[citation_id] = citation.source_id
+
+        # A unit is checked against its citations and dependencies, a citation
+        # against its source, and relationships against the set of unit ids;
+        # anything whose inputs are unchanged passed when the active build did.
+        affected_units = {
+            unit_id
+            for unit_id, refs in unit_refs.items()
+            if unit_id in changed_units
+            or changed_citations.intersection(refs["citation_ids"])
+            or changed_dependencies.intersection(refs["dependency_ids"])
+        }
+        affected_citations = {
+            citation_id
+            for citation_id, source_id in citation_sources.items()
+            if citation_id in changed_citations or source_id in changed_sources
+        }
+        findings: List[str] = []
+        for unit_id in sorted(affected_units, key=_file_order):
+            unit = units.get(unit_id)
+            if unit is not None:
+                findings.extend(self._unit_findings(unit, citations, dependencies, claims))
+        for citation_id in sorted(affected_citations, key=_file_order):
+            citation = citations.get(citation_id)
+            if citation is not None:
+                findings.extend(self._citation_findings(citation, sources))
+        relationships_changed = relationships_sha != previous["relationships_sha256"]
+        relationships: List[UnitRelationship] = []
+        if relationships_changed or unit_hashes.keys() != previous["units"].keys():
+            relationships = store.list_relationships()
+            findings.extend(self._relationship_findings(relationships, set(unit_hashes)))
+        if findings:
+            raise RepositoryValidationError(findings)
+
+        store.ensure_dirs()
+        build_id = f"BUILD-{_utc_compact()}"
+        build_dir = store.builds_dir / build_id
+        build_dir.mkdir(parents=True, exist_ok=False)
+        # Copy-on-write: the active build stays untouched for its readers.
+        shutil.copyfile(store.builds_dir / previous_build_id / "repository.sqlite3", build_dir / "repository.sqlite3")
+        published = dict(previous["published"])
+        relationship_count = previous["relationship_count"]
+        connection = sqlite3.connect(build_dir / "repository.sqlite3")
+        try:
+            for unit_id in changed_units:
+                connection.execute("DELETE FROM canonical_units WHERE unit_id = ?", (unit_id,))
+                connection.execute("DELETE FROM unit_citations WHERE unit_id = ?", (unit_id,))
+                published.pop(unit_id, None)
+                unit = units.get(unit_id) if unit_id in unit_hashes else None
+                if unit is not None and unit.status == "published":
+                    self._insert_unit(connection, unit)
+                    published[unit_id] = self._unit_summary(unit)
+            for source_id in changed_sources:
+                connection.execute("DELETE FROM source_documents WHERE source_id = ?", (source_id,))
+                source = sources.get(source_id) if source_id in source_hashes else None
+                if source is not None:
+                    self._insert_source(connection, source)
+            for citation_id in changed_citations:
+                connection.execute("DELETE FROM citations WHERE citation_id = ?", (citation_id,))
+                citation = citations.get(citation_id) if citation_id in citation_hashes else None
+                if citation is not None:
+                    self._insert_citation(connection, citation)
+            if relationships_changed:
+                approved = [item for item in relationships if item.status == "approved"]
+                connection.execute("DELETE FROM unit_relationships")
+                for relationship in approved:
+                    self._insert_relationship(connection, relationship)
+                relationship_count = len(approved)
+            connection.commit()
+        finally:
+            connection.close()
+
+        for dependency_id in changed_dependencies:
+            dependency_state.pop(dependency_id)
+        referenced = {dependency_id for refs in unit_refs.values() for dependency_id in refs["dependency_ids"]}
+        dependency_state.update(self._dependency_state(referenced - dependency_state.keys()))
+        state = {
+            "schema_version": BUILD_STATE_VERSION,
+            "units": unit_hashes,
+            "sources": source_hashes,
+            "citations": citation_hashes,
+            "relationships_sha256": relationships_sha,
+            "relationship_count": relationship_count,
+            "unit_refs": unit_refs,
+            "citation_sources": citation_sources,
+            "dependencies": {key: value for key, value in dependency_state.items() if key in referenced},
+            "published": published,
+        }
+        return self._publish(build_id, build_dir, state)
+
+    def _publish(self, build_id: str, build_dir: Path, state: Dict[str, Any]) -> Dict[str, Any]:
+        summaries = [state["published"][unit_id] for unit_id in sorted(state["published"], key=_file_order)]
         bible: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
         topics: Dict[str, Dict[str, Any]] = {}
-        for unit in units:
-            summary = self._unit_summary(unit)
-            if unit.unit_type == "passage":
-                for reference in unit.primary_bible_refs:
-                    bible[reference.osis].append(summary)
-            elif unit.unit_type == "concept":
+        for summary in summaries:
+            if summary["unit_type"] == "passage":
+                for reference in summary["primary_bible_refs"]:
+                    bible[reference["osis"]].append(summary)
+            elif summary["unit_type"] == "concept":
                 # A concept may carry secondary topic assignments so readers can
                 # understand related themes.  Those assignments are metadata, not
                 # additional catalogue locations: otherwise the same unit appears
                 # repeatedly under every related topic.
                 for assignment in (
-                    item for item in unit.topic_assignments if item.role == "primary"
+                    item for item in summary["topic_assignments"] if item["role"] == "primary"
                 ):
-                    key = assignment.topic_ids[-1] if assignment.topic_ids else "/".join(assignment.path)
-                    card = topics.setdefault(key, {"topic_id": key, "path": assignment.path, "units": []})
+                    key = assignment["topic_ids"][-1] if assignment["topic_ids"] else "/".join(assignment["path"])
+                    card = topics.setdefault(key, {"topic_id": key, "path": assignment["path"], "units": []})
                     card["units"].append(summary)
 
         _write_json(build_dir / "bible_index.json", {"references": bible})
         _write_json(build_dir / "topic_index.json", {"topics": sorted(topics.values(), key=lambda item: item["path"])})
-        self._write_sqlite(build_dir / "repository.sqlite3", units, sources, citations, relationships)
+        # Read back only by the next incremental build; no need to indent it.
+        (build_dir / BUILD_STATE_FILE).write_text(
+            json.dumps(state, ensure_ascii=False, separators=(",", ":")), encoding="utf-8"
+        )
         generated_at = datetime.now(timezone.utc).isoformat()
         manifest = {
             "schema_version": 1,
             "build_id": build_id,
             "generated_at": generated_at,
-            "unit_count": len(units),
-            "passage_count": sum(item.unit_type == "passage" for item in units),
-            "concept_count": sum(item.unit_type == "concept" for item in units),
-            "source_count": len(sources),
-            "citation_count": len(citations),
-            "relationship_count": len(relationships),
+            "unit_count": len(summaries),
+            "passage_count": sum(item["unit_type"] == "passage" for item in summaries),
+            "concept_count": sum(item["unit_type"] == "concept" for item in summaries),
+            "source_count": len(state["sources"]),
+            "citation_count": len(state["citations"]),
+            "relationship_count": state["relationship_count"],
         }
         _write_json(build_dir / "build_manifest.json", manifest)
         self.store.set_active_build(build_id, generated_at)
         return manifest
 
+    @staticmethod
+    def _unit_refs(unit: CanonicalUnit) -> Dict[str, List[str]]:
+        return {"citation_ids": list(unit.citation_ids), "dependency_ids": list(unit.knowledge_dependency_ids)}
+
+    def _knowledge_hash(self, collection: str, record_id: str) -> Optional[str]:
+        try:
+            return self.store.content_hash(self.store.knowledge_record_path(collection, record_id))
+        except ValueError:
+            return None
+
+    def _dependency_state(self, dependency_ids: Iterable[str]) -> Dict[str, Dict[str, Optional[str]]]:
+        """Hash of each dependency record and of the claim it pins."""
+
+        dependencies = _Lookup(lambda item_id: self.store.get_knowledge_record("product_dependencies", item_id))
+        state: Dict[str, Dict[str, Optional[str]]] = {}
+        for dependency_id in dependency_ids:
+            # Hash before reading, so a concurrent edit can only make the
+            # next build recheck the dependency, never skip it.
+            sha = self._knowledge_hash("product_dependencies", dependency_id)
+            dependency = dependencies.get(dependency_id)
+            claim_id = getattr(dependency, "claim_id", None)
+            state[dependency_id] = {
+                "sha256": sha,
+                "claim_id": claim_id,
+                "claim_sha256": self._knowledge_hash("claims", claim_id) if claim_id else None,
+            }
+        return state
+
     @staticmethod
     def _unit_summary(unit: CanonicalUnit) -> Dict[str, Any]:
         return {
@@ -156,19 +419,35 @@ class RepositoryCompiler:
                 """
             )
             for unit in units:
-                payload = unit.model_dump_json()
-                connection.execute("INSERT INTO canonical_units VALUES (?, ?, ?, ?)", (unit.unit_id, unit.title, unit.unit_type, payload))
-                for order, citation_id in enumerate(unit.citation_ids, start=1):
-                    connection.execute("INSERT INTO unit_citations VALUES (?, ?, ?)", (unit.unit_id, citation_id, order))
+                RepositoryCompiler._insert_unit(connection, unit)
             for source in sources:
-                connection.execute("INSERT INTO source_documents VALUES (?, ?, ?, ?)", (source.source_id, source.source_type, source.origin_id, source.model_dump_json()))
+                RepositoryCompiler._insert_source(connection, source)
             for citation in citations:
-                connection.execute("INSERT INTO citations VALUES (?, ?, ?, ?)", (citation.citation_id, citation.source_id, citation.status, citation.model_dump_json()))
+                RepositoryCompiler._insert_citation(connection, citation)
             for relationship in relationships:
-                connection.execute(
-                    "INSERT INTO unit_relationships VALUES (?, ?, ?, ?, ?)",
-                    (relationship.relationship_id, relationship.from_unit_id, relationship.to_unit_id, relationship.relationship_type, relationship.model_dump_json()),
-                )
+                RepositoryCompiler._insert_relationship(connection, relationship)
             connection.commit()
         finally:
             connection.close()
+
+    @staticmethod
+    def _insert_unit(connection: sqlite3.Connection, unit: CanonicalUnit) -> None:
+        payload = unit.model_dump_json()
+        connection.execute("INSERT INTO canonical_units VALUES (?, ?, ?, ?)", (unit.unit_id, unit.title, unit.unit_type, payload))
+        for order, citation_id in enumerate(unit.citation_ids, start=1):
+            connection.execute("INSERT INTO unit_citations VALUES (?, ?, ?)", (unit.unit_id, citation_id, order))
+
+    @staticmethod
+    def _insert_source(connection: sqlite3.Connection, source: SourceDocument) -> None:
+        connection.execute("INSERT INTO source_documents VALUES (?, ?, ?, ?)", (source.source_id, source.source_type, source.origin_id, source.model_dump_json()))
+
+    @staticmethod
+    def _insert_citation(connection: sqlite3.Connection, citation: Citation) -> None:
+        connection.execute("INSERT INTO citations VALUES (?, ?, ?, ?)", (citation.citation_id, citation.source_id, citation.status, citation.model_dump_json()))
+
+    @staticmethod
+    def _insert_relationship(connection: sqlite3.Connection, relationship: UnitRelationship) -> None:
+        connection.execute(
+            "INSERT INTO unit_relationships VALUES (?, ?, ?, ?, ?)",
+            (relationship.relationship_id, relationship.from_unit_id, relationship.to_unit_id, relationship.relationship_type, relationship.model_dump_json()),
+        )
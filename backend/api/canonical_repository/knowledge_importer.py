@@ -373,21 +373,22 @@ class KnowledgePackageImporter:
 
         changes = {"created": 0, "updated": 0, "unchanged": 0}
         record_ids: dict[str, list[str]] = {}
-        for collection, items in records.items():
-            _, id_field = KNOWLEDGE_COLLECTIONS[collection]
-            record_ids[collection] = []
-            for proposed in items:
-                record = self._preserve_review(collection, proposed)
-                record_id = str(getattr(record, id_field))
-                record_ids[collection].append(record_id)
-                path = self.store.knowledge_record_path(collection, record_id)
-                existing = json.loads(path.read_text(encoding="utf-8")) if path.is_file() else None
-                normalized = record.model_dump(mode="json")
-                if existing == normalized:
-                    changes["unchanged"] += 1
-                    continue
-                changes["updated" if existing is not None else "created"] += 1
-                self.store.save_knowledge_record(collection, record)
+        with self.store.batch():
+            for collection, items in records.items():
+                _, id_field = KNOWLEDGE_COLLECTIONS[collection]
+                record_ids[collection] = []
+                for proposed in items:
+                    record = self._preserve_review(collection, proposed)
+                    record_id = str(getattr(record, id_field))
+                    record_ids[collection].append(record_id)
+                    path = self.store.knowledge_record_path(collection, record_id)
+                    existing = json.loads(path.read_text(encoding="utf-8")) if path.is_file() else None
+                    normalized = record.model_dump(mode="json")
+                    if existing == normalized:
+                        changes["unchanged"] += 1
+                        continue
+                    changes["updated" if existing is not None else "created"] += 1
+                    self.store.save_knowledge_record(collection, record)
 
         manifest = KnowledgePackageManifest(
             package_id=package_id,
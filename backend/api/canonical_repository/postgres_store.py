@@ -12,11 +12,14 @@ import hashlib
 import json
 import os
 import tempfile
+import threading
+import time
 import uuid
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Iterable, Mapping, Optional, Sequence
+from typing import Any, Iterable, Iterator, Mapping, Optional, Sequence
 
 from .knowledge_importer import KnowledgePackageImporter
 from .knowledge_models import KNOWLEDGE_COLLECTIONS
@@ -772,6 +775,30 @@ def conflict_for(
     )
 
 
+def _written_values(
+    operation: ChangeOperation,
+) -> tuple[dict[str, Any], str, str, str, Optional[str]]:
+    """The payload a create or update stores, with the columns read off it."""
+
+    payload = dict(operation.payload)
+    payload["revision"] = operation.after_revision
+    source_fingerprint = next(
+        iter(payload.get("extraction_fingerprints") or []),
+        payload.get("extraction_fingerprint"),
+    )
+    return (
+        payload,
+        record_content_sha(payload),
+        str(payload.get("review_status", "candidate")),
+        str(payload.get("visibility", "internal")),
+        source_fingerprint,
+    )
+
+
+def _one_operation_per_record(plan: ChangeSetPlan) -> bool:
+    return len({(item.collection, item.object_id) for item in plan.operations}) == len(plan.operations)
+
+
 def reviewed_relations_package(artifact: Mapping[str, Any]) -> dict[str, Any]:
     """Convert accepted cross-sermon judgments to an incremental package.
 
@@ -831,13 +858,115 @@ def reviewed_relations_package(artifact: Mapping[str, Any]) -> dict[str, Any]:
     }
 
 
+# Keys per set-based lookup; keeps each array parameter a manageable size.
+EXISTING_LOOKUP_BATCH = 5000
+# Plans with at least this many operations are staged with COPY and merged
+# set-based; smaller ones are written a row at a time.
+BULK_APPLY_THRESHOLD = int(os.getenv("KNOWLEDGE_BULK_APPLY_THRESHOLD", "500"))
+
+
+class ConnectionPool:
+    """Idle connections kept open between calls, shared per database URL.
+
+    `connection()` behaves like `with psycopg.connect(...) as conn`: the
+    transaction commits when the block succeeds and rolls back when it
+    raises. The connection then goes back to the pool instead of closing,
+    unless it is closed, broken, or left mid-transaction. Connections idle
+    longer than `max_idle_seconds` are closed rather than reused, so one the
+    server has dropped is not handed out.
+    """
+
+    def __init__(
+        self, psycopg: Any, database_url: str, *, max_idle: int = 4,
+        max_idle_seconds: float = 300.0,
+    ) -> None:
+        self.psycopg = psycopg
+        self.database_url = database_url
+        self.max_idle = max_idle
+        self.max_idle_seconds = max_idle_seconds
+        self._idle: list[tuple[float, Any]] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        conn = self._checkout()
+        try:
+            yield conn
+        except BaseException:
+            self._finish(conn, commit=False)
+            raise
+        self._finish(conn, commit=True)
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for _, conn in idle:
+            conn.close()
+
+    def _checkout(self) -> Any:
+        now = time.monotonic()
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                released_at, conn = self._idle.pop()
+            if conn.closed or conn.broken or now - released_at > self.max_idle_seconds:
+                conn.close()
+                continue
+            return conn
+        return self.psycopg.connect(self.database_url)
+
+    def _finish(self, conn: Any, *, commit: bool) -> None:
+        if conn.closed:
+            return
+        try:
+            if commit:
+                conn.commit()
+            else:
+                conn.rollback()
+        except BaseException:
+            conn.close()
+            if commit:
+                raise
+            return
+        idle_status = self.psycopg.pq.TransactionStatus.IDLE
+        if conn.broken or conn.info.transaction_status != idle_status:
+            conn.close()
+            return
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append((time.monotonic(), conn))
+                return
+        conn.close()
+
+
+_POOLS: dict[str, ConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def connection_pool(psycopg: Any, database_url: str) -> ConnectionPool:
+    with _POOLS_LOCK:
+        pool = _POOLS.get(database_url)
+        if pool is None:
+            pool = ConnectionPool(
+                psycopg,
+                database_url,
+                max_idle=int(os.getenv("KNOWLEDGE_DATABASE_POOL_SIZE", "4")),
+                max_idle_seconds=float(os.getenv("KNOWLEDGE_DATABASE_POOL_MAX_IDLE_SECONDS", "300")),
+            )
+            _POOLS[database_url] = pool
+        return pool
+
+
 class PostgresKnowledgeStore:
     def __init__(self, database_url: Optional[str] = None):
         self.database_url = database_url_from_env(database_url)
         self.psycopg = _load_psycopg()
+        self.pool = connection_pool(self.psycopg, self.database_url)
 
     def connect(self) -> Any:
-        return self.psycopg.connect(self.database_url)
+        """A pooled connection, used as `with store.connect() as conn`."""
+        return self.pool.connection()
 
     def get_record(self, collection: str, object_id: str) -> Optional[dict[str, Any]]:
         with self.connect() as conn, conn.cursor() as cursor:
@@ -849,6 +978,23 @@ class PostgresKnowledgeStore:
             row = cursor.fetchone()
         return dict(row[0]) if row else None
 
+    def get_records(self, collection: str, object_ids: Sequence[str]) -> dict[str, dict[str, Any]]:
+        """Active records among `object_ids`, keyed by id, in one round trip.
+
+        Ids the store does not have, or has retired, are simply absent.
+        """
+
+        if not object_ids:
+            return {}
+        with self.connect() as conn, conn.cursor() as cursor:
+            cursor.execute(
+                """SELECT object_id, payload FROM wang_knowledge.objects
+                   WHERE collection=%s AND object_id = ANY(%s) AND retired_at IS NULL""",
+                (collection, list(dict.fromkeys(map(str, object_ids)))),
+            )
+            rows = cursor.fetchall()
+        return {str(row[0]): dict(row[1]) for row in rows}
+
     def list_records(self, collection: str) -> list[dict[str, Any]]:
         """Read the active collection in stable object-id order."""
 
@@ -891,9 +1037,11 @@ class PostgresKnowledgeStore:
         plan = self.get_record("composition_plans", plan_id)
         if plan is None:
             return None
+        decision_ids = plan.get("decision_ids") or []
+        found = self.get_records("composition_decisions", decision_ids)
         decisions = []
-        for decision_id in plan.get("decision_ids") or []:
-            decision = self.get_record("composition_decisions", decision_id)
+        for decision_id in decision_ids:
+            decision = found.get(str(decision_id))
             if decision is None:
                 raise KeyError(
                     f"decision {decision_id} referenced by {plan_id} is not in the store"
@@ -911,19 +1059,23 @@ class PostgresKnowledgeStore:
         return applied
 
     def _existing(self, conn: Any, keys: Iterable[tuple[str, str]]) -> dict[tuple[str, str], dict[str, Any]]:
+        """Live rows for `keys`, read with one set-based query per batch."""
+        unique = list(dict.fromkeys((str(collection), str(object_id)) for collection, object_id in keys))
         result: dict[tuple[str, str], dict[str, Any]] = {}
         with conn.cursor() as cursor:
-            for collection, object_id in keys:
+            for start in range(0, len(unique), EXISTING_LOOKUP_BATCH):
+                batch = unique[start:start + EXISTING_LOOKUP_BATCH]
                 cursor.execute(
-                    """SELECT revision, content_sha256, payload
-                       FROM wang_knowledge.objects
-                       WHERE collection=%s AND object_id=%s AND retired_at IS NULL""",
-                    (collection, object_id),
+                    """SELECT o.collection, o.object_id, o.revision, o.content_sha256, o.payload
+                       FROM wang_knowledge.objects o
+                       JOIN UNNEST(%s::text[], %s::text[]) AS k(collection, object_id)
+                         ON o.collection = k.collection AND o.object_id = k.object_id
+                       WHERE o.retired_at IS NULL""",
+                    ([key[0] for key in batch], [key[1] for key in batch]),
                 )
-                row = cursor.fetchone()
-                if row:
+                for collection, object_id, revision, content_sha256, payload in cursor.fetchall():
                     result[(collection, object_id)] = {
-                        "revision": row[0], "content_sha256": row[1], "payload": row[2]
+                        "revision": revision, "content_sha256": content_sha256, "payload": payload
                     }
         return result
 
@@ -982,7 +1134,10 @@ class PostgresKnowledgeStore:
             str(payload["relation_type"]),
         )
 
-    def apply_plan(self, plan: ChangeSetPlan, *, metadata: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+    def apply_plan(
+        self, plan: ChangeSetPlan, *, metadata: Optional[dict[str, Any]] = None,
+        bulk: Optional[bool] = None,
+    ) -> dict[str, Any]:
         with self.connect() as conn:
             with conn.cursor() as cursor:
                 cursor.execute(
@@ -1005,107 +1160,12 @@ class PostgresKnowledgeStore:
                         canonical_json(metadata or {}),
                     ),
                 )
-                changed_records: list[tuple[str, str, int, int]] = []
-                for index, operation in enumerate(plan.operations):
-                    cursor.execute(
-                        """SELECT revision, content_sha256, retired_at FROM wang_knowledge.objects
-                           WHERE collection=%s AND object_id=%s FOR UPDATE""",
-                        (operation.collection, operation.object_id),
-                    )
-                    locked = cursor.fetchone()
-                    actual_sha = locked[1] if locked else None
-                    if actual_sha != operation.before_sha256:
-                        raise conflict_for(
-                            operation.collection, operation.object_id,
-                            expected=operation.before_sha256, found=actual_sha,
-                            retired_at=locked[2] if locked else None,
-                        )
-                    if operation.operation in {"retire", "revive"}:
-                        self._set_retirement(cursor, plan, index, operation)
-                        if operation.before_revision is not None:
-                            changed_records.append((
-                                operation.collection, operation.object_id,
-                                operation.before_revision, operation.after_revision,
-                            ))
-                        continue
-                    payload = dict(operation.payload)
-                    payload["revision"] = operation.after_revision
-                    content_sha = record_content_sha(payload)
-                    review_status = str(payload.get("review_status", "candidate"))
-                    visibility = str(payload.get("visibility", "internal"))
-                    source_fingerprint = next(
-                        iter(payload.get("extraction_fingerprints") or []),
-                        payload.get("extraction_fingerprint"),
-                    )
-                    cursor.execute(
-                        """INSERT INTO wang_knowledge.objects
-                           (collection, object_id, revision, review_status, visibility,
-                            content_sha256, source_fingerprint, payload)
-                           VALUES (%s,%s,%s,%s,%s,%s,%s,%s::jsonb)
-                           ON CONFLICT (collection, object_id) DO UPDATE SET
-                             revision=EXCLUDED.revision,
-                             review_status=EXCLUDED.review_status,
-                             visibility=EXCLUDED.visibility,
-                             content_sha256=EXCLUDED.content_sha256,
-                             source_fingerprint=EXCLUDED.source_fingerprint,
-                             payload=EXCLUDED.payload,
-                             updated_at=now(), retired_at=NULL""",
-                        (
-                            operation.collection, operation.object_id, operation.after_revision,
-                            review_status, visibility, content_sha, source_fingerprint,
-                            canonical_json(payload),
-                        ),
-                    )
-                    cursor.execute(
-                        """INSERT INTO wang_knowledge.object_versions
-                           (collection, object_id, revision, content_sha256, payload, change_set_id)
-                           VALUES (%s,%s,%s,%s,%s::jsonb,%s)""",
-                        (
-                            operation.collection, operation.object_id, operation.after_revision,
-                            content_sha, canonical_json(payload), plan.change_set_id,
-                        ),
-                    )
-                    cursor.execute(
-                        """INSERT INTO wang_knowledge.change_operations
-                           (change_set_id, operation_index, operation, collection, object_id,
-                            before_sha256, after_sha256, before_revision, after_revision,
-                            details)
-                           VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s::jsonb)""",
-                        (
-                            plan.change_set_id, index, operation.operation, operation.collection,
-                            operation.object_id, operation.before_sha256, content_sha,
-                            operation.before_revision, operation.after_revision,
-                            canonical_json(
-                                {"removed_fields": list(operation.removed_fields)}
-                                if operation.removed_fields
-                                else {}
-                            ),
-                        ),
-                    )
-                    if operation.collection in EDGE_COLLECTIONS:
-                        from_id, to_id, relation_type = self._edge_values(operation.collection, payload)
-                        cursor.execute(
-                            """INSERT INTO wang_knowledge.edges
-                               (edge_collection, edge_id, from_id, to_id, relation_type,
-                                review_status, revision, payload)
-                               VALUES (%s,%s,%s,%s,%s,%s,%s,%s::jsonb)
-                               ON CONFLICT (edge_collection, edge_id) DO UPDATE SET
-                                 from_id=EXCLUDED.from_id, to_id=EXCLUDED.to_id,
-                                 relation_type=EXCLUDED.relation_type,
-                                 review_status=EXCLUDED.review_status,
-                                 revision=EXCLUDED.revision, payload=EXCLUDED.payload,
-                                 updated_at=now(), retired_at=NULL""",
-                            (
-                                operation.collection, operation.object_id, from_id, to_id,
-                                relation_type, review_status, operation.after_revision,
-                                canonical_json(payload),
-                            ),
-                        )
-                    if operation.operation == "update":
-                        changed_records.append(
-                            (operation.collection, operation.object_id,
-                             operation.before_revision or 0, operation.after_revision)
-                        )
+                if bulk is None:
+                    bulk = len(plan.operations) >= BULK_APPLY_THRESHOLD and _one_operation_per_record(plan)
+                if bulk:
+                    changed_records = self._apply_operations_bulk(cursor, plan)
+                else:
+                    changed_records = self._apply_operations(cursor, plan)
 
                 invalidated = self._invalidate_dependencies(cursor, plan, changed_records, len(plan.operations))
                 summary["invalidated_dependencies"] = invalidated
@@ -1117,6 +1177,284 @@ class PostgresKnowledgeStore:
                 )
         return {"status": "applied", "change_set_id": plan.change_set_id, "summary": summary}
 
+    def _apply_operations(
+        self, cursor: Any, plan: ChangeSetPlan
+    ) -> list[tuple[str, str, int, int]]:
+        changed_records: list[tuple[str, str, int, int]] = []
+        for index, operation in enumerate(plan.operations):
+            cursor.execute(
+                """SELECT revision, content_sha256, retired_at FROM wang_knowledge.objects
+                   WHERE collection=%s AND object_id=%s FOR UPDATE""",
+                (operation.collection, operation.object_id),
+            )
+            locked = cursor.fetchone()
+            actual_sha = locked[1] if locked else None
+            if actual_sha != operation.before_sha256:
+                raise conflict_for(
+                    operation.collection, operation.object_id,
+                    expected=operation.before_sha256, found=actual_sha,
+                    retired_at=locked[2] if locked else None,
+                )
+            if operation.operation in {"retire", "revive"}:
+                self._set_retirement(cursor, plan, index, operation)
+                if operation.before_revision is not None:
+                    changed_records.append((
+                        operation.collection, operation.object_id,
+                        operation.before_revision, operation.after_revision,
+                    ))
+                continue
+            payload, content_sha, review_status, visibility, source_fingerprint = _written_values(operation)
+            cursor.execute(
+                """INSERT INTO wang_knowledge.objects
+                   (collection, object_id, revision, review_status, visibility,
+                    content_sha256, source_fingerprint, payload)
+                   VALUES (%s,%s,%s,%s,%s,%s,%s,%s::jsonb)
+                   ON CONFLICT (collection, object_id) DO UPDATE SET
+                     revision=EXCLUDED.revision,
+                     review_status=EXCLUDED.review_status,
+                     visibility=EXCLUDED.visibility,
+                     content_sha256=EXCLUDED.content_sha256,
+                     source_fingerprint=EXCLUDED.source_fingerprint,
+                     payload=EXCLUDED.payload,
+                     updated_at=now(), retired_at=NULL""",
+                (
+                    operation.collection, operation.object_id, operation.after_revision,
+                    review_status, visibility, content_sha, source_fingerprint,
+                    canonical_json(payload),
+                ),
+            )
+            cursor.execute(
+                """INSERT INTO wang_knowledge.object_versions
+                   (collection, object_id, revision, content_sha256, payload, change_set_id)
+                   VALUES (%s,%s,%s,%s,%s::jsonb,%s)""",
+                (
+                    operation.collection, operation.object_id, operation.after_revision,
+                    content_sha, canonical_json(payload), plan.change_set_id,
+                ),
+            )
+            cursor.execute(
+                """INSERT INTO wang_knowledge.change_operations
+                   (change_set_id, operation_index, operation, collection, object_id,
+                    before_sha256, after_sha256, before_revision, after_revision,
+                    details)
+                   VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s::jsonb)""",
+                (
+                    plan.change_set_id, index, operation.operation, operation.collection,
+                    operation.object_id, operation.before_sha256, content_sha,
+                    operation.before_revision, operation.after_revision,
+                    canonical_json(
+                        {"removed_fields": list(operation.removed_fields)}
+                        if operation.removed_fields
+                        else {}
+                    ),
+                ),
+            )
+            if operation.collection in EDGE_COLLECTIONS:
+                from_id, to_id, relation_type = self._edge_values(operation.collection, payload)
+                cursor.execute(
+                    """INSERT INTO wang_knowledge.edges
+                       (edge_collection, edge_id, from_id, to_id, relation_type,
+                        review_status, revision, payload)
+                       VALUES (%s,%s,%s,%s,%s,%s,%s,%s::jsonb)
+                       ON CONFLICT (edge_collection, edge_id) DO UPDATE SET
+                         from_id=EXCLUDED.from_id, to_id=EXCLUDED.to_id,
+                         relation_type=EXCLUDED.relation_type,
+                         review_status=EXCLUDED.review_status,
+                         revision=EXCLUDED.revision, payload=EXCLUDED.payload,
+                         updated_at=now(), retired_at=NULL""",
+                    (
+                        operation.collection, operation.object_id, from_id, to_id,
+                        relation_type, review_status, operation.after_revision,
+                        canonical_json(payload),
+                    ),
+                )
+            if operation.operation == "update":
+                changed_records.append(
+                    (operation.collection, operation.object_id,
+                     operation.before_revision or 0, operation.after_revision)
+                )
+        return changed_records
+
+    def _apply_operations_bulk(
+        self, cursor: Any, plan: ChangeSetPlan
+    ) -> list[tuple[str, str, int, int]]:
+        """Write the same rows as `_apply_operations` in a fixed number of statements.
+
+        Every operation is staged with one COPY into a temporary table, the
+        target rows are locked with one `SELECT ... FOR UPDATE`, and each table
+        is then written with one set-based statement. Conflicts are checked in
+        operation order before anything is written, so the first mismatch is
+        the one the row-by-row path would have reported. Values are derived by
+        the same code as that path and `now()` is the transaction's timestamp,
+        so the two leave identical rows. A record must appear once: the
+        row-by-row path lets a later operation see an earlier one's write, a
+        merge cannot.
+        """
+
+        if not _one_operation_per_record(plan):
+            raise PostgresKnowledgeStoreError(
+                f"{plan.change_set_id} touches a record twice; apply it row by row"
+            )
+        cursor.execute(
+            """CREATE TEMP TABLE apply_operations (
+                 operation_index integer PRIMARY KEY,
+                 operation text NOT NULL,
+                 collection text NOT NULL,
+                 object_id text NOT NULL,
+                 before_sha256 text,
+                 after_sha256 text NOT NULL,
+                 before_revision integer,
+                 after_revision integer NOT NULL,
+                 review_status text,
+                 visibility text,
+                 source_fingerprint text,
+                 payload jsonb NOT NULL,
+                 details jsonb NOT NULL,
+                 from_id text,
+                 to_id text,
+                 relation_type text
+               ) ON COMMIT DROP"""
+        )
+        with cursor.copy(
+            """COPY apply_operations
+               (operation_index, operation, collection, object_id, before_sha256,
+                after_sha256, before_revision, after_revision, review_status, visibility,
+                source_fingerprint, payload, details, from_id, to_id, relation_type)
+               FROM STDIN"""
+        ) as copy:
+            for index, operation in enumerate(plan.operations):
+                if operation.operation in {"retire", "revive"}:
+                    payload = dict(operation.payload)
+                    payload["revision"] = operation.after_revision
+                    copy.write_row((
+                        index, operation.operation, operation.collection, operation.object_id,
+                        operation.before_sha256, operation.after_sha256,
+                        operation.before_revision, operation.after_revision,
+                        None, None, None, canonical_json(payload), canonical_json({}),
+                        None, None, None,
+                    ))
+                    continue
+                payload, content_sha, review_status, visibility, source_fingerprint = _written_values(operation)
+                edge = (
+                    self._edge_values(operation.collection, payload)
+                    if operation.collection in EDGE_COLLECTIONS
+                    else (None, None, None)
+                )
+                copy.write_row((
+                    index, operation.operation, operation.collection, operation.object_id,
+                    operation.before_sha256, content_sha,
+                    operation.before_revision, operation.after_revision,
+                    review_status, visibility, source_fingerprint, canonical_json(payload),
+                    canonical_json(
+                        {"removed_fields": list(operation.removed_fields)}
+                        if operation.removed_fields
+                        else {}
+                    ),
+                    *edge,
+                ))
+        cursor.execute("ANALYZE apply_operations")
+
+        cursor.execute(
+            """SELECT s.operation_index, o.content_sha256, o.retired_at
+               FROM apply_operations s
+               JOIN wang_knowledge.objects o
+                 ON o.collection=s.collection AND o.object_id=s.object_id
+               ORDER BY o.collection, o.object_id
+               FOR UPDATE OF o"""
+        )
+        locked = {int(index): (sha, retired_at) for index, sha, retired_at in cursor.fetchall()}
+        changed_records: list[tuple[str, str, int, int]] = []
+        for index, operation in enumerate(plan.operations):
+            actual_sha, retired_at = locked.get(index, (None, None))
+            if actual_sha != operation.before_sha256:
+                raise conflict_for(
+                    operation.collection, operation.object_id,
+                    expected=operation.before_sha256, found=actual_sha,
+                    retired_at=retired_at,
+                )
+            if operation.operation in {"retire", "revive"}:
+                if operation.before_revision is not None:
+                    changed_records.append((
+                        operation.collection, operation.object_id,
+                        operation.before_revision, operation.after_revision,
+                    ))
+            elif operation.operation == "update":
+                changed_records.append(
+                    (operation.collection, operation.object_id,
+                     operation.before_revision or 0, operation.after_revision)
+                )
+
+        edge_collections = sorted(EDGE_COLLECTIONS)
+        cursor.execute(
+            """INSERT INTO wang_knowledge.objects
+               (collection, object_id, revision, review_status, visibility,
+                content_sha256, source_fingerprint, payload)
+               SELECT collection, object_id, after_revision, review_status, visibility,
+                      after_sha256, source_fingerprint, payload
+               FROM apply_operations
+               WHERE operation NOT IN ('retire','revive')
+               ORDER BY operation_index
+               ON CONFLICT (collection, object_id) DO UPDATE SET
+                 revision=EXCLUDED.revision,
+                 review_status=EXCLUDED.review_status,
+                 visibility=EXCLUDED.visibility,
+                 content_sha256=EXCLUDED.content_sha256,
+                 source_fingerprint=EXCLUDED.source_fingerprint,
+                 payload=EXCLUDED.payload,
+                 updated_at=now(), retired_at=NULL"""
+        )
+        cursor.execute(
+            """UPDATE wang_knowledge.objects o
+               SET revision=s.after_revision, updated_at=now(),
+                   retired_at = CASE WHEN s.operation='retire' THEN now() ELSE NULL END
+               FROM apply_operations s
+               WHERE s.operation IN ('retire','revive')
+                 AND o.collection=s.collection AND o.object_id=s.object_id"""
+        )
+        cursor.execute(
+            """INSERT INTO wang_knowledge.object_versions
+               (collection, object_id, revision, content_sha256, payload, change_set_id)
+               SELECT collection, object_id, after_revision, after_sha256, payload, %s
+               FROM apply_operations ORDER BY operation_index""",
+            (plan.change_set_id,),
+        )
+        cursor.execute(
+            """INSERT INTO wang_knowledge.change_operations
+               (change_set_id, operation_index, operation, collection, object_id,
+                before_sha256, after_sha256, before_revision, after_revision, details)
+               SELECT %s, operation_index, operation, collection, object_id,
+                      before_sha256, after_sha256, before_revision, after_revision, details
+               FROM apply_operations ORDER BY operation_index""",
+            (plan.change_set_id,),
+        )
+        cursor.execute(
+            """INSERT INTO wang_knowledge.edges
+               (edge_collection, edge_id, from_id, to_id, relation_type,
+                review_status, revision, payload)
+               SELECT collection, object_id, from_id, to_id, relation_type,
+                      review_status, after_revision, payload
+               FROM apply_operations
+               WHERE operation NOT IN ('retire','revive') AND collection = ANY(%s)
+               ORDER BY operation_index
+               ON CONFLICT (edge_collection, edge_id) DO UPDATE SET
+                 from_id=EXCLUDED.from_id, to_id=EXCLUDED.to_id,
+                 relation_type=EXCLUDED.relation_type,
+                 review_status=EXCLUDED.review_status,
+                 revision=EXCLUDED.revision, payload=EXCLUDED.payload,
+                 updated_at=now(), retired_at=NULL""",
+            (edge_collections,),
+        )
+        cursor.execute(
+            """UPDATE wang_knowledge.edges e
+               SET revision=s.after_revision, updated_at=now(),
+                   retired_at = CASE WHEN s.operation='retire' THEN now() ELSE NULL END
+               FROM apply_operations s
+               WHERE s.operation IN ('retire','revive') AND s.collection = ANY(%s)
+                 AND e.edge_collection=s.collection AND e.edge_id=s.object_id""",
+            (edge_collections,),
+        )
+        return changed_records
+
     def _set_retirement(
         self, cursor: Any, plan: ChangeSetPlan, index: int, operation: ChangeOperation
     ) -> None:
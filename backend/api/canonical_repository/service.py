@@ -573,7 +573,7 @@ class CanonicalRepositoryService:
             unit.status = "archived"
             self.store.save_unit(unit)
         try:
-            build = self.compiler.build() if affected_units else None
+            build = self.compiler.build(incremental=True) if affected_units else None
         except Exception:
             for unit in previous.values():
                 self.store.save_unit(unit)
@@ -674,7 +674,7 @@ class CanonicalRepositoryService:
         self.store.save_unit(unit)
         if refresh_public_index:
             try:
-                self.compiler.build()
+                self.compiler.build(incremental=True)
             except Exception:
                 self.store.save_unit(existing)
                 raise
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import tempfile
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional, Type, TypeVar
+from typing import Any, Dict, Iterable, Iterator, Optional, Type, TypeVar
 
 from pydantic import BaseModel
 
@@ -18,9 +23,77 @@ from .models import CanonicalUnit, Citation, SourceDocument, SourceMap, UnitRela
 
 T = TypeVar("T", bound=BaseModel)
 
+INDEX_DIR_NAME = ".index"
+# A folder changed this close to when its index was written may have changed
+# again within the same filesystem timestamp tick, so the index is rechecked.
+INDEX_RACY_NS = 2_000_000_000
+
+
+class _RecordFileCache:
+    """Record file text keyed on the (inode, mtime, size) it was read at.
+
+    Models are validated from the cached text on every read rather than kept:
+    callers edit the models they get back, and validating a record is cheaper
+    than deep-copying one.
+    """
+
+    def __init__(self, max_entries: int = 50000) -> None:
+        self.max_entries = max_entries
+        # path -> [stamp, text, sha256 of the text or None until asked for]
+        self._entries: OrderedDict[str, list[Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _stamp(st: os.stat_result) -> tuple[int, int, int]:
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+    def _entry(self, path: str) -> list[Any]:
+        # Plain string paths: building a Path per record was a large share of
+        # a warm listing.
+        stamp = self._stamp(os.stat(path))
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == stamp:
+                self._entries.move_to_end(path)
+                return entry
+        with open(path, "r", encoding="utf-8") as stream:
+            # Stamp what was actually opened; the path may have been replaced
+            # since the stat above.
+            stamp = self._stamp(os.fstat(stream.fileno()))
+            text = stream.read()
+        entry = [stamp, text, None]
+        with self._lock:
+            self._entries[path] = entry
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def read(self, path: str) -> str:
+        return self._entry(path)[1]
+
+    def sha256(self, path: str) -> str:
+        entry = self._entry(path)
+        if entry[2] is None:
+            entry[2] = hashlib.sha256(entry[1].encode("utf-8")).hexdigest()
+        return entry[2]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_record_files = _RecordFileCache()
+
 
 class RepositoryStore:
-    """Reviewable JSON authoring store with atomic record writes."""
+    """Reviewable JSON authoring store with atomic record writes.
+
+    Each record folder has an index under `.index/` listing its record ids and
+    the folder mtime it was taken at, so counts and listings skip the
+    directory scan while the folder is unchanged. `_write_json` keeps the
+    index current; inside `batch()` the index is written once at the end.
+    """
 
     def __init__(self, root: Path):
         self.root = Path(root)
@@ -32,6 +105,11 @@ class RepositoryStore:
         self.knowledge_dir = self.root / "knowledge"
         self.knowledge_packages_dir = self.knowledge_dir / "packages"
         self.builds_dir = self.root / "builds"
+        self.index_dir = self.root / INDEX_DIR_NAME
+        self._indexes: Dict[Path, tuple[int, int, list[str]]] = {}
+        self._index_lock = threading.RLock()
+        self._batch_depth = 0
+        self._dirty_indexes: set[Path] = set()
 
     def ensure_dirs(self) -> None:
         for path in (
@@ -67,18 +145,154 @@ class RepositoryStore:
         finally:
             if os.path.exists(temporary_name):
                 os.unlink(temporary_name)
+        if self._is_record_folder(path.parent):
+            self._record_written(path.parent, path.stem)
 
     @staticmethod
     def _read_model(path: Path, model: Type[T]) -> T:
         if not path.is_file():
             raise FileNotFoundError(path)
-        return model.model_validate_json(path.read_text(encoding="utf-8"))
+        return model.model_validate_json(_record_files.read(os.fspath(path)))
+
+    def _list_models(self, folder: Path, model: Type[T]) -> Iterable[T]:
+        directory = os.fspath(folder)
+        models = []
+        for record_id in self._record_ids(folder):
+            try:
+                text = _record_files.read(os.path.join(directory, f"{record_id}.json"))
+            except FileNotFoundError:
+                continue
+            models.append(model.model_validate_json(text))
+        return models
+
+    def content_hashes(self, folder: Path) -> Dict[str, str]:
+        """SHA-256 of each record file in `folder`, by record id, without parsing."""
+
+        directory = os.fspath(folder)
+        hashes: Dict[str, str] = {}
+        for record_id in self._record_ids(folder):
+            try:
+                hashes[record_id] = _record_files.sha256(os.path.join(directory, f"{record_id}.json"))
+            except FileNotFoundError:
+                continue
+        return hashes
+
+    @staticmethod
+    def content_hash(path: Path) -> Optional[str]:
+        try:
+            return _record_files.sha256(os.fspath(path))
+        except FileNotFoundError:
+            return None
+
+    def _is_record_folder(self, folder: Path) -> bool:
+        if folder in {
+            self.units_dir,
+            self.sources_dir,
+            self.source_maps_dir,
+            self.citations_dir,
+            self.knowledge_packages_dir,
+        }:
+            return True
+        return folder.parent == self.knowledge_dir and folder.name in KNOWLEDGE_COLLECTIONS
+
+    def _index_path(self, folder: Path) -> Path:
+        return self.index_dir / f"{folder.relative_to(self.root).as_posix().replace('/', '__')}.json"
 
     @staticmethod
-    def _list_models(folder: Path, model: Type[T]) -> Iterable[T]:
-        if not folder.is_dir():
+    def _file_order(record_id: str) -> str:
+        # Listings have always come back in file name order.
+        return f"{record_id}.json"
+
+    @classmethod
+    def _scan_ids(cls, folder: Path) -> list[str]:
+        with os.scandir(folder) as entries:
+            return sorted(
+                (
+                    entry.name[: -len(".json")]
+                    for entry in entries
+                    if entry.name.endswith(".json") and len(entry.name) > len(".json") and entry.is_file()
+                ),
+                key=cls._file_order,
+            )
+
+    def _record_ids(self, folder: Path) -> list[str]:
+        """Record ids in `folder`, sorted, from its index while the folder is unchanged."""
+
+        try:
+            folder_mtime = folder.stat().st_mtime_ns
+        except FileNotFoundError:
             return []
-        return [model.model_validate_json(path.read_text(encoding="utf-8")) for path in sorted(folder.glob("*.json"))]
+        with self._index_lock:
+            index = self._indexes.get(folder)
+            if index is None:
+                index = self._load_index(folder)
+            if index is not None and index[0] == folder_mtime and index[1] - folder_mtime >= INDEX_RACY_NS:
+                self._indexes[folder] = index
+                return list(index[2])
+            record_ids = self._scan_ids(folder)
+            scanned = (folder_mtime, time.time_ns(), record_ids)
+            self._indexes[folder] = scanned
+            if index is None or index[0] != folder_mtime or index[2] != record_ids:
+                self._save_index(folder)
+            elif scanned[1] - folder_mtime >= INDEX_RACY_NS:
+                # Unchanged, and old enough now to be trusted next time.
+                self._save_index(folder)
+            return list(record_ids)
+
+    def _record_written(self, folder: Path, record_id: str) -> None:
+        with self._index_lock:
+            index = self._indexes.get(folder) or self._load_index(folder)
+            record_ids = list(index[2]) if index is not None else self._scan_ids(folder)
+            if record_id not in record_ids:
+                record_ids.append(record_id)
+                record_ids.sort(key=self._file_order)
+            self._indexes[folder] = (folder.stat().st_mtime_ns, time.time_ns(), record_ids)
+            self._save_index(folder)
+
+    def _load_index(self, folder: Path) -> Optional[tuple[int, int, list[str]]]:
+        try:
+            payload = json.loads(self._index_path(folder).read_text(encoding="utf-8"))
+            return int(payload["folder_mtime_ns"]), int(payload["written_ns"]), list(payload["record_ids"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _save_index(self, folder: Path) -> None:
+        if self._batch_depth:
+            self._dirty_indexes.add(folder)
+            return
+        folder_mtime, written, record_ids = self._indexes[folder]
+        path = self._index_path(folder)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # The index can always be rebuilt from the folder, so it is replaced
+        # atomically but not fsynced.
+        handle, temporary_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+        try:
+            with os.fdopen(handle, "w", encoding="utf-8") as stream:
+                json.dump(
+                    {"folder_mtime_ns": folder_mtime, "written_ns": written, "record_ids": record_ids},
+                    stream,
+                    ensure_ascii=False,
+                )
+            os.replace(temporary_name, path)
+        finally:
+            if os.path.exists(temporary_name):
+                os.unlink(temporary_name)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer index writes until the outermost batch ends; records are still written one by one."""
+
+        with self._index_lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._index_lock:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    dirty, self._dirty_indexes = self._dirty_indexes, set()
+                    for folder in sorted(dirty):
+                        self._save_index(folder)
 
     def save_unit(self, unit: CanonicalUnit) -> None:
         self._write_json(self.units_dir / f"{self._validate_id(unit.unit_id)}.json", unit)
@@ -180,7 +394,7 @@ class RepositoryStore:
 
     def knowledge_counts(self) -> Dict[str, int]:
         return {
-            collection: len(list(self.list_knowledge_records(collection)))
+            collection: len(self._record_ids(self.knowledge_dir / collection))
             for collection in KNOWLEDGE_COLLECTIONS
         }
 
@@ -13,7 +13,9 @@ from collections.abc import Callable, Mapping, Sequence
 from pathlib import Path
 from typing import Any, Literal, Protocol
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, model_validator
+
+from backend.pipeline.llm_response_cache import accept_response, reject_response
 
 from .knowledge_models import (
     CanonicalViewpointRecord,
@@ -1817,7 +1819,9 @@ class StructuredJsonReviewerAdapter:
 
     The wrapped Stage1 clients may retry transport failures internally.  This
     adapter invokes ``generate_json`` once, so an invalid semantic answer fails
-    the run instead of triggering repeated model calls until agreement.
+    the run instead of triggering repeated model calls until agreement.  An
+    answer that does not parse as ``response_model`` is never kept in the shared
+    response store; the caller still receives it for its failure artifact.
     """
 
     def __init__(
@@ -1843,9 +1847,16 @@ class StructuredJsonReviewerAdapter:
             "strict": True,
             "schema": _strict_json_schema(self._response_model.model_json_schema()),
         }
-        return self._client.generate_json(
+        raw = self._client.generate_json(
             system_prompt=self._prompt,
             user_prompt=json.dumps(payload, ensure_ascii=False, indent=2),
             json_schema=schema,
             temperature=0.0,
         )
+        try:
+            self._response_model.model_validate(raw)
+        except ValidationError:
+            reject_response(self._client)
+        else:
+            accept_response(self._client)
+        return raw
@@ -72,6 +72,12 @@ FELLOWSHIP_MEET_RECORDINGS_FOLDER_ID: Final[Optional[str]] = (
 FELLOWSHIP_CHAT_MIN_BYTES: Final[int] = int(os.getenv("FELLOWSHIP_CHAT_MIN_BYTES", "1024"))
 FELLOWSHIP_TRANSCRIBE_MODEL: Final[str] = os.getenv("FELLOWSHIP_TRANSCRIBE_MODEL", "gpt-4o-transcribe")
 FELLOWSHIP_TRANSCRIBE_DIARIZE_MODEL: Final[Optional[str]] = os.getenv("FELLOWSHIP_TRANSCRIBE_DIARIZE_MODEL")
+FELLOWSHIP_TRANSCRIBE_CONCURRENCY: Final[int] = max(1, int(os.getenv("FELLOWSHIP_TRANSCRIBE_CONCURRENCY", "4")))
+FELLOWSHIP_TRANSCRIPTION_CACHE_DIR: Final[Path] = Path(
+    os.getenv("FELLOWSHIP_TRANSCRIPTION_CACHE_DIR", DATA_BASE_PATH / "fellowship_transcription_cache")
+).resolve()
+FELLOWSHIP_TRANSCRIPTION_CACHE_MAX_ENTRIES: Final[int] = int(os.getenv("FELLOWSHIP_TRANSCRIPTION_CACHE_MAX_ENTRIES", "2000"))
+FELLOWSHIP_TRANSCRIPTION_CACHE_MAX_AGE_DAYS: Final[int] = int(os.getenv("FELLOWSHIP_TRANSCRIPTION_CACHE_MAX_AGE_DAYS", "30"))
 OPENAI_GENERATION_MODEL: Final[str] = os.getenv("OPENAI_GENERATION_MODEL", "gpt-5.6-sol")
 FELLOWSHIP_ANALYSIS_MODEL: Final[str] = os.getenv(
     "FELLOWSHIP_ANALYSIS_MODEL",
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
@@ -20,7 +21,7 @@ from .router import (
     micro_sermon_public_router,
 )
 from .slides import router as slides_router
-from .scripture import router as scripture_router
+from .scripture import close_http_client as close_scripture_http_client, router as scripture_router
 from .sc_api import router as sc_api_router
 from .sc_api.rag import router as rag_router
 from .sermon_converter_router import router as sermon_converter_router
@@ -39,7 +40,14 @@ from .wang_operations import router as wang_operations_router
 from .wang_articles import router as wang_articles_router
 from .viewpoint_admin import router as viewpoint_admin_router
 
-app = FastAPI()
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI):
+    yield
+    await close_scripture_http_client()
+
+
+app = FastAPI(lifespan=_lifespan)
 
 # Add CORS middleware
 app.add_middleware(
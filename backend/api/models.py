@@ -239,6 +239,8 @@ class FellowshipAnalysisJob(BaseModel):
     result_document_name: Optional[str] = Field(None, alias="resultDocumentName")
     error: Optional[str] = None
     content: Optional[FellowshipAnalysisContent] = None
+    transcription_chunks_total: Optional[int] = Field(None, alias="transcriptionChunksTotal")
+    transcription_chunks_completed: Optional[int] = Field(None, alias="transcriptionChunksCompleted")
 
     model_config = ConfigDict(populate_by_name=True)
 
@@ -97,9 +97,9 @@ class Copilot:
         question = history[-1].content
         prefix = "提取文字 at "
         if question.startswith(prefix):
-            i2t = ImageToText(docs[0].item)
             timestamp = int(question[len(prefix):])
-            res = i2t.extract_slide(timestamp)
+            with ImageToText(docs[0].item) as i2t:
+                res = i2t.extract_slide(timestamp)
             return ChatResponse(quotes=[], answer=res)
         else:
             history[-1].content = self.map_prompt( question )
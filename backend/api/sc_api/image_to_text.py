@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import json
 import os
-from typing import Optional
+import shutil
+import tempfile
+import threading
+from bisect import bisect_right
+from typing import Callable, List, Optional
 
 import cv2
 from google import genai
@@ -10,15 +15,152 @@ from google.genai import types
 from backend.api.config import DATA_BASE_PATH
 
 
+def _write_atomic(path: str, write: Callable[[str], None]) -> None:
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    descriptor, temporary = tempfile.mkstemp(prefix=".slide.", suffix=os.path.splitext(path)[1], dir=directory)
+    os.close(descriptor)
+    try:
+        write(temporary)
+        os.replace(temporary, path)
+    except Exception:
+        try:
+            os.unlink(temporary)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+class SlideCache:
+    """Slide frames and OCR text for one sermon video, stored on disk.
+
+    Entries are keyed by the start of the detected scene containing the
+    requested timestamp, so every request while one slide is on screen
+    shares an entry. Until scenes have been detected the exact timestamp is
+    the key. Everything is dropped when the video's size or mtime changes.
+    """
+
+    def __init__(self, root: str, video_path: str) -> None:
+        self.root = root
+        self.video_path = video_path
+        self._scenes: Optional[List[int]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def index_path(self) -> str:
+        return os.path.join(self.root, "scenes.json")
+
+    def _video_stamp(self) -> Optional[List[int]]:
+        try:
+            stat = os.stat(self.video_path)
+        except FileNotFoundError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def scenes(self) -> List[int]:
+        """Detected scene starts; also resets the cache if the video changed."""
+        with self._lock:
+            if self._scenes is not None:
+                return self._scenes
+            index = {}
+            if os.path.exists(self.index_path):
+                with open(self.index_path, "r", encoding="utf-8") as f:
+                    index = json.load(f)
+            if index.get("video") != self._video_stamp():
+                shutil.rmtree(self.root, ignore_errors=True)
+                index = {}
+                os.makedirs(self.root, exist_ok=True)
+                self._write_index([], detected=False)
+            self._scenes = sorted(index.get("scenes") or []) if index.get("detected") else []
+            return self._scenes
+
+    def _write_index(self, scenes: List[int], *, detected: bool) -> None:
+        payload = {"video": self._video_stamp(), "detected": detected, "scenes": scenes}
+
+        def write(path: str) -> None:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+
+        _write_atomic(self.index_path, write)
+
+    def set_scenes(self, scenes: List[int]) -> None:
+        self.scenes()
+        with self._lock:
+            self._write_index(sorted(scenes), detected=True)
+            self._scenes = sorted(scenes)
+
+    def key(self, timestamp: int) -> int:
+        scenes = self.scenes()
+        position = bisect_right(scenes, timestamp)
+        return scenes[position - 1] if position else timestamp
+
+    def frame_path(self, key: int) -> str:
+        return os.path.join(self.root, f"frame-{key}.jpg")
+
+    def text_path(self, key: int) -> str:
+        return os.path.join(self.root, f"text-{key}.md")
+
+    def get_frame(self, key: int):
+        path = self.frame_path(key)
+        return cv2.imread(path) if os.path.exists(path) else None
+
+    def put_frame(self, key: int, frame) -> None:
+        _write_atomic(self.frame_path(key), lambda path: cv2.imwrite(path, frame, [cv2.IMWRITE_JPEG_QUALITY, 90]))
+
+    def get_text(self, key: int) -> Optional[str]:
+        path = self.text_path(key)
+        if not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+
+    def put_text(self, key: int, text: str) -> None:
+        def write(path: str) -> None:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+
+        _write_atomic(self.text_path(key), write)
+
+
 class ImageToText:
     def __init__(self, item_name: str) -> None:
         self.base_dir = str(DATA_BASE_PATH)
         self.item_name = item_name
         item_name_mp4 = f"{item_name}.mp4"
         self.video_path = os.path.join(self.base_dir, "video", item_name_mp4)
-        self._client = genai.Client()
+        self.cache = SlideCache(os.path.join(self.base_dir, "slide_cache", item_name), self.video_path)
+        self._client = None
+        self._capture = None
         self._model_name = "gemini-2.5-pro"
 
+    @property
+    def client(self):
+        # Created on first OCR call; cache hits never need it.
+        if self._client is None:
+            self._client = genai.Client()
+        return self._client
+
+    def __enter__(self) -> "ImageToText":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._capture is not None:
+            self._capture.release()
+            self._capture = None
+
+    def __del__(self) -> None:
+        if getattr(self, "_capture", None) is not None:
+            self.close()
+
+    def _video(self):
+        # One decoder handle per extractor, reused across lookups.
+        if self._capture is None:
+            self._capture = cv2.VideoCapture(self.video_path)
+        return self._capture
+
     def extract_text_from_frame(self, frame, *, as_markdown: bool = True) -> Optional[str]:
         if frame is None:
             return None
@@ -40,7 +182,7 @@ class ImageToText:
             )
         )
         try:
-            response = self._client.models.generate_content(
+            response = self.client.models.generate_content(
                 model=self._model_name,
                 contents=[
                     types.Content(
@@ -62,29 +204,87 @@ class ImageToText:
         text = getattr(response, "text", None)
         return text.strip() if isinstance(text, str) and text.strip() else None
 
-    def extract_slide_image(self, timestamp: int):
-        video = cv2.VideoCapture(self.video_path)
+    def _decode_frame(self, timestamp: int):
+        video = self._video()
         video.set(cv2.CAP_PROP_POS_MSEC, timestamp)
         success, frame = video.read()
-        video.release()
         if not success:
             return None
 
         # Potential future ROI extraction can be added here.
         return frame
 
+    def extract_slide_image(self, timestamp: int):
+        key = self.cache.key(timestamp)
+        frame = self.cache.get_frame(key)
+        if frame is None:
+            frame = self._decode_frame(timestamp)
+            if frame is not None:
+                self.cache.put_frame(key, frame)
+        return frame
+
     def extract_slide(self, timestamp: int) -> Optional[str]:
-        frame = self.extract_slide_image(timestamp)
-        return self.extract_text_from_frame(frame)
+        key = self.cache.key(timestamp)
+        text = self.cache.get_text(key)
+        if text is None:
+            text = self.extract_text_from_frame(self.extract_slide_image(timestamp))
+            if text:
+                self.cache.put_text(key, text)
+        return text
 
     def get_slide_image_url(self, script_base_dir: str, timestamp: int) -> Optional[str]:
+        img_path = f"{self.item_name}-{timestamp}.jpg"
+        target = os.path.join(script_base_dir, "script_review", img_path)
+        key = self.cache.key(timestamp)
+        if os.path.exists(self.cache.frame_path(key)):
+            if not os.path.exists(target):
+                shutil.copyfile(self.cache.frame_path(key), target)
+            return f"data/script_review/{img_path}"
         frame = self.extract_slide_image(timestamp)
         if frame is None:
             return None
-        img_path = f"{self.item_name}-{timestamp}.jpg"
-        cv2.imwrite(os.path.join(script_base_dir, "script_review", img_path), frame)
+        cv2.imwrite(target, frame)
         return f"data/script_review/{img_path}"
 
+    def detect_scenes(self, sample_ms: int = 2000, threshold: float = 12.0) -> List[int]:
+        """Timestamps (ms) where the picture changes, sampled every ``sample_ms``.
+
+        Frames are read sequentially with ``grab`` and only the samples are
+        decoded; a sample starts a new scene when its mean absolute
+        difference from the previous sample, on a 64x36 grayscale
+        thumbnail, exceeds ``threshold``.
+        """
+        self.cache.scenes()
+        video = self._video()
+        video.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        fps = video.get(cv2.CAP_PROP_FPS) or 30.0
+        step = max(1, int(round(fps * sample_ms / 1000.0)))
+        scenes: List[int] = []
+        previous = None
+        index = 0
+        while video.grab():
+            if index % step == 0:
+                success, frame = video.retrieve()
+                if not success:
+                    break
+                small = cv2.resize(cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY), (64, 36)).astype("float32")
+                if previous is None or float(abs(small - previous).mean()) > threshold:
+                    timestamp = int(round(index * 1000.0 / fps))
+                    scenes.append(timestamp)
+                    self.cache.put_frame(timestamp, frame)
+                previous = small
+            index += 1
+        self.cache.set_scenes(scenes)
+        return scenes
+
+    def prewarm(self, *, ocr: bool = True, sample_ms: int = 2000) -> List[int]:
+        """Detect every scene, cache its frame and (optionally) its OCR text."""
+        scenes = self.detect_scenes(sample_ms=sample_ms)
+        if ocr:
+            for timestamp in scenes:
+                self.extract_slide(timestamp)
+        return scenes
+
 
 if __name__ == "__main__":
     item_name = "S 190512-GH020035"
@@ -0,0 +1,113 @@
+"""Phrase lookup and text alignment for published scripts.
+
+``PhraseIndex`` keeps a bigram postings list over a script's paragraphs, so
+locating a quoted phrase only aligns it against the few windows its bigrams
+point at instead of diffing every paragraph. ``align`` pins two texts
+together at k-grams that occur exactly once in each and runs Myers only
+between those anchors.
+"""
+
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from typing import Optional, Sequence
+
+from .text_diff import matched_pairs
+
+
+def _unique_grams(text: str, k: int) -> dict[str, int]:
+    counts = Counter(text[i: i + k] for i in range(len(text) - k + 1))
+    return {text[i: i + k]: i for i in range(len(text) - k + 1) if counts[text[i: i + k]] == 1}
+
+
+def _increasing_chain(anchors: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Longest run of anchors increasing in both texts (patience sorting)."""
+    tails: list[int] = []
+    tail_index: list[int] = []
+    previous = [-1] * len(anchors)
+    for n, (_, j) in enumerate(anchors):
+        slot = bisect_left(tails, j)
+        if slot == len(tails):
+            tails.append(j)
+            tail_index.append(n)
+        else:
+            tails[slot] = j
+            tail_index[slot] = n
+        previous[n] = tail_index[slot - 1] if slot else -1
+    chain = []
+    n = tail_index[-1] if tail_index else -1
+    while n >= 0:
+        chain.append(anchors[n])
+        n = previous[n]
+    chain.reverse()
+    return chain
+
+
+def align(a: str, b: str, k: int = 4) -> list[tuple[int, int]]:
+    """Matched index pairs ``(i, j)``, ``a[i] == b[j]``, increasing in both."""
+    in_b = _unique_grams(b, k)
+    anchors = sorted((i, in_b[gram]) for gram, i in _unique_grams(a, k).items() if gram in in_b)
+    pairs: list[tuple[int, int]] = []
+    x = y = 0
+    for i, j in _increasing_chain(anchors):
+        if i < x or j < y:
+            continue  # already covered by the previous anchor's extension
+        pairs.extend((x + p, y + q) for p, q in matched_pairs(a[x:i], b[y:j]))
+        while i < len(a) and j < len(b) and a[i] == b[j]:
+            pairs.append((i, j))
+            i += 1
+            j += 1
+        x, y = i, j
+    pairs.extend((x + p, y + q) for p, q in matched_pairs(a[x:], b[y:]))
+    return pairs
+
+
+class PhraseIndex:
+    def __init__(self, texts: Sequence[str], n: int = 2, candidates_per_text: int = 3) -> None:
+        self.texts = list(texts)
+        self.n = n
+        self.candidates_per_text = candidates_per_text
+        self.postings: dict[str, list[tuple[int, int]]] = defaultdict(list)
+        for t, text in enumerate(self.texts):
+            for pos in range(len(text) - n + 1):
+                self.postings[text[pos: pos + n]].append((t, pos))
+
+    @staticmethod
+    def score(phrase: str, unmatched: int) -> float:
+        """The ratio ``ScriptDelta.search`` has always thresholded.
+
+        It compared the phrase with itself rebuilt from the diff, where
+        unmatched characters carry a '+' marker and whitespace is stripped.
+        """
+        spaces = sum(ch.isspace() for ch in phrase)
+        total = 2 * len(phrase) - spaces + unmatched
+        return 2 * (len(phrase) - spaces) / total if total else 1.0
+
+    def locate(self, phrase: str, threshold: float = 0.9) -> Optional[int]:
+        """Index of the first text that contains ``phrase`` closely enough."""
+        if len(phrase) < self.n:
+            return next((t for t, text in enumerate(self.texts) if phrase in text), None)
+
+        votes: dict[int, Counter] = defaultdict(Counter)
+        for offset in range(len(phrase) - self.n + 1):
+            for t, pos in self.postings.get(phrase[offset: offset + self.n], ()):
+                votes[t][pos - offset] += 1
+
+        # Each unmatched phrase character breaks at most two of its bigrams and
+        # each stray character in between at most one more, so a window that can
+        # reach the threshold collects at least ``min_votes`` bigram hits.
+        max_unmatched = 0
+        while max_unmatched < len(phrase) and self.score(phrase, max_unmatched + 1) >= threshold:
+            max_unmatched += 1
+        min_votes = len(phrase) - self.n + 1 - 3 * max_unmatched
+        slack = max_unmatched + 1
+        for t in sorted(votes):
+            text = self.texts[t]
+            diagonals = votes[t]
+            for start, _ in diagonals.most_common(self.candidates_per_text):
+                if sum(diagonals[d] for d in range(start - slack, start + slack + 1)) < min_votes:
+                    continue
+                window = text[max(0, start - slack): start + len(phrase) + slack]
+                unmatched = len(phrase) - len(matched_pairs(phrase, window))
+                if self.score(phrase, unmatched) >= threshold:
+                    return t
+        return None
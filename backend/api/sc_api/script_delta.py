@@ -1,13 +1,63 @@
 import json
-import difflib
 import jsonlines
 import os
 import math
 import re
 import datetime
 import tempfile
+import threading
+import copy
+from collections import OrderedDict
 
 from .sentence_splitter import SentenceSplitter
+from .phrase_index import PhraseIndex
+from .text_diff import is_similar, tagged_diff
+
+
+class _CompiledScriptCache:
+    """Per-item results keyed on the (inode, mtime, size) of their source files.
+
+    ``save_rows`` replaces files atomically, so any save changes the stamp and
+    the next read recompiles.
+    """
+
+    def __init__(self, max_entries: int = 64) -> None:
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def stamp(*paths):
+        stamps = []
+        for path in paths:
+            st = os.stat(path)
+            stamps.append((st.st_ino, st.st_mtime_ns, st.st_size))
+        return tuple(stamps)
+
+    def get(self, key, stamp):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != stamp:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key, stamp, value):
+        with self._lock:
+            self._entries[key] = (stamp, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_timeline_cache = _CompiledScriptCache(max_entries=128)
+_changes_cache = _CompiledScriptCache(max_entries=32)
+_phrase_index_cache = _CompiledScriptCache(max_entries=32)
+
 
 class ScriptDelta:
 
@@ -35,14 +85,24 @@ class ScriptDelta:
 
 
     def loadTimeline(self):
-        with open(self.base_folder +  '/script/' + self.item_name + '.json', 'r') as f:           
+        # The linked timeline is only read after this point, so instances
+        # share one compiled copy until script/<item>.json changes.
+        path = self.base_folder +  '/script/' + self.item_name + '.json'
+        stamp = _CompiledScriptCache.stamp(path)
+        timeline = _timeline_cache.get(path, stamp)
+        if timeline is not None:
+            return timeline
+
+        with open(path, 'r') as f:           
             timeData = json.load(f) 
 
             timelineData = timeData['entries']  
             for i in range(1, len(timelineData)):
                 timelineData[i-1]['next_item'] = timelineData[i]['index'] if i < len(timelineData) else None
 
-            return  { t['index'] : t  for t in  timelineData }
+            timeline = { t['index'] : t  for t in  timelineData }
+        _timeline_cache.put(path, stamp, timeline)
+        return timeline
             
 
     def get_end_tag(self, tag:str):
@@ -139,14 +199,29 @@ class ScriptDelta:
         if p2.get('type') == 'comment': 
             return False
         
-        ratio = difflib.SequenceMatcher(None, p1['text'], p2['text']).ratio() 
-        if ratio > 0.8:        
+        if is_similar(p1['text'], p2['text'], 0.8):
             return True
         return  p1['index'] == p2['index']
 
 
 
     def getChanges(self):
+        paths = [ self.base_folder + '/' + folder + '/' + self.item_name + '.json' for folder in ('script', 'script_patched', 'script_review') ]
+        stamp = _CompiledScriptCache.stamp(*paths)
+        # computeChanges leaves self.patched (with its timeline) and
+        # self.review loaded, and some changes are rows of self.patched; keep
+        # all three together so a hit leaves the instance as a miss does.
+        cached = _changes_cache.get(paths[0], stamp)
+        if cached is None:
+            changes = self.computeChanges()
+            cached = copy.deepcopy((changes, self.patched, self.review))
+            _changes_cache.put(paths[0], stamp, cached)
+            return changes
+        # Callers decorate paragraphs (user names on comments), so hand out copies.
+        changes, self.patched, self.review = copy.deepcopy(cached)
+        return changes
+
+    def computeChanges(self):
 
         paragraphs_patched = self.loadPatchedScript()
         paragraphs_review = self.loadReviewScript()
@@ -159,20 +234,7 @@ class ScriptDelta:
         script_changes = []
         while iPatched < len_patched and iReview < len_review:    
             while iPatched < len_patched and iReview < len_review and  self.compare_text(iPatched, iReview):
-                diff = difflib.Differ().compare(paragraphs_patched[iPatched], paragraphs_review[iReview])
-                line = []
-                change_tag = ''
-                for ele in diff:
-                    if ele.startswith('-'):
-                        change_tag = self.set_tag(change_tag, line,'<->')
-                        line.append( ele.replace('-','').strip() )  
-                    elif ele.startswith('+'):
-                        change_tag = self.set_tag(change_tag, line,'<+>')
-                        line.append( ele.replace('+','').strip() )  
-                    else:
-                        change_tag = self.set_tag(change_tag, line,'')
-                        line.append( ele.strip() )  
-                para = self.create_paragraph(self.patched[iPatched], ''.join(line) ) 
+                para = self.create_paragraph(self.patched[iPatched], tagged_diff(paragraphs_patched[iPatched], paragraphs_review[iReview]) ) 
                 script_changes.append(para)
                 iPatched += 1
                 iReview += 1
@@ -317,29 +379,25 @@ class ScriptDelta:
 
 
     def search(self, text_list:list[str]):
-        published_script = self.get_final_script(True)
+        path = self.base_folder + '/script_published/' + self.item_name + '.json'
+        stamp = _CompiledScriptCache.stamp(path)
+        compiled = _phrase_index_cache.get(path, stamp)
+        if compiled is None:
+            # loadPublishedScript keeps only the text, so read the rows directly
+            # to keep their start_index; text is cleaned as get_clean_script does.
+            with open(path, 'r') as file1:
+                rows = json.load(file1)['script']
+            paragraphs = [ (p.get('start_index'), ScriptDelta.remove_format(p.get('text') or '')) for p in rows ]
+            paragraphs = [ (start_index, text) for start_index, text in paragraphs if text ]
+            compiled = ( [ start_index for start_index, _ in paragraphs ], PhraseIndex([ text for _, text in paragraphs ]) )
+            _phrase_index_cache.put(path, stamp, compiled)
+
+        start_indexes, index = compiled
         match_result = {}
         for text in text_list:
-            text2 = text + '~'
-            for p in published_script['script']:
-                if not p['text']:
-                    continue 
-                diff = difflib.Differ().compare(p['text'], text2)
-                line = []
-                for ele in diff:
-                    if ele.startswith('-'):
-                        pass
-                    elif ele.startswith('+'):
-                        ch = ele.strip()
-                        if ch.find('~') >= 0:
-                            break
-                        line.append( ch.replace(' ','') )  
-                    else:
-                        line.append( ele.strip() )
-                changed_text = ''.join(line)  
-                if difflib.SequenceMatcher(None, text, changed_text).ratio() >= 0.9:
-                    match_result[text] =  p['start_index'] 
-                    break
+            found = index.locate(text, 0.9)
+            if found is not None:
+                match_result[text] = start_indexes[found]
 
         return match_result 
 
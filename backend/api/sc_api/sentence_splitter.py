@@ -1,6 +1,7 @@
-import difflib
 import re
 
+from .phrase_index import align
+
 class SentenceSplitter:
     def __init__(self, timelineDictionary:dict):
         self.timelineDictionary = timelineDictionary
@@ -39,29 +40,17 @@ class SentenceSplitter:
     def split_sentences(self, paragraph):
         org_text, sec_indx = self.get_original_text_timeline(paragraph)
         new_text, positions = self.get_sentence_positions(paragraph['text'])
-        diff = difflib.Differ().compare(org_text, new_text)
-        line = []
-        org_idx = 0
-        new_idx = 0
-        match_pos = []
-        for ele in diff:
-            if ele.startswith('-'):
-                org_idx += len(ele[2:])   
-            elif ele.startswith('+'):
-                new_idx += len(ele[2:])    
-            else:
-                match_pos.append((org_idx,new_idx))
-                org_idx += 1
-                new_idx += 1
+        match_pos = align(org_text, new_text)
+        # new_text positions increase along match_pos, so each maps to one match.
+        match_at = { m[1]: i for i, m in enumerate(match_pos) }
 
         sentence_tl = []
         start_time = paragraph['start_time']
         for j, pos in enumerate(positions):
-            m = next(( m for i, m in enumerate(match_pos) if 
-                      m[1] == pos and 
-                      match_pos[i-1][1] == pos-1 and
-                      ( i+1 >= len(match_pos) or match_pos[i+1][1] == pos+1)                        
-                      ), None)
+            i = match_at.get(pos)
+            m = None
+            if i is not None and match_pos[i-1][1] == pos-1 and ( i+1 >= len(match_pos) or match_pos[i+1][1] == pos+1):
+                m = match_pos[i]
             if m:
                 org_sec = sec_indx[m[0]]
                 sentence_tl.append({
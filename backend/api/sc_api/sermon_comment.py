@@ -1,41 +1,38 @@
 import os
-import json
+import threading
 from backend.api.config import DATA_BASE_DIR
 
+from .user_state import UserStateStore
+
 class SermonCommentManager:
     
     def __init__(self):
         self.bookmark_file = os.path.join(DATA_BASE_DIR, 'bookmark', 'bookmark.json')
-
-    def _load_bookmarks(self):
-        if not os.path.exists(self.bookmark_file):
-            return {}
-        try:
-            with open(self.bookmark_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception:
-            return {}
-
-    def _save_bookmarks(self, bookmarks):
-        os.makedirs(os.path.dirname(self.bookmark_file), exist_ok=True)
-        with open(self.bookmark_file, 'w', encoding='utf-8') as f:
-            json.dump(bookmarks, f, ensure_ascii=False, indent=4)
+        self._store = None
+        self._store_lock = threading.Lock()
+
+    @property
+    def store(self) -> UserStateStore:
+        # Opened lazily next to the legacy bookmark.json, whose entries are
+        # imported the first time the store is opened.
+        path = os.path.join(os.path.dirname(self.bookmark_file), 'user_state.sqlite3')
+        with self._store_lock:
+            if self._store is None or self._store.path != path:
+                store = UserStateStore(path)
+                store.migrate_json('bookmark', self.bookmark_file)
+                self._store = store
+            return self._store
 
     def get_key(self, user_id:str, item:str):
         return f"{user_id}/{item}"
 
     def set_bookmark(self, user_id:str, item:str, index:str):
-        bookmarks = self._load_bookmarks()
-        key = self.get_key(user_id, item)
-        bookmarks[key] = {
+        self.store.set('bookmark', self.get_key(user_id, item), {
             'index': index
-        }
-        self._save_bookmarks(bookmarks)
+        })
 
     def get_bookmark(self, user_id:str, item:str):
-        bookmarks = self._load_bookmarks()
-        key = self.get_key(user_id, item)
-        return bookmarks.get(key, {})
+        return self.store.get('bookmark', self.get_key(user_id, item), {})
 
 
     def add_comment(self, user_id:str, item:str, comment:str)->str:
@@ -161,8 +161,8 @@ class SermonManager:
         if not permissions.canRead:
             return {"message": "You don't have read permission"}
         
-        i2t = ImageToText(item)
-        txt = i2t.extract_slide(timestamp)
+        with ImageToText(item) as i2t:
+            txt = i2t.extract_slide(timestamp)
         return {'text': txt}
         
     def get_slide_image(self, user_id:str, item:str, timestamp:int):
@@ -170,8 +170,8 @@ class SermonManager:
         if not permissions.canWrite:
             return {"message": "You don't have read permission"}
         
-        i2t = ImageToText(item)
-        img_url = i2t.get_slide_image_url(self.base_folder, timestamp)
+        with ImageToText(item) as i2t:
+            img_url = i2t.get_slide_image_url(self.base_folder, timestamp)
         return {'image_url': img_url}
 
 
@@ -0,0 +1,187 @@
+"""Transcript diffs: review-page markup and phrase alignment.
+
+Review pages compare the patched transcript with the reviewer's edits
+paragraph by paragraph and must render exactly what ``difflib.Differ`` did.
+``tagged_diff`` keeps Differ's SequenceMatcher opcodes but settles each
+replaced block without Differ's per-character-pair scoring, which was
+quadratic in the block and never changed the outcome for characters.
+
+``matched_pairs`` aligns phrases with Myers' O((N+M)D) algorithm, where any
+shortest edit script will do.
+"""
+
+from difflib import SequenceMatcher
+
+DELETE_TAG = '<->'
+INSERT_TAG = '<+>'
+END_TAG = '</>'
+
+
+def _edit_script(a, b):
+    """Myers' greedy forward search; returns (op, token) pairs."""
+    n, m = len(a), len(b)
+    limit = n + m
+    offset = limit + 1
+    v = [0] * (2 * limit + 3)
+    trace = []
+    for d in range(limit + 1):
+        trace.append(v[offset - d - 1: offset + d + 2])
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[offset + k - 1] < v[offset + k + 1]):
+                x = v[offset + k + 1]
+            else:
+                x = v[offset + k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[offset + k] = x
+            if x >= n and y >= m:
+                return _backtrack(a, b, trace, d)
+
+
+def _backtrack(a, b, trace, d):
+    ops = []
+    x, y = len(a), len(b)
+    for depth in range(d, 0, -1):
+        # trace[depth] is V before round ``depth``, stored for k in [-depth-1, depth+1].
+        snapshot = trace[depth]
+        base = depth + 1
+        k = x - y
+        if k == -depth or (k != depth and snapshot[base + k - 1] < snapshot[base + k + 1]):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = snapshot[base + prev_k]
+        prev_y = prev_x - prev_k
+        while x > prev_x and y > prev_y:
+            x -= 1
+            y -= 1
+            ops.append((' ', a[x]))
+        if x == prev_x:
+            y -= 1
+            ops.append(('+', b[y]))
+        else:
+            x -= 1
+            ops.append(('-', a[x]))
+    while x > 0 and y > 0:
+        x -= 1
+        y -= 1
+        ops.append((' ', a[x]))
+    ops.reverse()
+    return ops
+
+
+def _trimmed(a, b):
+    prefix = 0
+    limit = min(len(a), len(b))
+    while prefix < limit and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    limit -= prefix
+    while suffix < limit and a[-1 - suffix] == b[-1 - suffix]:
+        suffix += 1
+    return prefix, suffix
+
+
+def matched_pairs(a, b) -> list[tuple[int, int]]:
+    """Index pairs ``(i, j)`` with ``a[i] == b[j]`` on a shortest edit script."""
+    prefix, suffix = _trimmed(a, b)
+    pairs = [(i, i) for i in range(prefix)]
+    x = y = prefix
+    for op, _ in _edit_script(a[prefix: len(a) - suffix], b[prefix: len(b) - suffix]):
+        if op == ' ':
+            pairs.append((x, y))
+        if op != '+':
+            x += 1
+        if op != '-':
+            y += 1
+    pairs.extend((x + i, y + i) for i in range(suffix))
+    return pairs
+
+
+def _differ_ops(a: str, b: str):
+    """``difflib.Differ().compare(a, b)`` over characters, as ``(op, char)`` pairs.
+
+    Differ runs ``_fancy_replace`` on every replaced block: it scores each
+    character pair of the block with a SequenceMatcher, which is where the
+    quadratic time went.  Two different characters always score 0, below the
+    0.75 cutoff, so the search only ever finds the first identical pair, in
+    Differ's order (``b`` outer, ``a`` inner).  That pair is the sync point;
+    with none, the block is a plain replace, shorter side first.
+    """
+    for tag, alo, ahi, blo, bhi in SequenceMatcher(None, a, b).get_opcodes():
+        if tag == 'equal':
+            yield from ((' ', ch) for ch in a[alo:ahi])
+        elif tag == 'delete':
+            yield from (('-', ch) for ch in a[alo:ahi])
+        elif tag == 'insert':
+            yield from (('+', ch) for ch in b[blo:bhi])
+        else:
+            yield from _replace_ops(a, alo, ahi, b, blo, bhi)
+
+
+def _replace_ops(a, alo, ahi, b, blo, bhi):
+    # Differ recurses on both sides of a sync point; a stack of pending
+    # blocks keeps long paragraphs clear of the recursion limit.
+    stack = [('block', alo, ahi, blo, bhi)]
+    while stack:
+        kind, alo, ahi, blo, bhi = stack.pop()
+        if kind == 'same':
+            yield (' ', a[alo])
+            continue
+        if alo >= ahi:
+            yield from (('+', ch) for ch in b[blo:bhi])
+            continue
+        if blo >= bhi:
+            yield from (('-', ch) for ch in a[alo:ahi])
+            continue
+        first = {}
+        for i in range(alo, ahi):
+            first.setdefault(a[i], i)
+        sync = next(((first[b[j]], j) for j in range(blo, bhi) if b[j] in first), None)
+        if sync is None:
+            if bhi - blo < ahi - alo:
+                yield from (('+', ch) for ch in b[blo:bhi])
+                yield from (('-', ch) for ch in a[alo:ahi])
+            else:
+                yield from (('-', ch) for ch in a[alo:ahi])
+                yield from (('+', ch) for ch in b[blo:bhi])
+            continue
+        i, j = sync
+        stack.append(('block', i + 1, ahi, j + 1, bhi))
+        stack.append(('same', i, i + 1, j, j + 1))
+        stack.append(('block', alo, i, blo, j))
+
+
+def tagged_diff(old: str, new: str) -> str:
+    """Render ``old`` -> ``new`` with ``<->`` / ``<+>`` ... ``</>`` change tags.
+
+    Exactly the markup the Differ loop produced: each character is stripped
+    and loses its own diff marker with ``str.replace``, so whitespace drops
+    out everywhere and '-' / '+' drop out of deleted / inserted text.
+    """
+    line = []
+    current = ''
+    for op, ch in _differ_ops(old, new):
+        tag = DELETE_TAG if op == '-' else INSERT_TAG if op == '+' else ''
+        if tag != current:
+            line.append(END_TAG if current else '')
+            line.append(tag)
+            current = tag
+        line.append((ch.replace(op, '') if op != ' ' else ch).strip())
+    return ''.join(line)
+
+
+def is_similar(a: str, b: str, threshold: float = 0.8) -> bool:
+    """True when ``SequenceMatcher(None, a, b).ratio()`` exceeds ``threshold``.
+
+    The two cheap upper bounds reject most dissimilar pairs before the
+    matching blocks are computed.
+    """
+    matcher = SequenceMatcher(None, a, b)
+    return (
+        matcher.real_quick_ratio() > threshold
+        and matcher.quick_ratio() > threshold
+        and matcher.ratio() > threshold
+    )
@@ -0,0 +1,119 @@
+"""Per-user reading state (bookmarks and the like) in a small SQLite store.
+
+Each value is one row keyed by (namespace, key), so an update is a single
+upsert instead of a rewrite of every user's state. The database runs in WAL
+mode, which lets readers proceed during a write and serializes writers from
+concurrent requests or worker processes. Reads are served from an in-memory
+cache that is dropped whenever SQLite's ``data_version`` shows another
+connection committed.
+"""
+
+import copy
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+class UserStateStore:
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._conn = None
+        self._data_version = None
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS user_state (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                ) WITHOUT ROWID;
+
+                CREATE TABLE IF NOT EXISTS migrations (
+                    name TEXT PRIMARY KEY,
+                    applied_at REAL NOT NULL
+                );
+                """
+            )
+            self._conn = conn
+        return self._conn
+
+    def _sync_cache(self, conn: sqlite3.Connection) -> None:
+        # data_version changes only when another connection commits, so our
+        # own writes keep the cache and anyone else's clears it.
+        version = conn.execute('PRAGMA data_version').fetchone()[0]
+        if version != self._data_version:
+            self._cache.clear()
+            self._data_version = version
+
+    def get(self, namespace: str, key: str, default=None):
+        with self._lock:
+            conn = self._connection()
+            self._sync_cache(conn)
+            cache_key = (namespace, key)
+            if cache_key not in self._cache:
+                row = conn.execute(
+                    'SELECT value FROM user_state WHERE namespace = ? AND key = ?', (namespace, key)
+                ).fetchone()
+                self._cache[cache_key] = json.loads(row[0]) if row else None
+            value = self._cache[cache_key]
+        return default if value is None else copy.deepcopy(value)
+
+    def set(self, namespace: str, key: str, value) -> None:
+        encoded = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            conn = self._connection()
+            self._sync_cache(conn)
+            with conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO user_state(namespace, key, value, updated_at) VALUES (?, ?, ?, ?)',
+                    (namespace, key, encoded, time.time()),
+                )
+            self._cache[(namespace, key)] = json.loads(encoded)
+
+    def migrate_json(self, namespace: str, json_path: str) -> int:
+        """Import a legacy ``{key: value}`` JSON file once; later calls are no-ops.
+
+        Keys already in the store win, and the JSON file is left in place.
+        """
+        name = f'{namespace}:{os.path.abspath(json_path)}'
+        with self._lock:
+            conn = self._connection()
+            if conn.execute('SELECT 1 FROM migrations WHERE name = ?', (name,)).fetchone():
+                return 0
+            entries = {}
+            if os.path.exists(json_path):
+                try:
+                    with open(json_path, 'r', encoding='utf-8') as f:
+                        entries = json.load(f)
+                except Exception:
+                    entries = {}
+            if not isinstance(entries, dict):
+                entries = {}
+            now = time.time()
+            with conn:
+                cursor = conn.executemany(
+                    'INSERT OR IGNORE INTO user_state(namespace, key, value, updated_at) VALUES (?, ?, ?, ?)',
+                    [(namespace, key, json.dumps(value, ensure_ascii=False), now) for key, value in entries.items()],
+                )
+                conn.execute('INSERT OR IGNORE INTO migrations(name, applied_at) VALUES (?, ?)', (name, now))
+            self._cache.clear()
+        return max(cursor.rowcount, 0)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
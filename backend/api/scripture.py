@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import re
-from typing import Dict, Optional
+from pathlib import Path
+from typing import Dict, Iterator, Optional
 from urllib.parse import quote_plus
 
 import httpx
 from fastapi import APIRouter, HTTPException
 
+from .scripture_store import VerseRow, osis_range, scripture_store
+
 BOOK_TO_OSIS: Dict[str, str] = {
     "GEN": "Gen",
     "EXO": "Exod",
@@ -682,34 +686,119 @@ async def fetch_bible_api(
     return f"<p>{html}</p>"
 
 
+_http_clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+
+def _http_client() -> httpx.AsyncClient:
+    """The pooled client for the running event loop.
+
+    An AsyncClient's connections belong to the loop that opened them, so the
+    client is shared per loop rather than per process.
+    """
+    loop = asyncio.get_running_loop()
+    for stale in [other for other in _http_clients if other.is_closed()]:
+        del _http_clients[stale]
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=10,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+        _http_clients[loop] = client
+    return client
+
+
+async def close_http_client() -> None:
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def _render_lines(lines: list[str]) -> str:
+    return f"<p>{'<br/>'.join(lines)}</p>"
+
+
+async def _cached_bible_api(info: Dict[str, object], translation: Optional[str], label: str) -> str:
+    """Imported verses, else a cached response, else bible-api.com (then cached)."""
+    if not translation:
+        return ""
+    osis_book = BOOK_TO_OSIS[str(info["slug_book"])]
+    chapter, start, end = int(info["chapter"]), int(info["start"]), int(info["end"])
+    store = scripture_store()
+    verses = store.get_verses(translation, osis_book, chapter, start, end)
+    if verses:
+        return _render_lines([text for _, text in verses])
+    reference = osis_range(osis_book, chapter, start, end)
+    cached = store.get_passage(translation, reference)
+    if cached is not None:
+        return cached
+    try:
+        content = await fetch_bible_api(_http_client(), str(info["slug_book"]), chapter, start, end, translation)
+    except httpx.HTTPError as exc:
+        print(f"Failed to fetch {label} passage: {exc}")
+        return ""
+    if content:
+        store.put_passage(translation, reference, content)
+    return content
+
+
+async def _cached_original(info: Dict[str, object], lang: str, bible_id: str) -> str:
+    osis_book = BOOK_TO_OSIS[str(info["slug_book"])]
+    chapter, start, end = int(info["chapter"]), int(info["start"]), int(info["end"])
+    store = scripture_store()
+    verses = store.get_verses(bible_id, osis_book, chapter, start, end)
+    if verses:
+        return " ".join(f"[{verse}] {text}" for verse, text in verses)
+    reference = osis_range(osis_book, chapter, start, end)
+    cached = store.get_passage(bible_id, reference)
+    if cached is not None:
+        return cached
+    try:
+        book_slug = info["slug_book"]
+        verse_part = f"{book_slug}.{chapter}.{start}-{book_slug}.{chapter}.{end}" if end != start else f"{chapter}:{start}"
+        content = await fetch_passage(_http_client(), bible_id, quote_plus(verse_part))
+    except httpx.HTTPError as exc:
+        print(f"Failed to fetch passage for {lang}: {exc}")
+        return ""
+    if content:
+        store.put_passage(bible_id, reference, content)
+    return content
+
+
+def read_bible_text(path: Path) -> Iterator[VerseRow]:
+    """Parse a bulk Bible text file of ``book<TAB>chapter<TAB>verse<TAB>text`` lines.
+
+    Books may be OSIS ids (Matt), USFM codes (MAT), slugs, English or Chinese
+    names. Blank lines and lines starting with ``#`` are skipped.
+    """
+    osis_books = set(BOOK_TO_OSIS.values())
+    with path.open(encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            if not line.strip() or line.startswith("#"):
+                continue
+            parts = line.rstrip("\n").split("\t", 3)
+            if len(parts) != 4:
+                raise ValueError(f"{path}:{line_number}: expected book, chapter, verse and text")
+            book, chapter, verse, text = parts
+            if book in osis_books:
+                osis_book = book
+            else:
+                alias = BOOK_TO_OSIS.get(book.upper()) and book.upper()
+                alias = alias or SLUG_ALIASES.get(_resolve_book_slug(book) or "")
+                if not alias:
+                    raise ValueError(f"{path}:{line_number}: unknown book {book!r}")
+                osis_book = BOOK_TO_OSIS[alias]
+            yield osis_book, int(chapter), int(verse), text.strip()
+
+
 @router.get("/basic/{reference}")
 async def get_scripture_basic(reference: str):
     info = parse_reference(reference)
-    passages: Dict[str, str] = {"zh": "", "en": ""}
-    async with httpx.AsyncClient(timeout=10) as client:
-        try:
-            passages["zh"] = await fetch_bible_api(
-                client,
-                info["slug_book"],
-                info["chapter"],
-                info["start"],
-                info["end"],
-                BIBLE_API_TRANSLATION_ZH,
-            )
-        except httpx.HTTPError as exc:
-            print(f"Failed to fetch Chinese passage: {exc}")
-        try:
-            passages["en"] = await fetch_bible_api(
-                client,
-                info["slug_book"],
-                info["chapter"],
-                info["start"],
-                info["end"],
-                BIBLE_API_TRANSLATION_EN,
-            )
-        except httpx.HTTPError as exc:
-            print(f"Failed to fetch English passage: {exc}")
-    return {"reference": info["display"], "passages": passages}
+    zh, en = await asyncio.gather(
+        _cached_bible_api(info, BIBLE_API_TRANSLATION_ZH, "Chinese"),
+        _cached_bible_api(info, BIBLE_API_TRANSLATION_EN, "English"),
+    )
+    return {"reference": info["display"], "passages": {"zh": zh, "en": en}}
 
 
 @router.get("/original/{reference}")
@@ -721,21 +810,6 @@ async def get_scripture_original(reference: str):
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
-    passages: Dict[str, str] = {}
-    async with httpx.AsyncClient(timeout=10) as client:
-        for lang in ("el", "he"):
-            bible_id = BIBLE_IDS.get(lang)
-            if not bible_id:
-                continue
-            try:
-                chapter = info["chapter"]
-                start = info["start"]
-                end = info["end"]
-                book_slug = info["slug_book"]
-                verse_part = f"{book_slug}.{chapter}.{start}-{book_slug}.{chapter}.{end}" if end != start else f"{chapter}:{start}"
-                range_ref = quote_plus(verse_part)
-                passages[lang] = await fetch_passage(client, bible_id, range_ref)
-            except httpx.HTTPError as exc:
-                passages[lang] = ""
-                print(f"Failed to fetch passage for {lang}: {exc}")
-    return {"reference": info["display"], "passages": passages}
+    langs = [lang for lang in ("el", "he") if BIBLE_IDS.get(lang)]
+    contents = await asyncio.gather(*(_cached_original(info, lang, str(BIBLE_IDS[lang])) for lang in langs))
+    return {"reference": info["display"], "passages": dict(zip(langs, contents))}
@@ -0,0 +1,137 @@
+"""Local scripture passages for the /scripture endpoints.
+
+Two tables back the store: ``verses`` holds Bible text imported from bulk
+files, and ``passages`` caches rendered responses fetched from the upstream
+APIs. Both are keyed by translation and OSIS reference, so an imported or
+cached passage never needs the network. Imported verses take precedence.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+from .config import DATA_BASE_PATH
+
+VerseRow = Tuple[str, int, int, str]
+
+
+def _default_store_path() -> Path:
+    configured = os.getenv("SCRIPTURE_STORE_PATH")
+    if configured:
+        return Path(configured).expanduser().resolve()
+    return DATA_BASE_PATH / "scripture" / "passages.sqlite3"
+
+
+def osis_range(osis_book: str, chapter: int, start: int, end: int) -> str:
+    start_ref = f"{osis_book}.{chapter}.{start}"
+    return start_ref if end == start else f"{start_ref}-{osis_book}.{chapter}.{end}"
+
+
+class ScriptureStore:
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self.path = path or _default_store_path()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        # One shared connection; every call holds the lock, and lookups are
+        # single primary-key reads, so contention is negligible.
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS verses (
+                    translation TEXT NOT NULL,
+                    book TEXT NOT NULL,
+                    chapter INTEGER NOT NULL,
+                    verse INTEGER NOT NULL,
+                    text TEXT NOT NULL,
+                    PRIMARY KEY (translation, book, chapter, verse)
+                ) WITHOUT ROWID;
+
+                CREATE TABLE IF NOT EXISTS passages (
+                    translation TEXT NOT NULL,
+                    osis_range TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    PRIMARY KEY (translation, osis_range)
+                ) WITHOUT ROWID;
+                """
+            )
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get_passage(self, translation: str, reference: str) -> Optional[str]:
+        with self._lock:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT content FROM passages WHERE translation = ? AND osis_range = ?",
+                    (translation, reference),
+                )
+                .fetchone()
+            )
+        return row[0] if row else None
+
+    def put_passage(self, translation: str, reference: str, content: str) -> None:
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO passages(translation, osis_range, content, fetched_at) VALUES (?, ?, ?, ?)",
+                    (translation, reference, content, time.time()),
+                )
+
+    def get_verses(self, translation: str, osis_book: str, chapter: int, start: int, end: int) -> Optional[List[Tuple[int, str]]]:
+        """Imported verses for the range, or None unless every verse is present."""
+        with self._lock:
+            rows = (
+                self._connection()
+                .execute(
+                    """
+                    SELECT verse, text FROM verses
+                    WHERE translation = ? AND book = ? AND chapter = ? AND verse BETWEEN ? AND ?
+                    ORDER BY verse
+                    """,
+                    (translation, osis_book, chapter, start, end),
+                )
+                .fetchall()
+            )
+        if len(rows) != end - start + 1:
+            return None
+        return [(verse, text) for verse, text in rows]
+
+    def import_verses(self, translation: str, rows: Iterable[VerseRow]) -> int:
+        """Insert (osis_book, chapter, verse, text) rows, replacing existing verses."""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                cursor = conn.executemany(
+                    "INSERT OR REPLACE INTO verses(translation, book, chapter, verse, text) VALUES (?, ?, ?, ?, ?)",
+                    ((translation, book, chapter, verse, text) for book, chapter, verse, text in rows),
+                )
+        return cursor.rowcount
+
+
+_store: Optional[ScriptureStore] = None
+_store_lock = threading.Lock()
+
+
+def scripture_store() -> ScriptureStore:
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ScriptureStore()
+        return _store
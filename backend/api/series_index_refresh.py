@@ -77,11 +77,14 @@ def run_series_index_refresh(series_id: str) -> None:
             status.message = "Refreshing manuscript search…"
 
         # Preserve semantic search when the existing production index uses it.
+        # Only manuscripts whose content or metadata changed are re-parsed and
+        # re-embedded.
         include_embeddings = sermon_search_service.status().embedding_enabled
         search_result = sermon_search_service.reindex(
             ReindexRequest(
                 project_types=DEFAULT_MANUSCRIPT_PROJECT_TYPES,
                 include_embeddings=include_embeddings,
+                incremental=True,
             )
         )
         if search_result.status != "completed":
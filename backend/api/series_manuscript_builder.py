@@ -20,6 +20,7 @@ from backend.api.series_manuscript_service import (
     get_latest_proposal,
     get_series_manuscript_dir,
 )
+from backend.pipeline.llm_response_cache import validating_response
 from backend.pipeline.stage1 import SourceDocument, Stage1OpenAIClient
 
 
@@ -413,11 +414,12 @@ def _generate_operation(
     covered = list(result.get("covered_new_evidence_ids", []))
     missing = sorted(set(operation["evidence_ids"]) - set(covered))
     unknown = sorted(set(covered) - set(operation["evidence_ids"]))
-    if missing or unknown or len(covered) != len(set(covered)):
-        raise ValueError(
-            f"Series unit operation {operation['operation_id']} failed evidence coverage: "
-            f"missing={missing}, unknown={unknown}"
-        )
+    with validating_response(client):
+        if missing or unknown or len(covered) != len(set(covered)):
+            raise ValueError(
+                f"Series unit operation {operation['operation_id']} failed evidence coverage: "
+                f"missing={missing}, unknown={unknown}"
+            )
     markdown = _render_unit(result["unit_title"], result["manuscript_sections"])
     return {
         **result,
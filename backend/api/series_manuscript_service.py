@@ -18,6 +18,7 @@ from backend.api.sermon_converter_service import (
     get_sermon_final_path,
     get_sermon_project_metadata,
 )
+from backend.pipeline.llm_response_cache import validating_response
 from backend.pipeline.stage1 import Stage1OpenAIClient
 
 
@@ -372,7 +373,8 @@ def analyze_series_continuity(
         timeout_seconds=300,
     )
     try:
-        _validate_proposal(proposal, evidence_ids, candidate_ids)
+        with validating_response(client):
+            _validate_proposal(proposal, evidence_ids, candidate_ids)
     except ValueError as exc:
         repair_prompt = (
             f"{user_prompt}\n\n"
@@ -387,7 +389,8 @@ def analyze_series_continuity(
             runtime_schema,
             timeout_seconds=300,
         )
-        _validate_proposal(proposal, evidence_ids, candidate_ids)
+        with validating_response(client):
+            _validate_proposal(proposal, evidence_ids, candidate_ids)
 
     _enrich_matched_prior_units(proposal, context["prior_candidates"])
 
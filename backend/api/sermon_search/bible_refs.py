@@ -77,8 +77,10 @@ BOOKS: List[Tuple[str, str, List[str]]] = [
 
 ALIAS_TO_BOOK: Dict[str, Tuple[str, str]] = {}
 BOOK_TO_ZH: Dict[str, str] = {}
+BOOK_ORDINALS: Dict[str, int] = {}
 for osis_book, zh, aliases in BOOKS:
     BOOK_TO_ZH[osis_book] = zh
+    BOOK_ORDINALS[osis_book] = len(BOOK_ORDINALS) + 1
     for alias in aliases:
         ALIAS_TO_BOOK[alias.lower()] = (osis_book, zh)
 
@@ -190,6 +192,20 @@ def refs_overlap(a: CanonicalRef, b: CanonicalRef) -> bool:
     return a_start <= b_end and b_start <= a_end
 
 
+def ref_interval_key(ref: CanonicalRef) -> Optional[tuple[int, int]]:
+    """Encode a reference as one integer interval that is comparable across books.
+
+    Keys are ``book_ordinal * 1_000_000 + chapter * 1000 + verse``, so two refs
+    overlap exactly when ``refs_overlap`` says they do, reversed ranges included.
+    """
+    ordinal = BOOK_ORDINALS.get(ref.book)
+    if ordinal is None:
+        return None
+    start, end = _ref_interval(ref)
+    base = ordinal * 1_000_000
+    return base + start, base + end
+
+
 def _ref_interval(ref: CanonicalRef) -> tuple[int, int]:
     chapter_end = ref.chapter_end or ref.chapter_start
     start_verse = ref.verse_start if ref.verse_start is not None else 0
@@ -199,4 +215,6 @@ def _ref_interval(ref: CanonicalRef) -> tuple[int, int]:
         end_verse = ref.verse_start
     else:
         end_verse = 999
-    return ref.chapter_start * 1000 + start_verse, chapter_end * 1000 + end_verse
+    start, end = ref.chapter_start * 1000 + start_verse, chapter_end * 1000 + end_verse
+    # A reversed range ("太 5:10-3") covers the same verses as its ascending form.
+    return min(start, end), max(start, end)
@@ -1,47 +1,274 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import os
-from typing import List, Sequence
+import random
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from backend.api.config import DATA_BASE_PATH
+
+# Providers that embed locally; they are cheap enough that caching them on
+# disk would only add I/O.
+_LOCAL_PROVIDERS = {"hashing"}
+_REMOTE_PROVIDERS = {"google"}
+_RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+_HAN = "\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff"
+_HASHING_TOKEN_RE = re.compile(rf"[{_HAN}]|[^\W_{_HAN}]+")
+_HAN_RE = re.compile(rf"[{_HAN}]")
+_QUERY_TASK_TYPE = "RETRIEVAL_QUERY"
+
+
+def _default_cache_path() -> Path:
+    configured = os.getenv("SERMON_SEARCH_EMBEDDING_CACHE_PATH")
+    if configured:
+        return Path(configured).expanduser().resolve()
+    return DATA_BASE_PATH / "sermon_search" / "embedding_cache.sqlite3"
+
+
+def _is_retryable(exc: Exception) -> bool:
+    status = getattr(exc, "code", None) or getattr(exc, "status_code", None)
+    if isinstance(status, int):
+        return status in _RETRYABLE_STATUS_CODES
+    # Transport failures: OSError subclasses, or httpx errors from the SDK.
+    return isinstance(exc, OSError) or type(exc).__module__.startswith("httpx")
+
+
+class _RateLimiter:
+    """Spaces out calls so no more than ``per_minute`` start in any minute."""
+
+    def __init__(self, per_minute: float) -> None:
+        self.interval = 60.0 / per_minute if per_minute > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class EmbeddingCache:
+    """On-disk vectors keyed by a hash of provider, model, task type and text.
+
+    Document vectors are bounded by the corpus. Query vectors are not -- every
+    distinct search adds one -- so only the ``max_queries`` most recently
+    written are kept.
+    """
+
+    def __init__(self, path: Path, max_queries: int = 10000) -> None:
+        self.path = path
+        self.max_queries = max_queries
+        self._initialized = False
+        self._lock = threading.Lock()
+
+    def connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        if not self._initialized:
+            with self._lock:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, dimensions INTEGER NOT NULL, vector BLOB NOT NULL)"
+                )
+                columns = {row[1] for row in conn.execute("PRAGMA table_info(embeddings)")}
+                if "task_type" not in columns:
+                    # Rows written before this column are left alone: the key
+                    # is a hash, so a query row cannot be told from a document.
+                    conn.execute("ALTER TABLE embeddings ADD COLUMN task_type TEXT")
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_embeddings_task_type ON embeddings(task_type)")
+                conn.commit()
+                self._initialized = True
+        return conn
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, List[float]]:
+        if not keys:
+            return {}
+        conn = self.connect()
+        try:
+            rows = conn.execute(
+                "SELECT key, vector FROM embeddings WHERE key IN (SELECT value FROM json_each(?))",
+                (json.dumps(list(keys)),),
+            ).fetchall()
+        finally:
+            conn.close()
+        return {key: np.frombuffer(blob, dtype=np.float32).tolist() for key, blob in rows}
+
+    def put_many(self, items: Dict[str, Sequence[float]], task_type: str) -> None:
+        if not items:
+            return
+        conn = self.connect()
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings(key, dimensions, vector, task_type) VALUES (?, ?, ?, ?)",
+                    [
+                        (key, len(vector), np.asarray(vector, dtype=np.float32).tobytes(), task_type)
+                        for key, vector in items.items()
+                    ],
+                )
+                if task_type == _QUERY_TASK_TYPE:
+                    # REPLACE gives a row a new rowid, so the lowest are the
+                    # least recently written.
+                    conn.execute(
+                        """
+                        DELETE FROM embeddings WHERE task_type = ? AND rowid <= (
+                            SELECT rowid FROM embeddings WHERE task_type = ?
+                            ORDER BY rowid DESC LIMIT 1 OFFSET ?
+                        )
+                        """,
+                        (task_type, task_type, self.max_queries),
+                    )
+        finally:
+            conn.close()
 
 
 class EmbeddingClient:
-    def __init__(self) -> None:
+    def __init__(self, cache_path: Optional[Path] = None) -> None:
         self.provider = os.getenv("SERMON_SEARCH_EMBEDDING_PROVIDER", "").strip().lower()
         self.model = os.getenv("SERMON_SEARCH_EMBEDDING_MODEL", "gemini-embedding-001")
         self.dimensions = int(os.getenv("SERMON_SEARCH_EMBEDDING_DIMENSIONS", "768"))
         self.batch_size = int(os.getenv("SERMON_SEARCH_EMBEDDING_BATCH_SIZE", "64"))
+        self.concurrency = max(1, int(os.getenv("SERMON_SEARCH_EMBEDDING_CONCURRENCY", "4")))
+        self.max_retries = max(0, int(os.getenv("SERMON_SEARCH_EMBEDDING_MAX_RETRIES", "4")))
+        self.retry_base_delay = float(os.getenv("SERMON_SEARCH_EMBEDDING_RETRY_DELAY", "1.0"))
+        self.rate_limiter = _RateLimiter(float(os.getenv("SERMON_SEARCH_EMBEDDING_REQUESTS_PER_MINUTE", "0")))
+        cache_enabled = os.getenv("SERMON_SEARCH_EMBEDDING_CACHE", "1").strip().lower() not in {"0", "false", "no"}
+        self.cache: Optional[EmbeddingCache] = None
+        if cache_enabled and self.provider not in _LOCAL_PROVIDERS:
+            self.cache = EmbeddingCache(
+                cache_path or _default_cache_path(),
+                max_queries=int(os.getenv("SERMON_SEARCH_EMBEDDING_CACHE_MAX_QUERIES", "10000")),
+            )
         self._client = None
+        self._client_lock = threading.Lock()
 
     @property
     def available(self) -> bool:
-        return self.provider == "google"
+        return self.provider in _REMOTE_PROVIDERS or self.provider in _LOCAL_PROVIDERS
 
     def embed_documents(self, texts: Sequence[str]) -> List[List[float]]:
         return self._embed(texts, task_type="RETRIEVAL_DOCUMENT")
 
     def embed_query(self, text: str) -> List[float]:
-        vectors = self._embed([text], task_type="RETRIEVAL_QUERY")
+        vectors = self._embed([text], task_type=_QUERY_TASK_TYPE)
         return vectors[0] if vectors else []
 
     def _embed(self, texts: Sequence[str], task_type: str) -> List[List[float]]:
         if not self.available or not texts:
             return []
-        from google import genai
-        from google.genai import types
+        if self.provider == "hashing":
+            return [self._hashing_vector(text) for text in texts]
+
+        keys = [self._cache_key(text, task_type) for text in texts]
+        found = self.cache.get_many(list(dict.fromkeys(keys))) if self.cache else {}
+        pending: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in found:
+                pending.setdefault(key, text)
+        if pending:
+            found.update(self._embed_remote(pending, task_type))
+        missing = sum(1 for key in keys if key not in found)
+        if missing:
+            # Callers pair vectors with their texts by position; a short list
+            # would put every vector after the gap on the wrong text.
+            raise ValueError(f"{missing} of {len(keys)} texts came back without an embedding")
+        return [found[key] for key in keys]
 
-        if self._client is None:
-            api_key = os.getenv("GEMINI_API_KEY") or None
-            self._client = genai.Client(api_key=api_key) if api_key else genai.Client()
-        vectors: List[List[float]] = []
+    def _embed_remote(self, pending: Dict[str, str], task_type: str) -> Dict[str, List[float]]:
+        """Embed ``pending`` texts in concurrent batches, caching each batch as it lands."""
+        items = list(pending.items())
         batch_size = max(1, self.batch_size)
-        for start in range(0, len(texts), batch_size):
-            response = self._client.models.embed_content(
-                model=self.model,
-                contents=list(texts[start : start + batch_size]),
-                config=types.EmbedContentConfig(
-                    taskType=task_type,
-                    outputDimensionality=self.dimensions,
-                ),
-            )
-            vectors.extend(list(embedding.values) for embedding in response.embeddings or [])
-        return vectors
+        batches = [items[start : start + batch_size] for start in range(0, len(items), batch_size)]
+        results: Dict[str, List[float]] = {}
+
+        def finish(batch, vectors) -> None:
+            if len(vectors) != len(batch):
+                raise ValueError(f"embedding provider returned {len(vectors)} vectors for {len(batch)} texts")
+            # Round to float32 now so fresh and cached vectors are identical.
+            embedded = {
+                key: np.asarray(vector, dtype=np.float32).tolist()
+                for (key, _), vector in zip(batch, vectors)
+            }
+            if self.cache:
+                self.cache.put_many(embedded, task_type)
+            results.update(embedded)
+
+        if len(batches) == 1 or self.concurrency == 1:
+            for batch in batches:
+                finish(batch, self._embed_batch([text for _, text in batch], task_type))
+            return results
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(batches))) as pool:
+            futures = {pool.submit(self._embed_batch, [text for _, text in batch], task_type): batch for batch in batches}
+            for future in as_completed(futures):
+                finish(futures[future], future.result())
+        return results
+
+    def _embed_batch(self, texts: Sequence[str], task_type: str) -> List[List[float]]:
+        attempt = 0
+        while True:
+            self.rate_limiter.wait()
+            try:
+                return self._call_provider(texts, task_type)
+            except Exception as exc:
+                if attempt >= self.max_retries or not _is_retryable(exc):
+                    raise
+                delay = self.retry_base_delay * (2**attempt)
+                time.sleep(delay + random.uniform(0, delay / 2))
+                attempt += 1
+
+    def _call_provider(self, texts: Sequence[str], task_type: str) -> List[List[float]]:
+        from google.genai import types
+
+        response = self._google_client().models.embed_content(
+            model=self.model,
+            contents=list(texts),
+            config=types.EmbedContentConfig(
+                taskType=task_type,
+                outputDimensionality=self.dimensions,
+            ),
+        )
+        return [list(embedding.values) for embedding in response.embeddings or []]
+
+    def _google_client(self):
+        with self._client_lock:
+            if self._client is None:
+                from google import genai
+
+                api_key = os.getenv("GEMINI_API_KEY") or None
+                self._client = genai.Client(api_key=api_key) if api_key else genai.Client()
+            return self._client
+
+    def _cache_key(self, text: str, task_type: str) -> str:
+        header = f"{self.provider}\n{self.model}\n{self.dimensions}\n{task_type}\n"
+        return hashlib.sha256((header + text).encode("utf-8")).hexdigest()
+
+    def _hashing_vector(self, text: str) -> List[float]:
+        """Deterministic feature-hashing embedding for offline tests and benchmarks.
+
+        Tokens are Han characters, adjacent Han pairs and lowercased words; each
+        adds a signed count to the slot chosen by its blake2b digest.
+        """
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        tokens = _HASHING_TOKEN_RE.findall(text.lower())
+        features = tokens + [a + b for a, b in zip(tokens, tokens[1:]) if _HAN_RE.fullmatch(a) and _HAN_RE.fullmatch(b)]
+        for feature in features:
+            digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+            bucket = int.from_bytes(digest[:4], "little") % self.dimensions
+            vector[bucket] += 1.0 if digest[4] & 1 else -1.0
+        norm = float(np.linalg.norm(vector))
+        if norm:
+            vector /= norm
+        return vector.tolist()
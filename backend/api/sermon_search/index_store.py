@@ -1,23 +1,27 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import math
 import os
 import re
 import sqlite3
+import threading
 import uuid
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from backend.api.config import DATA_BASE_PATH
 
-from .bible_refs import extract_refs, normalize_ref, refs_overlap
+from .bible_refs import extract_refs, normalize_ref, ref_interval_key, refs_overlap
 from .discovery import discover_manuscripts
 from .embedding_client import EmbeddingClient
-from .markdown_parser import parse_manuscript
+from .markdown_parser import _stable_doc_id, parse_manuscript
 from .models import (
     CanonicalRef,
     DiscoveredManuscript,
@@ -27,6 +31,7 @@ from .models import (
     SourceCard,
     SourceUnit,
 )
+from .query_cache import QueryCache, normalize_query
 from .topics import expand_topic_query, extract_topics, load_topic_definitions, topic_taxonomy_path
 
 
@@ -43,6 +48,63 @@ def _default_db_path() -> Path:
     return DATA_BASE_PATH / "sermon_search" / "sermon_search.sqlite3"
 
 
+_VECTOR_CANDIDATE_LIMIT = 120
+_READER_MMAP_SIZE = 256 * 1024 * 1024
+_READER_CACHED_STATEMENTS = 256
+_CJK_RUN_RE = re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+")
+_FTS_TOKENIZATION = "cjk_bigram"
+
+
+def _cjk_bigrams(text: str) -> str:
+    """Rewrite CJK runs as space-separated overlapping bigrams for FTS5.
+
+    unicode61 treats an unbroken run of Han characters as a single token, so
+    Chinese words were unsearchable. As bigrams, any substring of two or more
+    characters is a phrase query over consecutive tokens.
+    """
+
+    def split(match: re.Match) -> str:
+        run = match.group(0)
+        if len(run) == 1:
+            return f" {run} "
+        return " " + " ".join(run[i : i + 2] for i in range(len(run) - 1)) + " "
+
+    return _CJK_RUN_RE.sub(split, text)
+
+
+def _unit_search_text(
+    series_title: str,
+    lecture_title: str,
+    project_title: str,
+    heading_path: Sequence[str],
+    topic_tags: Sequence[str],
+    osis_refs: Sequence[str],
+    text: str,
+) -> str:
+    return _cjk_bigrams(
+        "\n".join(
+            [
+                series_title,
+                lecture_title,
+                project_title,
+                " > ".join(heading_path),
+                " ".join(topic_tags),
+                " ".join(osis_refs),
+                text,
+            ]
+        )
+    )
+
+
+def _manuscript_fingerprint(manuscript: DiscoveredManuscript) -> str:
+    # Units embed series/lecture context, so metadata edits re-index too; a
+    # touched file with identical content (modified_time only) does not.
+    payload = _dump_model(manuscript)
+    payload.pop("modified_time", None)
+    payload["manuscript_path"] = str(manuscript.manuscript_path)
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
 @dataclass
 class Candidate:
     source_id: str
@@ -55,9 +117,25 @@ class Candidate:
 
 
 class SermonSearchIndex:
-    def __init__(self, db_path: Optional[Path] = None) -> None:
+    def __init__(self, db_path: Optional[Path] = None, vector_dir: Optional[Path] = None) -> None:
         self.db_path = db_path or _default_db_path()
+        # Packed, row-normalized float32 embedding matrices live next to the
+        # database; index_metadata names the generation that belongs to it.
+        self.vector_dir = vector_dir or self.db_path.with_name(f"{self.db_path.name}.vectors")
         self.embedding_client = EmbeddingClient()
+        self._vector_matrix: Optional[Tuple[str, List[str], np.ndarray]] = None
+        # The service holds one index per process, so these caches are shared
+        # by every request; search results are dropped when indexed_at moves.
+        cache_size = int(os.getenv("SERMON_SEARCH_CACHE_SIZE", "256"))
+        cache_ttl = float(os.getenv("SERMON_SEARCH_CACHE_TTL_SECONDS", "600"))
+        self.search_cache: QueryCache[Tuple[List[SourceCard], List[str]]] = QueryCache(cache_size, cache_ttl)
+        self.query_embedding_cache: QueryCache[List[float]] = QueryCache(cache_size * 4)
+        # Read paths share one connection per thread, reopened whenever the
+        # database file is swapped; the schema is checked once per file.
+        self._readers = threading.local()
+        self._swap_count = 0
+        self._initialized_generation: Optional[tuple] = None
+        self._initialize_lock = threading.Lock()
 
     def connect(self) -> sqlite3.Connection:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -65,7 +143,41 @@ class SermonSearchIndex:
         conn.row_factory = sqlite3.Row
         return conn
 
+    def read_connection(self) -> sqlite3.Connection:
+        """This thread's pooled, query-only connection to the current database file."""
+        generation = self._file_generation()
+        pooled = getattr(self._readers, "entry", None)
+        if pooled is not None and pooled[0] == generation:
+            return pooled[1]
+        if pooled is not None:
+            pooled[1].close()
+        conn = sqlite3.connect(self.db_path, cached_statements=_READER_CACHED_STATEMENTS)
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA mmap_size = {_READER_MMAP_SIZE}")
+        conn.execute("PRAGMA query_only = ON")
+        self._readers.entry = (generation, conn)
+        return conn
+
+    def _file_generation(self) -> Optional[tuple]:
+        # os.replace gives the path a new inode; the swap counter covers an
+        # inode number being reused by a later rebuild in this process.
+        try:
+            stat = self.db_path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_dev, stat.st_ino, self._swap_count)
+
     def initialize(self) -> None:
+        generation = self._file_generation()
+        if generation is not None and generation == self._initialized_generation:
+            return
+        with self._initialize_lock:
+            if generation is not None and self._file_generation() == self._initialized_generation:
+                return
+            self._initialize_schema()
+            self._initialized_generation = self._file_generation()
+
+    def _initialize_schema(self) -> None:
         with self.connect() as conn:
             conn.executescript(
                 """
@@ -89,6 +201,11 @@ class SermonSearchIndex:
                     modified_time REAL NOT NULL
                 );
 
+                CREATE TABLE IF NOT EXISTS document_fingerprints (
+                    document_id TEXT PRIMARY KEY,
+                    fingerprint TEXT NOT NULL
+                );
+
                 CREATE TABLE IF NOT EXISTS source_units (
                     source_id TEXT PRIMARY KEY,
                     document_id TEXT NOT NULL,
@@ -141,6 +258,12 @@ class SermonSearchIndex:
                     PRIMARY KEY(source_id, topic)
                 );
 
+                CREATE TABLE IF NOT EXISTS source_unit_content_types (
+                    source_id TEXT NOT NULL,
+                    content_type TEXT NOT NULL,
+                    PRIMARY KEY(source_id, content_type)
+                );
+
                 CREATE TABLE IF NOT EXISTS source_unit_embeddings (
                     source_id TEXT PRIMARY KEY,
                     provider TEXT NOT NULL,
@@ -149,11 +272,17 @@ class SermonSearchIndex:
                     vector_json TEXT NOT NULL
                 );
 
+                CREATE TABLE IF NOT EXISTS source_unit_vector_rows (
+                    row_index INTEGER PRIMARY KEY,
+                    source_id TEXT NOT NULL
+                );
+
                 CREATE INDEX IF NOT EXISTS idx_documents_series ON documents(series_id, project_type);
                 CREATE INDEX IF NOT EXISTS idx_source_units_doc ON source_units(document_id);
                 CREATE INDEX IF NOT EXISTS idx_refs_lookup ON source_unit_refs(book, chapter_start, role);
                 CREATE INDEX IF NOT EXISTS idx_document_refs_doc ON document_refs(document_id);
                 CREATE INDEX IF NOT EXISTS idx_topics_lookup ON source_unit_topics(topic);
+                CREATE INDEX IF NOT EXISTS idx_content_types_lookup ON source_unit_content_types(content_type);
                 """
             )
             try:
@@ -165,10 +294,92 @@ class SermonSearchIndex:
                 )
             except sqlite3.OperationalError:
                 pass
+            try:
+                conn.execute(
+                    """
+                    CREATE VIRTUAL TABLE IF NOT EXISTS source_unit_ref_intervals
+                    USING rtree_i32(id, start_key, end_key, +source_id, +role);
+                    """
+                )
+            except sqlite3.OperationalError:
+                pass
+            self._backfill_content_types(conn)
+            self._backfill_ref_intervals(conn)
+            self._backfill_fts(conn)
+
+    def _backfill_content_types(self, conn: sqlite3.Connection) -> None:
+        # Indexes built before source_unit_content_types existed only carry
+        # content_types_json; normalize them once so SQL filters see them.
+        if conn.execute("SELECT 1 FROM index_metadata WHERE key = 'content_types_table'").fetchone():
+            return
+        for row in conn.execute("SELECT source_id, content_types_json FROM source_units").fetchall():
+            conn.executemany(
+                "INSERT OR IGNORE INTO source_unit_content_types(source_id, content_type) VALUES(?, ?)",
+                [(row["source_id"], content_type) for content_type in json.loads(row["content_types_json"])],
+            )
+        conn.execute("INSERT OR REPLACE INTO index_metadata(key, value) VALUES('content_types_table', '1')")
+
+    def _backfill_ref_intervals(self, conn: sqlite3.Connection) -> None:
+        if conn.execute("SELECT 1 FROM index_metadata WHERE key = 'ref_intervals_table'").fetchone():
+            return
+        try:
+            conn.execute("DELETE FROM source_unit_ref_intervals")
+        except sqlite3.OperationalError:
+            return
+        rows = conn.execute(
+            """
+            SELECT source_id, osis, raw, book, book_zh, chapter_start,
+                   verse_start, chapter_end, verse_end, role
+            FROM source_unit_refs
+            ORDER BY rowid
+            """
+        ).fetchall()
+        for row in rows:
+            self._insert_ref_interval(conn, row["source_id"], row["role"], self._row_ref(row))
+        conn.execute("INSERT OR REPLACE INTO index_metadata(key, value) VALUES('ref_intervals_table', '1')")
+
+    def _backfill_fts(self, conn: sqlite3.Connection) -> None:
+        # Older indexes stored unsegmented text; re-tokenize them once.
+        row = conn.execute("SELECT value FROM index_metadata WHERE key = 'fts_tokenization'").fetchone()
+        if row and row[0] == _FTS_TOKENIZATION:
+            return
+        try:
+            conn.execute("DELETE FROM source_units_fts")
+        except sqlite3.OperationalError:
+            return
+        rows = conn.execute(
+            """
+            SELECT source_id, series_title, lecture_title, project_title,
+                   heading_path_json, topic_tags_json, refs_json, text
+            FROM source_units
+            """
+        ).fetchall()
+        conn.executemany(
+            "INSERT INTO source_units_fts(source_id, search_text) VALUES(?, ?)",
+            [
+                (
+                    row["source_id"],
+                    _unit_search_text(
+                        row["series_title"],
+                        row["lecture_title"],
+                        row["project_title"],
+                        json.loads(row["heading_path_json"]),
+                        json.loads(row["topic_tags_json"]),
+                        [ref["osis"] for ref in json.loads(row["refs_json"])],
+                        row["text"],
+                    ),
+                )
+                for row in rows
+            ],
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO index_metadata(key, value) VALUES('fts_tokenization', ?)",
+            (_FTS_TOKENIZATION,),
+        )
 
     def status(self) -> IndexStatus:
         self.initialize()
-        with self.connect() as conn:
+        with self.read_connection() as conn:
             document_count = conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
             unit_count = conn.execute("SELECT COUNT(*) FROM source_units").fetchone()[0]
             embedding_count = conn.execute("SELECT COUNT(*) FROM source_unit_embeddings").fetchone()[0]
@@ -181,11 +392,17 @@ class SermonSearchIndex:
             source_unit_count=unit_count,
             indexed_at=row[0] if row else None,
             embedding_enabled=embedding_count > 0,
+            search_cache=self.search_cache.stats(),
+            query_embedding_cache=self.query_embedding_cache.stats(),
         )
 
+    def _index_generation(self, conn: sqlite3.Connection) -> Optional[str]:
+        row = conn.execute("SELECT value FROM index_metadata WHERE key = 'indexed_at'").fetchone()
+        return row[0] if row else None
+
     def list_documents(self) -> List[dict]:
         self.initialize()
-        with self.connect() as conn:
+        with self.read_connection() as conn:
             rows = conn.execute(
                 """
                 SELECT document_id, series_title, lecture_title, project_id,
@@ -204,7 +421,7 @@ class SermonSearchIndex:
         query_terms = [self._normalize_title(term) for term in self._query_terms(query)]
         query_terms = [term for term in query_terms if term]
         scored: List[dict] = []
-        with self.connect() as conn:
+        with self.read_connection() as conn:
             rows = conn.execute(
                 """
                 SELECT document_id, series_title, lecture_title, project_id,
@@ -247,24 +464,62 @@ class SermonSearchIndex:
         series_ids: Optional[Iterable[str]] = None,
         project_types: Optional[Iterable[str]] = None,
         include_embeddings: bool = False,
+        incremental: bool = False,
     ) -> ReindexResponse:
         manuscripts = discover_manuscripts(series_ids=series_ids, project_types=project_types)
+        if incremental:
+            return self.update_from_manuscripts(manuscripts, include_embeddings=include_embeddings)
         return self.rebuild_from_manuscripts(manuscripts, include_embeddings=include_embeddings)
 
     def rebuild_from_manuscripts(
         self,
         manuscripts: Sequence[DiscoveredManuscript],
         include_embeddings: bool = False,
+    ) -> ReindexResponse:
+        return self._build_and_swap(
+            manuscripts,
+            lambda tmp_index: tmp_index._populate_from_manuscripts(manuscripts, include_embeddings=include_embeddings),
+        )
+
+    def update_from_manuscripts(
+        self,
+        manuscripts: Sequence[DiscoveredManuscript],
+        include_embeddings: bool = False,
+    ) -> ReindexResponse:
+        """Re-index only documents whose manuscript changed since the last build.
+
+        The current database is copied and patched in place, so unchanged
+        documents keep their units and embeddings; the copy is swapped in the
+        same way as a full rebuild.
+        """
+        if not self.db_path.exists():
+            return self.rebuild_from_manuscripts(manuscripts, include_embeddings=include_embeddings)
+        return self._build_and_swap(
+            manuscripts,
+            lambda tmp_index: tmp_index._update_from_manuscripts(manuscripts, include_embeddings=include_embeddings),
+            seed_from_current=True,
+        )
+
+    def _build_and_swap(
+        self,
+        manuscripts: Sequence[DiscoveredManuscript],
+        populate: Callable[["SermonSearchIndex"], ReindexResponse],
+        seed_from_current: bool = False,
     ) -> ReindexResponse:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         tmp_path = self.db_path.with_name(f".{self.db_path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
         if tmp_path.exists():
             tmp_path.unlink()
-        tmp_index = SermonSearchIndex(tmp_path)
+        tmp_index = SermonSearchIndex(tmp_path, vector_dir=self.vector_dir)
+        tmp_index.embedding_client = self.embedding_client
         try:
-            response = tmp_index._populate_from_manuscripts(manuscripts, include_embeddings=include_embeddings)
+            if seed_from_current:
+                with self.connect() as source, tmp_index.connect() as target:
+                    source.backup(target)
+            response = populate(tmp_index)
             if manuscripts and response.documents_indexed == 0:
                 self._cleanup_temp_db(tmp_path)
+                self._prune_vector_matrices()
                 return ReindexResponse(
                     status="failed",
                     documents_indexed=0,
@@ -275,10 +530,13 @@ class SermonSearchIndex:
                     ],
                 )
             os.replace(tmp_path, self.db_path)
+            self._swap_count += 1
             self._cleanup_temp_db(tmp_path)
+            self._prune_vector_matrices()
             return response
         except Exception:
             self._cleanup_temp_db(tmp_path)
+            self._prune_vector_matrices()
             raise
 
     def _populate_from_manuscripts(
@@ -296,62 +554,29 @@ class SermonSearchIndex:
         with self.connect() as conn:
             conn.execute("DELETE FROM source_unit_refs")
             conn.execute("DELETE FROM document_refs")
+            conn.execute("DELETE FROM document_fingerprints")
             conn.execute("DELETE FROM source_unit_topics")
+            conn.execute("DELETE FROM source_unit_content_types")
             conn.execute("DELETE FROM source_unit_embeddings")
+            conn.execute("DELETE FROM source_unit_vector_rows")
             conn.execute("DELETE FROM source_units")
             conn.execute("DELETE FROM documents")
-            try:
-                conn.execute("DELETE FROM source_units_fts")
-            except sqlite3.OperationalError:
-                pass
+            for virtual_table in ("source_units_fts", "source_unit_ref_intervals"):
+                try:
+                    conn.execute(f"DELETE FROM {virtual_table}")
+                except sqlite3.OperationalError:
+                    pass
 
             for manuscript in manuscripts:
-                try:
-                    markdown = manuscript.manuscript_path.read_text(encoding="utf-8")
-                    units = parse_manuscript(manuscript, markdown)
-                except Exception as exc:
-                    skipped.append({"project_id": manuscript.project_id, "reason": str(exc)})
-                    continue
-                if not units:
-                    skipped.append({"project_id": manuscript.project_id, "reason": "no source units"})
+                units = self._index_manuscript(conn, manuscript, skipped)
+                if units is None:
                     continue
-
-                document_id = units[0].document_id
-                conn.execute(
-                    """
-                    INSERT INTO documents (
-                        document_id, series_id, series_title, lecture_id, lecture_title,
-                        project_id, project_title, project_type, bible_verse,
-                        manuscript_path, content_hash, modified_time
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        document_id,
-                        manuscript.series_id,
-                        manuscript.series_title,
-                        manuscript.lecture_id,
-                        manuscript.lecture_title,
-                        manuscript.project_id,
-                        manuscript.project_title,
-                        manuscript.project_type,
-                        manuscript.bible_verse,
-                        str(manuscript.manuscript_path),
-                        manuscript.content_hash,
-                        manuscript.modified_time,
-                    ),
-                )
-                self._insert_document_refs(conn, document_id, units[0].document_scope_refs)
-                for unit in units:
-                    self._insert_unit(conn, unit)
                 if embeddings_enabled:
                     self._insert_embeddings(conn, units, skipped)
                 indexed_documents += 1
                 indexed_units += len(units)
 
-            conn.execute(
-                "INSERT OR REPLACE INTO index_metadata(key, value) VALUES('indexed_at', ?)",
-                (datetime.now(timezone.utc).isoformat(),),
-            )
+            self._finish_build(conn)
         return ReindexResponse(
             status="ok",
             documents_indexed=indexed_documents,
@@ -359,6 +584,173 @@ class SermonSearchIndex:
             skipped=skipped,
         )
 
+    def _update_from_manuscripts(
+        self,
+        manuscripts: Sequence[DiscoveredManuscript],
+        include_embeddings: bool = False,
+    ) -> ReindexResponse:
+        self.initialize()
+        skipped: List[dict] = []
+        reparsed_documents = 0
+        unchanged_documents = 0
+        reused_embeddings = 0
+        embeddings_enabled = include_embeddings and self.embedding_client.available
+        if include_embeddings and not embeddings_enabled:
+            skipped.append({"reason": "SERMON_SEARCH_EMBEDDING_PROVIDER is not configured; embeddings skipped"})
+        with self.connect() as conn:
+            if not embeddings_enabled:
+                # Match a full rebuild: an index built without embeddings has none.
+                conn.execute("DELETE FROM source_unit_embeddings")
+            existing = {
+                row["document_id"]: row["fingerprint"]
+                for row in conn.execute(
+                    """
+                    SELECT d.document_id, f.fingerprint
+                    FROM documents d
+                    LEFT JOIN document_fingerprints f ON f.document_id = d.document_id
+                    """
+                )
+            }
+            discovered = {_stable_doc_id(manuscript.project_id) for manuscript in manuscripts}
+            removed = [document_id for document_id in existing if document_id not in discovered]
+            for document_id in removed:
+                self._delete_document(conn, document_id)
+
+            for manuscript in manuscripts:
+                document_id = _stable_doc_id(manuscript.project_id)
+                if existing.get(document_id) == _manuscript_fingerprint(manuscript):
+                    unchanged_documents += 1
+                    continue
+                previous_vectors: Dict[str, List[float]] = {}
+                if embeddings_enabled and document_id in existing:
+                    previous_vectors = self._stored_embeddings_by_text(conn, document_id)
+                self._delete_document(conn, document_id)
+                units = self._index_manuscript(conn, manuscript, skipped)
+                if units is None:
+                    continue
+                reparsed_documents += 1
+                if embeddings_enabled:
+                    reused_embeddings += self._insert_embeddings(conn, units, skipped, reuse=previous_vectors)
+
+            if embeddings_enabled:
+                missing = [
+                    row["source_id"]
+                    for row in conn.execute(
+                        """
+                        SELECT source_id FROM source_units
+                        WHERE source_id NOT IN (SELECT source_id FROM source_unit_embeddings)
+                        ORDER BY document_id, ordinal
+                        """
+                    )
+                ]
+                if missing:
+                    self._insert_embeddings(conn, self._load_units(conn, missing), skipped)
+
+            document_count = conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+            unit_count = conn.execute("SELECT COUNT(*) FROM source_units").fetchone()[0]
+            self._finish_build(conn)
+        return ReindexResponse(
+            status="ok",
+            documents_indexed=document_count,
+            source_units_indexed=unit_count,
+            documents_reparsed=reparsed_documents,
+            documents_unchanged=unchanged_documents,
+            documents_removed=len(removed),
+            embeddings_reused=reused_embeddings,
+            skipped=skipped,
+        )
+
+    def _index_manuscript(
+        self,
+        conn: sqlite3.Connection,
+        manuscript: DiscoveredManuscript,
+        skipped: List[dict],
+    ) -> Optional[List[SourceUnit]]:
+        try:
+            markdown = manuscript.manuscript_path.read_text(encoding="utf-8")
+            units = parse_manuscript(manuscript, markdown)
+        except Exception as exc:
+            skipped.append({"project_id": manuscript.project_id, "reason": str(exc)})
+            return None
+        if not units:
+            skipped.append({"project_id": manuscript.project_id, "reason": "no source units"})
+            return None
+
+        document_id = units[0].document_id
+        conn.execute(
+            """
+            INSERT INTO documents (
+                document_id, series_id, series_title, lecture_id, lecture_title,
+                project_id, project_title, project_type, bible_verse,
+                manuscript_path, content_hash, modified_time
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                document_id,
+                manuscript.series_id,
+                manuscript.series_title,
+                manuscript.lecture_id,
+                manuscript.lecture_title,
+                manuscript.project_id,
+                manuscript.project_title,
+                manuscript.project_type,
+                manuscript.bible_verse,
+                str(manuscript.manuscript_path),
+                manuscript.content_hash,
+                manuscript.modified_time,
+            ),
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO document_fingerprints(document_id, fingerprint) VALUES(?, ?)",
+            (document_id, _manuscript_fingerprint(manuscript)),
+        )
+        self._insert_document_refs(conn, document_id, units[0].document_scope_refs)
+        for unit in units:
+            self._insert_unit(conn, unit)
+        return units
+
+    def _delete_document(self, conn: sqlite3.Connection, document_id: str) -> None:
+        unit_ids = "SELECT source_id FROM source_units WHERE document_id = ?"
+        for virtual_table in ("source_units_fts", "source_unit_ref_intervals"):
+            try:
+                conn.execute(f"DELETE FROM {virtual_table} WHERE source_id IN ({unit_ids})", (document_id,))
+            except sqlite3.OperationalError:
+                pass
+        for table in ("source_unit_refs", "source_unit_topics", "source_unit_content_types", "source_unit_embeddings"):
+            conn.execute(f"DELETE FROM {table} WHERE source_id IN ({unit_ids})", (document_id,))
+        conn.execute("DELETE FROM source_units WHERE document_id = ?", (document_id,))
+        conn.execute("DELETE FROM document_refs WHERE document_id = ?", (document_id,))
+        conn.execute("DELETE FROM document_fingerprints WHERE document_id = ?", (document_id,))
+        conn.execute("DELETE FROM documents WHERE document_id = ?", (document_id,))
+
+    def _stored_embeddings_by_text(self, conn: sqlite3.Connection, document_id: str) -> Dict[str, List[float]]:
+        rows = conn.execute(
+            """
+            SELECT e.source_id, e.vector_json
+            FROM source_unit_embeddings e
+            JOIN source_units u ON u.source_id = e.source_id
+            WHERE u.document_id = ? AND e.provider = ? AND e.model = ?
+            """,
+            (document_id, self.embedding_client.provider, self.embedding_client.model),
+        ).fetchall()
+        vectors = {}
+        for row in rows:
+            try:
+                vectors[row["source_id"]] = json.loads(row["vector_json"])
+            except json.JSONDecodeError:
+                continue
+        return {
+            self._embedding_text(unit): vectors[unit.source_id]
+            for unit in self._load_units(conn, list(vectors))
+        }
+
+    def _finish_build(self, conn: sqlite3.Connection) -> None:
+        self._write_vector_matrix(conn)
+        conn.execute(
+            "INSERT OR REPLACE INTO index_metadata(key, value) VALUES('indexed_at', ?)",
+            (datetime.now(timezone.utc).isoformat(),),
+        )
+
     def _cleanup_temp_db(self, path: Path) -> None:
         for candidate in (path, Path(f"{path}-wal"), Path(f"{path}-shm"), Path(f"{path}-journal")):
             try:
@@ -366,6 +758,66 @@ class SermonSearchIndex:
             except FileNotFoundError:
                 pass
 
+    def _write_vector_matrix(self, conn: sqlite3.Connection) -> None:
+        conn.execute("DELETE FROM source_unit_vector_rows")
+        conn.execute("DELETE FROM index_metadata WHERE key = 'vector_matrix'")
+        source_ids: List[str] = []
+        vectors: List[List[float]] = []
+        dimensions: set[int] = set()
+        for row in conn.execute("SELECT source_id, vector_json FROM source_unit_embeddings ORDER BY rowid"):
+            try:
+                vector = json.loads(row["vector_json"])
+            except json.JSONDecodeError:
+                continue
+            source_ids.append(row["source_id"])
+            vectors.append(vector)
+            dimensions.add(len(vector))
+        # Mixed dimensionalities mean mixed models; leave those to the JSON scan.
+        if not vectors or len(dimensions) != 1:
+            return
+        matrix = np.asarray(vectors, dtype=np.float64)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix = np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0).astype(np.float32)
+
+        generation = uuid.uuid4().hex
+        self.vector_dir.mkdir(parents=True, exist_ok=True)
+        path = self._vector_matrix_path(generation)
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        with open(tmp_path, "wb") as fh:
+            np.save(fh, matrix)
+        os.replace(tmp_path, path)
+        conn.executemany(
+            "INSERT INTO source_unit_vector_rows(row_index, source_id) VALUES(?, ?)",
+            enumerate(source_ids),
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO index_metadata(key, value) VALUES('vector_matrix', ?)",
+            (generation,),
+        )
+
+    def _vector_matrix_path(self, generation: str) -> Path:
+        return self.vector_dir / f"{generation}.npy"
+
+    def _prune_vector_matrices(self) -> None:
+        if not self.vector_dir.is_dir():
+            return
+        current = None
+        if self.db_path.exists():
+            with self.connect() as conn:
+                try:
+                    row = conn.execute(
+                        "SELECT value FROM index_metadata WHERE key = 'vector_matrix'"
+                    ).fetchone()
+                except sqlite3.OperationalError:
+                    row = None
+            current = row[0] if row else None
+        for path in self.vector_dir.glob("*.npy"):
+            if path.stem != current:
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+
     def _insert_document_refs(
         self,
         conn: sqlite3.Connection,
@@ -427,7 +879,7 @@ class SermonSearchIndex:
             ("mention", unit.all_canonical_refs),
         ):
             for ref in refs:
-                conn.execute(
+                inserted = conn.execute(
                     """
                     INSERT OR IGNORE INTO source_unit_refs (
                         source_id, osis, raw, book, book_zh, chapter_start,
@@ -447,21 +899,26 @@ class SermonSearchIndex:
                         role,
                     ),
                 )
+                if inserted.rowcount:
+                    self._insert_ref_interval(conn, unit.source_id, role, ref)
         for topic in unit.topic_tags:
             conn.execute(
                 "INSERT OR IGNORE INTO source_unit_topics(source_id, topic) VALUES(?, ?)",
                 (unit.source_id, topic),
             )
-        search_text = "\n".join(
-            [
-                unit.series_title,
-                unit.lecture_title,
-                unit.project_title,
-                " > ".join(unit.heading_path),
-                " ".join(unit.topic_tags),
-                " ".join(ref.osis for ref in unit.all_canonical_refs),
-                unit.text,
-            ]
+        for content_type in unit.content_types:
+            conn.execute(
+                "INSERT OR IGNORE INTO source_unit_content_types(source_id, content_type) VALUES(?, ?)",
+                (unit.source_id, content_type),
+            )
+        search_text = _unit_search_text(
+            unit.series_title,
+            unit.lecture_title,
+            unit.project_title,
+            unit.heading_path,
+            unit.topic_tags,
+            [ref.osis for ref in unit.all_canonical_refs],
+            unit.text,
         )
         try:
             conn.execute(
@@ -471,17 +928,51 @@ class SermonSearchIndex:
         except sqlite3.OperationalError:
             pass
 
-    def _insert_embeddings(self, conn: sqlite3.Connection, units: Sequence[SourceUnit], skipped: List[dict]) -> None:
+    def _insert_ref_interval(self, conn: sqlite3.Connection, source_id: str, role: str, ref: CanonicalRef) -> None:
+        key = ref_interval_key(ref)
+        if key is None:
+            return
+        try:
+            conn.execute(
+                """
+                INSERT INTO source_unit_ref_intervals(start_key, end_key, source_id, role)
+                VALUES (?, ?, ?, ?)
+                """,
+                (key[0], key[1], source_id, role),
+            )
+        except sqlite3.OperationalError:
+            pass
+
+    def _insert_embeddings(
+        self,
+        conn: sqlite3.Connection,
+        units: Sequence[SourceUnit],
+        skipped: List[dict],
+        reuse: Optional[Dict[str, List[float]]] = None,
+    ) -> int:
+        """Store unit embeddings, embedding only texts missing from ``reuse``.
+
+        Returns how many vectors were reused rather than generated.
+        """
         if not self.embedding_client.available:
             skipped.append({"reason": "SERMON_SEARCH_EMBEDDING_PROVIDER is not configured; embeddings skipped"})
-            return
+            return 0
+        reuse = reuse or {}
         texts = [self._embedding_text(unit) for unit in units]
+        pending = [text for text in dict.fromkeys(texts) if text not in reuse]
         try:
-            vectors = self.embedding_client.embed_documents(texts)
+            generated = self.embedding_client.embed_documents(pending) if pending else []
         except Exception as exc:
             skipped.append({"reason": f"embedding generation failed: {exc}"})
-            return
-        for unit, vector in zip(units, vectors):
+            return 0
+        available = {**reuse, **dict(zip(pending, generated))}
+        reused = 0
+        for unit, text in zip(units, texts):
+            vector = available.get(text)
+            if vector is None:
+                continue
+            if text in reuse:
+                reused += 1
             conn.execute(
                 """
                 INSERT OR REPLACE INTO source_unit_embeddings(
@@ -496,6 +987,7 @@ class SermonSearchIndex:
                     json.dumps(vector),
                 ),
             )
+        return reused
 
     def _embedding_text(self, unit: SourceUnit) -> str:
         return "\n".join(
@@ -513,6 +1005,18 @@ class SermonSearchIndex:
     def search(self, query: str, filters: Optional[SearchFilters] = None, limit: int = 50) -> Tuple[List[SourceCard], List[str]]:
         self.initialize()
         filters = filters or SearchFilters()
+        query = normalize_query(query)
+        with self.read_connection() as conn:
+            generation = self._index_generation(conn)
+        key = (query, filters.model_dump_json(), limit)
+        cached = self.search_cache.get(key, generation)
+        if cached is None:
+            cached = self._search(query, filters, limit)
+            self.search_cache.put(key, cached, generation)
+        cards, tools_used = cached
+        return [card.model_copy(deep=True) for card in cards], list(tools_used)
+
+    def _search(self, query: str, filters: SearchFilters, limit: int) -> Tuple[List[SourceCard], List[str]]:
         candidates: Dict[str, Candidate] = {}
         tools_used: set[str] = set()
         query_refs = self._query_refs(query, filters)
@@ -523,30 +1027,11 @@ class SermonSearchIndex:
             candidate.add(score, tool)
             tools_used.add(tool)
 
-        with self.connect() as conn:
+        with self.read_connection() as conn:
             for ref in query_refs:
-                for row in conn.execute(
-                    """
-                    SELECT source_id, osis, raw, book, book_zh, chapter_start,
-                           verse_start, chapter_end, verse_end, role
-                    FROM source_unit_refs
-                    WHERE book = ?
-                    """,
-                    (ref.book,),
-                ):
-                    stored = CanonicalRef(
-                        raw=row["raw"],
-                        book=row["book"],
-                        book_zh=row["book_zh"],
-                        chapter_start=row["chapter_start"],
-                        verse_start=row["verse_start"],
-                        chapter_end=row["chapter_end"],
-                        verse_end=row["verse_end"],
-                        osis=row["osis"],
-                    )
-                    if refs_overlap(ref, stored):
-                        role_weight = {"primary": 120.0, "cross": 95.0, "mention": 70.0}.get(row["role"], 50.0)
-                        add(row["source_id"], role_weight, "canonical_ref")
+                for source_id, role in self._ref_candidates(conn, ref):
+                    role_weight = {"primary": 120.0, "cross": 95.0, "mention": 70.0}.get(role, 50.0)
+                    add(source_id, role_weight, "canonical_ref")
 
             for topic in query_topics:
                 for row in conn.execute(
@@ -565,6 +1050,47 @@ class SermonSearchIndex:
 
         return cards, sorted(tools_used)
 
+    def _ref_candidates(self, conn: sqlite3.Connection, ref: CanonicalRef) -> List[Tuple[str, str]]:
+        """Return (source_id, role) for every stored ref overlapping ``ref``."""
+        key = ref_interval_key(ref)
+        if key is not None:
+            try:
+                # start_key / 1000 is (book, chapter): the order the book scan
+                # below walks idx_refs_lookup in, so score ties break the same.
+                rows = conn.execute(
+                    """
+                    SELECT source_id, role FROM source_unit_ref_intervals
+                    WHERE start_key <= ? AND end_key >= ?
+                    ORDER BY start_key / 1000, role, id
+                    """,
+                    (key[1], key[0]),
+                ).fetchall()
+                return [(row["source_id"], row["role"]) for row in rows]
+            except sqlite3.OperationalError:
+                pass
+        rows = conn.execute(
+            """
+            SELECT source_id, osis, raw, book, book_zh, chapter_start,
+                   verse_start, chapter_end, verse_end, role
+            FROM source_unit_refs
+            WHERE book = ?
+            """,
+            (ref.book,),
+        ).fetchall()
+        return [(row["source_id"], row["role"]) for row in rows if refs_overlap(ref, self._row_ref(row))]
+
+    def _row_ref(self, row: sqlite3.Row) -> CanonicalRef:
+        return CanonicalRef(
+            raw=row["raw"],
+            book=row["book"],
+            book_zh=row["book_zh"],
+            chapter_start=row["chapter_start"],
+            verse_start=row["verse_start"],
+            chapter_end=row["chapter_end"],
+            verse_end=row["verse_end"],
+            osis=row["osis"],
+        )
+
     def _query_refs(self, query: str, filters: SearchFilters) -> List[CanonicalRef]:
         refs = extract_refs(query)
         for raw in filters.canonical_refs:
@@ -594,16 +1120,8 @@ class SermonSearchIndex:
             return scores
 
         for term in terms[:8]:
-            like = f"%{term}%"
-            for row in conn.execute(
-                """
-                SELECT source_id FROM source_units
-                WHERE text LIKE ? OR project_title LIKE ? OR heading_path_json LIKE ?
-                LIMIT 100
-                """,
-                (like, like, like),
-            ):
-                scores[row["source_id"]] += 12.0
+            for source_id in self._term_matches(conn, term):
+                scores[source_id] += 12.0
 
         match_query = " OR ".join(self._escape_fts_term(term) for term in terms[:6] if self._escape_fts_term(term))
         if match_query:
@@ -623,18 +1141,113 @@ class SermonSearchIndex:
                 pass
         return dict(scores)
 
+    def _term_matches(self, conn: sqlite3.Connection, term: str) -> List[str]:
+        """Units whose text, project title or heading path contains ``term``.
+
+        A Han term of two or more characters is narrowed through the bigram
+        FTS index first, best BM25 first; the LIKE test on the joined row keeps
+        the match to those three columns, exactly as the plain scan.  Any other
+        term is a plain LIKE scan: FTS5 tokens are whole words, and a Latin or
+        Greek term must keep matching inside longer words ("Christ" in
+        "Christian").  The plain scan also covers SQLite builds without FTS5.
+        """
+        like = f"%{term}%"
+        if len(term) >= 2 and _CJK_RUN_RE.fullmatch(term):
+            try:
+                rows = conn.execute(
+                    """
+                    SELECT f.source_id FROM source_units_fts AS f
+                    JOIN source_units AS u ON u.source_id = f.source_id
+                    WHERE source_units_fts MATCH ?
+                      AND (u.text LIKE ? OR u.project_title LIKE ? OR u.heading_path_json LIKE ?)
+                    ORDER BY f.rank
+                    LIMIT 100
+                    """,
+                    (self._escape_fts_term(term), like, like, like),
+                ).fetchall()
+                return [row["source_id"] for row in rows]
+            except sqlite3.OperationalError:
+                pass
+        rows = conn.execute(
+            """
+            SELECT source_id FROM source_units
+            WHERE text LIKE ? OR project_title LIKE ? OR heading_path_json LIKE ?
+            LIMIT 100
+            """,
+            (like, like, like),
+        ).fetchall()
+        return [row["source_id"] for row in rows]
+
     def _vector_candidates(self, conn: sqlite3.Connection, query: str) -> Dict[str, float]:
         if not self.embedding_client.available:
             return {}
-        embedding_count = conn.execute("SELECT COUNT(*) FROM source_unit_embeddings").fetchone()[0]
-        if not embedding_count:
+        packed = self._load_vector_matrix(conn)
+        if packed is None:
+            embedding_count = conn.execute("SELECT COUNT(*) FROM source_unit_embeddings").fetchone()[0]
+            if not embedding_count:
+                return {}
+        client = self.embedding_client
+        key = (client.provider, client.model, client.dimensions, normalize_query(query))
+        query_vector = self.query_embedding_cache.get(key)
+        if query_vector is None:
+            try:
+                query_vector = client.embed_query(query)
+            except Exception:
+                return {}
+            if query_vector:
+                self.query_embedding_cache.put(key, query_vector)
+        if not query_vector:
             return {}
+        if packed is not None:
+            return self._matrix_vector_candidates(packed, query_vector)
+        return self._scan_vector_candidates(conn, query_vector)
+
+    def _load_vector_matrix(self, conn: sqlite3.Connection) -> Optional[Tuple[List[str], np.ndarray]]:
+        row = conn.execute("SELECT value FROM index_metadata WHERE key = 'vector_matrix'").fetchone()
+        if not row:
+            return None
+        generation = row[0]
+        cached = self._vector_matrix
+        if cached is not None and cached[0] == generation:
+            return cached[1], cached[2]
         try:
-            query_vector = self.embedding_client.embed_query(query)
-        except Exception:
-            return {}
-        if not query_vector:
+            matrix = np.load(self._vector_matrix_path(generation), mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+        source_ids = [
+            item["source_id"]
+            for item in conn.execute("SELECT source_id FROM source_unit_vector_rows ORDER BY row_index")
+        ]
+        if matrix.ndim != 2 or matrix.shape[0] != len(source_ids):
+            return None
+        self._vector_matrix = (generation, source_ids, matrix)
+        return source_ids, matrix
+
+    def _matrix_vector_candidates(
+        self,
+        packed: Tuple[List[str], np.ndarray],
+        query_vector: Sequence[float],
+    ) -> Dict[str, float]:
+        source_ids, matrix = packed
+        query = np.asarray(query_vector, dtype=np.float64)
+        norm = float(np.linalg.norm(query))
+        if not source_ids or not norm or query.shape[0] != matrix.shape[1]:
             return {}
+        similarities = matrix @ (query / norm).astype(np.float32)
+        limit = min(_VECTOR_CANDIDATE_LIMIT, len(source_ids))
+        if len(source_ids) > limit:
+            top = np.argpartition(-similarities, limit - 1)[:limit]
+        else:
+            top = np.arange(len(source_ids))
+        # Highest similarity first; ties keep index order like the row scan.
+        top = top[np.lexsort((top, -similarities[top]))]
+        return {
+            source_ids[i]: float(similarities[i]) * 85.0
+            for i in top
+            if similarities[i] > 0
+        }
+
+    def _scan_vector_candidates(self, conn: sqlite3.Connection, query_vector: Sequence[float]) -> Dict[str, float]:
         scores: Dict[str, float] = {}
         rows = conn.execute("SELECT source_id, vector_json FROM source_unit_embeddings").fetchall()
         for row in rows:
@@ -645,7 +1258,7 @@ class SermonSearchIndex:
             similarity = self._cosine_similarity(query_vector, vector)
             if similarity > 0:
                 scores[row["source_id"]] = similarity * 85.0
-        return dict(sorted(scores.items(), key=lambda item: item[1], reverse=True)[:120])
+        return dict(sorted(scores.items(), key=lambda item: item[1], reverse=True)[:_VECTOR_CANDIDATE_LIMIT])
 
     def _cosine_similarity(self, a: Sequence[float], b: Sequence[float]) -> float:
         if not a or not b or len(a) != len(b):
@@ -691,7 +1304,11 @@ class SermonSearchIndex:
     def _escape_fts_term(self, term: str) -> str:
         if not re.match(r"^[\w\u4e00-\u9fff\u0370-\u03ff\u0590-\u05ff.-]+$", term):
             return ""
-        return f'"{term}"'
+        tokens = _cjk_bigrams(term).split()
+        if any(_CJK_RUN_RE.fullmatch(token) and len(token) == 1 for token in tokens):
+            # A lone Han character only exists inside bigrams; leave it to LIKE.
+            return ""
+        return '"' + " ".join(tokens) + '"'
 
     def _load_cards(
         self,
@@ -703,13 +1320,11 @@ class SermonSearchIndex:
         if not candidates:
             return []
         ordered = sorted(candidates.values(), key=lambda c: c.score, reverse=True)
+        rows = self._filtered_unit_rows(conn, [candidate.source_id for candidate in ordered], filters)
         cards: List[SourceCard] = []
         for candidate in ordered:
-            row = conn.execute(
-                "SELECT * FROM source_units WHERE source_id = ?",
-                (candidate.source_id,),
-            ).fetchone()
-            if not row or not self._row_passes_filters(conn, row, filters):
+            row = rows.get(candidate.source_id)
+            if row is None:
                 continue
             headings = json.loads(row["heading_path_json"])
             topics = json.loads(row["topic_tags_json"])
@@ -732,28 +1347,59 @@ class SermonSearchIndex:
                 break
         return cards
 
-    def _row_passes_filters(self, conn: sqlite3.Connection, row: sqlite3.Row, filters: SearchFilters) -> bool:
-        if filters.series_ids and row["series_id"] not in filters.series_ids:
-            return False
+    def _filtered_unit_rows(
+        self,
+        conn: sqlite3.Connection,
+        source_ids: Sequence[str],
+        filters: SearchFilters,
+    ) -> Dict[str, sqlite3.Row]:
+        """Hydrate candidate units and apply search filters in one query.
+
+        Id lists are bound as JSON arrays so a single statement covers any
+        number of candidates without hitting SQLite's variable limit.
+        """
+        clauses = ["u.source_id IN (SELECT value FROM json_each(?))"]
+        params: List[str] = [json.dumps(list(source_ids), ensure_ascii=False)]
+        if filters.series_ids:
+            clauses.append("u.series_id IN (SELECT value FROM json_each(?))")
+            params.append(json.dumps(filters.series_ids, ensure_ascii=False))
         if filters.project_types:
-            doc = self._document_project_type(conn, row["document_id"])
-            if doc not in filters.project_types:
-                return False
-        content_types = set(json.loads(row["content_types_json"]))
-        if filters.content_types and not content_types.intersection(filters.content_types):
-            return False
+            clauses.append("COALESCE(d.project_type, '') IN (SELECT value FROM json_each(?))")
+            params.append(json.dumps(filters.project_types, ensure_ascii=False))
+        if filters.content_types:
+            clauses.append(
+                """
+                EXISTS (
+                    SELECT 1 FROM source_unit_content_types c
+                    WHERE c.source_id = u.source_id
+                      AND c.content_type IN (SELECT value FROM json_each(?))
+                )
+                """
+            )
+            params.append(json.dumps(filters.content_types, ensure_ascii=False))
         if filters.topics:
-            topics = set(json.loads(row["topic_tags_json"]))
-            if not topics.intersection(extract_topics(filters.topics) or filters.topics):
-                return False
-        return True
-
-    def _document_project_type(self, conn: sqlite3.Connection, document_id: str) -> str:
-        row = conn.execute(
-            "SELECT project_type FROM documents WHERE document_id = ?",
-            (document_id,),
-        ).fetchone()
-        return row["project_type"] if row else ""
+            clauses.append(
+                """
+                EXISTS (
+                    SELECT 1 FROM source_unit_topics t
+                    WHERE t.source_id = u.source_id
+                      AND t.topic IN (SELECT value FROM json_each(?))
+                )
+                """
+            )
+            params.append(json.dumps(list(extract_topics(filters.topics) or filters.topics), ensure_ascii=False))
+        rows = conn.execute(
+            f"""
+            SELECT u.source_id, u.project_id, u.project_title, u.series_title,
+                   u.lecture_title, u.heading_path_json, u.topic_tags_json,
+                   u.refs_json, u.text
+            FROM source_units u
+            LEFT JOIN documents d ON d.document_id = u.document_id
+            WHERE {" AND ".join(clauses)}
+            """,
+            params,
+        ).fetchall()
+        return {row["source_id"]: row for row in rows}
 
     def _snippet(self, text: str, limit: int = 260) -> str:
         normalized = re.sub(r"\s+", " ", text).strip()
@@ -765,39 +1411,42 @@ class SermonSearchIndex:
         if not source_ids:
             return []
         self.initialize()
+        with self.read_connection() as conn:
+            return self._load_units(conn, source_ids)
+
+    def _load_units(self, conn: sqlite3.Connection, source_ids: Sequence[str]) -> List[SourceUnit]:
         units: List[SourceUnit] = []
-        with self.connect() as conn:
-            for source_id in source_ids:
-                row = conn.execute(
-                    "SELECT * FROM source_units WHERE source_id = ?",
-                    (source_id,),
-                ).fetchone()
-                if not row:
-                    continue
-                refs = [CanonicalRef(**payload) for payload in json.loads(row["refs_json"])]
-                role_refs = self._load_unit_role_refs(conn, source_id)
-                units.append(
-                    SourceUnit(
-                        source_id=row["source_id"],
-                        document_id=row["document_id"],
-                        series_id=row["series_id"],
-                        series_title=row["series_title"],
-                        lecture_id=row["lecture_id"],
-                        lecture_title=row["lecture_title"],
-                        project_id=row["project_id"],
-                        project_title=row["project_title"],
-                        heading_path=json.loads(row["heading_path_json"]),
-                        text=row["text"],
-                        primary_passage_refs=role_refs.get("primary", []),
-                        cross_refs=role_refs.get("cross", []),
-                        all_canonical_refs=refs,
-                        document_scope_refs=self._load_document_refs(conn, row["document_id"]),
-                        topic_tags=json.loads(row["topic_tags_json"]),
-                        content_types=json.loads(row["content_types_json"]),
-                        terms=json.loads(row["terms_json"]),
-                        ordinal=row["ordinal"],
-                    )
+        for source_id in source_ids:
+            row = conn.execute(
+                "SELECT * FROM source_units WHERE source_id = ?",
+                (source_id,),
+            ).fetchone()
+            if not row:
+                continue
+            refs = [CanonicalRef(**payload) for payload in json.loads(row["refs_json"])]
+            role_refs = self._load_unit_role_refs(conn, source_id)
+            units.append(
+                SourceUnit(
+                    source_id=row["source_id"],
+                    document_id=row["document_id"],
+                    series_id=row["series_id"],
+                    series_title=row["series_title"],
+                    lecture_id=row["lecture_id"],
+                    lecture_title=row["lecture_title"],
+                    project_id=row["project_id"],
+                    project_title=row["project_title"],
+                    heading_path=json.loads(row["heading_path_json"]),
+                    text=row["text"],
+                    primary_passage_refs=role_refs.get("primary", []),
+                    cross_refs=role_refs.get("cross", []),
+                    all_canonical_refs=refs,
+                    document_scope_refs=self._load_document_refs(conn, row["document_id"]),
+                    topic_tags=json.loads(row["topic_tags_json"]),
+                    content_types=json.loads(row["content_types_json"]),
+                    terms=json.loads(row["terms_json"]),
+                    ordinal=row["ordinal"],
                 )
+            )
         return units
 
     def _load_unit_role_refs(self, conn: sqlite3.Connection, source_id: str) -> Dict[str, List[CanonicalRef]]:
@@ -856,7 +1505,7 @@ class SermonSearchIndex:
 
     def load_document_units(self, document_id: str) -> List[SourceUnit]:
         self.initialize()
-        with self.connect() as conn:
+        with self.read_connection() as conn:
             rows = conn.execute(
                 """
                 SELECT source_id FROM source_units
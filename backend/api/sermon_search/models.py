@@ -103,12 +103,21 @@ class Citation(BaseModel):
     supports: str
 
 
+class ToolTiming(BaseModel):
+    tool: str
+    query: str
+    elapsed_ms: float
+    cached: bool = False
+
+
 class SearchRoundTrace(BaseModel):
     round: int
     tools_used: List[str]
     query: str
     candidate_count: int
     selected_count: int
+    elapsed_ms: Optional[float] = None
+    tool_timings: List[ToolTiming] = Field(default_factory=list)
 
 
 class SearchTrace(BaseModel):
@@ -127,24 +136,40 @@ class SermonSearchResponse(BaseModel):
     search_trace: SearchTrace
 
 
+class CacheStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    size: int = 0
+    max_entries: int = 0
+    ttl_seconds: Optional[float] = None
+    generation: Optional[str] = None
+
+
 class IndexStatus(BaseModel):
     db_path: str
     document_count: int
     source_unit_count: int
     indexed_at: Optional[str] = None
     embedding_enabled: bool = False
+    search_cache: Optional[CacheStats] = None
+    query_embedding_cache: Optional[CacheStats] = None
 
 
 class ReindexRequest(BaseModel):
     series_ids: List[str] = Field(default_factory=list)
     project_types: List[str] = Field(default_factory=lambda: ["sermon_note", "transcript"])
     include_embeddings: bool = False
+    incremental: bool = False
 
 
 class ReindexResponse(BaseModel):
     status: str
     documents_indexed: int
     source_units_indexed: int
+    documents_reparsed: Optional[int] = None
+    documents_unchanged: Optional[int] = None
+    documents_removed: Optional[int] = None
+    embeddings_reused: Optional[int] = None
     skipped: List[Dict[str, Any]] = Field(default_factory=list)
 
 
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+from .models import CacheStats
+
+V = TypeVar("V")
+
+
+def normalize_query(text: str) -> str:
+    return " ".join(text.split())
+
+
+class QueryCache(Generic[V]):
+    """Thread-safe LRU cache with an optional TTL and hit/miss counters.
+
+    Entries carry the index generation they were computed against; asking for
+    a different generation drops everything, so a reindex never serves stale
+    results.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: Optional[float] = None) -> None:
+        self.max_entries = max(0, max_entries)
+        self.ttl_seconds = ttl_seconds if ttl_seconds and ttl_seconds > 0 else None
+        self.hits = 0
+        self.misses = 0
+        self._generation: Optional[str] = None
+        self._entries: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, generation: Optional[str] = None) -> Optional[V]:
+        with self._lock:
+            self._sync_generation(generation)
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl_seconds is not None and time.monotonic() - entry[0] > self.ttl_seconds:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value: V, generation: Optional[str] = None) -> None:
+        if not self.max_entries:
+            return
+        with self._lock:
+            self._sync_generation(generation)
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation = None
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self.hits,
+                misses=self.misses,
+                size=len(self._entries),
+                max_entries=self.max_entries,
+                ttl_seconds=self.ttl_seconds,
+                generation=self._generation,
+            )
+
+    def _sync_generation(self, generation: Optional[str]) -> None:
+        if generation != self._generation:
+            self._entries.clear()
+            self._generation = generation
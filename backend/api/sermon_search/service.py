@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import os
 import re
+import threading
+import time
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Iterable, Iterator, List, Sequence
 
 from .deepseek_client import DeepSeekClient
@@ -18,6 +22,7 @@ from .models import (
     SermonSearchResponse,
     SourceCard,
     SourceUnit,
+    ToolTiming,
 )
 
 
@@ -25,6 +30,9 @@ class SermonSearchService:
     def __init__(self, index: SermonSearchIndex | None = None, llm: DeepSeekClient | None = None) -> None:
         self.index = index or SermonSearchIndex()
         self.llm = llm or DeepSeekClient()
+        self.max_search_workers = max(1, int(os.getenv("SERMON_SEARCH_FANOUT_WORKERS", "4")))
+        self._search_pool: ThreadPoolExecutor | None = None
+        self._search_pool_lock = threading.Lock()
 
     def status(self) -> IndexStatus:
         return self.index.status()
@@ -34,6 +42,7 @@ class SermonSearchService:
             series_ids=request.series_ids or None,
             project_types=request.project_types or DEFAULT_MANUSCRIPT_PROJECT_TYPES,
             include_embeddings=request.include_embeddings,
+            incremental=request.incremental,
         )
 
     def query(self, request: SermonSearchRequest) -> SermonSearchResponse:
@@ -136,29 +145,24 @@ class SermonSearchService:
             state["evidence_count"] = len(all_cards)
             state["tools_used"] = sorted(tools)
             plan = self._plan_next_searches(request, state)
+            searches = self._normalize_searches(plan)
             selected: List[SourceCard] = []
             round_candidate_count = 0
             round_tools: List[str] = []
+            round_started = time.perf_counter()
+            outcomes = self._run_searches(request, searches, search_cache)
 
-            for search in self._normalize_searches(plan):
-                tool = str(search.get("tool") or "multi_index_search")
+            # Merge in plan order so ranking matches a sequential run.
+            for search, outcome in zip(searches, outcomes):
+                tool = search["tool"]
                 round_tools.append(tool)
                 tools.add(tool)
                 if tool == "document_lookup":
-                    document_query = str(search.get("document_query") or search.get("query") or request.question)
-                    documents = self.index.find_documents(document_query, limit=int(search.get("limit") or 8))
-                    state["observations"].append(
-                        {
-                            "tool": "document_lookup",
-                            "query": document_query,
-                            "documents": documents,
-                        }
-                    )
-                    round_candidate_count += len(documents)
+                    state["observations"].append(outcome["observation"])
+                    round_candidate_count += len(outcome["observation"]["documents"])
                     continue
                 if tool == "document_coverage":
-                    document_query = str(search.get("document_query") or request.question)
-                    observation, cards = self._document_coverage_observation(document_query)
+                    observation, cards = outcome["observation"], outcome["cards"]
                     state["observations"].append(observation)
                     round_candidate_count += observation.get("unit_count", 0)
                     for card in cards:
@@ -168,13 +172,8 @@ class SermonSearchService:
                     selected = self._rank_cards(all_cards.values())[:target_k]
                     continue
 
-                query_text = str(search.get("query") or request.question)
-                cache_key = self._search_cache_key(query_text, request)
-                if cache_key in search_cache:
-                    cards, used = search_cache[cache_key]
-                else:
-                    cards, used = self.index.search(query_text, request.filters, limit=80)
-                    search_cache[cache_key] = (cards, used)
+                cards, used = outcome["cards"], outcome["used"]
+                search_cache.setdefault(outcome["cache_key"], (cards, used))
                 round_candidate_count += len(cards)
                 tools.update(used)
                 round_tools.extend(used)
@@ -192,10 +191,12 @@ class SermonSearchService:
                     tools_used=sorted(set(round_tools)),
                     query=" | ".join(
                         str(s.get("query") or s.get("document_query") or request.question)
-                        for s in self._normalize_searches(plan)
+                        for s in searches
                     ),
                     candidate_count=round_candidate_count,
                     selected_count=len(selected),
+                    elapsed_ms=round((time.perf_counter() - round_started) * 1000.0, 2),
+                    tool_timings=[outcome["timing"] for outcome in outcomes],
                 )
             )
             assessment = self._assess_evidence(request, selected, plan)
@@ -224,6 +225,64 @@ class SermonSearchService:
         )
         return sources, units, trace, state["observations"]
 
+    def _run_searches(
+        self,
+        request: SermonSearchRequest,
+        searches: Sequence[dict],
+        search_cache: Dict[str, tuple[List[SourceCard], List[str]]],
+    ) -> List[dict]:
+        """Run one round's sub-searches on the shared pool, results in plan order."""
+        if len(searches) <= 1 or self.max_search_workers <= 1:
+            return [self._run_search(request, search, search_cache) for search in searches]
+        pool = self._get_search_pool()
+        futures = [pool.submit(self._run_search, request, search, search_cache) for search in searches]
+        return [future.result() for future in futures]
+
+    def _run_search(
+        self,
+        request: SermonSearchRequest,
+        search: dict,
+        search_cache: Dict[str, tuple[List[SourceCard], List[str]]],
+    ) -> dict:
+        tool = search["tool"]
+        started = time.perf_counter()
+        outcome: dict = {}
+        cached = False
+        if tool == "document_lookup":
+            query_text = str(search.get("document_query") or search.get("query") or request.question)
+            documents = self.index.find_documents(query_text, limit=int(search.get("limit") or 8))
+            outcome["observation"] = {
+                "tool": "document_lookup",
+                "query": query_text,
+                "documents": documents,
+            }
+        elif tool == "document_coverage":
+            query_text = str(search.get("document_query") or request.question)
+            outcome["observation"], outcome["cards"] = self._document_coverage_observation(query_text)
+        else:
+            query_text = str(search.get("query") or request.question)
+            cache_key = self._search_cache_key(query_text, request)
+            hit = search_cache.get(cache_key)
+            cached = hit is not None
+            cards, used = hit if hit is not None else self.index.search(query_text, request.filters, limit=80)
+            outcome.update(cards=cards, used=used, cache_key=cache_key)
+        outcome["timing"] = ToolTiming(
+            tool=tool,
+            query=query_text,
+            elapsed_ms=round((time.perf_counter() - started) * 1000.0, 2),
+            cached=cached,
+        )
+        return outcome
+
+    def _get_search_pool(self) -> ThreadPoolExecutor:
+        with self._search_pool_lock:
+            if self._search_pool is None:
+                self._search_pool = ThreadPoolExecutor(
+                    max_workers=self.max_search_workers,
+                    thread_name_prefix="sermon-search",
+                )
+            return self._search_pool
+
     def _plan_next_searches(self, request: SermonSearchRequest, state: dict) -> dict:
         if request.mode.value == "normal":
             return self._fallback_plan(request, state)
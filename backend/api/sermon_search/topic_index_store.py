@@ -3,9 +3,10 @@ from __future__ import annotations
 import json
 import os
 import re
+from dataclasses import dataclass, field
 from pathlib import Path
 from threading import Lock
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from backend.api.config import DATA_BASE_PATH
 
@@ -52,16 +53,55 @@ def _section_anchor(section: str) -> str:
     return slugify_heading(parent)
 
 
+# Joins the searchable strings of one card so a needle cannot match across two.
+_HAYSTACK_SEPARATOR = "\x00"
+
+
+def _card_haystack(card: TopicCard) -> str:
+    parts = [card.name, *card.aliases]
+    for src in card.sources:
+        parts.extend(src.lun_dian)
+    return _HAYSTACK_SEPARATOR.join((part or "").lower() for part in parts)
+
+
+@dataclass
+class _TopicView:
+    """Prebuilt cards for one series scope ("" is every series), in file order."""
+
+    entries: List[Tuple[TopicCard, str]] = field(default_factory=list)
+    by_type: Dict[str, List[Tuple[TopicCard, str]]] = field(default_factory=dict)
+    by_id: Dict[str, TopicCard] = field(default_factory=dict)
+
+    def add(self, raw_type: Optional[str], card: TopicCard, first_with_id: bool) -> None:
+        entry = (card, _card_haystack(card))
+        self.entries.append(entry)
+        if raw_type is not None:
+            self.by_type.setdefault(raw_type, []).append(entry)
+        if first_with_id:
+            self.by_id[card.id] = card
+
+
+@dataclass
+class _CompiledIndex:
+    generated_at: Optional[str]
+    status: TopicStatus
+    views: Dict[str, _TopicView]
+
+
 class TopicIndexStore:
-    """Reads the authoritative topic_index.json. Pure JSON, no SQLite."""
+    """Reads the authoritative topic_index.json. Pure JSON, no SQLite.
+
+    The file is compiled once per mtime into cards indexed by series, type
+    and id, so requests only filter prebuilt objects.
+    """
 
     def __init__(self, path: Optional[Path] = None) -> None:
         self.path = path or _default_index_path()
         self._lock = Lock()
-        self._cache: Optional[Dict[str, Any]] = None
+        self._cache: Optional[_CompiledIndex] = None
         self._cache_mtime: Optional[float] = None
 
-    def _load(self) -> Optional[Dict[str, Any]]:
+    def _load(self) -> Optional[_CompiledIndex]:
         if not self.path.exists():
             return None
         mtime = self.path.stat().st_mtime
@@ -72,9 +112,33 @@ class TopicIndexStore:
                 data = json.loads(self.path.read_text(encoding="utf-8"))
             except Exception:
                 return None
-            self._cache = data
+            if not data:
+                return None
+            self._cache = self._compile(data)
             self._cache_mtime = mtime
-            return data
+            return self._cache
+
+    def _compile(self, data: Dict[str, Any]) -> _CompiledIndex:
+        topics = data.get("topics", [])
+        views: Dict[str, _TopicView] = {"": _TopicView()}
+        for raw in topics:
+            raw_type = raw.get("type")
+            # get_topic answers with the first topic carrying an id, even when
+            # that one has no sources in the requested series.
+            first_with_id = raw.get("id", "") not in views[""].by_id
+            views[""].add(raw_type, self._build_card(raw, None), first_with_id)
+            series_ids = {s.get("series_id") for s in raw.get("sources") or [] if s.get("series_id")}
+            for series_id in sorted(series_ids):
+                card = self._build_card(raw, series_id)
+                if card is not None:
+                    views.setdefault(series_id, _TopicView()).add(raw_type, card, first_with_id)
+        status = TopicStatus(
+            available=True,
+            generated_at=data.get("generated_at"),
+            passage_count=sum(1 for t in topics if t.get("type") == "passage"),
+            concept_count=sum(1 for t in topics if t.get("type") == "concept"),
+        )
+        return _CompiledIndex(generated_at=data.get("generated_at"), status=status, views=views)
 
     def _build_card(self, raw: Dict[str, Any], series_id: Optional[str]) -> Optional[TopicCard]:
         sources_raw = raw.get("sources") or []
@@ -114,66 +178,42 @@ class TopicIndexStore:
             aliases=raw.get("taxonomy_aliases", []) or [],
         )
 
-    @staticmethod
-    def _matches_query(card: TopicCard, q: str) -> bool:
-        needle = q.strip().lower()
-        if not needle:
-            return True
-        haystack = [card.name, *card.aliases]
-        for src in card.sources:
-            haystack.extend(src.lun_dian)
-        return any(needle in (h or "").lower() for h in haystack)
-
     def list_topics(
         self,
         series_id: Optional[str] = None,
         topic_type: Optional[str] = None,
         q: Optional[str] = None,
     ) -> TopicListResponse:
-        data = self._load()
-        if not data:
+        index = self._load()
+        if not index:
             return TopicListResponse(available=False, generated_at=None, count=0, topics=[])
 
-        cards: List[TopicCard] = []
-        for raw in data.get("topics", []):
-            if topic_type and raw.get("type") != topic_type:
-                continue
-            card = self._build_card(raw, series_id)
-            if card is None:
-                continue
-            if q and not self._matches_query(card, q):
-                continue
-            cards.append(card)
+        view = index.views.get(series_id or "")
+        entries: List[Tuple[TopicCard, str]] = []
+        if view is not None:
+            entries = view.by_type.get(topic_type, []) if topic_type else view.entries
+        needle = (q or "").strip().lower()
+        cards = [card for card, haystack in entries if needle in haystack] if needle else [card for card, _ in entries]
 
         return TopicListResponse(
             available=True,
-            generated_at=data.get("generated_at"),
+            generated_at=index.generated_at,
             count=len(cards),
             topics=cards,
         )
 
     def get_topic(self, topic_id: str, series_id: Optional[str] = None) -> Optional[TopicCard]:
-        data = self._load()
-        if not data:
+        index = self._load()
+        if not index:
             return None
-        for raw in data.get("topics", []):
-            if raw.get("id") == topic_id:
-                return self._build_card(raw, series_id)
-        return None
+        view = index.views.get(series_id or "")
+        return view.by_id.get(topic_id) if view is not None else None
 
     def status(self) -> TopicStatus:
-        data = self._load()
-        if not data:
+        index = self._load()
+        if not index:
             return TopicStatus(available=False)
-        topics = data.get("topics", [])
-        passage = sum(1 for t in topics if t.get("type") == "passage")
-        concept = sum(1 for t in topics if t.get("type") == "concept")
-        return TopicStatus(
-            available=True,
-            generated_at=data.get("generated_at"),
-            passage_count=passage,
-            concept_count=concept,
-        )
+        return index.status
 
 
 topic_index_store = TopicIndexStore()
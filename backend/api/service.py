@@ -21,7 +21,8 @@ import git
 from decimal import Decimal
 from typing import Optional
 from urllib.parse import quote, quote_plus
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 
 import httpx
 from opencc import OpenCC
@@ -83,8 +84,12 @@ from .config import (
     FELLOWSHIP_CHAT_MIN_BYTES,
     FELLOWSHIP_DOCS_DIR,
     FELLOWSHIP_MEET_RECORDINGS_FOLDER_ID,
+    FELLOWSHIP_TRANSCRIBE_CONCURRENCY,
     FELLOWSHIP_TRANSCRIBE_DIARIZE_MODEL,
     FELLOWSHIP_TRANSCRIBE_MODEL,
+    FELLOWSHIP_TRANSCRIPTION_CACHE_DIR,
+    FELLOWSHIP_TRANSCRIPTION_CACHE_MAX_AGE_DAYS,
+    FELLOWSHIP_TRANSCRIPTION_CACHE_MAX_ENTRIES,
     OPENAI_API_KEY,
     SUNDAY_WORSHIP_DIR,
     PPT_TEMPLATE_FILE,
@@ -1050,7 +1055,75 @@ def _transcription_response_to_markdown(response: object, *, offset_seconds: flo
     return "\n".join([*lines, text]).strip()
 
 
-def _transcribe_recording(recording_path: Path) -> str:
+def _chunk_transcription_cache_path(chunk: Path, request: dict) -> Path:
+    digest = hashlib.sha256()
+    with chunk.open("rb") as handle:
+        for block in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(block)
+    digest.update(json.dumps(request, sort_keys=True).encode("utf-8"))
+    return FELLOWSHIP_TRANSCRIPTION_CACHE_DIR / f"{digest.hexdigest()}.json"
+
+
+def _prune_chunk_transcription_cache() -> None:
+    """Drop cached chunk results older than the age limit, then the least recently used beyond the size limit."""
+    try:
+        entries = []
+        for path in FELLOWSHIP_TRANSCRIPTION_CACHE_DIR.glob("*.json"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+    except OSError:
+        return
+    entries.sort(reverse=True)
+    cutoff = time.time() - FELLOWSHIP_TRANSCRIPTION_CACHE_MAX_AGE_DAYS * 86400
+    for position, (mtime, path) in enumerate(entries):
+        if position >= FELLOWSHIP_TRANSCRIPTION_CACHE_MAX_ENTRIES or mtime < cutoff:
+            path.unlink(missing_ok=True)
+
+
+def _transcribe_chunk(client: object, chunk: Path, index: int, request: dict) -> dict:
+    """Transcribe one chunk, reusing a cached result for identical audio and settings."""
+    cache_path = _chunk_transcription_cache_path(chunk, request)
+    if cache_path.exists():
+        try:
+            data = json.loads(cache_path.read_text(encoding="utf-8"))
+            # A hit counts as a use, so pruning keeps entries a rerun still needs.
+            os.utime(cache_path)
+            return data
+        except (OSError, ValueError):
+            pass
+    try:
+        with chunk.open("rb") as file_obj:
+            response = client.audio.transcriptions.create(file=file_obj, **request)
+    except OSError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Unable to transcribe audio chunk {index + 1}: {exc}",
+        ) from exc
+    except Exception as exc:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"Unable to transcribe audio chunk {index + 1}: {exc}",
+        ) from exc
+    data = response.model_dump() if hasattr(response, "model_dump") else response
+    if not isinstance(data, dict):
+        data = {"text": str(response)}
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = cache_path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+    temp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    temp_path.replace(cache_path)
+    return data
+
+
+def _transcribe_recording(recording_path: Path, progress: Callable[[int, int], None] | None = None) -> str:
+    """Transcribe a recording chunk by chunk on a bounded pool.
+
+    Each finished chunk is cached by audio hash and request settings, so a
+    rerun after a failure only pays for the chunks that had not finished.
+    The cache is pruned by age and size before each recording starts.
+    ``progress`` receives (completed, total) as chunks land.
+    """
     if not OPENAI_API_KEY:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -1063,37 +1136,37 @@ def _transcribe_recording(recording_path: Path) -> str:
     model = FELLOWSHIP_TRANSCRIBE_DIARIZE_MODEL or FELLOWSHIP_TRANSCRIBE_MODEL
     uses_gpt4o_transcribe = model.startswith("gpt-4o-transcribe")
     chunks = _split_audio_for_transcription(audio_path, force=uses_gpt4o_transcribe)
+    response_format = "json" if uses_gpt4o_transcribe else "verbose_json"
+    request: dict = {"model": model, "response_format": response_format}
+    if response_format == "verbose_json" and not FELLOWSHIP_TRANSCRIBE_DIARIZE_MODEL:
+        request["timestamp_granularities"] = ["segment"]
+
+    completed = 0
+    completed_lock = threading.Lock()
+
+    def transcribe(index: int, chunk: Path) -> dict:
+        nonlocal completed
+        data = _transcribe_chunk(client, chunk, index, request)
+        # Reported under the lock so two chunks finishing together cannot
+        # move the job message backwards.
+        with completed_lock:
+            completed += 1
+            if progress:
+                progress(completed, len(chunks))
+        return data
+
+    _prune_chunk_transcription_cache()
+    if progress:
+        progress(0, len(chunks))
+    with ThreadPoolExecutor(max_workers=min(FELLOWSHIP_TRANSCRIBE_CONCURRENCY, len(chunks))) as pool:
+        futures = [pool.submit(transcribe, index, chunk) for index, chunk in enumerate(chunks)]
+        # Leaving the pool waits for every chunk, so finished chunks are cached
+        # even when an earlier one failed.
+        responses = [future.result() for future in futures]
+
     markdown_parts: list[str] = ["# 錄音自動轉錄", ""]
-    for index, chunk in enumerate(chunks):
+    for index, response in enumerate(responses):
         offset = index * FELLOWSHIP_STT_SEGMENT_SECONDS
-        response_format = "json" if uses_gpt4o_transcribe else "verbose_json"
-        kwargs = {}
-        try:
-            kwargs = {
-                "model": model,
-                "file": chunk.open("rb"),
-                "response_format": response_format,
-            }
-            if response_format == "verbose_json" and not FELLOWSHIP_TRANSCRIBE_DIARIZE_MODEL:
-                kwargs["timestamp_granularities"] = ["segment"]
-            response = client.audio.transcriptions.create(**kwargs)
-        except OSError as exc:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Unable to transcribe audio chunk {index + 1}: {exc}",
-            ) from exc
-        except Exception as exc:
-            raise HTTPException(
-                status_code=status.HTTP_502_BAD_GATEWAY,
-                detail=f"Unable to transcribe audio chunk {index + 1}: {exc}",
-            ) from exc
-        finally:
-            file_obj = locals().get("kwargs", {}).get("file")
-            if file_obj:
-                try:
-                    file_obj.close()
-                except Exception:
-                    pass
         part = _transcription_response_to_markdown(response, offset_seconds=offset, include_header=False)
         chunk_end = offset + FELLOWSHIP_STT_SEGMENT_SECONDS
         markdown_parts.append(f"## Part {index + 1} [{_format_seconds(offset)}-{_format_seconds(chunk_end)}]")
@@ -1223,7 +1296,7 @@ def _write_fellowship_analysis_outputs(date: str, transcript_text: str | None, c
     (folder / FELLOWSHIP_ANALYSIS_DOCUMENT).write_text(content.markdown.strip() + "\n", encoding="utf-8")
 
 
-def _run_fellowship_analysis(date: str) -> FellowshipAnalysisContent:
+def _run_fellowship_analysis(date: str, progress: Callable[[int, int], None] | None = None) -> FellowshipAnalysisContent:
     entry = _find_fellowship_entry(date)
     assets = resolve_fellowship_analysis_assets(entry.date)
     ppt_text = _read_analysis_asset_text(entry.date, assets.pptx) if assets.pptx else ""
@@ -1234,7 +1307,7 @@ def _run_fellowship_analysis(date: str) -> FellowshipAnalysisContent:
         if not assets.recording:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No usable transcript or recording found for fellowship analysis")
         recording_path = _download_recording_asset(entry.date, assets.recording)
-        generated_transcript = _transcribe_recording(recording_path)
+        generated_transcript = _transcribe_recording(recording_path, progress)
         meeting_text = generated_transcript
     content = _generate_analysis_content(entry, assets, meeting_text, source_transcript_text, ppt_text)
     _write_fellowship_analysis_outputs(entry.date, generated_transcript, content)
@@ -1290,8 +1363,15 @@ def run_fellowship_analysis_job(job_id: str) -> None:
     job.status = "running"
     job.message = "Resolving assets, transcribing if needed, and generating analysis"
     _set_analysis_job(job)
+
+    def transcription_progress(completed: int, total: int) -> None:
+        with _ANALYSIS_JOB_LOCK:
+            job.transcription_chunks_total = total
+            job.transcription_chunks_completed = completed
+            job.message = f"Transcribing recording ({completed}/{total} chunks)"
+
     try:
-        content = _run_fellowship_analysis(job.date)
+        content = _run_fellowship_analysis(job.date, transcription_progress)
         job.status = "completed"
         job.message = "Analysis completed"
         job.result_document_name = FELLOWSHIP_ANALYSIS_DOCUMENT
@@ -546,8 +546,8 @@ def extract_custom_frame_text(item_id: str, capture_id: str) -> SurmonSlideAsset
     if frame is None:
         raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, "Unable to load capture image")
 
-    extractor = ImageToText(item)
-    extracted_markdown = extractor.extract_text_from_frame(frame, as_markdown=True)
+    with ImageToText(item) as extractor:
+        extracted_markdown = extractor.extract_text_from_frame(frame, as_markdown=True)
     if not extracted_markdown:
         raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, "Gemini 未回傳任何文字")
 
@@ -626,8 +626,8 @@ def extract_slide_text(item_id: str, slide_id: str) -> SurmonSlideAsset:
     if frame is None:
         raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, "Unable to load slide image")
 
-    extractor = ImageToText(item)
-    extracted_markdown = extractor.extract_text_from_frame(frame, as_markdown=True)
+    with ImageToText(item) as extractor:
+        extracted_markdown = extractor.extract_text_from_frame(frame, as_markdown=True)
     if not extracted_markdown:
         raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, "Gemini 未回傳任何文字")
 
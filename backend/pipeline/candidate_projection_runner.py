@@ -26,6 +26,7 @@ from backend.pipeline.candidate_projection import (
     stable_plan_key,
     validate_candidates,
 )
+from backend.pipeline.llm_response_cache import validating_response
 from backend.pipeline.stage1 import Stage1AnthropicClient, Stage1OpenAIClient
 
 
@@ -76,7 +77,8 @@ def _generate_valid(
     for _ in range(attempts):
         response = client.generate_json(prompt, feedback, schema, cache_prefix=user_input)
         try:
-            validator(response)
+            with validating_response(client):
+                validator(response)
             return response
         except ValueError as exc:
             last_error = exc
@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+import itertools
 import json
 import os
 import shutil
 import subprocess
 import tempfile
+import threading
+import weakref
 from pathlib import Path
 from typing import Any, Mapping
 
+from backend.pipeline.llm_response_cache import cached_generate
+from backend.pipeline.llm_usage import budgeted_call
+
 
 class CodexSubscriptionError(RuntimeError):
     """The subscription backend could not produce a structured response."""
@@ -46,6 +52,16 @@ def _diagnostic(completed: subprocess.CompletedProcess[str]) -> str:
     return detail[-4000:]
 
 
+def _kill_spares(spares: dict[str, list[tuple[subprocess.Popen, Path]]]) -> None:
+    # A spare is blocked reading its prompt from stdin. Closing that pipe
+    # would hand it an empty prompt to run, so it is killed first.
+    for queue in spares.values():
+        for process, _ in queue:
+            process.kill()
+            process.communicate()
+        queue.clear()
+
+
 class CodexSubscriptionClient:
     """Adapt ``codex exec`` to the extraction runner's ``generate_json`` contract.
 
@@ -54,9 +70,15 @@ class CodexSubscriptionClient:
     use. The first real call verifies that the sanitized child environment is
     logged in specifically through ChatGPT, then all calls fail closed on any
     CLI, quota, authentication, transport, or output error.
+
+    With ``warm_workers`` set, that many ``codex exec`` processes per schema
+    are kept started and waiting for a prompt, so a request does not wait for
+    the CLI to boot. Schemas are written to the client's workspace once and
+    reused. ``close()`` stops the spares; they are also killed at exit.
     """
 
     backend = "codex_subscription"
+    provider = "codex_subscription"
 
     def __init__(
         self,
@@ -67,6 +89,7 @@ class CodexSubscriptionClient:
         max_output_tokens: int = 64000,
         executable: str | None = None,
         environment: Mapping[str, str] | None = None,
+        warm_workers: int = 0,
     ) -> None:
         self.model = model
         self.reasoning_effort = reasoning_effort
@@ -74,32 +97,158 @@ class CodexSubscriptionClient:
         self.max_output_tokens = max_output_tokens
         self.executable = executable or shutil.which("codex") or "codex"
         self.environment = subscription_environment(environment)
+        self.warm_workers = warm_workers
         self.last_usage: Any = None
         self._authenticated = False
+        self._lock = threading.Lock()
+        self._workspace: tempfile.TemporaryDirectory[str] | None = None
+        # id(schema) -> (schema, its file). Holding the schema keeps the id
+        # from being reused by another object while the entry exists.
+        self._schema_files: dict[int, tuple[Any, Path]] = {}
+        self._outputs = itertools.count()
+        # Schema file -> processes already started with it, each waiting on
+        # stdin for its prompt.
+        self._spares: dict[str, list[tuple[subprocess.Popen, Path]]] = {}
+        self._finalizer = weakref.finalize(self, _kill_spares, self._spares)
+
+    def close(self) -> None:
+        """Stop the spare processes and remove the schema and output files."""
+
+        with self._lock:
+            _kill_spares(self._spares)
+            if self._workspace is not None:
+                self._workspace.cleanup()
+                self._workspace = None
+                self._schema_files.clear()
+
+    def __enter__(self) -> CodexSubscriptionClient:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
 
     def _verify_chatgpt_login(self) -> None:
-        if self._authenticated:
-            return
-        try:
+        with self._lock:
+            if self._authenticated:
+                return
+            try:
+                completed = subprocess.run(
+                    [self.executable, "login", "status"],
+                    capture_output=True,
+                    text=True,
+                    env=self.environment,
+                    timeout=min(self.timeout_seconds, 30.0),
+                    check=False,
+                )
+            except (OSError, subprocess.TimeoutExpired) as exc:
+                raise CodexSubscriptionError(
+                    f"unable to verify Codex ChatGPT login: {type(exc).__name__}: {exc}"
+                ) from exc
+            status = "\n".join(part for part in (completed.stdout, completed.stderr) if part).strip()
+            if completed.returncode != 0 or status.casefold() != "logged in using chatgpt":
+                raise CodexSubscriptionError(
+                    "codex-subscription requires `codex login status` to report a ChatGPT login; "
+                    f"received: {status or f'exit {completed.returncode} with no output'}"
+                )
+            self._authenticated = True
+
+    def _schema_file(self, schema: Any) -> Path:
+        """The schema's file in the client's workspace, written on first use.
+
+        Callers pass the same few module-level schema dicts on every call, so
+        each is serialized once per client rather than once per request.
+        """
+
+        with self._lock:
+            cached = self._schema_files.get(id(schema))
+            if cached is not None and cached[0] is schema:
+                return cached[1]
+            if self._workspace is None:
+                self._workspace = tempfile.TemporaryDirectory(prefix="codex-subscription-extraction-")
+            path = Path(self._workspace.name) / f"response-schema-{len(self._schema_files)}.json"
+            path.write_text(json.dumps(schema, ensure_ascii=False, sort_keys=True), encoding="utf-8")
+            self._schema_files[id(schema)] = (schema, path)
+            return path
+
+    def _command(self, schema_path: Path, output_path: Path) -> list[str]:
+        return [
+            self.executable,
+            "exec",
+            "--ephemeral",
+            "--ignore-user-config",
+            "--ignore-rules",
+            "--skip-git-repo-check",
+            "--sandbox",
+            "read-only",
+            "--color",
+            "never",
+            "--model",
+            self.model,
+            "--config",
+            f'model_reasoning_effort="{self.reasoning_effort}"',
+            "--output-schema",
+            str(schema_path),
+            "--output-last-message",
+            str(output_path),
+            "-",
+        ]
+
+    def _output_path(self, schema_path: Path) -> Path:
+        return schema_path.parent / f"response-{next(self._outputs)}.json"
+
+    def _spawn(self, schema_path: Path) -> tuple[subprocess.Popen, Path]:
+        output_path = self._output_path(schema_path)
+        process = subprocess.Popen(
+            self._command(schema_path, output_path),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            cwd=schema_path.parent,
+            env=self.environment,
+        )
+        return process, output_path
+
+    def _take_warm(self, schema_path: Path) -> tuple[subprocess.Popen, Path]:
+        """A started process for this schema, and a replacement started behind it.
+
+        `codex exec` answers one prompt per process, so the process cannot be
+        reused; what can be saved is its start-up, which a spare has already
+        paid while the previous request was running.
+        """
+
+        with self._lock:
+            queue = self._spares.setdefault(str(schema_path), [])
+            taken = queue.pop(0) if queue else self._spawn(schema_path)
+            while len(queue) < self.warm_workers:
+                queue.append(self._spawn(schema_path))
+            return taken
+
+    def _run(
+        self, schema_path: Path, prompt: str, timeout: float,
+    ) -> tuple[subprocess.CompletedProcess[str], Path]:
+        if not self.warm_workers:
+            output_path = self._output_path(schema_path)
+            command = self._command(schema_path, output_path)
             completed = subprocess.run(
-                [self.executable, "login", "status"],
+                command,
+                input=prompt,
                 capture_output=True,
                 text=True,
+                cwd=schema_path.parent,
                 env=self.environment,
-                timeout=min(self.timeout_seconds, 30.0),
+                timeout=timeout,
                 check=False,
             )
-        except (OSError, subprocess.TimeoutExpired) as exc:
-            raise CodexSubscriptionError(
-                f"unable to verify Codex ChatGPT login: {type(exc).__name__}: {exc}"
-            ) from exc
-        status = "\n".join(part for part in (completed.stdout, completed.stderr) if part).strip()
-        if completed.returncode != 0 or status.casefold() != "logged in using chatgpt":
-            raise CodexSubscriptionError(
-                "codex-subscription requires `codex login status` to report a ChatGPT login; "
-                f"received: {status or f'exit {completed.returncode} with no output'}"
-            )
-        self._authenticated = True
+            return completed, output_path
+        process, output_path = self._take_warm(schema_path)
+        try:
+            stdout, stderr = process.communicate(prompt, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            raise
+        return subprocess.CompletedProcess(process.args, process.returncode, stdout, stderr), output_path
 
     def generate_json(
         self,
@@ -111,6 +260,27 @@ class CodexSubscriptionClient:
         cache_prefix: str | None = None,
     ) -> dict[str, Any]:
         del temperature  # Codex uses the selected model's supported controls.
+        # A store hit, like a fingerprint hit, must not launch Codex at all.
+        return cached_generate(
+            self,
+            model=self.model,
+            settings={"backend": self.backend, "reasoning_effort": self.reasoning_effort},
+            system_prompt=system_prompt,
+            json_schema=json_schema,
+            user_input=(cache_prefix or "") + user_prompt,
+            generate=lambda: budgeted_call(self, lambda: self._generate_json_uncached(
+                system_prompt, user_prompt, json_schema, timeout_seconds, cache_prefix,
+            )),
+        )
+
+    def _generate_json_uncached(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        json_schema: dict[str, Any],
+        timeout_seconds: float | None,
+        cache_prefix: str | None,
+    ) -> dict[str, Any]:
         self._verify_chatgpt_login()
         effective_timeout = timeout_seconds or self.timeout_seconds
         schema = json_schema.get("schema", json_schema)
@@ -125,49 +295,13 @@ class CodexSubscriptionClient:
         ]
         prompt = "".join(prompt_parts)
 
-        with tempfile.TemporaryDirectory(prefix="codex-subscription-extraction-") as temp_dir:
-            root = Path(temp_dir)
-            schema_path = root / "response-schema.json"
-            output_path = root / "response.json"
-            schema_path.write_text(
-                json.dumps(schema, ensure_ascii=False, sort_keys=True), encoding="utf-8"
-            )
-            command = [
-                self.executable,
-                "exec",
-                "--ephemeral",
-                "--ignore-user-config",
-                "--ignore-rules",
-                "--skip-git-repo-check",
-                "--sandbox",
-                "read-only",
-                "--color",
-                "never",
-                "--model",
-                self.model,
-                "--config",
-                f'model_reasoning_effort="{self.reasoning_effort}"',
-                "--output-schema",
-                str(schema_path),
-                "--output-last-message",
-                str(output_path),
-                "-",
-            ]
-            try:
-                completed = subprocess.run(
-                    command,
-                    input=prompt,
-                    capture_output=True,
-                    text=True,
-                    cwd=root,
-                    env=self.environment,
-                    timeout=effective_timeout,
-                    check=False,
-                )
-            except (OSError, subprocess.TimeoutExpired) as exc:
-                raise CodexSubscriptionError(
-                    f"Codex subscription transport failed: {type(exc).__name__}: {exc}"
-                ) from exc
+        try:
+            completed, output_path = self._run(self._schema_file(schema), prompt, effective_timeout)
+        except (OSError, subprocess.TimeoutExpired) as exc:
+            raise CodexSubscriptionError(
+                f"Codex subscription transport failed: {type(exc).__name__}: {exc}"
+            ) from exc
+        try:
             if completed.returncode != 0:
                 raise CodexSubscriptionError(
                     f"Codex subscription generation failed (exit {completed.returncode}): "
@@ -181,8 +315,10 @@ class CodexSubscriptionClient:
                     "Codex subscription returned no valid structured output: "
                     f"{type(exc).__name__}: {exc}; CLI diagnostic: {_diagnostic(completed)}"
                 ) from exc
-            if not isinstance(response, dict):
-                raise CodexSubscriptionError(
-                    f"Codex subscription response must be a JSON object, got {type(response).__name__}"
-                )
-            return response
+        finally:
+            output_path.unlink(missing_ok=True)
+        if not isinstance(response, dict):
+            raise CodexSubscriptionError(
+                f"Codex subscription response must be a JSON object, got {type(response).__name__}"
+            )
+        return response
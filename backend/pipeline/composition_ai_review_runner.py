@@ -27,6 +27,7 @@ from backend.pipeline.composition_ai_review import (
     validate_reconsideration,
     validate_review,
 )
+from backend.pipeline.llm_response_cache import validating_response
 from backend.pipeline.passage_knowledge_slice import Passage, _record_overlaps
 from backend.pipeline.base_contract_coverage import parse_passage_range
 from backend.pipeline.stage1 import Stage1AnthropicClient, Stage1OpenAIClient
@@ -252,7 +253,8 @@ def _generate_valid(
     for attempt in range(attempts):
         response = client.generate_json(prompt, feedback, schema, cache_prefix=user_input)
         try:
-            validator(response)
+            with validating_response(client):
+                validator(response)
             return response
         except CompositionReviewValidationError as exc:
             last_error = exc
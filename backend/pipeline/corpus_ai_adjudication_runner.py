@@ -34,6 +34,7 @@ from backend.pipeline.corpus_ai_review_runner import (
     _normalize_claim_layer,
     _sha256_bytes,
 )
+from backend.pipeline.llm_response_cache import validating_response
 from backend.pipeline.llm_usage import usage_row
 from backend.pipeline.run_ledger import RunRecord, run_record
 from backend.pipeline.corpus_survey_runner import PROJECT_ROOT, _load
@@ -337,12 +338,13 @@ def _run_adjudication(
             "model_id": openai_client.model, "role": "openai_adjudication",
         })
         try:
-            validate_openai_adjudication(
-                candidate,
-                reviews=reviews,
-                claims_by_id=claims_by_id,
-                transcript_segments=transcript_segments,
-            )
+            with validating_response(openai_client):
+                validate_openai_adjudication(
+                    candidate,
+                    reviews=reviews,
+                    claims_by_id=claims_by_id,
+                    transcript_segments=transcript_segments,
+                )
             openai_response = candidate
             break
         except AIAdjudicationValidationError as exc:
@@ -377,11 +379,12 @@ def _run_adjudication(
             **usage_row(getattr(claude_client, "last_usage", None), 1),
             "model_id": claude_client.model, "role": "claude_reconsideration",
         })
-        validate_claude_reconsideration(
-            reconsideration,
-            rejected_claim_ids={item["claim_id"] for item in rejected},
-            claims_by_id=claims_by_id,
-        )
+        with validating_response(claude_client):
+            validate_claude_reconsideration(
+                reconsideration,
+                rejected_claim_ids={item["claim_id"] for item in rejected},
+                claims_by_id=claims_by_id,
+            )
 
     fingerprint = adjudication_fingerprint(
         review_fingerprint=str((review_artifact.get("reviewer") or {}).get("fingerprint_sha256") or ""),
@@ -426,7 +429,7 @@ def _run_adjudication(
     return artifact
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--package", type=Path, default=DEFAULT_PACKAGE)
     parser.add_argument("--review", type=Path, default=DEFAULT_REVIEW)
@@ -443,7 +446,7 @@ def main() -> int:
     # fill the budget without streaming.
     parser.add_argument("--max-output-tokens", type=int, default=32000)
     parser.add_argument("--dry-run", action="store_true")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     transcript_dirs = args.transcript_dirs or DEFAULT_TRANSCRIPT_DIRS
     survey, claims_by_id, transcripts, _ = _load_context(args.package, transcript_dirs)
     review_artifact = json.loads(args.review.read_text(encoding="utf-8"))
@@ -30,6 +30,7 @@ from backend.pipeline.corpus_survey import validate_survey
 from backend.pipeline.corpus_survey_runner import PROJECT_ROOT, _load, _slug, _transcript_for_prompt
 from backend.pipeline.knowledge_package import live_claims
 from backend.pipeline.knowledge_source import load_knowledge_source_document
+from backend.pipeline.llm_response_cache import validating_response
 from backend.pipeline.llm_usage import usage_row, usage_summary
 from backend.pipeline.run_ledger import run_record
 from backend.pipeline.source_keys import package_row_key
@@ -238,7 +239,8 @@ def _generate_valid_review(
         )
         usage_rows.append(usage_row(getattr(client, "last_usage", None), attempt))
         try:
-            validate_review_response(response, survey)
+            with validating_response(client):
+                validate_review_response(response, survey)
             return response, usage_rows
         except AIReviewValidationError as exc:
             last_error = exc
@@ -494,7 +496,7 @@ def _write_claim_layer_review(
     return "created", output_path
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--survey-dir", type=Path, default=DEFAULT_SURVEY_DIR)
     parser.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR)
@@ -526,7 +528,7 @@ def main() -> int:
         type=Path,
         default=DEFAULT_CLAIM_LAYER_OUTPUT,
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     if not 0 <= args.spot_check_percent <= 100:
         parser.error("--spot-check-percent must be between 0 and 100")
 
@@ -20,6 +20,7 @@ from backend.pipeline.corpus_scripture_enrichment import (
     validate_enrichment,
 )
 from backend.pipeline.corpus_survey_runner import PROJECT_ROOT, _slug
+from backend.pipeline.llm_response_cache import validating_response
 from backend.pipeline.stage1 import Stage1OpenAIClient
 
 
@@ -108,16 +109,17 @@ def run_one(
         )
         response = client.generate_json(system_prompt, user_prompt, ROLE_SCHEMA)
 
-    returned_keys = [item.get("ref_key") for item in response.get("classifications") or []]
-    expected_keys = [item["ref_key"] for item in inventory]
-    if len(returned_keys) != len(set(returned_keys)) or set(returned_keys) != set(expected_keys):
-        raise ScriptureEnrichmentValidationError("model classification did not cover each ref_key exactly once")
+    with validating_response(client):
+        returned_keys = [item.get("ref_key") for item in response.get("classifications") or []]
+        expected_keys = [item["ref_key"] for item in inventory]
+        if len(returned_keys) != len(set(returned_keys)) or set(returned_keys) != set(expected_keys):
+            raise ScriptureEnrichmentValidationError("model classification did not cover each ref_key exactly once")
 
-    enrichment = make_enrichment(
-        survey, survey_path, inventory, response,
-        model=client.model, reasoning_effort=client.reasoning_effort,
-    )
-    validate_enrichment(enrichment, survey, survey_path)
+        enrichment = make_enrichment(
+            survey, survey_path, inventory, response,
+            model=client.model, reasoning_effort=client.reasoning_effort,
+        )
+        validate_enrichment(enrichment, survey, survey_path)
     output_path.write_text(json.dumps(enrichment, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
     return "created", output_path
 
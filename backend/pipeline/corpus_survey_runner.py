@@ -24,6 +24,7 @@ from dotenv import load_dotenv
 from backend.config.wang_platform_paths import wang_platform_paths
 from backend.pipeline.corpus_survey import SurveyValidationError, validate_survey
 from backend.pipeline.knowledge_source import live_script
+from backend.pipeline.llm_response_cache import validating_response
 from backend.pipeline.stage1 import Stage1OpenAIClient
 
 
@@ -493,12 +494,13 @@ def run_one(
         )
         _preserve_exact_anchor_fallbacks(candidate, payload)
         try:
-            validate_survey(
-                candidate,
-                payload,
-                raw,
-                expected_extraction_fingerprint=extraction["fingerprint_sha256"],
-            )
+            with validating_response(client):
+                validate_survey(
+                    candidate,
+                    payload,
+                    raw,
+                    expected_extraction_fingerprint=extraction["fingerprint_sha256"],
+                )
         except SurveyValidationError as exc:
             validation_error = exc
             continue
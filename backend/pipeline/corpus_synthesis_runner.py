@@ -20,6 +20,7 @@ from dotenv import load_dotenv
 from backend.config.wang_platform_paths import wang_platform_paths
 from backend.pipeline.corpus_survey import validate_survey
 from backend.pipeline.corpus_survey_runner import _load as _load_transcript
+from backend.pipeline.llm_response_cache import validating_response
 from backend.pipeline.stage1 import Stage1OpenAIClient
 
 
@@ -405,7 +406,8 @@ def _run_batches(
         }
         response = client.generate_json(prompt, json.dumps(request, ensure_ascii=False), BATCH_SCHEMA)
         _normalize_claim_refs(response, valid_refs, ["theme_candidates", "design_observations"])
-        _validate_refs(response, valid_refs, ["theme_candidates", "design_observations"])
+        with validating_response(client):
+            _validate_refs(response, valid_refs, ["theme_candidates", "design_observations"])
         response["analysis"] = {
             "status": "candidate",
             "batch_number": number,
@@ -582,12 +584,13 @@ def main() -> int:
             ["candidate_systems", "design_findings", "unresolved_tensions"],
         )
         try:
-            _validate_refs(
-                candidate,
-                valid_refs,
-                ["candidate_systems", "design_findings", "unresolved_tensions"],
-            )
-            _validate_batch_theme_refs(candidate, batch_theme_catalog)
+            with validating_response(client):
+                _validate_refs(
+                    candidate,
+                    valid_refs,
+                    ["candidate_systems", "design_findings", "unresolved_tensions"],
+                )
+                _validate_batch_theme_refs(candidate, batch_theme_catalog)
         except RuntimeError as exc:
             validation_error = exc
             print(f"final validation retry {attempt + 1}: {exc}")
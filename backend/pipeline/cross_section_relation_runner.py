@@ -23,6 +23,7 @@ from backend.pipeline.cross_section_relation import (
     render_catalogue,
     validate_proposals,
 )
+from backend.pipeline.llm_response_cache import validating_response
 from backend.pipeline.llm_usage import usage_row
 from backend.pipeline.run_ledger import run_record
 from backend.pipeline.source_keys import package_row_key
@@ -158,7 +159,8 @@ def run(
         if usage_sink is not None:
             usage_sink.append(usage_row(getattr(client, "last_usage", None), attempt))
         try:
-            validate_proposals(candidate, package, positions=positions, boundaries=boundaries)
+            with validating_response(client):
+                validate_proposals(candidate, package, positions=positions, boundaries=boundaries)
             response = candidate
             break
         except CrossSectionValidationError as exc:
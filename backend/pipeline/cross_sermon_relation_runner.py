@@ -29,6 +29,7 @@ from backend.pipeline.cross_sermon_relation import (
     validate_reconsideration,
     validate_review,
 )
+from backend.pipeline.llm_response_cache import validating_response
 from backend.pipeline.stage1 import Stage1AnthropicClient, Stage1OpenAIClient
 
 
@@ -160,7 +161,8 @@ def _generate_valid(
             client.generate_json(prompt, feedback, schema, cache_prefix=user_input)
         )
         try:
-            validate(response)
+            with validating_response(client):
+                validate(response)
             return response
         except CrossSermonRelationValidationError as exc:
             last_error = exc
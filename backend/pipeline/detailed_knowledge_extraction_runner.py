@@ -5,8 +5,10 @@ from __future__ import annotations
 import argparse
 import hashlib
 import json
+import os
 import re
 import shutil
+import threading
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -40,10 +42,11 @@ from backend.pipeline.extraction_sections import (
     save_plan,
 )
 from backend.pipeline.knowledge_source import load_source_manifest, markdown_source_document
+from backend.pipeline.llm_response_cache import validating_response
 from backend.pipeline.llm_usage import usage_row, usage_summary
 from backend.pipeline.run_ledger import RunRecord, run_record
 from backend.pipeline.sentence_ledger_runner import run as run_ledger
-from backend.pipeline.stage1 import Stage1AnthropicClient, Stage1OpenAIClient
+from backend.pipeline.stage1 import Stage1AnthropicClient, Stage1OpenAIClient, map_in_order
 from backend.pipeline.subtitle_generation import generate_subtitles
 from backend.pipeline.sermon_subtitle_persistence import (
     SubtitlePersistenceError,
@@ -89,6 +92,14 @@ DEFAULT_OUTPUT_DIR = wang_platform_paths().claim_layer_staging / "detailed-extra
 PROMPT_PATH = Path("backend/pipeline/prompts/detailed_knowledge_extraction.md")
 NOTES_PROMPT_PATH = Path("backend/pipeline/prompts/detailed_notes_knowledge_extraction.md")
 VALIDATION_ATTEMPTS = 4
+#: Sections extracted at once. How many of their calls are in flight, and how
+#: many tokens a minute they spend, is the client's provider budget; see
+#: `provider_budget`.
+SECTION_CONCURRENCY = max(1, int(os.getenv("EXTRACTION_SECTION_CONCURRENCY", "4")))
+#: Spare `codex exec` processes kept started per schema for the
+#: codex-subscription backend; 0 starts one process per call.
+CODEX_WARM_WORKERS = int(os.getenv("EXTRACTION_CODEX_WARM_WORKERS", "0"))
+_print_lock = threading.Lock()
 
 
 def _archive(path: Path) -> None:
@@ -393,6 +404,11 @@ def published_source_id(source_id: str, source_descriptor: dict[str, Any] | None
     return str((source_descriptor or {}).get("source_id") or f"SRC-{_slug(source_id)}")
 
 
+def _print_progress(**fields: Any) -> None:
+    with _print_lock:
+        print(json.dumps({"phase": "extraction", **fields}, ensure_ascii=False), flush=True)
+
+
 def _extract_sections(
     *,
     source_id: str,
@@ -407,51 +423,49 @@ def _extract_sections(
     force: bool,
     only: tuple[int, ...] | None = None,
     record: RunRecord | None = None,
+    concurrency: int | None = None,
 ) -> tuple[dict[str, Any], list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]:
     """Run every section, then concatenate.
 
     Sections do not overlap, so there is no merge step and nothing to
     deduplicate -- the combining is `combine_sections` and that is all of it.
+    The same independence lets them run side by side, `concurrency` at once;
+    results are gathered back in section order, so the package is the one a
+    sequential run writes.
     """
 
-    answered: list[tuple[Section, dict[str, Any]]] = []
-    usage_rows: list[dict[str, Any]] = []
-    section_rows: list[dict[str, Any]] = []
-    exclusions: list[dict[str, Any]] = []
-    for section in plan.sections:
-        if only is not None and section.index not in only:
-            continue
+    record_lock = threading.Lock()
+    selected = [
+        section for section in plan.sections if only is None or section.index in only
+    ]
+
+    def extract(section: Section) -> tuple[
+        dict[str, Any], list[dict[str, Any]], dict[str, Any], list[AuditedSentence]
+    ]:
         cache_path = _section_cache_path(output_dir, source_id, fingerprint, section)
         sentences = section_sentences(source, section)
         if cache_path.is_file() and not force:
-            print(json.dumps({
-                "phase": "extraction", "source": source_id,
-                "section": section.index, "sections": len(plan.sections),
-                "status": "cached",
-            }, ensure_ascii=False), flush=True)
+            _print_progress(
+                source=source_id, section=section.index, sections=len(plan.sections),
+                status="cached",
+            )
             cached = json.loads(cache_path.read_text(encoding="utf-8"))["response"]
-            answered.append((section, cached))
-            exclusions.extend(exclusions_from_audit(
-                cached, sentences, source_id=exclusion_source_id,
-                ledger_sentence_id=ledger_sentence_id))
-            section_rows.append({**vars(section), "attempts": 0, "cached": True})
-            continue
-        print(json.dumps({
-            "phase": "extraction", "source": source_id,
-            "section": section.index, "sections": len(plan.sections),
-            "title": section.title, "sentences": len(sentences), "status": "started",
-        }, ensure_ascii=False), flush=True)
+            return cached, [], {**vars(section), "attempts": 0, "cached": True}, sentences
+        _print_progress(
+            source=source_id, section=section.index, sections=len(plan.sections),
+            title=section.title, sentences=len(sentences), status="started",
+        )
         user_input = header + _section_prompt_body(source, section, sentences)
+        usage_rows: list[dict[str, Any]] = []
         last_error: DetailedExtractionValidationError | None = None
         last_candidate: dict[str, Any] | None = None
         response, attempts = None, 0
         for attempt in range(1, VALIDATION_ATTEMPTS + 1):
             attempts = attempt
-            print(json.dumps({
-                "phase": "extraction", "source": source_id,
-                "section": section.index, "sections": len(plan.sections),
-                "attempt": attempt, "status": "model_call",
-            }, ensure_ascii=False), flush=True)
+            _print_progress(
+                source=source_id, section=section.index, sections=len(plan.sections),
+                attempt=attempt, status="model_call",
+            )
             feedback = ""
             if last_error and last_candidate:
                 feedback = (
@@ -470,14 +484,16 @@ def _extract_sections(
             # ledger that only learns the total on success prices that failure
             # at nothing.
             if record is not None:
-                record.usage([call_usage])
+                with record_lock:
+                    record.usage([call_usage])
             try:
                 # A section is a composition unit, so the full contract is
                 # answerable inside it: measured, 0 of 264 relations cross a
                 # `##`, and the step a load_bearing observation reasons to is
                 # in the same section as the observation.
-                validate_response(candidate, source)
-                validate_sentence_audit(candidate, source, sentences)
+                with validating_response(client):
+                    validate_response(candidate, source)
+                    validate_sentence_audit(candidate, source, sentences)
                 response = candidate
                 break
             except DetailedExtractionValidationError as exc:
@@ -495,11 +511,23 @@ def _extract_sections(
             json.dumps({"section": vars(section), "response": response}, ensure_ascii=False) + "\n",
             encoding="utf-8",
         )
+        return response, usage_rows, {**vars(section), "attempts": attempts, "cached": False}, sentences
+
+    answered: list[tuple[Section, dict[str, Any]]] = []
+    usage_rows: list[dict[str, Any]] = []
+    section_rows: list[dict[str, Any]] = []
+    exclusions: list[dict[str, Any]] = []
+    # A failed section is raised once the others finish, so their caches are
+    # written and a rerun pays only for the section that failed.
+    for section, (response, section_usage, section_row, sentences) in zip(
+        selected, map_in_order(selected, extract, concurrency or SECTION_CONCURRENCY)
+    ):
         answered.append((section, response))
+        usage_rows.extend(section_usage)
+        section_rows.append(section_row)
         exclusions.extend(exclusions_from_audit(
             response, sentences, source_id=exclusion_source_id,
             ledger_sentence_id=ledger_sentence_id))
-        section_rows.append({**vars(section), "attempts": attempts, "cached": False})
     return combine_sections(answered), usage_rows, section_rows, exclusions
 
 
@@ -1035,7 +1063,7 @@ def build_client(
     if backend == "codex-subscription":
         return CodexSubscriptionClient(
             model=model, reasoning_effort=reasoning_effort, timeout_seconds=900,
-            max_output_tokens=max_output_tokens,
+            max_output_tokens=max_output_tokens, warm_workers=CODEX_WARM_WORKERS,
         )
     if backend != "api":
         raise ValueError(f"unknown backend {backend!r}")
@@ -1060,7 +1088,7 @@ def build_client(
     )
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--transcript-dir", type=Path, default=DEFAULT_TRANSCRIPT_DIR)
     parser.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR)
@@ -1099,7 +1127,7 @@ def main() -> int:
     )
     parser.add_argument("--force", action="store_true")
     parser.add_argument("--dry-run", action="store_true")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     if args.write_back_generated_subtitles and args.no_generated_sections:
         parser.error("--write-back-generated-subtitles cannot be combined with --no-generated-sections")
     if args.write_back_generated_subtitles and not args.subtitle_user_id:
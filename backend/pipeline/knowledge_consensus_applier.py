@@ -342,7 +342,7 @@ def apply_consensus_overrides(
     return result
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--package", type=Path, required=True)
     parser.add_argument("--overrides", type=Path, required=True)
@@ -351,7 +351,7 @@ def main() -> int:
         "--transcript-dir", type=Path,
         default=Path("/opt/homebrew/var/www/church/web/data/script_published"),
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     package = json.loads(args.package.read_text(encoding="utf-8"))
     overrides = json.loads(args.overrides.read_text(encoding="utf-8"))
     transcripts = {}
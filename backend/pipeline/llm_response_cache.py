@@ -0,0 +1,386 @@
+"""One content-addressed store for structured model responses, shared by every runner.
+
+Each runner grew its own output cache -- a fingerprint in the artifact, an
+`_archive` of the old one -- and those still decide whether an *artifact* is
+rebuilt.  None of them could notice that a survey, a review and a rerun after a
+crash were paying for the same call.  This store sits under all of them, in the
+`generate_json` of each client, so an identical call is answered from disk
+whichever runner makes it.
+
+An entry is keyed by the model and its settings plus the SHA-256 of the system
+prompt, the response schema and the user input.  Anything that can change the
+answer is in the key.
+
+**Only an accepted answer is stored.**  Runners build retry feedback from the
+answer they rejected, so every attempt's input is deterministic; storing each
+answer as it arrived meant a rerun replayed the same rejected attempts from
+disk and failed the same way without reaching the model.  A model answer is
+held for its client and thread until the caller judges it: `accept_response`
+writes it, `reject_response` drops it -- and deletes the entry if the answer
+came from the store, so a stored answer that newer validation refuses is asked
+again.  `validating_response` does both around a validation block.
+
+The store is off unless `LLM_RESPONSE_CACHE_DIR` names a directory: a rerun that
+wants a fresh answer must be able to get one, and that is the operator's call.
+`LLM_RESPONSE_CACHE_MAX_BYTES` bounds it (2 GiB by default); the least recently
+read entries go first.
+"""
+
+from __future__ import annotations
+
+import argparse
+import atexit
+import copy
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterator, Mapping
+
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+STATS_FILE = "stats.jsonl"
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def response_key(
+    *, model: str, settings: Mapping[str, Any], system_prompt: str, json_schema: Any,
+    user_input: str,
+) -> str:
+    """The entry key: (model and settings, prompt sha, schema sha, input sha)."""
+
+    return _sha256(json.dumps({
+        "model": model,
+        "settings": dict(settings),
+        "prompt_sha256": _sha256(system_prompt),
+        "schema_sha256": _sha256(json.dumps(json_schema, ensure_ascii=False, sort_keys=True)),
+        "input_sha256": _sha256(user_input),
+    }, ensure_ascii=False, sort_keys=True))
+
+
+class ResponseCache:
+    """Entries live at `<root>/<key[:2]>/<key>.json`; reading one refreshes its mtime.
+
+    Writes go through a temporary file and `os.replace`, so concurrent runners
+    see either the whole entry or none of it.  Two runners missing the same key
+    at once both pay for the call and the last write wins -- the same answer to
+    the same question, so nothing is lost but the money.
+    """
+
+    def __init__(self, root: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.hits = self.misses = self.writes = self.evicted = 0
+        self._lock = threading.Lock()
+        self._bytes: int | None = None
+        # Per thread: id(client) -> (client, key, model, response, from_store)
+        # for the last answer that client gave on that thread.
+        self._pending = threading.local()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def entries(self) -> Iterator[Path]:
+        return self.root.glob("??/*.json")
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            os.utime(path)
+        except FileNotFoundError:
+            entry = None
+        except (OSError, json.JSONDecodeError):
+            # A truncated entry is a miss, and the write after it repairs it.
+            entry = None
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return None if entry is None else entry["response"]
+
+    def put(self, key: str, response: dict[str, Any], *, model: str) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps({
+            "key": key,
+            "model": model,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "response": response,
+        }, ensure_ascii=False)
+        handle, temporary = tempfile.mkstemp(dir=path.parent, prefix=".", suffix=".tmp")
+        with os.fdopen(handle, "w", encoding="utf-8") as stream:
+            stream.write(payload)
+        os.replace(temporary, path)
+        with self._lock:
+            self.writes += 1
+            if self._bytes is None:
+                self._bytes = sum(entry.stat().st_size for entry in self.entries())
+            else:
+                self._bytes += len(payload.encode("utf-8"))
+            over = self._bytes > self.max_bytes
+        if over:
+            self.prune(max_bytes=self.max_bytes * 9 // 10)
+
+    def prune(
+        self, *, max_bytes: int | None = None, older_than_seconds: float | None = None,
+    ) -> int:
+        """Remove entries unread for `older_than_seconds`, then the least recently
+        read until the rest fit in `max_bytes`.  Returns how many were removed."""
+
+        sized = []
+        for path in self.entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            sized.append((stat.st_mtime, stat.st_size, path))
+        sized.sort()
+        total = sum(size for _, size, _ in sized)
+        cutoff = None if older_than_seconds is None else time.time() - older_than_seconds
+        removed = 0
+        for mtime, size, path in sized:
+            stale = cutoff is not None and mtime < cutoff
+            if not stale and (max_bytes is None or total <= max_bytes):
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        with self._lock:
+            self._bytes = total
+            self.evicted += removed
+        return removed
+
+    def through(
+        self, client: Any, *, model: str, settings: Mapping[str, Any], system_prompt: str,
+        json_schema: Any, user_input: str, generate: Callable[[], dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Answer from the store or from `generate`, held until the caller judges it."""
+
+        key = response_key(
+            model=model, settings=settings, system_prompt=system_prompt,
+            json_schema=json_schema, user_input=user_input,
+        )
+        response = self.get(key)
+        from_store = response is not None
+        if from_store:
+            # Nothing was billed; a stale usage object would be counted again.
+            client.last_usage = None
+        else:
+            response = generate()
+        # A copy, so what is stored is the answer as given even if the caller
+        # normalizes it in place before judging it.
+        self._pending_for_thread()[id(client)] = (
+            client, key, model, None if from_store else copy.deepcopy(response), from_store,
+        )
+        return response
+
+    def _pending_for_thread(self) -> dict[int, tuple[Any, str, str, dict[str, Any] | None, bool]]:
+        pending = getattr(self._pending, "by_client", None)
+        if pending is None:
+            pending = self._pending.by_client = {}
+        return pending
+
+    def _take_pending(self, client: Any) -> tuple[str, str, dict[str, Any] | None, bool] | None:
+        entry = self._pending_for_thread().pop(id(client), None)
+        if entry is None or entry[0] is not client:
+            return None
+        return entry[1:]
+
+    def accept(self, client: Any) -> None:
+        """Store the last answer `client` gave on this thread."""
+
+        entry = self._take_pending(client)
+        if entry is not None and not entry[3]:
+            key, model, response, _ = entry
+            self.put(key, response, model=model)
+
+    def reject(self, client: Any) -> None:
+        """Forget the last answer `client` gave on this thread, on disk too."""
+
+        entry = self._take_pending(client)
+        if entry is not None and entry[3]:
+            self._path(entry[0]).unlink(missing_ok=True)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits, "misses": self.misses,
+                "writes": self.writes, "evicted": self.evicted,
+            }
+
+    def record_stats(self) -> None:
+        """Append this process's counters to the store's stats log, if it did anything."""
+
+        counters = self.stats()
+        if not any(counters.values()):
+            return
+        line = json.dumps({
+            "finished_at": datetime.now(timezone.utc).isoformat(), "pid": os.getpid(), **counters,
+        })
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            with (self.root / STATS_FILE).open("a", encoding="utf-8") as stream:
+                stream.write(line + "\n")
+        except OSError as exc:
+            print(f"llm_response_cache: could not record stats: {exc}", file=sys.stderr)
+
+
+_caches: dict[tuple[Path, int], ResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def default_cache() -> ResponseCache | None:
+    """The store named by `LLM_RESPONSE_CACHE_DIR`, or None when it is unset."""
+
+    root = os.getenv("LLM_RESPONSE_CACHE_DIR")
+    if not root:
+        return None
+    max_bytes = int(os.getenv("LLM_RESPONSE_CACHE_MAX_BYTES") or DEFAULT_MAX_BYTES)
+    identity = (Path(root).expanduser(), max_bytes)
+    with _caches_lock:
+        cache = _caches.get(identity)
+        if cache is None:
+            cache = _caches[identity] = ResponseCache(identity[0], max_bytes)
+            atexit.register(cache.record_stats)
+        return cache
+
+
+def cached_generate(
+    client: Any, *, model: str, settings: Mapping[str, Any], system_prompt: str,
+    json_schema: Any, user_input: str, generate: Callable[[], dict[str, Any]],
+) -> dict[str, Any]:
+    """`generate()` through the default store, or directly when there is none."""
+
+    cache = default_cache()
+    if cache is None:
+        return generate()
+    return cache.through(
+        client, model=model, settings=settings, system_prompt=system_prompt,
+        json_schema=json_schema, user_input=user_input, generate=generate,
+    )
+
+
+def accept_response(client: Any) -> None:
+    """The caller validated `client`'s last answer on this thread; store it."""
+
+    cache = default_cache()
+    if cache is not None:
+        cache.accept(client)
+
+
+def reject_response(client: Any) -> None:
+    """The caller refused `client`'s last answer on this thread; never serve it."""
+
+    cache = default_cache()
+    if cache is not None:
+        cache.reject(client)
+
+
+@contextmanager
+def validating_response(client: Any) -> Iterator[None]:
+    """Accept `client`'s last answer if the block finishes, reject it if it raises."""
+
+    try:
+        yield
+    except BaseException:
+        reject_response(client)
+        raise
+    accept_response(client)
+
+
+def _summary(cache: ResponseCache) -> dict[str, Any]:
+    models: dict[str, int] = {}
+    count = size = 0
+    oldest = newest = None
+    for path in cache.entries():
+        try:
+            stat = path.stat()
+            model = json.loads(path.read_text(encoding="utf-8")).get("model")
+        except (OSError, json.JSONDecodeError):
+            continue
+        count += 1
+        size += stat.st_size
+        models[model] = models.get(model, 0) + 1
+        oldest = stat.st_mtime if oldest is None else min(oldest, stat.st_mtime)
+        newest = stat.st_mtime if newest is None else max(newest, stat.st_mtime)
+    totals = {"hits": 0, "misses": 0, "writes": 0, "evicted": 0}
+    stats_path = cache.root / STATS_FILE
+    if stats_path.is_file():
+        for line in stats_path.read_text(encoding="utf-8").splitlines():
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            for name in totals:
+                totals[name] += int(row.get(name) or 0)
+    looked_up = totals["hits"] + totals["misses"]
+
+    def stamp(value: float | None) -> str | None:
+        return None if value is None else datetime.fromtimestamp(value, timezone.utc).isoformat()
+
+    return {
+        "root": str(cache.root),
+        "entries": count,
+        "bytes": size,
+        "max_bytes": cache.max_bytes,
+        "models": dict(sorted(models.items(), key=lambda item: str(item[0]))),
+        "least_recently_read": stamp(oldest),
+        "most_recently_read": stamp(newest),
+        **totals,
+        "hit_rate": round(totals["hits"] / looked_up, 4) if looked_up else None,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument(
+        "--root", type=Path,
+        help="store directory; defaults to LLM_RESPONSE_CACHE_DIR",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("stats", help="entries, size, models, and hit/miss totals")
+    show = commands.add_parser("show", help="print one entry")
+    show.add_argument("key")
+    prune = commands.add_parser("prune", help="remove stale or least recently read entries")
+    prune.add_argument("--max-bytes", type=int)
+    prune.add_argument("--older-than-days", type=float)
+    args = parser.parse_args(argv)
+
+    root = args.root or (Path(os.environ["LLM_RESPONSE_CACHE_DIR"]).expanduser()
+                         if os.getenv("LLM_RESPONSE_CACHE_DIR") else None)
+    if root is None:
+        parser.error("--root is required when LLM_RESPONSE_CACHE_DIR is unset")
+    cache = ResponseCache(
+        root, int(os.getenv("LLM_RESPONSE_CACHE_MAX_BYTES") or DEFAULT_MAX_BYTES),
+    )
+    if args.command == "stats":
+        print(json.dumps(_summary(cache), ensure_ascii=False, indent=2))
+    elif args.command == "show":
+        path = cache._path(args.key)
+        if not path.is_file():
+            print(f"no entry {args.key}", file=sys.stderr)
+            return 1
+        print(json.dumps(json.loads(path.read_text(encoding="utf-8")), ensure_ascii=False, indent=2))
+    else:
+        if args.max_bytes is None and args.older_than_days is None:
+            parser.error("prune needs --max-bytes or --older-than-days")
+        removed = cache.prune(
+            max_bytes=args.max_bytes,
+            older_than_seconds=None if args.older_than_days is None else args.older_than_days * 86400,
+        )
+        print(json.dumps({"removed": removed, **_summary(cache)}, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -8,7 +8,12 @@ rather than an estimate.
 
 from __future__ import annotations
 
-from typing import Any
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
 
 
 def usage_row(usage: Any, attempt: int) -> dict[str, Any]:
@@ -65,3 +70,97 @@ def usage_summary(label: str, usage_rows: list[dict[str, Any]]) -> dict[str, Any
         "cache_hit": f"{100 * cached / prompt:.0f}%" if prompt else "n/a",
         "completion_tokens": sum(row["completion_tokens"] or 0 for row in usage_rows),
     }
+
+
+class CallBudget:
+    """How many model calls may be in flight, and how many tokens a minute.
+
+    One budget is shared by every client of a provider in the process (see
+    `provider_budget`): the limits are the account's, not a thread's or a
+    client's. A call waits for a free slot and then, when `tokens_per_minute`
+    is set, for the tokens spent over the last minute to drop below it.
+    """
+
+    WINDOW_SECONDS = 60.0
+
+    def __init__(
+        self,
+        max_requests: int,
+        tokens_per_minute: int | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.max_requests = max(1, max_requests)
+        self.tokens_per_minute = tokens_per_minute or None
+        self._slots = threading.BoundedSemaphore(self.max_requests)
+        self._spent: deque[tuple[float, int]] = deque()
+        self._lock = threading.Lock()
+        self._clock = clock
+        self._sleep = sleep
+
+    @contextmanager
+    def request(self) -> Iterator[None]:
+        with self._slots:
+            self._wait_for_tokens()
+            yield
+
+    def spend(self, tokens: int | None) -> None:
+        """Charge one finished call, read from its usage row's `total_tokens`."""
+        if tokens:
+            with self._lock:
+                self._spent.append((self._clock(), tokens))
+
+    def _wait_for_tokens(self) -> None:
+        while self.tokens_per_minute:
+            with self._lock:
+                now = self._clock()
+                while self._spent and self._spent[0][0] <= now - self.WINDOW_SECONDS:
+                    self._spent.popleft()
+                if sum(tokens for _, tokens in self._spent) < self.tokens_per_minute:
+                    return
+                delay = self._spent[0][0] + self.WINDOW_SECONDS - now
+            self._sleep(delay)
+
+
+_budgets: dict[tuple[str, int, int | None], CallBudget] = {}
+_budgets_lock = threading.Lock()
+
+
+def provider_budget(provider: str) -> CallBudget:
+    """The process-wide budget for one provider's model calls.
+
+    Sized by `LLM_<PROVIDER>_MAX_CONCURRENT_REQUESTS` (default 4) and
+    `LLM_<PROVIDER>_TOKENS_PER_MINUTE` (off unless set). Every client for the
+    provider draws from it, so a Stage 1 job, an extraction and subtitle
+    generation running in one process share the account's limits instead of
+    each enforcing its own.
+    """
+
+    name = provider.upper()
+    identity = (
+        provider,
+        int(os.getenv(f"LLM_{name}_MAX_CONCURRENT_REQUESTS") or 4),
+        int(os.getenv(f"LLM_{name}_TOKENS_PER_MINUTE") or 0) or None,
+    )
+    with _budgets_lock:
+        budget = _budgets.get(identity)
+        if budget is None:
+            budget = _budgets[identity] = CallBudget(identity[1], identity[2])
+        return budget
+
+
+def budgeted_call(client: Any, generate: Callable[[], Any]) -> Any:
+    """Run one of `client`'s model calls inside its provider's budget.
+
+    The tokens charged are the call's own, read from `client.last_usage` on
+    the thread that made it; a backend that reports no usage takes a request
+    slot and spends nothing.
+    """
+
+    budget = provider_budget(client.provider)
+    with budget.request():
+        response = generate()
+        tokens = usage_row(client.last_usage, 0)["total_tokens"]
+    budget.spend(tokens)
+    return response
@@ -26,6 +26,7 @@ import re
 from pathlib import Path
 from typing import Any, Callable
 
+from backend.pipeline.llm_response_cache import validating_response
 from backend.pipeline.matthew_exposition_authoring import (
     canonical_json,
     evidence_step_fragment_ids,
@@ -372,7 +373,8 @@ def check_paragraph_grounding(
     result = _cached_verdict(cache_dir, fingerprint)
     if result is None:
         result = client.generate_json(prompt, payload, GROUNDING_RESULT_SCHEMA)
-        validate_grounding_result(result, paragraph_text=paragraph_text)
+        with validating_response(client):
+            validate_grounding_result(result, paragraph_text=paragraph_text)
         _store_verdict(cache_dir, fingerprint, result)
     validate_grounding_result(result, paragraph_text=paragraph_text)
     # Derived, never self-reported: quoting a sentence it cannot ground is the
@@ -46,6 +46,7 @@ from backend.pipeline.matthew_exposition_authoring import (
     validate_revision_result,
     validate_strict_schema,
 )
+from backend.pipeline.llm_response_cache import validating_response
 from backend.pipeline.stage1 import Stage1AnthropicClient, Stage1OpenAIClient
 from backend.pipeline.editorial_draft_audit import write_editorial_draft_audit
 from backend.pipeline.editorial_draft_repository import publish_automated_editorial_draft
@@ -402,6 +403,8 @@ def _repair_grounding(
         ),
         force=force,
     )
+    with validating_response(openai_client):
+        validate_strict_schema(repaired, AUTHOR_RESULT_SCHEMA)
     return repaired
 
 
@@ -695,18 +698,19 @@ def run_authoring(
             generate=lambda: seeded_author_result,
             force=force,
         )
-    validate_strict_schema(author_result, AUTHOR_RESULT_SCHEMA)
     valid_claim_ids = {
         item["claim_id"]
         for item in packet["knowledge"].get("claims", [])
         if isinstance(item, dict) and item.get("claim_id")
     }
-    validate_author_result(
-        author_result,
-        contract=packet["base_contract"],
-        plan=packet["plan"],
-        valid_claim_ids=valid_claim_ids,
-    )
+    with validating_response(openai_client):
+        validate_strict_schema(author_result, AUTHOR_RESULT_SCHEMA)
+        validate_author_result(
+            author_result,
+            contract=packet["base_contract"],
+            plan=packet["plan"],
+            valid_claim_ids=valid_claim_ids,
+        )
     if author_result["status"] == "plan_change_required":
         return {
             "status": "plan_change_required",
@@ -879,12 +883,13 @@ def run_authoring(
             )
             # Literal anchors and all other contracts are verified before the
             # response can be persisted or used by another stage.
-            validate_editorial_review(
-                generated,
-                contract=packet["base_contract"],
-                manuscript=draft,
-                quality_profile=packet["quality_profile"],
-            )
+            with validating_response(claude_client):
+                validate_editorial_review(
+                    generated,
+                    contract=packet["base_contract"],
+                    manuscript=draft,
+                    quality_profile=packet["quality_profile"],
+                )
             return generated
 
         review, review_cached = _run_cached_stage(
@@ -975,8 +980,9 @@ def run_authoring(
         ),
         force=force,
     )
-    validate_strict_schema(adjudication, ADJUDICATION_SCHEMA)
-    _validate_exact_ids(adjudication["adjudications"], finding_ids, "adjudication")
+    with validating_response(openai_client):
+        validate_strict_schema(adjudication, ADJUDICATION_SCHEMA)
+        _validate_exact_ids(adjudication["adjudications"], finding_ids, "adjudication")
     rejected_ids = {
         item["finding_id"] for item in adjudication["adjudications"] if item["decision"] == "reject"
     }
@@ -1007,8 +1013,9 @@ def run_authoring(
             ),
             force=force,
         )
-        validate_strict_schema(reconsideration, RECONSIDERATION_SCHEMA)
-        _validate_exact_ids(reconsideration["reconsiderations"], rejected_ids, "reconsideration")
+        with validating_response(claude_client):
+            validate_strict_schema(reconsideration, RECONSIDERATION_SCHEMA)
+            _validate_exact_ids(reconsideration["reconsiderations"], rejected_ids, "reconsideration")
         maintained_ids = {
             item["finding_id"] for item in reconsideration["reconsiderations"] if item["decision"] == "maintain"
         }
@@ -1106,21 +1113,22 @@ def run_authoring(
     # rejects the combination of that status with a manuscript -- correctly,
     # since a handoff must not double as a final draft, but a model returning
     # both should end the run with a reviewable status rather than a traceback.
-    if revision.get("status") == "plan_change_required":
-        return {
-            "status": "plan_change_required_after_review",
-            "revision_path": str(output_dir / "revision-01.json"),
-            "plan_change_requests": revision.get("plan_change_requests", []),
-            "returned_manuscript_with_handoff": bool(revision.get("manuscript_markdown")),
-        }
-    validate_revision_result(
-        revision,
-        contract=packet["base_contract"],
-        plan=packet["plan"],
-        valid_claim_ids=valid_claim_ids,
-    )
-    dispositions = revision.get("finding_dispositions", [])
-    _validate_exact_ids(dispositions, accepted_ids, "revision dispositions")
+    with validating_response(openai_client):
+        if revision.get("status") == "plan_change_required":
+            return {
+                "status": "plan_change_required_after_review",
+                "revision_path": str(output_dir / "revision-01.json"),
+                "plan_change_requests": revision.get("plan_change_requests", []),
+                "returned_manuscript_with_handoff": bool(revision.get("manuscript_markdown")),
+            }
+        validate_revision_result(
+            revision,
+            contract=packet["base_contract"],
+            plan=packet["plan"],
+            valid_claim_ids=valid_claim_ids,
+        )
+        dispositions = revision.get("finding_dispositions", [])
+        _validate_exact_ids(dispositions, accepted_ids, "revision dispositions")
     blocking_ids = {item["finding_id"] for item in accepted_findings if item["blocking"]}
     deferred_blocking = {
         item["finding_id"] for item in dispositions
@@ -1183,12 +1191,13 @@ def run_authoring(
         generated = _call_final_reviewer(
             claude_client, delta_prompt, delta_input, FINAL_DELTA_REVIEW_SCHEMA
         )
-        validate_final_delta_review(
-            generated,
-            packet=delta_packet,
-            revised_manuscript=revised_draft,
-            quality_profile=packet["quality_profile"],
-        )
+        with validating_response(claude_client):
+            validate_final_delta_review(
+                generated,
+                packet=delta_packet,
+                revised_manuscript=revised_draft,
+                quality_profile=packet["quality_profile"],
+            )
         return generated
 
     delta_review, delta_cached = _run_cached_stage(
@@ -25,6 +25,7 @@ from pathlib import Path
 from typing import Any, Optional
 
 from backend.pipeline.knowledge_package import live_claims
+from backend.pipeline.llm_response_cache import validating_response
 from backend.pipeline.observation_argument_coverage import (
     REACHED,
     measure_coverage,
@@ -264,7 +265,8 @@ def main(argv: list[str] | None = None) -> int:
         json.dumps(packet, ensure_ascii=False),
         RESPONSE_SCHEMA,
     )
-    validate_adjudication(response, packet)
+    with validating_response(client):
+        validate_adjudication(response, packet)
     report = summarize(response, packet)
 
     totals = report["totals"]
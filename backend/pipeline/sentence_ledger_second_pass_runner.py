@@ -24,6 +24,7 @@ from typing import Any, Sequence
 
 from dotenv import load_dotenv
 
+from backend.pipeline.llm_response_cache import validating_response
 from backend.pipeline.sentence_ledger import build_inventory, reconcile, summarise
 from backend.pipeline.sentence_ledger_runner import load_segments, place_fragments
 from backend.pipeline.sentence_ledger_second_pass import (
@@ -78,7 +79,8 @@ def run_batch(
         )
         usage.append({"attempt": attempt, "usage": _usage(client.last_usage)})
         try:
-            validate_response(candidate, questions)
+            with validating_response(client):
+                validate_response(candidate, questions)
             return candidate, usage
         except SecondPassValidationError as exc:
             last_error, previous = exc, candidate
@@ -6,7 +6,9 @@ import logging
 import os
 import re
 import shutil
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -16,10 +18,63 @@ from anthropic import Anthropic
 from openai import OpenAI
 
 from backend.api.openai_client import DEFAULT_OPENAI_GENERATION_MODEL
+from backend.pipeline.llm_response_cache import cached_generate, validating_response
+from backend.pipeline.llm_usage import budgeted_call
 
 LogCallback = Callable[[str, str], None]
 ProgressCallback = Callable[[str, int], None]
 
+#: Units a pipeline generates at once; 1 restores the one-at-a-time loop.
+STAGE1_UNIT_CONCURRENCY = max(1, int(os.getenv("STAGE1_UNIT_CONCURRENCY", "4")))
+
+def map_in_order(
+    items: List[Any],
+    work: Callable[[Any], Any],
+    concurrency: int,
+    before_each: Optional[Callable[[int], None]] = None,
+) -> List[Any]:
+    """Run ``work`` over ``items`` on at most ``concurrency`` threads.
+
+    Results come back in item order. ``before_each(position)`` runs on the
+    calling thread once every earlier item has finished, so progress reported
+    from it advances exactly as the sequential loop's did. If ``work`` raises,
+    the first failing item's exception is re-raised after the others finish.
+    """
+    results: List[Any] = []
+    if concurrency <= 1 or len(items) <= 1:
+        for position, item in enumerate(items):
+            if before_each:
+                before_each(position)
+            results.append(work(item))
+        return results
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(items))) as pool:
+        futures = [pool.submit(work, item) for item in items]
+        for position, future in enumerate(futures):
+            if before_each:
+                before_each(position)
+            results.append(future.result())
+    return results
+
+
+class PerThread:
+    """An instance attribute that holds one value per thread.
+
+    Used for `last_usage`: callers read it straight after the call that set
+    it, and when worker threads share one client a plain attribute hands each
+    of them whichever call happened to finish last.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.key = f"_{name}_per_thread"
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        return getattr(instance.__dict__.get(self.key), "value", None)
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        instance.__dict__.setdefault(self.key, threading.local()).value = value
+
 
 def _utcnow() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -164,6 +219,7 @@ class StructuredLogger:
         self.callback = callback
         self.logger = logging.getLogger(f"stage1.{log_path}")
         self.logger.setLevel(logging.INFO)
+        self._lock = threading.Lock()
 
     def emit(self, role: str, message: str, **fields: Any) -> None:
         entry = {
@@ -174,7 +230,7 @@ class StructuredLogger:
         if fields:
             entry.update(fields)
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
-        with self.log_path.open("a", encoding="utf-8") as handle:
+        with self._lock, self.log_path.open("a", encoding="utf-8") as handle:
             handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
         self.logger.info("%s: %s", role, message)
         if self.callback:
@@ -203,6 +259,8 @@ ADAPTIVE_THINKING_MODELS = re.compile(r"^claude-(opus-5|sonnet-5|fable-5|mythos-
 
 
 class Stage1AnthropicClient:
+    last_usage = PerThread()
+
     def __init__(
         self,
         model: str = "claude-sonnet-4-6",
@@ -217,6 +275,7 @@ class Stage1AnthropicClient:
         self.timeout_seconds = timeout_seconds
         self.max_retries = max_retries
         self.max_output_tokens = max_output_tokens
+        self.provider = "anthropic"
         self.client = Anthropic(
             api_key=api_key,
             max_retries=0,
@@ -240,15 +299,26 @@ class Stage1AnthropicClient:
         timeout_seconds: Optional[float] = None,
         cache_prefix: Optional[str] = None,
     ) -> Dict[str, Any]:
-        return self._with_retries(
-            lambda: self._generate_json_once(
-                system_prompt=system_prompt,
-                user_prompt=user_prompt,
-                json_schema=json_schema,
-                temperature=temperature,
-                timeout_seconds=timeout_seconds,
-                cache_prefix=cache_prefix,
-            )
+        return cached_generate(
+            self,
+            model=self.model,
+            settings={
+                "provider": self.provider, "temperature": temperature,
+                "max_output_tokens": self.max_output_tokens,
+            },
+            system_prompt=system_prompt,
+            json_schema=json_schema,
+            user_input=(cache_prefix or "") + user_prompt,
+            generate=lambda: budgeted_call(self, lambda: self._with_retries(
+                lambda: self._generate_json_once(
+                    system_prompt=system_prompt,
+                    user_prompt=user_prompt,
+                    json_schema=json_schema,
+                    temperature=temperature,
+                    timeout_seconds=timeout_seconds,
+                    cache_prefix=cache_prefix,
+                )
+            )),
         )
 
     def generate_text(
@@ -483,6 +553,8 @@ class Stage1AnthropicClient:
 class Stage1OpenAIClient:
     """OpenAI structured-output adapter for the production Stage 1 pipeline."""
 
+    last_usage = PerThread()
+
     def __init__(
         self,
         model: str = DEFAULT_OPENAI_GENERATION_MODEL,
@@ -506,6 +578,9 @@ class Stage1OpenAIClient:
         self.max_retries = max_retries
         self.max_output_tokens = max_output_tokens
         self.reasoning_effort = reasoning_effort
+        # Rate limits are per provider, so a DeepSeek key draws from its own
+        # budget rather than OpenAI's; see `provider_budget`.
+        self.provider = api_key_env.lower().replace("_api_key", "") or "openai"
         # Declared by the backend registry rather than guessed from the model
         # id; `None` keeps the guess, so a model that declares nothing behaves
         # exactly as it did. See `_wants_reasoning_effort`.
@@ -583,6 +658,33 @@ class Stage1OpenAIClient:
         # identical to concatenating it at the call site.
         if cache_prefix:
             user_prompt = cache_prefix + user_prompt
+        settings: Dict[str, Any] = {
+            "provider": self.provider, "max_output_tokens": self.max_output_tokens,
+        }
+        if self._wants_reasoning_effort():
+            settings["reasoning_effort"] = self.reasoning_effort
+        if self._wants_temperature():
+            settings["temperature"] = temperature
+        return cached_generate(
+            self,
+            model=self.model,
+            settings=settings,
+            system_prompt=system_prompt,
+            json_schema=json_schema,
+            user_input=user_prompt,
+            generate=lambda: budgeted_call(self, lambda: self._generate_json_uncached(
+                system_prompt, user_prompt, json_schema, temperature, timeout_seconds,
+            )),
+        )
+
+    def _generate_json_uncached(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        json_schema: Dict[str, Any],
+        temperature: float,
+        timeout_seconds: Optional[float],
+    ) -> Dict[str, Any]:
         last_error: Optional[Exception] = None
         for attempt in range(1, self.max_retries + 1):
             try:
@@ -766,11 +868,14 @@ class Stage1Pipeline:
         max_retries: int = 3,
         logger: Optional[StructuredLogger] = None,
         progress_callback: Optional[ProgressCallback] = None,
+        unit_concurrency: Optional[int] = None,
     ) -> None:
         self.model = model
         self.project_type = "transcript" if project_type == "transcript" else "sermon_note"
         self.timeout_seconds = timeout_seconds
         self.max_retries = max_retries
+        self.unit_concurrency = unit_concurrency or STAGE1_UNIT_CONCURRENCY
+        self._manifest_lock = threading.Lock()
         self.llm = Stage1OpenAIClient(
             model=model,
             timeout_seconds=timeout_seconds,
@@ -868,127 +973,22 @@ class Stage1Pipeline:
             raise ValueError("No matching units selected for generation")
 
         total_units = len(units_to_process)
-        completed_units: List[GeneratedUnit] = []
-        failed_units: List[Dict[str, str]] = []
 
-        for index, unit in enumerate(units_to_process, start=1):
-            progress = 10 if total_units == 0 else 10 + int((index - 1) / total_units * 85)
-            self._progress("逐單元生成", progress)
-            artifact_path = generated_dir / f"{unit.unit_id}.json"
-            points_artifact_path = generated_dir / f"{unit.unit_id}.points.json"
-            existing_unit = self._load_generated_unit(
-                artifact_path=artifact_path,
-                expected_source_hash=source_doc.sha256,
-                expected_model=self.model,
-            )
-            if existing_unit:
-                completed_units.append(existing_unit)
-                self._log(
-                    "expander",
-                    f"跳過 {unit.unit_id}，沿用既有輸出。",
-                    unit_id=unit.unit_id,
-                )
-                self._mark_unit_status(
-                    manifest=manifest,
-                    manifest_path=manifest_path,
-                    unit_id=unit.unit_id,
-                    status="completed",
-                    artifact=str(artifact_path),
-                )
-                continue
-
-            self._log(
-                "expander",
-                f"開始生成 {unit.unit_id}：{unit.unit_title}",
-                unit_id=unit.unit_id,
-                scripture_range=unit.scripture_range,
-            )
-            self._mark_unit_status(
+        def generate(unit: UnitBoundary) -> Optional[Dict[str, str]]:
+            return self._process_unit(
+                source_doc=source_doc,
+                unit=unit,
+                units=units,
+                generated_dir=generated_dir,
                 manifest=manifest,
                 manifest_path=manifest_path,
-                unit_id=unit.unit_id,
-                status="running",
-                artifact=str(artifact_path),
             )
-            try:
-                points = self._load_points_artifact(
-                    artifact_path=points_artifact_path,
-                    expected_source_hash=source_doc.sha256,
-                    expected_model=self.model,
-                )
-                if points:
-                    self._log(
-                        "expander",
-                        f"沿用既有要點提取 {unit.unit_id}。",
-                        unit_id=unit.unit_id,
-                    )
-                else:
-                    self._log(
-                        "expander",
-                        f"開始提取要點 {unit.unit_id}：{unit.unit_title}",
-                        unit_id=unit.unit_id,
-                    )
-                    points = self._extract_points_for_unit(
-                        source_doc=source_doc,
-                        unit=unit,
-                        units=units,
-                    )
-                    self._save_points_artifact(
-                        artifact_path=points_artifact_path,
-                        source_hash=source_doc.sha256,
-                        unit=unit,
-                        points=points,
-                    )
-                    self._log(
-                        "expander",
-                        f"要點提取完成 {unit.unit_id}，共 {len(points)} 條。",
-                        unit_id=unit.unit_id,
-                    )
 
-                self._log(
-                    "expander",
-                    f"開始生成逐字稿 {unit.unit_id}：{unit.unit_title}",
-                    unit_id=unit.unit_id,
-                )
-                generated_unit = self._generate_manuscript_for_unit(
-                    source_doc=source_doc,
-                    unit=unit,
-                    units=units,
-                    points=points,
-                )
-                completed_units.append(generated_unit)
-                self._save_generated_unit(
-                    artifact_path=artifact_path,
-                    source_hash=source_doc.sha256,
-                    generated_unit=generated_unit,
-                )
-                self._mark_unit_status(
-                    manifest=manifest,
-                    manifest_path=manifest_path,
-                    unit_id=unit.unit_id,
-                    status="completed",
-                    artifact=str(artifact_path),
-                )
-                self._log(
-                    "expander",
-                    f"完成 {unit.unit_id}：{unit.unit_title}",
-                    unit_id=unit.unit_id,
-                )
-            except Exception as exc:
-                failed_units.append({"unit_id": unit.unit_id, "error": str(exc)})
-                self._mark_unit_status(
-                    manifest=manifest,
-                    manifest_path=manifest_path,
-                    unit_id=unit.unit_id,
-                    status="failed",
-                    artifact=str(artifact_path),
-                    error=str(exc),
-                )
-                self._log(
-                    "expander",
-                    f"生成失敗 {unit.unit_id}：{exc}",
-                    unit_id=unit.unit_id,
-                )
+        def report(position: int) -> None:
+            self._progress("逐單元生成", 10 + int(position / total_units * 85))
+
+        outcomes = map_in_order(units_to_process, generate, self.unit_concurrency, before_each=report)
+        failed_units = [failure for failure in outcomes if failure]
 
         ordered_completed_units = self._load_available_generated_units(
             generated_dir=generated_dir,
@@ -1024,6 +1024,131 @@ class Stage1Pipeline:
         summary.combined_markdown = combined_markdown
         return summary
 
+    def _process_unit(
+        self,
+        source_doc: SourceDocument,
+        unit: UnitBoundary,
+        units: List[UnitBoundary],
+        generated_dir: Path,
+        manifest: Dict[str, Any],
+        manifest_path: Path,
+    ) -> Optional[Dict[str, str]]:
+        """Extract points and generate one unit; returns its failure, if any."""
+        artifact_path = generated_dir / f"{unit.unit_id}.json"
+        points_artifact_path = generated_dir / f"{unit.unit_id}.points.json"
+        existing_unit = self._load_generated_unit(
+            artifact_path=artifact_path,
+            expected_source_hash=source_doc.sha256,
+            expected_model=self.model,
+        )
+        if existing_unit:
+            self._log(
+                "expander",
+                f"跳過 {unit.unit_id}，沿用既有輸出。",
+                unit_id=unit.unit_id,
+            )
+            self._mark_unit_status(
+                manifest=manifest,
+                manifest_path=manifest_path,
+                unit_id=unit.unit_id,
+                status="completed",
+                artifact=str(artifact_path),
+            )
+            return None
+
+        self._log(
+            "expander",
+            f"開始生成 {unit.unit_id}：{unit.unit_title}",
+            unit_id=unit.unit_id,
+            scripture_range=unit.scripture_range,
+        )
+        self._mark_unit_status(
+            manifest=manifest,
+            manifest_path=manifest_path,
+            unit_id=unit.unit_id,
+            status="running",
+            artifact=str(artifact_path),
+        )
+        try:
+            points = self._load_points_artifact(
+                artifact_path=points_artifact_path,
+                expected_source_hash=source_doc.sha256,
+                expected_model=self.model,
+            )
+            if points:
+                self._log(
+                    "expander",
+                    f"沿用既有要點提取 {unit.unit_id}。",
+                    unit_id=unit.unit_id,
+                )
+            else:
+                self._log(
+                    "expander",
+                    f"開始提取要點 {unit.unit_id}：{unit.unit_title}",
+                    unit_id=unit.unit_id,
+                )
+                points = self._extract_points_for_unit(
+                    source_doc=source_doc,
+                    unit=unit,
+                    units=units,
+                )
+                self._save_points_artifact(
+                    artifact_path=points_artifact_path,
+                    source_hash=source_doc.sha256,
+                    unit=unit,
+                    points=points,
+                )
+                self._log(
+                    "expander",
+                    f"要點提取完成 {unit.unit_id}，共 {len(points)} 條。",
+                    unit_id=unit.unit_id,
+                )
+
+            self._log(
+                "expander",
+                f"開始生成逐字稿 {unit.unit_id}：{unit.unit_title}",
+                unit_id=unit.unit_id,
+            )
+            generated_unit = self._generate_manuscript_for_unit(
+                source_doc=source_doc,
+                unit=unit,
+                units=units,
+                points=points,
+            )
+            self._save_generated_unit(
+                artifact_path=artifact_path,
+                source_hash=source_doc.sha256,
+                generated_unit=generated_unit,
+            )
+            self._mark_unit_status(
+                manifest=manifest,
+                manifest_path=manifest_path,
+                unit_id=unit.unit_id,
+                status="completed",
+                artifact=str(artifact_path),
+            )
+            self._log(
+                "expander",
+                f"完成 {unit.unit_id}：{unit.unit_title}",
+                unit_id=unit.unit_id,
+            )
+        except Exception as exc:
+            self._mark_unit_status(
+                manifest=manifest,
+                manifest_path=manifest_path,
+                unit_id=unit.unit_id,
+                status="failed",
+                artifact=str(artifact_path),
+                error=str(exc),
+            )
+            self._log(
+                "expander",
+                f"生成失敗 {unit.unit_id}：{exc}",
+                unit_id=unit.unit_id,
+            )
+            return {"unit_id": unit.unit_id, "error": str(exc)}
+        return None
+
     def _load_or_create_units(
         self,
         source_doc: SourceDocument,
@@ -1077,7 +1202,7 @@ class Stage1Pipeline:
             f"【來源{('逐字稿' if self.project_type == 'transcript' else '筆記')}（含行號）】\n"
             f"{source_doc.with_line_numbers(end_line=split_cutoff_line)}"
         )
-        response = self.llm.generate_json(
+        response = self._generate_json(
             system_prompt=self.split_prompt,
             user_prompt=user_prompt,
             json_schema=self.SPLIT_SCHEMA,
@@ -1085,7 +1210,8 @@ class Stage1Pipeline:
         )
         raw_units = response.get("units", [])
         try:
-            return self._normalize_units(raw_units, line_count=split_cutoff_line)
+            with validating_response(self.llm):
+                return self._normalize_units(raw_units, line_count=split_cutoff_line)
         except Exception as exc:
             self._log("segmenter", f"初次切割結果驗證失敗，嘗試修正：{exc}")
             repair_user_prompt = (
@@ -1101,7 +1227,7 @@ class Stage1Pipeline:
                 "4. 保留原本的邏輯切割意圖，只在必要處修正邊界。\n"
                 "5. 仍然不可複製任何原始筆記內容到欄位中。\n"
             )
-            repaired_response = self.llm.generate_json(
+            repaired_response = self._generate_json(
                 system_prompt=self.split_prompt,
                 user_prompt=repair_user_prompt,
                 json_schema=self.SPLIT_SCHEMA,
@@ -1109,7 +1235,8 @@ class Stage1Pipeline:
                 cache_prefix=user_prompt,
             )
             repaired_units = repaired_response.get("units", [])
-            normalized = self._normalize_units(repaired_units, line_count=split_cutoff_line)
+            with validating_response(self.llm):
+                normalized = self._normalize_units(repaired_units, line_count=split_cutoff_line)
             self._log("segmenter", "切割修正成功，已採用修正版邊界。")
             return normalized
 
@@ -1204,13 +1331,14 @@ class Stage1Pipeline:
             f"【上一單元{source_kind}】\n{previous_slice or '無'}\n\n"
             f"【下一單元{source_kind}】\n{next_slice or '無'}\n"
         )
-        generated_payload = self.llm.generate_json(
+        generated_payload = self._generate_json(
             system_prompt=self.point_extractor_prompt,
             user_prompt=user_prompt,
             json_schema=self.POINT_EXTRACTION_SCHEMA,
             temperature=0.0,
         )
-        return self._normalize_points(generated_payload.get("points", []))
+        with validating_response(self.llm):
+            return self._normalize_points(generated_payload.get("points", []))
 
     def _generate_manuscript_for_unit(
         self,
@@ -1257,20 +1385,21 @@ class Stage1Pipeline:
             f"【上一單元{source_kind}】\n{previous_slice or '無'}\n\n"
             f"【下一單元{source_kind}】\n{next_slice or '無'}\n"
         )
-        generated_payload = self.llm.generate_json(
+        generated_payload = self._generate_json(
             system_prompt=self.generator_prompt,
             user_prompt=user_prompt,
             json_schema=self.MANUSCRIPT_GENERATION_SCHEMA,
             temperature=0.2,
             timeout_seconds=manuscript_timeout_seconds,
         )
-        manuscript_sections = self._normalize_manuscript_sections(generated_payload.get("manuscript_sections", {}))
-        coverage_checks = self._normalize_coverage_checks(generated_payload.get("coverage_checks", []), points=points)
-        coverage_summary = self._normalize_coverage_summary(
-            generated_payload.get("coverage_summary", {}),
-            points=points,
-            coverage_checks=coverage_checks,
-        )
+        with validating_response(self.llm):
+            manuscript_sections = self._normalize_manuscript_sections(generated_payload.get("manuscript_sections", {}))
+            coverage_checks = self._normalize_coverage_checks(generated_payload.get("coverage_checks", []), points=points)
+            coverage_summary = self._normalize_coverage_summary(
+                generated_payload.get("coverage_summary", {}),
+                points=points,
+                coverage_checks=coverage_checks,
+            )
 
         original_outline_score = self._outline_style_score(manuscript_sections)
         if self._manuscript_needs_prose_refinement(manuscript_sections):
@@ -1287,7 +1416,7 @@ class Stage1Pipeline:
                 + "每個小標題下方至少應有完整散文段落來承載論證，而不是用條列替代逐字稿。\n"
             )
             try:
-                retry_payload = self.llm.generate_json(
+                retry_payload = self._generate_json(
                     system_prompt=self.generator_prompt,
                     user_prompt=retry_user_prompt,
                     json_schema=self.MANUSCRIPT_GENERATION_SCHEMA,
@@ -1295,16 +1424,17 @@ class Stage1Pipeline:
                     timeout_seconds=manuscript_timeout_seconds,
                     cache_prefix=user_prompt,
                 )
-                retry_sections = self._normalize_manuscript_sections(retry_payload.get("manuscript_sections", {}))
-                retry_coverage_checks = self._normalize_coverage_checks(
-                    retry_payload.get("coverage_checks", []),
-                    points=points,
-                )
-                retry_coverage_summary = self._normalize_coverage_summary(
-                    retry_payload.get("coverage_summary", {}),
-                    points=points,
-                    coverage_checks=retry_coverage_checks,
-                )
+                with validating_response(self.llm):
+                    retry_sections = self._normalize_manuscript_sections(retry_payload.get("manuscript_sections", {}))
+                    retry_coverage_checks = self._normalize_coverage_checks(
+                        retry_payload.get("coverage_checks", []),
+                        points=points,
+                    )
+                    retry_coverage_summary = self._normalize_coverage_summary(
+                        retry_payload.get("coverage_summary", {}),
+                        points=points,
+                        coverage_checks=retry_coverage_checks,
+                    )
                 retry_outline_score = self._outline_style_score(retry_sections)
                 if retry_outline_score < original_outline_score:
                     manuscript_sections = retry_sections
@@ -1685,10 +1815,13 @@ class Stage1Pipeline:
         return manifest
 
     def _save_manifest(self, manifest_path: Path, manifest: Dict[str, Any]) -> None:
-        manifest_path.write_text(
+        # Replaced atomically: status pollers read it while units are running.
+        temp_path = manifest_path.with_name(f".{manifest_path.name}.{threading.get_ident()}.tmp")
+        temp_path.write_text(
             json.dumps(manifest, indent=2, ensure_ascii=False),
             encoding="utf-8",
         )
+        os.replace(temp_path, manifest_path)
 
     def _save_units(self, units_path: Path, units: List[UnitBoundary]) -> None:
         payload = {
@@ -1772,15 +1905,19 @@ class Stage1Pipeline:
         artifact: str,
         error: Optional[str] = None,
     ) -> None:
-        manifest.setdefault("units", {})
-        manifest["units"][unit_id] = {
-            "status": status,
-            "artifact": artifact,
-            "updated_at": _utcnow(),
-        }
-        if error:
-            manifest["units"][unit_id]["error"] = error
-        self._save_manifest(manifest_path, manifest)
+        # Units finish on worker threads; the lock keeps each update and the
+        # file written from it whole. Entries keep the unit order
+        # `_refresh_manifest_unit_statuses` laid down, not completion order.
+        with self._manifest_lock:
+            manifest.setdefault("units", {})
+            manifest["units"][unit_id] = {
+                "status": status,
+                "artifact": artifact,
+                "updated_at": _utcnow(),
+            }
+            if error:
+                manifest["units"][unit_id]["error"] = error
+            self._save_manifest(manifest_path, manifest)
 
     def _refresh_manifest_unit_statuses(
         self,
@@ -1859,6 +1996,9 @@ class Stage1Pipeline:
             if file_path.exists():
                 file_path.unlink()
 
+    def _generate_json(self, **kwargs: Any) -> Dict[str, Any]:
+        return self.llm.generate_json(**kwargs)
+
     def _log(self, role: str, message: str, **fields: Any) -> None:
         if self.logger:
             self.logger.emit(role, message, **fields)
@@ -37,6 +37,7 @@ import os
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Mapping, Sequence
 
+from backend.pipeline.llm_response_cache import validating_response
 from backend.pipeline.llm_usage import usage_row
 from backend.pipeline.run_ledger import run_record
 
@@ -264,7 +265,8 @@ def generate_subtitles(
             # success prices its failures at nothing.
             record.usage([usage_row(client.last_usage, attempt)])
             try:
-                insertions = validate_insertions(candidate, rows)
+                with validating_response(client):
+                    insertions = validate_insertions(candidate, rows)
             except SubtitleValidationError as exc:
                 last_error = exc
                 continue
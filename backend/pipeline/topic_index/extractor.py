@@ -6,6 +6,7 @@ from typing import Any, Dict, List, Optional
 
 from backend.api.sermon_search.bible_refs import extract_refs
 from backend.api.sermon_search.models import DiscoveredManuscript
+from backend.pipeline.llm_response_cache import accept_response
 from backend.pipeline.stage1 import Stage1AnthropicClient
 
 from .models import TopicEntry, TopicSource
@@ -150,6 +151,8 @@ def extract_topics_from_chunk(
         json_schema=_EXTRACTION_SCHEMA,
         temperature=0.2,
     )
+    # Parsing below tolerates any shape the schema allows; there is nothing to reject.
+    accept_response(llm)
 
     # Notes projects without a declared scope remain overview/structural
     # documents. Transcript projects are different: their actual exegesis is
@@ -14,6 +14,7 @@ from dotenv import load_dotenv
 
 from backend.config.wang_platform_paths import wang_platform_paths
 from backend.api.canonical_repository.postgres_store import PostgresKnowledgeStore
+from backend.pipeline.llm_response_cache import validating_response
 from backend.pipeline.stage1 import Stage1AnthropicClient, Stage1OpenAIClient
 from backend.pipeline.topic_structure_discovery import (
     ADJUDICATION_SCHEMA,
@@ -236,7 +237,8 @@ def _generate_valid(client: Any, prompt: str, source: dict[str, Any], schema: di
     for _ in range(3):
         response = client.generate_json(prompt, feedback, schema, cache_prefix=original)
         try:
-            validator(response)
+            with validating_response(client):
+                validator(response)
             return response
         except ValueError as exc:
             last_error = exc
@@ -6,16 +6,19 @@ import shutil
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from backend.api.openai_client import DEFAULT_OPENAI_GENERATION_MODEL
 from backend.api.sermon_search.slugify import slugify_heading
+from backend.pipeline.llm_response_cache import reject_response, validating_response
 from backend.pipeline.stage1 import (
+    STAGE1_UNIT_CONCURRENCY,
     SourceDocument,
     Stage1OpenAIClient,
     StructuredLogger,
     _sha256_text,
     get_stage1_prompt_bundle,
+    map_in_order,
 )
 
 
@@ -322,10 +325,12 @@ class TranscriptPipeline:
         max_retries: int = 3,
         logger: Optional[StructuredLogger] = None,
         progress_callback: Optional[ProgressCallback] = None,
+        unit_concurrency: Optional[int] = None,
     ) -> None:
         self.model = model
         self.timeout_seconds = timeout_seconds
         self.max_retries = max_retries
+        self.unit_concurrency = unit_concurrency or STAGE1_UNIT_CONCURRENCY
         self.logger = logger
         self.progress_callback = progress_callback
         self.prompts = get_stage1_prompt_bundle("transcript")
@@ -384,7 +389,8 @@ class TranscriptPipeline:
         if not evidence_payload:
             self._progress("全文證據提取", 5)
             self._log("evidence", "開始建立全文 evidence inventory。")
-            evidence_payload = self._extract_evidence(source)
+            with validating_response(self.llm):
+                evidence_payload = self._extract_evidence(source)
             self._save_cached_payload(output_dir / "evidence_inventory.json", source.sha256, evidence_payload)
             self._log("evidence", f"全文證據提取完成，共 {len(evidence_payload['evidence'])} 條。")
 
@@ -396,7 +402,8 @@ class TranscriptPipeline:
         if not plan_payload:
             self._progress("全文邏輯規劃", 25)
             self._log("planner", "開始依全文證據建立 manuscript plan。")
-            plan_payload = self._plan_manuscript(evidence_payload)
+            with validating_response(self.llm):
+                plan_payload = self._plan_manuscript(evidence_payload)
             self._save_cached_payload(output_dir / "manuscript_plan.json", source.sha256, plan_payload)
             self._log("planner", f"全文邏輯規劃完成，共 {len(plan_payload['units'])} 個單元。")
 
@@ -423,17 +430,26 @@ class TranscriptPipeline:
                 raise ValueError(f"Unknown transcript manuscript unit: {selected_unit_id}")
 
         evidence_by_id = {item["evidence_id"]: item for item in summary.evidence}
+        pending = []
         for index, unit in enumerate(units_to_generate, start=1):
-            unit_path = generated_dir / f"{unit['unit_id']}.json"
-            existing = self._load_cached_payload(unit_path, source.sha256)
+            existing = self._load_cached_payload(generated_dir / f"{unit['unit_id']}.json", source.sha256)
             if existing and not force:
                 self._log("generator", f"沿用既有 manuscript 单元 {unit['unit_id']}。")
                 continue
-            progress = 35 + int((index - 1) / max(len(units_to_generate), 1) * 45)
-            self._progress("按邏輯單元生成", progress)
+            pending.append((index, unit))
+
+        def generate(item: Tuple[int, Dict[str, Any]]) -> None:
+            _, unit = item
             self._log("generator", f"开始生成 {unit['unit_id']}：{unit['title']}。")
-            generated = self._generate_unit(source, unit, evidence_by_id)
-            self._save_cached_payload(unit_path, source.sha256, generated)
+            with validating_response(self.llm):
+                generated = self._generate_unit(source, unit, evidence_by_id)
+            self._save_cached_payload(generated_dir / f"{unit['unit_id']}.json", source.sha256, generated)
+
+        def report(position: int) -> None:
+            index = pending[position][0]
+            self._progress("按邏輯單元生成", 35 + int((index - 1) / max(len(units_to_generate), 1) * 45))
+
+        map_in_order(pending, generate, self.unit_concurrency, before_each=report)
 
         summary.generated_units = self._load_generated_units(
             generated_dir, source.sha256, summary.units
@@ -472,43 +488,53 @@ class TranscriptPipeline:
         if all_units_ready:
             self._progress("全文覆蓋審核", 85)
             self._log("auditor", "开始执行全文 coverage audit。")
-            audit = self._audit(
-                source,
-                evidence_payload,
-                plan_payload,
-                summary.combined_markdown,
-                integration_context=integration_context,
-            )
+            with validating_response(self.llm):
+                audit = self._audit(
+                    source,
+                    evidence_payload,
+                    plan_payload,
+                    summary.combined_markdown,
+                    integration_context=integration_context,
+                )
             self._save_cached_payload(output_dir / "coverage_audit.json", source.sha256, audit)
 
             repairable = self._group_repairable_findings(audit)
             if repairable and mode != "audit":
                 self._log("auditor", f"审核发现 {sum(len(v) for v in repairable.values())} 项可定位问题，开始定点修复。")
+                repairs = []
                 for unit_id, findings in repairable.items():
                     unit = next((item for item in summary.units if item["unit_id"] == unit_id), None)
                     existing = next((item for item in summary.generated_units if item["unit_id"] == unit_id), None)
                     if not unit or not existing:
                         continue
-                    repaired = self._generate_unit(
-                        source,
-                        unit,
-                        evidence_by_id,
-                        existing=existing,
-                        repair_findings=findings,
-                    )
-                    self._save_cached_payload(generated_dir / f"{unit_id}.json", source.sha256, repaired)
+                    repairs.append((unit, existing, findings))
+
+                def repair(item: Tuple[Dict[str, Any], Dict[str, Any], List[Dict[str, Any]]]) -> None:
+                    unit, existing, findings = item
+                    with validating_response(self.llm):
+                        repaired = self._generate_unit(
+                            source,
+                            unit,
+                            evidence_by_id,
+                            existing=existing,
+                            repair_findings=findings,
+                        )
+                    self._save_cached_payload(generated_dir / f"{unit['unit_id']}.json", source.sha256, repaired)
+
+                map_in_order(repairs, repair, self.unit_concurrency)
                 summary.generated_units = self._load_generated_units(
                     generated_dir, source.sha256, summary.units
                 )
                 summary.combined_markdown = self._combine_units(summary.generated_units)
                 (output_dir / "draft_v1.md").write_text(summary.combined_markdown, encoding="utf-8")
-                audit = self._audit(
-                    source,
-                    evidence_payload,
-                    plan_payload,
-                    summary.combined_markdown,
-                    integration_context=integration_context,
-                )
+                with validating_response(self.llm):
+                    audit = self._audit(
+                        source,
+                        evidence_payload,
+                        plan_payload,
+                        summary.combined_markdown,
+                        integration_context=integration_context,
+                    )
                 self._save_cached_payload(output_dir / "coverage_audit.json", source.sha256, audit)
 
             summary.audit = audit
@@ -529,7 +555,7 @@ class TranscriptPipeline:
             "以下是完整 transcript，每一行都有固定行号。请建立全文 evidence inventory。\n\n"
             f"【完整 transcript】\n{source.with_line_numbers()}"
         )
-        payload = self.llm.generate_json(
+        payload = self._generate_json(
             self.prompts["evidence_inventory"], user_prompt, EVIDENCE_SCHEMA,
             timeout_seconds=max(self.timeout_seconds, 300.0),
         )
@@ -578,7 +604,7 @@ class TranscriptPipeline:
             "请把以下完整 evidence inventory 重组为 manuscript 逻辑单元。每个 evidence ID 必须且只能出现一次。\n\n"
             f"【Evidence Inventory】\n{json.dumps(evidence_payload, ensure_ascii=False, indent=2)}"
         )
-        payload = self.llm.generate_json(
+        payload = self._generate_json(
             self.prompts["manuscript_planner"], user_prompt, PLAN_SCHEMA,
             timeout_seconds=max(self.timeout_seconds, 240.0),
         )
@@ -675,7 +701,7 @@ class TranscriptPipeline:
                 f"\n\n【审核发现，只修复这些问题】\n{json.dumps(repair_findings, ensure_ascii=False, indent=2)}"
                 "\n请保留现有单元已正确覆盖的全部内容，只做必要的定点修复。"
             )
-        payload = self.llm.generate_json(
+        payload = self._generate_json(
             self.prompts["unit_generator"], user_prompt, UNIT_GENERATION_SCHEMA,
             timeout_seconds=max(self.timeout_seconds, 240.0),
         )
@@ -686,6 +712,7 @@ class TranscriptPipeline:
         scripture_format_issues = self._scripture_format_issues(normalized_sections, evidence)
         appendix_link_issues = self._appendix_link_issues(normalized_sections, unit)
         if missing or unknown or scripture_format_issues or appendix_link_issues:
+            reject_response(self.llm)
             retry_prompt = (
                 f"{user_prompt}\n\n【确定性覆盖检查失败】\n"
                 f"遗漏 evidence IDs：{missing}\n非本单元 evidence IDs：{unknown}\n"
@@ -693,7 +720,7 @@ class TranscriptPipeline:
                 f"附录链接问题：{appendix_link_issues}\n"
                 "请重新输出完整单元；保留已正确内容，明确补足遗漏，并移除非本单元材料。"
             )
-            payload = self.llm.generate_json(
+            payload = self._generate_json(
                 self.prompts["unit_generator"], retry_prompt, UNIT_GENERATION_SCHEMA,
                 timeout_seconds=max(self.timeout_seconds, 240.0),
             )
@@ -743,7 +770,7 @@ class TranscriptPipeline:
             f"【Integration Application】\n"
             f"{json.dumps(integration_context, ensure_ascii=False) if integration_context else 'null'}"
         )
-        audit = self.llm.generate_json(
+        audit = self._generate_json(
             self.prompts["coverage_auditor"], user_prompt, AUDIT_SCHEMA,
             timeout_seconds=max(self.timeout_seconds, 300.0),
         )
@@ -1155,6 +1182,9 @@ class TranscriptPipeline:
         path.parent.mkdir(parents=True, exist_ok=True)
         path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
 
+    def _generate_json(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        return self.llm.generate_json(*args, **kwargs)
+
     def _log(self, role: str, message: str, **fields: Any) -> None:
         if self.logger:
             self.logger.emit(role, message, **fields)
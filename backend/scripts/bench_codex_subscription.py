@@ -0,0 +1,71 @@
+"""Time codex-subscription calls against a stub CLI with a fixed start-up cost.
+
+Compares one `codex exec` process started per call with spare processes
+started ahead of the calls (`warm_workers`), sequentially and with several
+requests in flight. The stub sleeps for the start-up time before reading its
+prompt and for the answer time after, so no network or login is involved.
+
+Usage: python backend/scripts/bench_codex_subscription.py [calls] [startup_ms] [answer_ms] [concurrency]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add project root to path (smart-answer/)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from backend.pipeline.codex_subscription_client import CodexSubscriptionClient  # noqa: E402
+from backend.pipeline.detailed_knowledge_extraction import DETAILED_RESPONSE_SCHEMA  # noqa: E402
+
+STUB = """#!{python}
+import json, sys, time
+if sys.argv[1:3] == ["login", "status"]:
+    print("Logged in using ChatGPT")
+    sys.exit(0)
+time.sleep({startup})
+sys.stdin.read()
+time.sleep({answer})
+json.dump({{}}, open(sys.argv[sys.argv.index("--output-last-message") + 1], "w"))
+"""
+
+
+def _timed(client: CodexSubscriptionClient, calls: int, concurrency: int) -> float:
+    client.generate_json("system", "warm-up", DETAILED_RESPONSE_SCHEMA)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(
+            lambda n: client.generate_json("system", f"call {n}", DETAILED_RESPONSE_SCHEMA),
+            range(calls),
+        ))
+    return (time.perf_counter() - started) * 1000.0 / calls
+
+
+def main(calls: int, startup_ms: int, answer_ms: int, concurrency: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        stub = Path(tmp) / "codex"
+        stub.write_text(
+            STUB.format(python=sys.executable, startup=startup_ms / 1000, answer=answer_ms / 1000),
+            encoding="utf-8",
+        )
+        stub.chmod(0o755)
+        print(f"{calls} calls, stub start-up {startup_ms} ms, answer {answer_ms} ms")
+        for label, warm_workers in (("per call", 0), ("warm", concurrency)):
+            for in_flight in (1, concurrency):
+                with CodexSubscriptionClient(
+                    model="bench", executable=str(stub), warm_workers=warm_workers,
+                ) as client:
+                    per_call = _timed(client, calls, in_flight)
+                print(f"  {label:8} x{in_flight}: {per_call:9.1f} ms/call")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 20,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 300,
+        int(sys.argv[3]) if len(sys.argv) > 3 else 200,
+        int(sys.argv[4]) if len(sys.argv) > 4 else 4,
+    )
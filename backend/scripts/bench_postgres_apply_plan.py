@@ -0,0 +1,110 @@
+"""Time apply_plan row by row against the bulk COPY path, and compare them.
+
+Builds a synthetic package of new claims, plans it against the store, and
+applies the plan once each way. Each apply runs in a transaction that is
+rolled back after the rows it wrote are read back, so nothing is kept. The
+two reads must match column for column, timestamps aside. Point
+KNOWLEDGE_DATABASE_URL at a local copy of the store.
+
+Usage: python backend/scripts/bench_postgres_apply_plan.py [operations] [database_url]
+"""
+
+import os
+import sys
+import time
+import uuid
+from contextlib import contextmanager
+
+# Add project root to path (smart-answer/)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from backend.api.canonical_repository.postgres_store import PostgresKnowledgeStore  # noqa: E402
+
+
+def _package(operations: int) -> dict:
+    prefix = f"BENCH-{uuid.uuid4().hex[:8]}"
+    return {
+        "schema_version": "wang_shared_knowledge_v1.3",
+        "package_id": f"PKG-{prefix}",
+        "claims": [
+            {
+                "claim_id": f"{prefix}-{n}",
+                "statement": f"主张 {n}",
+                "claim_type": "explicit_claim",
+                "evidence_step_ids": [],
+            }
+            for n in range(operations)
+        ],
+    }
+
+
+def _written(cursor, change_set_id: str) -> dict:
+    cursor.execute(
+        """SELECT collection, object_id, revision, review_status, visibility, content_sha256,
+                  source_fingerprint, payload, retired_at IS NULL
+           FROM wang_knowledge.objects
+           WHERE (collection, object_id) IN (
+             SELECT collection, object_id FROM wang_knowledge.change_operations
+             WHERE change_set_id=%s)
+           ORDER BY collection, object_id""",
+        (change_set_id,),
+    )
+    objects = cursor.fetchall()
+    cursor.execute(
+        """SELECT collection, object_id, revision, content_sha256, payload
+           FROM wang_knowledge.object_versions WHERE change_set_id=%s
+           ORDER BY collection, object_id, revision""",
+        (change_set_id,),
+    )
+    versions = cursor.fetchall()
+    cursor.execute(
+        """SELECT operation_index, operation, collection, object_id, before_sha256,
+                  after_sha256, before_revision, after_revision, details
+           FROM wang_knowledge.change_operations WHERE change_set_id=%s
+           ORDER BY operation_index""",
+        (change_set_id,),
+    )
+    return {"objects": objects, "versions": versions, "operations": cursor.fetchall()}
+
+
+def _apply_and_roll_back(store: PostgresKnowledgeStore, plan, *, bulk: bool):
+    conn = store.psycopg.connect(store.database_url)
+
+    @contextmanager
+    def connect():
+        yield conn
+
+    store.connect = connect
+    try:
+        started = time.perf_counter()
+        result = store.apply_plan(plan, bulk=bulk)
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        with conn.cursor() as cursor:
+            written = _written(cursor, plan.change_set_id)
+    finally:
+        conn.rollback()
+        conn.close()
+        del store.connect
+    return result, written, elapsed_ms
+
+
+def main(operations: int, database_url) -> None:
+    store = PostgresKnowledgeStore(database_url)
+    plan = store.plan_package(_package(operations))
+    print(f"{len(plan.operations)} operations")
+
+    row_result, row_written, row_ms = _apply_and_roll_back(store, plan, bulk=False)
+    bulk_result, bulk_written, bulk_ms = _apply_and_roll_back(store, plan, bulk=True)
+    assert row_result == bulk_result, "the two paths report different summaries"
+    assert row_written == bulk_written, "the two paths wrote different rows"
+    print(f"  row by row: {row_ms:9.1f} ms")
+    print(f"  bulk COPY:  {bulk_ms:9.1f} ms")
+    print("  rows written are identical")
+    store.pool.close()
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 10000,
+        sys.argv[2] if len(sys.argv) > 2 else None,
+    )
@@ -0,0 +1,66 @@
+"""Time package planning against a PostgreSQL authoring store.
+
+Compiles the store's live records into one package and plans it against the
+store, which reads back every record it names. It times the per-key lookup
+the planner used to do against the set-based one, and then a full
+plan_package. Nothing is written. Point KNOWLEDGE_DATABASE_URL at a local
+copy of the store.
+
+Usage: python backend/scripts/bench_postgres_plan_package.py [database_url]
+"""
+
+import os
+import sys
+import time
+
+# Add project root to path (smart-answer/)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from backend.api.canonical_repository.postgres_store import (  # noqa: E402
+    PostgresKnowledgeStore,
+    normalize_package,
+)
+
+
+def _per_key_existing(conn, keys):
+    """The one-SELECT-per-record lookup `_existing` used before."""
+    result = {}
+    with conn.cursor() as cursor:
+        for collection, object_id in keys:
+            cursor.execute(
+                """SELECT revision, content_sha256, payload FROM wang_knowledge.objects
+                   WHERE collection=%s AND object_id=%s AND retired_at IS NULL""",
+                (collection, object_id),
+            )
+            row = cursor.fetchone()
+            if row:
+                result[(collection, object_id)] = {"revision": row[0], "content_sha256": row[1], "payload": row[2]}
+    return result
+
+
+def _timed(fn):
+    started = time.perf_counter()
+    value = fn()
+    return value, (time.perf_counter() - started) * 1000.0
+
+
+def main(database_url) -> None:
+    store = PostgresKnowledgeStore(database_url)
+    package, compile_ms = _timed(store.compile_package)
+    keys = [(collection, object_id) for collection, rows in normalize_package(package).items() for object_id in rows]
+    print(f"{len(keys)} records compiled in {compile_ms:.0f} ms")
+
+    with store.connect() as conn:
+        legacy, legacy_ms = _timed(lambda: _per_key_existing(conn, keys))
+        current, current_ms = _timed(lambda: store._existing(conn, keys))
+    assert legacy == current, "set-based lookup disagrees with the per-key lookup"
+    print(f"  existing, per key:   {legacy_ms:9.1f} ms")
+    print(f"  existing, set-based: {current_ms:9.1f} ms")
+
+    plan, plan_ms = _timed(lambda: store.plan_package(package))
+    print(f"  plan_package:        {plan_ms:9.1f} ms ({len(plan.operations)} operations, {plan.unchanged} unchanged)")
+    store.pool.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -0,0 +1,109 @@
+"""Time a full RepositoryCompiler build against an incremental one.
+
+Writes a synthetic repository (units, one citation per unit, a few sources),
+builds it once, then edits one published unit and rebuilds it both ways. The
+two builds must compile the same SQLite rows and indexes.
+
+Usage: python backend/scripts/bench_repository_build.py [units]
+"""
+
+import hashlib
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path (smart-answer/)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from backend.api.canonical_repository.compiler import RepositoryCompiler  # noqa: E402
+from backend.api.canonical_repository.models import (  # noqa: E402
+    BibleReference,
+    CanonicalUnit,
+    Citation,
+    CitationLocator,
+    ManuscriptLocator,
+    SourceDocument,
+    TopicAssignment,
+)
+from backend.api.canonical_repository.store import RepositoryStore  # noqa: E402
+
+
+def _populate(store: RepositoryStore, count: int) -> list:
+    sha = hashlib.sha256(b"source").hexdigest()
+    units = []
+    with store.batch():
+        for n in range(max(1, count // 50)):
+            store.save_source(SourceDocument(
+                source_id=f"SRC-{n}", source_type="sermon_transcript", origin_id=f"S{n}",
+                project_id=f"P{n}", title=f"講道 {n}", source_stage="published",
+                public_url=f"/sermons/{n}", source_sha256=sha, unified_source_sha256=sha,
+            ))
+        for n in range(count):
+            store.save_citation(Citation(
+                citation_id=f"CIT-{n:06}", source_id=f"SRC-{n % max(1, count // 50)}", source_sha256=sha,
+                locator=CitationLocator(kind="transcript", highlight_text="雲彩", highlight_text_sha256=sha),
+                status="approved",
+            ))
+            unit = CanonicalUnit(
+                unit_id=f"CU-{n:06}",
+                title=f"雲彩與神的臨在 {n}",
+                unit_type="passage" if n % 2 else "concept",
+                status="published",
+                primary_bible_refs=[BibleReference(osis=f"Matt.17.{n % 27 + 1}", display="太 17")],
+                topic_assignments=[TopicAssignment(topic_ids=[f"topic-{n % 40}"], path=["神論", f"主題 {n % 40}"])],
+                manuscript=ManuscriptLocator(
+                    project_id=f"P{n}", project_type="transcript",
+                    heading_title="一、登山變像", heading_anchor="一-登山變像",
+                ),
+                citation_ids=[f"CIT-{n:06}"],
+            )
+            store.save_unit(unit)
+            units.append(unit)
+    return units
+
+
+def _compiled(store: RepositoryStore) -> tuple:
+    build_dir = store.builds_dir / store.get_active_build()["build_id"]
+    connection = sqlite3.connect(build_dir / "repository.sqlite3")
+    try:
+        rows = [
+            sorted(connection.execute(f"SELECT * FROM {table}").fetchall())
+            for table in ("canonical_units", "source_documents", "citations", "unit_citations", "unit_relationships")
+        ]
+    finally:
+        connection.close()
+    indexes = [(build_dir / name).read_text(encoding="utf-8") for name in ("bible_index.json", "topic_index.json")]
+    return rows, indexes
+
+
+def _timed(fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return (time.perf_counter() - started) * 1000.0
+
+
+def main(count: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        store = RepositoryStore(Path(tmp))
+        units = _populate(store, count)
+        compiler = RepositoryCompiler(store)
+        first_ms = _timed(compiler.build)
+
+        units[count // 2].title = "改過的標題"
+        store.save_unit(units[count // 2])
+        incremental_ms = _timed(lambda: compiler.build(incremental=True))
+        incremental = _compiled(store)
+        full_ms = _timed(compiler.build)
+        assert _compiled(store) == incremental, "incremental build differs from a full rebuild"
+
+        print(f"{count} units")
+        print(f"  first full build:        {first_ms:9.1f} ms")
+        print(f"  full rebuild, one edit:  {full_ms:9.1f} ms")
+        print(f"  incremental, one edit:   {incremental_ms:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
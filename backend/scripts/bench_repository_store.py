@@ -0,0 +1,82 @@
+"""Time RepositoryStore counts and listings on a synthetic repository.
+
+Writes a repository of claims, then times knowledge_counts and a full claim
+listing the way they ran before (glob and parse every file) against the
+indexed store, both in a fresh store object and warm in the same process.
+
+Usage: python backend/scripts/bench_repository_store.py [claims]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path (smart-answer/)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from backend.api.canonical_repository import store as store_module  # noqa: E402
+from backend.api.canonical_repository.knowledge_models import KNOWLEDGE_COLLECTIONS, ClaimRecord  # noqa: E402
+from backend.api.canonical_repository.store import RepositoryStore  # noqa: E402
+
+
+def _legacy_counts(store: RepositoryStore) -> dict:
+    """knowledge_counts as it was: parse every record of every collection."""
+    counts = {}
+    for collection, (model, _) in KNOWLEDGE_COLLECTIONS.items():
+        folder = store.knowledge_dir / collection
+        paths = sorted(folder.glob("*.json")) if folder.is_dir() else []
+        counts[collection] = len([model.model_validate_json(path.read_text(encoding="utf-8")) for path in paths])
+    return counts
+
+
+def _legacy_claims(store: RepositoryStore) -> list:
+    folder = store.knowledge_dir / "claims"
+    return [ClaimRecord.model_validate_json(path.read_text(encoding="utf-8")) for path in sorted(folder.glob("*.json"))]
+
+
+def _timed(fn, repeat: int = 1):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        value = fn()
+    return value, (time.perf_counter() - started) * 1000.0 / repeat
+
+
+def main(claims: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        store = RepositoryStore(Path(tmp))
+        with store.batch():
+            for n in range(claims):
+                store.save_knowledge_record("claims", ClaimRecord(
+                    claim_id=f"CL-{n:06}",
+                    statement=f"主张 {n}：云彩显明神的临在。" * 4,
+                    claim_type="explicit_claim",
+                    evidence_step_ids=[f"ES-{n}-{k}" for k in range(4)],
+                ))
+        # Let the folder settle past the racy window so the index is trusted.
+        time.sleep(store_module.INDEX_RACY_NS / 1e9)
+        store.knowledge_counts()
+
+        legacy_counts, legacy_counts_ms = _timed(lambda: _legacy_counts(store))
+        store_module._record_files.clear()
+        counts, fresh_counts_ms = _timed(lambda: RepositoryStore(Path(tmp)).knowledge_counts())
+        assert counts == legacy_counts
+        _, warm_counts_ms = _timed(store.knowledge_counts, repeat=20)
+
+        legacy_list, legacy_list_ms = _timed(lambda: _legacy_claims(store))
+        listed, cold_list_ms = _timed(lambda: RepositoryStore(Path(tmp)).list_knowledge_records("claims"))
+        assert listed == legacy_list
+        _, warm_list_ms = _timed(lambda: store.list_knowledge_records("claims"), repeat=5)
+
+        print(f"{claims} claims")
+        print(f"  counts, parse every file: {legacy_counts_ms:9.1f} ms")
+        print(f"  counts, fresh store:      {fresh_counts_ms:9.1f} ms")
+        print(f"  counts, warm:             {warm_counts_ms:9.3f} ms")
+        print(f"  list, parse every file:   {legacy_list_ms:9.1f} ms")
+        print(f"  list, cold file cache:    {cold_list_ms:9.1f} ms")
+        print(f"  list, warm file cache:    {warm_list_ms:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
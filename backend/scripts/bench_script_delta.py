@@ -0,0 +1,135 @@
+"""Time the review-page diff on a synthetic, sermon-length transcript.
+
+Compares the Differ/SequenceMatcher rendering getChanges used to run with the
+same markup from text_diff (cold) and with the compiled-script cache (warm).
+
+Usage: python backend/scripts/bench_script_delta.py [paragraphs] [chars_per_paragraph]
+"""
+
+import difflib
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path (smart-answer/)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from backend.api.sc_api import script_delta  # noqa: E402
+from backend.api.sc_api.script_delta import ScriptDelta  # noqa: E402
+
+CHARS = "起初神創造天地地是空虛混沌淵面黑暗神的靈運行在水面上神說要有光就有了光我們今天讀羅馬書第八章"
+PUNCTUATION = "，。！？"
+
+
+def _paragraph(rng: random.Random, length: int) -> str:
+    return "".join(rng.choice(PUNCTUATION) if rng.random() < 0.08 else rng.choice(CHARS) for _ in range(length))
+
+
+def _review(rng: random.Random, text: str) -> str:
+    chars = list(text)
+    for _ in range(max(1, len(chars) // 40)):
+        position = rng.randrange(len(chars))
+        roll = rng.random()
+        if roll < 0.4:
+            chars[position] = rng.choice(CHARS)
+        elif roll < 0.7:
+            chars.insert(position, rng.choice(PUNCTUATION))
+        else:
+            del chars[position]
+    return "".join(chars)
+
+
+def _write_sermon(base: Path, paragraphs: int, length: int) -> None:
+    rng = random.Random(11)
+    entries = []
+    patched = []
+    review = []
+    for index in range(paragraphs):
+        for sub in range(4):
+            second = (index * 4 + sub) % 1200
+            entries.append({
+                "index": f"1_{index * 4 + sub + 1}",
+                "start": f"00:{second // 60:02}:{second % 60:02},000",
+                "end": f"00:{second // 60:02}:{second % 60:02},900",
+                "text": "",
+            })
+        text = _paragraph(rng, length)
+        patched.append({"index": f"1_{index * 4 + 4}", "text": text})
+        if rng.random() < 0.03:
+            continue  # reviewer deleted the paragraph
+        review.append({"index": f"1_{index * 4 + 4}", "text": _review(rng, text)})
+    for folder, payload in (("script", {"entries": entries}), ("script_patched", patched), ("script_review", review)):
+        (base / folder).mkdir()
+        (base / folder / "item.json").write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+
+
+def _legacy_changes(sd: ScriptDelta) -> list:
+    """getChanges as it ran on difflib.Differ, for the baseline timing."""
+    patched = sd.loadPatchedScript()
+    review = sd.loadReviewScript()
+    sd.add_timeline(sd.patched)
+
+    def similar(i: int, j: int) -> bool:
+        if sd.review[j].get("type") == "comment":
+            return False
+        if difflib.SequenceMatcher(None, sd.patched[i]["text"], sd.review[j]["text"]).ratio() > 0.8:
+            return True
+        return sd.patched[i]["index"] == sd.review[j]["index"]
+
+    changes = []
+    i = j = 0
+    while i < len(patched) and j < len(review):
+        while i < len(patched) and j < len(review) and similar(i, j):
+            line, tag = [], ""
+            for ele in difflib.Differ().compare(patched[i], review[j]):
+                new_tag = "<->" if ele.startswith("-") else "<+>" if ele.startswith("+") else ""
+                tag = sd.set_tag(tag, line, new_tag)
+                line.append(ele.replace(ele[0], "").strip() if new_tag else ele.strip())
+            changes.append("".join(line))
+            i += 1
+            j += 1
+        k = j + 1
+        while i < len(patched) and k < len(review) and not similar(i, k):
+            k += 1
+        if k >= len(review):
+            i += 1
+        else:
+            j = k
+    return changes
+
+
+def _timed(fn, repeat: int = 1) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) * 1000.0 / repeat
+
+
+def main(paragraphs: int, length: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp)
+        _write_sermon(base, paragraphs, length)
+
+        def cold() -> None:
+            script_delta._timeline_cache.clear()
+            script_delta._changes_cache.clear()
+            ScriptDelta(tmp, "item").get_script(True)
+
+        legacy_ms = _timed(lambda: _legacy_changes(ScriptDelta(tmp, "item")))
+        cold_ms = _timed(cold, repeat=3)
+        warm_ms = _timed(lambda: ScriptDelta(tmp, "item").get_script(True), repeat=20)
+        print(f"{paragraphs} paragraphs x {length} chars")
+        print(f"  differ (legacy): {legacy_ms:9.1f} ms")
+        print(f"  text_diff (cold): {cold_ms:8.1f} ms")
+        print(f"  cached (warm):   {warm_ms:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 150,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 400,
+    )
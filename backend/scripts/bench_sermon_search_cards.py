@@ -0,0 +1,113 @@
+"""Compare per-row card hydration with the set-based _load_cards query.
+
+Usage: python backend/scripts/bench_sermon_search_cards.py [units] [candidates]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path (smart-answer/)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from backend.api.sermon_search.index_store import Candidate, SermonSearchIndex  # noqa: E402
+from backend.api.sermon_search.models import SearchFilters, SourceUnit  # noqa: E402
+from backend.api.sermon_search.topics import extract_topics  # noqa: E402
+
+REPEATS = 20
+FILTERS = SearchFilters(project_types=["sermon_note"], content_types=["釋經"], topics=["天國"])
+
+
+def _populate(index: SermonSearchIndex, units: int) -> None:
+    index.initialize()
+    with index.connect() as conn:
+        for doc in range(units // 20):
+            document_id = f"doc-{doc:05d}"
+            conn.execute(
+                """
+                INSERT INTO documents VALUES (?, 'series', '系列', 'lecture', '講座', ?, ?, ?, NULL, '', '', 0)
+                """,
+                (document_id, document_id, f"{doc}章", "sermon_note" if doc % 2 else "transcript"),
+            )
+            for ordinal in range(20):
+                index._insert_unit(
+                    conn,
+                    SourceUnit(
+                        source_id=f"{document_id}-{ordinal:04d}",
+                        document_id=document_id,
+                        series_id="series",
+                        series_title="系列",
+                        lecture_id="lecture",
+                        lecture_title="講座",
+                        project_id=document_id,
+                        project_title=f"{doc}章",
+                        heading_path=["天國的比喻"],
+                        text="天國好像芥菜種。" * 40,
+                        topic_tags=["天國"] if ordinal % 3 else ["教會"],
+                        content_types=["釋經"] if ordinal % 2 else ["生活應用"],
+                        ordinal=ordinal,
+                    ),
+                )
+
+
+def _legacy_load_cards(index, conn, candidates, filters, limit):
+    """The per-candidate hydration loop _load_cards replaced."""
+    cards = []
+    for candidate in sorted(candidates.values(), key=lambda c: c.score, reverse=True):
+        row = conn.execute("SELECT * FROM source_units WHERE source_id = ?", (candidate.source_id,)).fetchone()
+        if not row:
+            continue
+        if filters.series_ids and row["series_id"] not in filters.series_ids:
+            continue
+        if filters.project_types:
+            doc = conn.execute(
+                "SELECT project_type FROM documents WHERE document_id = ?", (row["document_id"],)
+            ).fetchone()
+            if (doc["project_type"] if doc else "") not in filters.project_types:
+                continue
+        if filters.content_types and not set(json.loads(row["content_types_json"])).intersection(filters.content_types):
+            continue
+        topics = set(json.loads(row["topic_tags_json"]))
+        if filters.topics and not topics.intersection(extract_topics(filters.topics) or filters.topics):
+            continue
+        cards.append(row["source_id"])
+        if len(cards) >= limit:
+            break
+    return cards
+
+
+def _time(fn) -> float:
+    started = time.perf_counter()
+    for _ in range(REPEATS):
+        fn()
+    return (time.perf_counter() - started) / REPEATS * 1000.0
+
+
+def main(units: int, candidate_count: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        index = SermonSearchIndex(Path(tmp) / "sermon_search.sqlite3")
+        _populate(index, units)
+        with index.connect() as conn:
+            ids = [row[0] for row in conn.execute("SELECT source_id FROM source_units")]
+            step = max(1, len(ids) // candidate_count)
+            candidates = {
+                source_id: Candidate(source_id=source_id, score=float(i))
+                for i, source_id in enumerate(ids[::step][:candidate_count])
+            }
+            before = _time(lambda: _legacy_load_cards(index, conn, candidates, FILTERS, 80))
+            after = _time(lambda: index._load_cards(conn, candidates, FILTERS, 80))
+            same = _legacy_load_cards(index, conn, candidates, FILTERS, 80) == [
+                card.source_id for card in index._load_cards(conn, candidates, FILTERS, 80)
+            ]
+    print(f"units={units} candidates={len(candidates)}")
+    print(f"per-row hydration: {before:8.2f} ms")
+    print(f"set-based query:   {after:8.2f} ms")
+    print(f"same cards:        {same}")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(*(args + [20_000, 600][len(args):]))
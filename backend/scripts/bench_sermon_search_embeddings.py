@@ -0,0 +1,69 @@
+"""Time the full vector path offline with the deterministic hashing provider.
+
+Usage: python backend/scripts/bench_sermon_search_embeddings.py [documents]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path (smart-answer/)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+os.environ["SERMON_SEARCH_EMBEDDING_PROVIDER"] = "hashing"
+
+from backend.api.sermon_search.index_store import SermonSearchIndex  # noqa: E402
+from backend.api.sermon_search.models import DiscoveredManuscript  # noqa: E402
+
+WORDS = ["天國", "鑰匙", "新郎", "婚姻", "受苦", "捨己", "僕人", "家譜", "恩典", "律法", "信心", "盼望"]
+QUERIES = ["天國的鑰匙", "新郎與婚姻", "受苦的僕人", "恩典與律法", "信心和盼望"]
+
+
+def _manuscripts(root: Path, documents: int, rng: random.Random) -> list[DiscoveredManuscript]:
+    manuscripts = []
+    for doc in range(documents):
+        path = root / f"doc-{doc:05d}.md"
+        sections = []
+        for section in range(10):
+            body = "".join(rng.choice(WORDS) for _ in range(60))
+            sections.append(f"## {rng.choice(WORDS)}{section}\n\n{body}。")
+        path.write_text("\n\n".join(sections), encoding="utf-8")
+        manuscripts.append(
+            DiscoveredManuscript(
+                series_id="series",
+                series_title="系列",
+                lecture_id="lecture",
+                lecture_title="講座",
+                project_id=f"project-{doc}",
+                project_title=f"{doc}章釋經",
+                manuscript_path=path,
+                content_hash=f"hash-{doc}",
+                modified_time=1.0,
+            )
+        )
+    return manuscripts
+
+
+def main(documents: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        manuscripts = _manuscripts(root, documents, random.Random(7))
+        index = SermonSearchIndex(root / "sermon_search.sqlite3")
+        started = time.perf_counter()
+        response = index.rebuild_from_manuscripts(manuscripts, include_embeddings=True)
+        rebuild_ms = (time.perf_counter() - started) * 1000.0
+        started = time.perf_counter()
+        for query in QUERIES:
+            index.search_cache.clear()
+            index.query_embedding_cache.clear()
+            index.search(query, limit=20)
+        search_ms = (time.perf_counter() - started) / len(QUERIES) * 1000.0
+    print(f"documents={documents} units={response.source_units_indexed}")
+    print(f"rebuild with embeddings: {rebuild_ms:10.1f} ms")
+    print(f"uncached search:         {search_ms:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,65 @@
+"""Compare the JSON row scan with the packed vector matrix for semantic search.
+
+Usage: python backend/scripts/bench_sermon_search_vectors.py [units ...]
+"""
+
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path (smart-answer/)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from backend.api.sermon_search.index_store import SermonSearchIndex  # noqa: E402
+
+DIMENSIONS = 768
+QUERIES = 5
+
+
+def _populate(index: SermonSearchIndex, units: int, rng: random.Random) -> None:
+    index.initialize()
+    with index.connect() as conn:
+        conn.executemany(
+            """
+            INSERT INTO source_unit_embeddings(source_id, provider, model, dimensions, vector_json)
+            VALUES (?, 'bench', 'bench', ?, ?)
+            """,
+            (
+                (f"unit-{i:06d}", DIMENSIONS, json.dumps([rng.gauss(0.0, 1.0) for _ in range(DIMENSIONS)]))
+                for i in range(units)
+            ),
+        )
+        index._write_vector_matrix(conn)
+
+
+def _time(fn) -> float:
+    started = time.perf_counter()
+    for _ in range(QUERIES):
+        fn()
+    return (time.perf_counter() - started) / QUERIES * 1000.0
+
+
+def main(sizes: list[int]) -> None:
+    rng = random.Random(7)
+    print(f"{'units':>8} {'json scan ms':>14} {'matrix ms':>10} {'same top-k':>11}")
+    for units in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            index = SermonSearchIndex(Path(tmp) / "sermon_search.sqlite3")
+            _populate(index, units, rng)
+            query = [rng.gauss(0.0, 1.0) for _ in range(DIMENSIONS)]
+            with index.connect() as conn:
+                packed = index._load_vector_matrix(conn)
+                scan_ms = _time(lambda: index._scan_vector_candidates(conn, query))
+                matrix_ms = _time(lambda: index._matrix_vector_candidates(packed, query))
+                same = list(index._scan_vector_candidates(conn, query)) == list(
+                    index._matrix_vector_candidates(packed, query)
+                )
+        print(f"{units:>8} {scan_ms:>14.1f} {matrix_ms:>10.2f} {str(same):>11}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10_000, 100_000])
@@ -0,0 +1,32 @@
+"""Import a bulk Bible text file into the local scripture passage store.
+
+Each line is ``book<TAB>chapter<TAB>verse<TAB>text``. The translation name
+must match what the /scripture endpoints ask for (BIBLE_API_TRANSLATION_ZH,
+BIBLE_API_TRANSLATION_EN or a SCRIPTURE_BIBLE_ID_* value).
+
+Usage: python backend/scripts/import_scripture_text.py <translation> <file> [<file> ...]
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add project root to path (smart-answer/)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from backend.api.scripture import read_bible_text  # noqa: E402
+from backend.api.scripture_store import scripture_store  # noqa: E402
+
+
+def main(translation: str, files: list[str]) -> None:
+    store = scripture_store()
+    for name in files:
+        count = store.import_verses(translation, read_bible_text(Path(name)))
+        print(f"{name}: imported {count} verses into {translation} ({store.path})")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print(__doc__)
+        sys.exit(1)
+    main(sys.argv[1], sys.argv[2:])
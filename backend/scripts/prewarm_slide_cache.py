@@ -0,0 +1,34 @@
+"""Detect slide scenes in sermon videos and cache their frames and OCR text.
+
+After this runs, slide text and image requests for the item are served
+from DATA_BASE_DIR/slide_cache/<item> without decoding video or calling OCR.
+Pass --no-ocr to cache scene frames only.
+
+Usage: python backend/scripts/prewarm_slide_cache.py [--no-ocr] <item> [<item> ...]
+"""
+
+import os
+import sys
+import time
+
+# Add project root to path (smart-answer/)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from backend.api.sc_api.image_to_text import ImageToText  # noqa: E402
+
+
+def main(items: list[str], ocr: bool) -> None:
+    for item in items:
+        started = time.perf_counter()
+        with ImageToText(item) as extractor:
+            scenes = extractor.prewarm(ocr=ocr)
+        elapsed = time.perf_counter() - started
+        print(f"{item}: {len(scenes)} scenes cached in {elapsed:.1f}s ({extractor.cache.root})")
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if arg != "--no-ocr"]
+    if not args:
+        print(__doc__)
+        sys.exit(1)
+    main(args, ocr="--no-ocr" not in sys.argv[1:])
@@ -314,3 +314,49 @@ def test_a_relation_may_start_at_an_observation():
 
     with pytest.raises(KnowledgePackageValidationError):
         importer._validate_links(_records("OBS-999"))
+
+
+def test_record_index_tracks_writes_and_outside_edits(tmp_path: Path) -> None:
+    store = RepositoryStore(tmp_path / "repo")
+    KnowledgePackageImporter(store).import_path(
+        _write_package(tmp_path / "package.json", _package())
+    )
+    claims_dir = store.knowledge_dir / "claims"
+    index = json.loads((store.index_dir / "knowledge__claims.json").read_text(encoding="utf-8"))
+    assert index["record_ids"] == ["CL-1"]
+    assert store.knowledge_counts()["claims"] == 1
+
+    # A record copied in by hand (a git checkout, say) still counts.
+    added = json.loads((claims_dir / "CL-1.json").read_text(encoding="utf-8"))
+    added.update({"claim_id": "CL-0", "statement": "另一条主张"})
+    (claims_dir / "CL-0.json").write_text(json.dumps(added, ensure_ascii=False), encoding="utf-8")
+
+    assert [item.claim_id for item in store.list_knowledge_records("claims")] == ["CL-0", "CL-1"]
+    assert RepositoryStore(store.root).knowledge_counts()["claims"] == 2
+
+    added["statement"] = "改过以后的主张"
+    (claims_dir / "CL-0.json").write_text(json.dumps(added, ensure_ascii=False), encoding="utf-8")
+    assert store.get_knowledge_record("claims", "CL-0").statement == "改过以后的主张"
+
+    listed = store.list_knowledge_records("claims")
+    listed[0].statement = "只改了内存里的副本"
+    assert store.list_knowledge_records("claims")[0].statement == "改过以后的主张"
+
+
+def test_a_settled_index_answers_counts_without_scanning(tmp_path: Path, monkeypatch) -> None:
+    store = RepositoryStore(tmp_path / "repo")
+    KnowledgePackageImporter(store).import_path(
+        _write_package(tmp_path / "package.json", _package())
+    )
+    index_path = store.index_dir / "knowledge__claims.json"
+    index = json.loads(index_path.read_text(encoding="utf-8"))
+    # Written long after the folder last changed: nothing can be missing from it.
+    index["written_ns"] = index["folder_mtime_ns"] + 60_000_000_000
+    index_path.write_text(json.dumps(index), encoding="utf-8")
+
+    def _no_scan(folder):
+        raise AssertionError(f"scanned {folder}")
+
+    fresh = RepositoryStore(store.root)
+    monkeypatch.setattr(fresh, "_scan_ids", _no_scan)
+    assert fresh._record_ids(store.knowledge_dir / "claims") == ["CL-1"]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import sqlite3
 
 import pytest
 
@@ -11,6 +12,7 @@ from backend.api.canonical_repository.models import (
     ManuscriptLocator,
     TopicAssignment,
 )
+from backend.api.canonical_repository.compiler import RepositoryValidationError
 from backend.api.canonical_repository.service import CanonicalRepositoryService
 
 
@@ -476,6 +478,107 @@ def test_compiler_places_concept_only_in_primary_topic(repository_workspace):
     assert len(topics[0]["units"][0]["topic_assignments"]) == 2
 
 
+def _published_units(repository_workspace):
+    service = repository_workspace["service"]
+    project_id, _ = _write_transcript_project(repository_workspace)
+    registered = service.register_project_source(project_id)
+    source_id = registered["source"]["source_id"]
+    source_map = service.store.get_source_map(source_id)
+    entry = next(item for item in source_map.entries if item["paragraph_key"] == "49")
+    citation = service.create_citation_from_source_range(source_id, entry["source_line_start"], entry["source_line_end"])
+    citation.status = "approved"
+    service.store.save_citation(citation)
+    locator = ManuscriptLocator(
+        project_id=project_id,
+        project_type="transcript",
+        heading_title="一、登山變像",
+        heading_anchor="一-登山變像",
+    )
+    units = [
+        CanonicalUnit(
+            unit_id=f"CU-cloud-{n}",
+            title=f"雲彩與神的臨在 {n}",
+            unit_type="passage",
+            status="published",
+            primary_bible_refs=[BibleReference(osis="Matt.17.5", display="太 17:5")],
+            manuscript=locator,
+            citation_ids=[citation.citation_id],
+        )
+        for n in range(3)
+    ]
+    units.append(
+        CanonicalUnit(
+            unit_id="CU-presence",
+            title="神臨在的記號",
+            unit_type="concept",
+            status="published",
+            topic_assignments=[TopicAssignment(topic_ids=["theophany"], path=["神論", "神的臨在"])],
+            manuscript=locator,
+            citation_ids=[citation.citation_id],
+        )
+    )
+    for unit in units:
+        service.store.save_unit(unit)
+    return service, citation, units
+
+
+def _compiled(service):
+    build_dir = service.store.builds_dir / service.store.get_active_build()["build_id"]
+    connection = sqlite3.connect(build_dir / "repository.sqlite3")
+    try:
+        tables = {
+            table: sorted(connection.execute(f"SELECT * FROM {table}").fetchall())
+            for table in ("canonical_units", "source_documents", "citations", "unit_citations", "unit_relationships")
+        }
+    finally:
+        connection.close()
+    manifest = json.loads((build_dir / "build_manifest.json").read_text(encoding="utf-8"))
+    return {
+        "tables": tables,
+        "bible": (build_dir / "bible_index.json").read_text(encoding="utf-8"),
+        "topic": (build_dir / "topic_index.json").read_text(encoding="utf-8"),
+        "manifest": {key: value for key, value in manifest.items() if key not in {"build_id", "generated_at"}},
+    }
+
+
+def test_incremental_build_matches_a_full_rebuild(repository_workspace, monkeypatch):
+    service, _, units = _published_units(repository_workspace)
+    service.compiler.build()
+    previous_build = service.store.get_active_build()["build_id"]
+    previous = _compiled(service)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(service.store, "list_units", lambda: pytest.fail("incremental build listed every unit"))
+        units[1].title = "改過的標題"
+        service.save_unit_and_refresh_public_index(units[1])
+        units[0].status = "archived"
+        service.save_unit_and_refresh_public_index(units[0])
+    incremental = _compiled(service)
+
+    assert service.store.get_active_build()["build_id"] != previous_build
+    assert incremental["manifest"]["unit_count"] == 3
+    assert "改過的標題" in incremental["bible"]
+    service.compiler.build()
+    assert _compiled(service) == incremental
+    # The build the site was reading is untouched.
+    service.store.set_active_build(previous_build, "earlier")
+    assert _compiled(service) == previous
+
+
+def test_incremental_build_rechecks_units_that_cite_a_changed_citation(repository_workspace):
+    service, citation, units = _published_units(repository_workspace)
+    service.compiler.build()
+
+    citation.status = "candidate"
+    service.store.save_citation(citation)
+    with pytest.raises(RepositoryValidationError) as failure:
+        service.compiler.build(incremental=True)
+
+    assert failure.value.findings == [
+        f"{unit.unit_id}: citation {citation.citation_id} is not approved" for unit in units
+    ]
+
+
 def test_unit_summaries_filter_by_sermon_transcript_origin(repository_workspace):
     service = repository_workspace["service"]
     project_id, transcript_id = _write_transcript_project(repository_workspace)
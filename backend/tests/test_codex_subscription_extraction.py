@@ -3,6 +3,8 @@ from __future__ import annotations
 import hashlib
 import json
 import subprocess
+import sys
+import time
 from pathlib import Path
 
 import pytest
@@ -233,3 +235,42 @@ def test_subscription_backend_changes_fingerprint_without_changing_api_identity(
     assert "backend" not in existing_api_identity
     assert subscription_identity["backend"] == "codex_subscription"
     assert subscription_identity["fingerprint_sha256"] != existing_api_identity["fingerprint_sha256"]
+
+
+_STUB_CODEX = """#!{python}
+import json, os, sys
+if sys.argv[1:3] == ["login", "status"]:
+    print("Logged in using ChatGPT")
+    sys.exit(0)
+open(os.path.join({log!r}, str(os.getpid())), "w").close()
+prompt = sys.stdin.read()
+schema = json.load(open(sys.argv[sys.argv.index("--output-schema") + 1]))
+output = sys.argv[sys.argv.index("--output-last-message") + 1]
+json.dump({{"schema_type": schema["type"], "pid": os.getpid(), "asked": prompt.endswith("ping")}}, open(output, "w"))
+"""
+
+
+def test_warm_workers_answer_from_processes_started_ahead_of_the_request(tmp_path: Path) -> None:
+    started = tmp_path / "started"
+    started.mkdir()
+    stub = tmp_path / "codex"
+    stub.write_text(_STUB_CODEX.format(python=sys.executable, log=str(started)), encoding="utf-8")
+    stub.chmod(0o755)
+    schema = {"type": "object"}
+
+    with CodexSubscriptionClient(
+        model="gpt-5.6-sol", executable=str(stub), warm_workers=1,
+    ) as client:
+        first = client.generate_json("system", "ping", schema)
+        assert first["schema_type"] == "object" and first["asked"] is True
+        # The spare started behind the first request is waiting for its prompt.
+        deadline = time.monotonic() + 10
+        while len(list(started.iterdir())) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        already_running = {path.name for path in started.iterdir()} - {str(first["pid"])}
+        assert len(already_running) == 1
+        second = client.generate_json("system", "ping", schema)
+        assert str(second["pid"]) in already_running
+        workspace = Path(client._workspace.name)
+        assert [path.name for path in workspace.glob("response-schema-*")] == ["response-schema-0.json"]
+    assert not workspace.exists()
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import json
+import threading
+import time
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
@@ -20,6 +23,7 @@ from backend.pipeline.extraction_sections import (
     save_plan,
     sections_from_headings,
 )
+from backend.pipeline.stage1 import PerThread
 
 
 def _segments(count: int) -> list[str]:
@@ -267,3 +271,69 @@ def test_a_broken_scoreboard_does_not_take_the_extraction_down(tmp_path: Path) -
     coverage = _coverage(source, broken)
     assert coverage["available"] is False
     assert "IndexError" in coverage["reason"] or "KeyError" in coverage["reason"]
+
+
+# --------------------------------------------------------------------------
+# Sections run side by side
+# --------------------------------------------------------------------------
+
+
+class _SlowSectionClient:
+    last_usage = PerThread()
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def generate_json(self, _prompt, _feedback, _schema, *, cache_prefix):
+        index = int(cache_prefix.split("本章节：第", 1)[1].split("节", 1)[0])
+        with self._lock:
+            self.calls += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        with self._lock:
+            self.active -= 1
+        self.last_usage = SimpleNamespace(prompt_tokens=index, completion_tokens=0, total_tokens=index)
+        return {"claims": [{"claim_id": "CL001", "statement": f"第{index}节"}]}
+
+
+def test_sections_run_concurrently_and_combine_in_section_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from backend.pipeline import detailed_knowledge_extraction_runner as runner
+
+    monkeypatch.setattr(runner, "validate_response", lambda *_args: None)
+    monkeypatch.setattr(runner, "validate_sentence_audit", lambda *_args: None)
+    segments = _segments(24)
+    for number, position in enumerate(range(0, 24, 3), start=1):
+        segments[position] = f"## 第{number}节"
+    source = {"script": [{"index": i, "text": text} for i, text in enumerate(segments)]}
+    plan = plan_sections(segments)
+
+    def extract(output_dir: Path, concurrency: int):
+        client = _SlowSectionClient()
+        result = runner._extract_sections(
+            source_id="src", exclusion_source_id="SRC-src", source=source, header="",
+            plan=plan, output_dir=output_dir, client=client, prompt="extract",
+            fingerprint="f" * 16, force=False, concurrency=concurrency,
+        )
+        return result, client
+
+    sequential, sequential_client = extract(tmp_path / "one", 1)
+    parallel, parallel_client = extract(tmp_path / "four", 4)
+
+    assert sequential_client.peak == 1 and parallel_client.peak > 1
+    assert parallel == sequential
+    combined, usage_rows, section_rows, _ = parallel
+    assert [claim["statement"] for claim in combined["claims"]] == [f"第{n}节" for n in range(1, 9)]
+    # Each row carries its own call's usage, not whichever call finished last.
+    assert [(row["section_index"], row["total_tokens"]) for row in usage_rows] == [(n, n) for n in range(1, 9)]
+    assert [row["cached"] for row in section_rows] == [False] * 8
+
+    cached, client = extract(tmp_path / "four", 4)
+    assert client.calls == 0
+    assert cached[0] == combined
+
@@ -4,6 +4,8 @@ import errno
 import importlib
 import os
 import sys
+import threading
+import time
 import types
 
 
@@ -381,3 +383,106 @@ def test_run_ffmpeg_command_reports_non_transient_oserror(monkeypatch, tmp_path)
         assert "test stage" in getattr(exc, "detail", "")
     else:
         raise AssertionError("Expected ffmpeg OSError to be reported")
+
+
+class _FakeTranscriptions:
+    def __init__(self, fail_on: set[bytes] | None = None) -> None:
+        self.fail_on = fail_on or set()
+        self.calls: list[bytes] = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def create(self, *, file, **_kwargs):
+        audio = file.read()
+        with self._lock:
+            self.calls.append(audio)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.05)
+        with self._lock:
+            self.active -= 1
+        if audio in self.fail_on:
+            raise RuntimeError("upstream timeout")
+        return {"segments": [{"start": 1, "end": 2, "text": audio.decode("utf-8")}]}
+
+
+def _stub_transcription(monkeypatch, tmp_path, service, transcriptions):
+    chunks = []
+    for index in range(4):
+        chunk = tmp_path / f"chunk-{index:03d}.mp3"
+        chunk.write_bytes(f"chunk {index}".encode("utf-8"))
+        chunks.append(chunk)
+    client = types.SimpleNamespace(audio=types.SimpleNamespace(transcriptions=transcriptions))
+    monkeypatch.setattr(service, "OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(service, "FELLOWSHIP_TRANSCRIBE_MODEL", "gpt-4o-transcribe")
+    monkeypatch.setattr(service, "FELLOWSHIP_TRANSCRIBE_CONCURRENCY", 4)
+    monkeypatch.setattr(service, "FELLOWSHIP_TRANSCRIPTION_CACHE_DIR", tmp_path / "stt-cache")
+    monkeypatch.setattr(service, "_extract_audio_for_transcription", lambda _path: tmp_path / "recording.stt.mp3")
+    monkeypatch.setattr(service, "_split_audio_for_transcription", lambda _path, force=False: chunks)
+    monkeypatch.setattr(importlib.import_module("backend.api.openai_client"), "get_openai_client", lambda: client)
+
+
+def test_transcribe_recording_runs_chunks_concurrently_in_offset_order(monkeypatch, tmp_path):
+    service = _load_service_with_data_dir(monkeypatch, tmp_path)
+    transcriptions = _FakeTranscriptions()
+    _stub_transcription(monkeypatch, tmp_path, service, transcriptions)
+    progress: list[tuple[int, int]] = []
+
+    markdown = service._transcribe_recording(tmp_path / "recording.mp4", lambda done, total: progress.append((done, total)))
+
+    assert transcriptions.max_active > 1
+    assert [markdown.index(f"chunk {index}") for index in range(4)] == sorted(markdown.index(f"chunk {index}") for index in range(4))
+    assert "## Part 3 [00:20:00-00:30:00]" in markdown
+    assert "[00:20:01-00:20:02] chunk 2" in markdown
+    assert progress[0] == (0, 4)
+    assert progress[-1] == (4, 4)
+    assert [done for done, _ in progress] == sorted(done for done, _ in progress)
+
+
+def test_transcribe_recording_resumes_without_repaying_finished_chunks(monkeypatch, tmp_path):
+    service = _load_service_with_data_dir(monkeypatch, tmp_path)
+    failing = _FakeTranscriptions(fail_on={b"chunk 1"})
+    _stub_transcription(monkeypatch, tmp_path, service, failing)
+
+    try:
+        service._transcribe_recording(tmp_path / "recording.mp4")
+    except Exception as exc:
+        assert getattr(exc, "status_code", None) == 502
+        assert "chunk 2" in getattr(exc, "detail", "")
+    else:
+        raise AssertionError("Expected the failed chunk to surface")
+
+    retry = _FakeTranscriptions()
+    _stub_transcription(monkeypatch, tmp_path, service, retry)
+    markdown = service._transcribe_recording(tmp_path / "recording.mp4")
+
+    assert len(failing.calls) == 4
+    assert retry.calls == [b"chunk 1"]
+    assert "chunk 3" in markdown
+
+
+def test_chunk_transcription_cache_is_bounded_by_age_and_size(monkeypatch, tmp_path):
+    service = _load_service_with_data_dir(monkeypatch, tmp_path)
+    transcriptions = _FakeTranscriptions()
+    _stub_transcription(monkeypatch, tmp_path, service, transcriptions)
+    monkeypatch.setattr(service, "FELLOWSHIP_TRANSCRIPTION_CACHE_MAX_ENTRIES", 5)
+    cache_dir = tmp_path / "stt-cache"
+    cache_dir.mkdir()
+    now = time.time()
+    stale = cache_dir / "stale.json"
+    stale.write_text("{}", encoding="utf-8")
+    os.utime(stale, (now - 31 * 86400, now - 31 * 86400))
+    for index in range(6):
+        older = cache_dir / f"older-{index}.json"
+        older.write_text("{}", encoding="utf-8")
+        os.utime(older, (now - 3600 + index, now - 3600 + index))
+
+    service._transcribe_recording(tmp_path / "recording.mp4")
+    service._transcribe_recording(tmp_path / "recording.mp4")
+
+    remaining = sorted(path.name for path in cache_dir.glob("*.json"))
+    assert len(remaining) == 5
+    assert "stale.json" not in remaining
+    assert "older-5.json" in remaining
+    assert len(transcriptions.calls) == 4
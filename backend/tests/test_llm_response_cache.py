@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from backend.pipeline import llm_response_cache
+from backend.pipeline.codex_subscription_client import CodexSubscriptionClient
+from backend.pipeline.llm_response_cache import ResponseCache, response_key
+
+SCHEMA = {"type": "object", "properties": {"answer": {"type": "string"}}}
+
+
+class _Client:
+    last_usage = "billed"
+
+
+def _key(**overrides) -> str:
+    fields = {
+        "model": "gpt-5.6-sol", "settings": {"reasoning_effort": "medium"},
+        "system_prompt": "system", "json_schema": SCHEMA, "user_input": "input",
+    }
+    return response_key(**{**fields, **overrides})
+
+
+def test_every_part_of_the_call_is_in_the_key() -> None:
+    base = _key()
+    assert _key() == base
+    assert _key(settings={"reasoning_effort": "medium"}) == base
+    for changed in (
+        {"model": "claude-sonnet-4-6"},
+        {"settings": {"reasoning_effort": "high"}},
+        {"system_prompt": "system v2"},
+        {"json_schema": {"type": "object"}},
+        {"user_input": "other input"},
+    ):
+        assert _key(**changed) != base, changed
+
+
+def _ask(cache: ResponseCache, client: _Client, calls: list[int], user_input: str = "u") -> dict:
+    def generate() -> dict:
+        calls.append(1)
+        return {"answer": f"call {len(calls)}"}
+
+    return cache.through(
+        client, model="m", settings={}, system_prompt="s", json_schema=SCHEMA,
+        user_input=user_input, generate=generate,
+    )
+
+
+def test_only_an_accepted_answer_is_served_to_the_next_client(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path)
+    calls: list[int] = []
+
+    first = _Client()
+    assert _ask(cache, first, calls) == {"answer": "call 1"}
+    # Not yet judged: nothing is on disk for another runner to replay.
+    assert _ask(cache, _Client(), calls) == {"answer": "call 2"}
+    cache.accept(first)
+
+    other_runner = _Client()
+    assert _ask(cache, other_runner, calls) == {"answer": "call 1"}
+    assert other_runner.last_usage is None
+    assert len(calls) == 2
+    assert cache.stats() == {"hits": 1, "misses": 2, "writes": 1, "evicted": 0}
+
+
+def test_a_rejected_stored_answer_is_deleted(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path)
+    calls: list[int] = []
+    writer = _Client()
+    _ask(cache, writer, calls)
+    cache.accept(writer)
+
+    # Validation tightened since the answer was stored; the next call asks again.
+    reader = _Client()
+    assert _ask(cache, reader, calls) == {"answer": "call 1"}
+    cache.reject(reader)
+    assert _ask(cache, _Client(), calls) == {"answer": "call 2"}
+    assert len(calls) == 2
+
+
+def test_a_rerun_after_failed_validation_reaches_the_model(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("LLM_RESPONSE_CACHE_DIR", str(tmp_path / "store"))
+    answers = iter([{"answer": "bad"}] * 3 + [{"answer": "good"}, {"answer": "bad"}])
+    calls: list[str] = []
+
+    class Client:
+        last_usage = None
+
+        def generate_json(self, system_prompt: str, user_prompt: str, json_schema: dict) -> dict:
+            def generate() -> dict:
+                calls.append(user_prompt)
+                return next(answers)
+
+            return llm_response_cache.cached_generate(
+                self, model="m", settings={}, system_prompt=system_prompt,
+                json_schema=json_schema, user_input=user_prompt, generate=generate,
+            )
+
+    def run(client: Client) -> dict:
+        # The shape of every runner's loop: feedback is built from the
+        # rejected answer, so each attempt's input is the same on a rerun.
+        user_prompt = "input"
+        for _ in range(2):
+            response = client.generate_json("system", user_prompt, SCHEMA)
+            try:
+                with llm_response_cache.validating_response(client):
+                    if response["answer"] != "good":
+                        raise ValueError(f"rejected {response['answer']}")
+                return response
+            except ValueError as exc:
+                user_prompt = f"input\nfeedback: {exc}"
+        raise RuntimeError("no valid answer")
+
+    with pytest.raises(RuntimeError):
+        run(Client())
+    assert run(Client()) == {"answer": "good"}
+    assert calls == ["input", "input\nfeedback: rejected bad"] * 2
+    # Only the accepted answer is stored; the refused first attempt is asked again.
+    assert run(Client()) == {"answer": "good"}
+    assert calls[4:] == ["input"]
+
+
+def test_the_store_evicts_the_least_recently_read_entries(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path, max_bytes=10_000)
+    keys = [_key(user_input=str(n)) for n in range(5)]
+    for n, key in enumerate(keys):
+        cache.put(key, {"answer": "x" * 1000}, model="m")
+        os.utime(cache._path(key), (n, n))
+    cache.get(keys[0])
+
+    assert cache.prune(max_bytes=3 * cache._path(keys[0]).stat().st_size) == 2
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None and cache.get(keys[2]) is None
+
+    small = ResponseCache(tmp_path / "small", max_bytes=3000)
+    for key in keys:
+        small.put(key, {"answer": "x" * 1000}, model="m")
+    assert sum(path.stat().st_size for path in small.entries()) <= 3000
+    assert small.stats()["evicted"] >= 2
+
+
+def test_concurrent_writers_leave_whole_entries(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path)
+    key = _key()
+
+    def write(n: int) -> None:
+        for _ in range(20):
+            cache.put(key, {"answer": str(n) * 5000}, model="m")
+
+    threads = [threading.Thread(target=write, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    answer = cache.get(key)["answer"]
+    assert len(answer) == 5000 and len(set(answer)) == 1
+    assert list(cache.root.glob("??/.*.tmp")) == []
+
+
+def test_a_store_hit_does_not_launch_codex(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("LLM_RESPONSE_CACHE_DIR", str(tmp_path / "store"))
+    launched: list[list[str]] = []
+
+    def fake_run(command, **_kwargs):
+        launched.append(command)
+        raise AssertionError("the second client should be answered from the store")
+
+    first = CodexSubscriptionClient(model="gpt-5.6-sol", executable="codex")
+    monkeypatch.setattr(first, "_generate_json_uncached", lambda *_args: {"answer": "stored"})
+    assert first.generate_json("system", "user", SCHEMA) == {"answer": "stored"}
+    llm_response_cache.accept_response(first)
+
+    monkeypatch.setattr("backend.pipeline.codex_subscription_client.subprocess.run", fake_run)
+    second = CodexSubscriptionClient(model="gpt-5.6-sol", executable="codex")
+    assert second.generate_json("system", "user", SCHEMA) == {"answer": "stored"}
+    assert launched == []
+
+
+def test_cli_reports_and_prunes_the_store(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    cache = ResponseCache(tmp_path)
+    for n in range(3):
+        cache.put(_key(user_input=str(n)), {"answer": n}, model="gpt-5.6-sol")
+    cache.get(_key(user_input="0"))
+    cache.get(_key(user_input="missing"))
+    cache.record_stats()
+
+    assert llm_response_cache.main(["--root", str(tmp_path), "stats"]) == 0
+    stats = json.loads(capsys.readouterr().out)
+    assert stats["entries"] == 3
+    assert stats["models"] == {"gpt-5.6-sol": 3}
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+    assert llm_response_cache.main(["--root", str(tmp_path), "prune", "--max-bytes", "0"]) == 0
+    assert json.loads(capsys.readouterr().out)["removed"] == 3
@@ -1,6 +1,9 @@
+import threading
+import time
 from types import SimpleNamespace
 
-from backend.pipeline.llm_usage import usage_row, usage_summary
+from backend.pipeline.codex_subscription_client import CodexSubscriptionClient
+from backend.pipeline.llm_usage import CallBudget, provider_budget, usage_row, usage_summary
 
 
 def test_anthropic_cache_legs_count_as_input() -> None:
@@ -52,3 +55,60 @@ def test_summary_adds_up_every_attempt_including_the_rejected_one() -> None:
     assert summary["prompt_tokens"] == 200
     assert summary["total_tokens"] == 230
     assert summary["cache_hit"] == "75%"
+
+
+def test_call_budget_waits_for_the_token_window_to_drain() -> None:
+    now = [0.0]
+    slept: list[float] = []
+
+    def sleep(seconds: float) -> None:
+        slept.append(seconds)
+        now[0] += seconds
+
+    budget = CallBudget(2, tokens_per_minute=1000, clock=lambda: now[0], sleep=sleep)
+    with budget.request():
+        pass
+    budget.spend(600)
+    now[0] = 10.0
+    with budget.request():
+        pass
+    budget.spend(500)
+    now[0] = 20.0
+    with budget.request():
+        pass
+    # 1100 tokens were spent in the window, so the third call waited for the
+    # first charge (at t=0) to age out.
+    assert slept == [40.0]
+
+
+def test_every_client_of_a_provider_shares_its_budget(monkeypatch) -> None:
+    monkeypatch.delenv("LLM_RESPONSE_CACHE_DIR", raising=False)
+    monkeypatch.setenv("LLM_CODEX_SUBSCRIPTION_MAX_CONCURRENT_REQUESTS", "2")
+    lock = threading.Lock()
+    in_flight = peak = 0
+
+    def answer(*_args):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.03)
+        with lock:
+            in_flight -= 1
+        return {}
+
+    # Two clients, as a subtitle pass and an extraction in one process would hold.
+    clients = [CodexSubscriptionClient(model="gpt-5.6-sol", executable="codex") for _ in range(2)]
+    for client in clients:
+        monkeypatch.setattr(client, "_generate_json_uncached", answer)
+    threads = [
+        threading.Thread(target=clients[n % 2].generate_json, args=("system", f"user {n}", {}))
+        for n in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak == 2
+    assert provider_budget("codex_subscription").max_requests == 2
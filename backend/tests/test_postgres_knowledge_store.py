@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from contextlib import contextmanager
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -8,6 +9,8 @@ import pytest
 
 from backend.api.canonical_repository.postgres_store import (
     SOURCE_KEYS,
+    ChangeSetConflict,
+    ConnectionPool,
     PostgresKnowledgeStore,
     build_active_snapshot,
     build_change_set_plan,
@@ -248,6 +251,10 @@ class _RecordStore:
     def get_record(self, collection: str, object_id: str):
         return self._records.get(collection, {}).get(object_id)
 
+    def get_records(self, collection: str, object_ids):
+        rows = self._records.get(collection, {})
+        return {object_id: rows[object_id] for object_id in object_ids if object_id in rows}
+
 
 def test_plan_document_inlines_its_decisions_and_survives_a_package_round_trip() -> None:
     """`export-plan` writes this shape and `ingest-plan` wraps it back up, so
@@ -571,3 +578,146 @@ def test_a_preserved_review_field_is_not_reported_as_removed() -> None:
     operation = next(item for item in plan.operations if item.object_id == "CL-1")
     assert operation.payload["review_note"] == "同工已核对"
     assert operation.removed_fields == ()
+
+
+class _SetCursor(_RecordingCursor):
+    def __init__(self, rows: list[tuple]) -> None:
+        super().__init__(())
+        self._rows = rows
+
+    def fetchall(self):
+        return self._rows
+
+
+def test_existing_reads_every_key_in_one_query() -> None:
+    """Planning thousands of records used to cost one round trip per record."""
+
+    payload = normalize_package(_package())["claims"]["CL-1"]
+    cursor = _SetCursor([("claims", "CL-1", 3, record_content_sha(payload), payload)])
+    store = PostgresKnowledgeStore.__new__(PostgresKnowledgeStore)
+    keys = [("claims", "CL-1"), ("claims", "CL-1"), *(("claims", f"CL-{n}") for n in range(2, 1200))]
+
+    existing = store._existing(_RecordingConnection(cursor), keys)
+
+    assert len(cursor.statements) == 1
+    sql, params = cursor.statements[0]
+    assert "UNNEST" in sql
+    assert params[0] == ["claims"] * 1199
+    assert params[1][:2] == ["CL-1", "CL-2"]
+    assert existing == {
+        ("claims", "CL-1"): {"revision": 3, "content_sha256": record_content_sha(payload), "payload": payload}
+    }
+
+
+class _PooledConnection:
+    def __init__(self, psycopg) -> None:
+        self.closed = False
+        self.broken = False
+        self.commits = 0
+        self.rollbacks = 0
+        self.info = SimpleNamespace(transaction_status=psycopg.pq.TransactionStatus.IDLE)
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_pool_reuses_connections_and_keeps_transaction_semantics() -> None:
+    psycopg = pytest.importorskip("psycopg")
+    opened: list[_PooledConnection] = []
+
+    def connect(url: str) -> _PooledConnection:
+        opened.append(_PooledConnection(psycopg))
+        return opened[-1]
+
+    pool = ConnectionPool(SimpleNamespace(connect=connect, pq=psycopg.pq), "postgresql://test", max_idle=1)
+
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        pass
+    assert second is first and first.commits == 2
+
+    with pytest.raises(RuntimeError):
+        with pool.connection() as failing:
+            raise RuntimeError("boom")
+    assert failing is first and first.rollbacks == 1 and not first.closed
+
+    with pool.connection() as outer, pool.connection() as inner:
+        assert inner is not outer
+    assert len(opened) == 2
+    assert outer.closed and not inner.closed  # only one idle slot
+
+    inner.broken = True
+    with pool.connection() as replacement:
+        assert replacement is not inner
+    pool.close()
+    assert replacement.closed
+
+
+class _CopyCursor(_RecordingCursor):
+    """A cursor that also takes COPY, for the bulk apply path."""
+
+    def __init__(self, locked_rows: list[tuple]) -> None:
+        super().__init__(())
+        self.copied: list[tuple] = []
+        self._locked_rows = locked_rows
+
+    @contextmanager
+    def copy(self, sql: str):
+        self.statements.append((sql, ()))
+        yield SimpleNamespace(write_row=self.copied.append)
+
+    def fetchall(self):
+        if "FOR UPDATE" in self._last:
+            return self._locked_rows
+        return []
+
+
+def _apply(plan, cursor, *, bulk: bool) -> dict:
+    store = PostgresKnowledgeStore.__new__(PostgresKnowledgeStore)
+    store.connect = lambda: _RecordingConnection(cursor)  # type: ignore[method-assign]
+    return store.apply_plan(plan, bulk=bulk)
+
+
+def test_bulk_apply_stages_the_rows_the_row_by_row_path_writes() -> None:
+    plan = build_change_set_plan(_package(), {})
+    rows = _RecordingCursor(None)
+    bulk = _CopyCursor([])
+
+    assert _apply(plan, rows, bulk=False) == _apply(plan, bulk, bulk=True)
+
+    objects = [
+        params for sql, params in rows.statements
+        if "INSERT INTO wang_knowledge.objects" in sql
+    ]
+    versions = [
+        params[:5] for sql, params in rows.statements
+        if "INSERT INTO wang_knowledge.object_versions" in sql
+    ]
+    operations = [
+        params[1:] for sql, params in rows.statements
+        if "INSERT INTO wang_knowledge.change_operations" in sql
+    ]
+    assert objects == [
+        (row[2], row[3], row[7], row[8], row[9], row[5], row[10], row[11]) for row in bulk.copied
+    ]
+    assert versions == [(row[2], row[3], row[7], row[5], row[11]) for row in bulk.copied]
+    assert operations == [(*row[:8], row[12]) for row in bulk.copied]
+    assert len(bulk.copied) == len(plan.operations) == 4
+    assert not any("FOR UPDATE" in sql and "%s" in sql for sql, _ in bulk.statements)
+
+
+def test_bulk_apply_reports_the_first_conflict_before_writing() -> None:
+    plan = build_change_set_plan(_package(), {})
+    cursor = _CopyCursor([(3, "c" * 64, None), (1, "b" * 64, None)])
+
+    with pytest.raises(ChangeSetConflict, match=plan.operations[1].object_id):
+        _apply(plan, cursor, bulk=True)
+
+    assert not any("INSERT INTO wang_knowledge.objects" in sql for sql, _ in cursor.statements)
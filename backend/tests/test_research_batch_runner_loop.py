@@ -10,7 +10,10 @@ from __future__ import annotations
 
 import json
 import subprocess
+import threading
+import time
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
@@ -242,6 +245,109 @@ def test_an_interrupt_still_leaves_a_terminal_status(tmp_path, monkeypatch, caps
     assert status["丙"] == "not_started"
 
 
+def test_workers_run_members_side_by_side_and_keep_each_members_order(
+    tmp_path, monkeypatch, capsys,
+) -> None:
+    """Members share nothing, so a batch should take about one member's time."""
+
+    batch = _batch_file(tmp_path)
+    transcripts = _transcripts(tmp_path, "甲", "乙", "丙")
+    plan = runner.build_command_plan(
+        runner.load_research_batch(batch), transcript_dir=[transcripts],
+        output_root=tmp_path / "out", force=False,
+    )
+    member_of = {tuple(row["command"]): row["transcript_id"] for row in plan}
+    lock = threading.Lock()
+    order: dict[str, list[list[str]]] = {}
+    in_flight = peak = 0
+
+    def fake_run(command, **kwargs):
+        nonlocal in_flight, peak
+        with lock:
+            order.setdefault(member_of[tuple(command)], []).append(command)
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        return subprocess.CompletedProcess(command, 0)
+
+    monkeypatch.setattr(runner.subprocess, "run", fake_run)
+    monkeypatch.setattr(
+        "sys.argv",
+        ["research_batch_runner", "--batch", str(batch), "--transcript-dir", str(transcripts),
+         "--output-root", str(tmp_path / "out"), "--workers", "3"],
+    )
+    runner.main()
+    capsys.readouterr()
+
+    assert peak == 3
+    serial: dict[str, list[list[str]]] = {}
+    for row in plan:
+        serial.setdefault(row["transcript_id"], []).append(row["command"])
+    assert order == serial
+    manifest = json.loads((tmp_path / "out" / "run-manifest.json").read_text(encoding="utf-8"))
+    assert "running_commands" not in manifest
+
+
+def test_in_process_stages_call_the_runner_main(tmp_path, monkeypatch, capsys) -> None:
+    batch = _batch_file(tmp_path)
+    transcripts = _transcripts(tmp_path, "甲", "乙", "丙")
+    calls: list[tuple[str, list[str]]] = []
+
+    def fake_import(name):
+        def main(argv):
+            calls.append((name, argv))
+            return 2 if "乙" in argv else 0
+        return SimpleNamespace(main=main)
+
+    monkeypatch.setattr(runner, "importlib", SimpleNamespace(import_module=fake_import))
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(
+        "sys.argv",
+        ["research_batch_runner", "--batch", str(batch), "--transcript-dir", str(transcripts),
+         "--output-root", str(tmp_path / "out"), "--stage", "extract", "--in-process"],
+    )
+    assert runner.main() == 1
+    report = json.loads(capsys.readouterr().out)
+
+    assert [name for name, _ in calls] == ["backend.pipeline.detailed_knowledge_extraction_runner"] * 3
+    assert {row["source"]: row["status"] for row in report["members"]} == {
+        "甲": "completed", "乙": "failed", "丙": "completed",
+    }
+
+
+def test_an_in_process_stage_that_raises_fails_only_its_member(
+    tmp_path, monkeypatch, capsys,
+) -> None:
+    batch = _batch_file(tmp_path)
+    transcripts = _transcripts(tmp_path, "甲", "乙", "丙")
+    output = tmp_path / "out"
+
+    def fake_import(name):
+        def main(argv):
+            if "乙" in argv:
+                raise RuntimeError("stage bug")
+            return 0
+        return SimpleNamespace(main=main)
+
+    monkeypatch.setattr(runner, "importlib", SimpleNamespace(import_module=fake_import))
+    monkeypatch.setattr(
+        "sys.argv",
+        ["research_batch_runner", "--batch", str(batch), "--transcript-dir", str(transcripts),
+         "--output-root", str(output), "--stage", "extract", "--in-process"],
+    )
+    assert runner.main() == 1
+    captured = capsys.readouterr()
+
+    assert "RuntimeError: stage bug" in captured.err
+    manifest = json.loads((output / "run-manifest.json").read_text(encoding="utf-8"))
+    assert manifest["status"] != "running"
+    assert {row["source"]: row["status"] for row in manifest["members"]} == {
+        "甲": "completed", "乙": "failed", "丙": "completed",
+    }
+
+
 def test_a_transcript_is_found_across_several_directories(tmp_path, monkeypatch, capsys) -> None:
     """Chapter 16 is split across two transcript directories.
 
@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+import difflib
+import json
+import os
+import random
+from pathlib import Path
+
+from backend.api.sc_api.phrase_index import PhraseIndex, align
+from backend.api.sc_api.script_delta import ScriptDelta
+from backend.api.sc_api.sentence_splitter import SentenceSplitter
+from backend.api.sc_api.text_diff import is_similar, tagged_diff
+
+FIXTURES = Path(__file__).resolve().parent / 'fixtures' / 'matthew_exposition' / 'matt16-18-v1'
+
+
+def _differ_markup(old: str, new: str) -> str:
+    """The Differ-based rendering getChanges used before the Myers engine."""
+    line: list[str] = []
+    tag = ''
+    for ele in difflib.Differ().compare(old, new):
+        new_tag = '<->' if ele.startswith('-') else '<+>' if ele.startswith('+') else ''
+        if new_tag != tag:
+            line.extend(['</>' if tag else '', new_tag])
+            tag = new_tag
+        line.append(ele.replace(ele[0], '').strip() if ele[0] in '-+' else ele.strip())
+    return ''.join(line)
+
+
+def _write(base: Path, folder: str, payload) -> None:
+    (base / folder).mkdir(exist_ok=True)
+    (base / folder / 'item.json').write_text(json.dumps(payload, ensure_ascii=False), encoding='utf-8')
+
+
+def _sermon(tmp_path: Path, review_rows: list[tuple[str, str]]) -> Path:
+    entries = [
+        {'index': f'1_{i}', 'start': f'00:00:{i:02},000', 'end': f'00:00:{i:02},900', 'text': f'字幕{i}'}
+        for i in range(1, 7)
+    ]
+    _write(tmp_path, 'script', {'entries': entries})
+    _write(tmp_path, 'script_patched', [
+        {'index': '1_2', 'text': '起初神創造天地。'},
+        {'index': '1_4', 'text': '地是空虛混沌，淵面黑暗。'},
+        {'index': '1_6', 'text': '神說要有光，就有了光。'},
+    ])
+    _write(tmp_path, 'script_review', [
+        {'index': index, 'text': text} for index, text in review_rows
+    ])
+    return tmp_path
+
+
+def test_tagged_diff_matches_differ_markup_on_common_edits():
+    cases = [
+        ('起初神創造天地。', '起初神創造了天地。'),
+        ('神說要有光，就有了光。', '神說：要有光！就有了光。'),
+        ('我們今天讀 Romans 8', '我們今天讀 Romans 9'),
+        ('same text', 'same text'),
+        ('刪除這幾個字吧', '刪除吧'),
+    ]
+    for old, new in cases:
+        assert tagged_diff(old, new) == _differ_markup(old, new)
+
+
+def _edited(rng: random.Random, text: str, alphabet: str, edits: int) -> str:
+    chars = list(text)
+    for _ in range(edits):
+        position = rng.randint(0, len(chars))
+        roll = rng.random()
+        if roll < 0.4 or not chars:
+            chars.insert(position, rng.choice(alphabet))
+        elif roll < 0.7:
+            del chars[min(position, len(chars) - 1)]
+        else:
+            chars[min(position, len(chars) - 1)] = rng.choice(alphabet)
+    return ''.join(chars)
+
+
+def test_tagged_diff_matches_differ_markup_on_random_edits():
+    rng = random.Random(3)
+    alphabet = '天國的比喻芥菜種神愛世人，。ab -+'
+    for _ in range(300):
+        old = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+        new = _edited(rng, old, alphabet, rng.randint(0, 6))
+        assert tagged_diff(old, new) == _differ_markup(old, new), (old, new)
+    # Past 200 characters SequenceMatcher junks popular characters.
+    text = (FIXTURES / 'good-reference.md').read_text(encoding='utf-8')
+    for _ in range(20):
+        old = text[rng.randrange(len(text) - 400):][:rng.randint(200, 400)]
+        new = _edited(rng, old, alphabet + ' Petros petra', rng.randint(1, 40))
+        assert tagged_diff(old, new) == _differ_markup(old, new)
+
+
+def test_is_similar_matches_the_sequence_matcher_ratio():
+    assert is_similar('', '')
+    assert is_similar('起初神創造天地。', '起初神創造了天地。')
+    assert not is_similar('起初神創造天地。', '地是空虛混沌，淵面黑暗。')
+    # 2 * 4 / 10 = 0.8 is not above the threshold; 2 * 5 / 11 is.
+    assert not is_similar('abcde', 'abcdx')
+    assert is_similar('abcde', 'abcdex')
+    rng = random.Random(5)
+    for _ in range(300):
+        old = ''.join(rng.choice('天國比喻芥菜種，。ab') for _ in range(rng.randint(0, 20)))
+        new = _edited(rng, old, '天國比喻芥菜種，。ab', rng.randint(0, 6))
+        assert is_similar(old, new) == (difflib.SequenceMatcher(None, old, new).ratio() > 0.8)
+
+
+def _legacy_changes(sd: ScriptDelta) -> list[dict]:
+    """getChanges as it ran on difflib, before the compiled-script cache."""
+    paragraphs_patched = sd.loadPatchedScript()
+    paragraphs_review = sd.loadReviewScript()
+    sd.add_timeline(sd.patched)
+
+    def similar(i: int, j: int) -> bool:
+        p1, p2 = sd.patched[i], sd.review[j]
+        if p2.get('type') == 'comment':
+            return False
+        return difflib.SequenceMatcher(None, p1['text'], p2['text']).ratio() > 0.8 or p1['index'] == p2['index']
+
+    i = j = 0
+    changes = []
+    while i < len(paragraphs_patched) and j < len(paragraphs_review):
+        while i < len(paragraphs_patched) and j < len(paragraphs_review) and similar(i, j):
+            changes.append({**sd.patched[i], 'text': _differ_markup(paragraphs_patched[i], paragraphs_review[j])})
+            i += 1
+            j += 1
+        k = j + 1
+        while i < len(paragraphs_patched) and k < len(paragraphs_review) and not similar(i, k):
+            k += 1
+        if k >= len(paragraphs_review):
+            if i < len(paragraphs_patched):
+                changes.append({**sd.patched[i], 'text': '<->' + sd.patched[i]['text'] + '</>'})
+            i += 1
+        else:
+            changes.extend({**sd.patched[i - 1], 'text': '<+>' + paragraphs_review[n] + '</>'} for n in range(j, k))
+            j = k
+    for n in range(i, len(paragraphs_patched)):
+        changes.append({**sd.patched[n], 'text': '<->' + sd.patched[n]['text'] + '</>'})
+    for n in range(j, len(paragraphs_review)):
+        changes.append({'text': '<+>' + paragraphs_review[n] + '</>', 'index': sd.patched[i - 1].get('index')})
+    return changes
+
+
+def _paragraphs(name: str) -> list[str]:
+    text = (FIXTURES / name).read_text(encoding='utf-8')
+    return [line for line in text.splitlines() if line.strip() and not line.startswith('<!--')]
+
+
+def test_get_changes_on_a_real_script_matches_the_difflib_output(tmp_path):
+    patched = _paragraphs('good-reference.md')
+    rng = random.Random(11)
+    review = [_edited(rng, text, '，。的是 Petros', rng.randint(0, 12)) for text in patched]
+    # The editor's rewrite stands in for paragraphs too changed to pair.
+    review[2:3] = _paragraphs('bad-production-current.md')[2:4]
+    del review[-2]
+    entries = [
+        {'index': f'1_{i}', 'start': f'00:00:{i:02},000', 'end': f'00:00:{i:02},900', 'text': ''}
+        for i in range(1, 2 * len(patched) + 2)
+    ]
+    _write(tmp_path, 'script', {'entries': entries})
+    _write(tmp_path, 'script_patched', [{'index': f'1_{2 * n + 2}', 'text': t} for n, t in enumerate(patched)])
+    _write(tmp_path, 'script_review', [{'index': f'1_{2 * n + 2}', 'text': t} for n, t in enumerate(review)])
+
+    expected = _legacy_changes(ScriptDelta(str(tmp_path), 'item'))
+    cold = ScriptDelta(str(tmp_path), 'item')
+    assert cold.getChanges() == expected
+    warm = ScriptDelta(str(tmp_path), 'item')
+    assert warm.getChanges() == expected
+    # A cache hit leaves the loaded scripts on the instance, as a miss does.
+    assert warm.patched == cold.patched and warm.review == cold.review
+
+
+def test_get_changes_tags_paragraph_edits_insertions_and_deletions(tmp_path):
+    base = _sermon(tmp_path, [('1_2', '起初神創造了天地。'), ('1_3', '插入的新段落'), ('1_6', '神說要有光，就有了光。')])
+
+    changes = ScriptDelta(str(base), 'item').get_script(True)
+
+    assert [p['text'] for p in changes] == [
+        '起初神創造<+>了</>天地。',
+        '<->地是空虛混沌，淵面黑暗。</>',
+        '<+>插入的新段落</>',
+        '神說要有光，就有了光。',
+    ]
+    assert changes[0]['start_timeline'] == '00:00:00'
+    assert changes[3]['start_index'] == '1_5'
+
+
+def test_compiled_script_is_reused_until_a_source_file_changes(tmp_path):
+    base = _sermon(tmp_path, [('1_2', '起初神創造天地。'), ('1_4', '地是空虛混沌，淵面黑暗。'), ('1_6', '神說要有光，就有了光。')])
+
+    first = ScriptDelta(str(base), 'item')
+    second = ScriptDelta(str(base), 'item')
+    assert second.timelineDictionary is first.timelineDictionary
+
+    changes = first.get_script(True)
+    changes[0]['user_name'] = 'someone'
+    assert 'user_name' not in second.get_script(True)[0]
+
+    review = base / 'script_review' / 'item.json'
+    rows = json.loads(review.read_text(encoding='utf-8'))
+    rows[0]['text'] = '起初，神創造天地。'
+    ScriptDelta.save_rows(str(base), 'item', 'script_review', rows)
+    os.utime(review, ns=(0, os.stat(review).st_mtime_ns + 1))
+
+    assert second.get_script(True)[0]['text'] == '起初<+>，</>神創造天地。'
+
+
+SENTENCES = [
+    '起初神創造天地。',
+    '地是空虛混沌，淵面黑暗；神的靈運行在水面上。',
+    '神說：要有光，就有了光。',
+    '神看光是好的，就把光暗分開了。',
+    '神稱光為晝，稱暗為夜。有晚上，有早晨，這是頭一日。',
+]
+
+
+def _legacy_search(paragraphs: list[str], text: str):
+    """ScriptDelta.search's Differ scan, kept to check the phrase index against."""
+    for t, paragraph in enumerate(paragraphs):
+        line = []
+        for ele in difflib.Differ().compare(paragraph, text + '~'):
+            if ele.startswith('+'):
+                if '~' in ele:
+                    break
+                line.append(ele.strip().replace(' ', ''))
+            elif not ele.startswith('-'):
+                line.append(ele.strip())
+        if difflib.SequenceMatcher(None, text, ''.join(line)).ratio() >= 0.9:
+            return t
+    return None
+
+
+def test_phrase_index_locates_phrases_like_the_differ_scan():
+    paragraphs = [''.join(SENTENCES[:2]), ''.join(SENTENCES[2:4]), SENTENCES[4], 'We read Romans 8 together.']
+    index = PhraseIndex(paragraphs)
+    phrases = [
+        '神的靈運行在水面上',
+        '神說要有光，就有了光',
+        '就把光暗分開',
+        '有晚上有早晨',
+        '這是頭一天',
+        'Romans 8',
+        '暗',
+        '',
+        '我們今天讀馬太福音',
+    ]
+    for phrase in phrases:
+        assert index.locate(phrase) == _legacy_search(paragraphs, phrase), phrase
+
+
+def test_search_maps_phrases_to_published_paragraph_starts(tmp_path):
+    base = _sermon(tmp_path, [])
+    _write(base, 'script_published', {
+        'metadata': {},
+        'script': [
+            {'index': '1_2', 'start_index': '1_1', 'text': SENTENCES[0]},
+            {'index': '1_4', 'start_index': '1_3', 'text': SENTENCES[1] + '~~備註~~'},
+            {'index': '1_6', 'start_index': '1_5', 'text': '*' + SENTENCES[2] + '*'},
+        ],
+    })
+
+    result = ScriptDelta(str(base), 'item').search(['淵面黑暗', '要有光就有了光', '不在講稿裡的句子'])
+
+    assert result == {'淵面黑暗': '1_3', '要有光就有了光': '1_5'}
+
+
+def test_align_pairs_match_and_increase():
+    rng = random.Random(8)
+    for _ in range(100):
+        a = ''.join(rng.choice(SENTENCES) for _ in range(rng.randint(0, 6)))
+        b = list(a)
+        for _ in range(rng.randint(0, 6)):
+            if b:
+                b[rng.randrange(len(b))] = rng.choice('，。 光暗')
+        b = ''.join(b)
+        pairs = align(a, b)
+        assert all(a[i] == b[j] for i, j in pairs)
+        assert all(p[0] < q[0] and p[1] < q[1] for p, q in zip(pairs, pairs[1:]))
+        if a == b:
+            assert len(pairs) == len(a)
+
+
+def test_sentence_timing_matches_the_differ_alignment():
+    segments = ['起初神創造天地', '地是空虛混沌', '淵面黑暗', '神的靈運行在水面上', '神說要有光', '就有了光', '神看光是好的']
+    timeline = {}
+    for i, text in enumerate(segments, start=1):
+        timeline[f'1_{i}'] = {
+            'index': f'1_{i}', 'text': text, 'next_item': f'1_{i + 1}',
+            'start_time': f'00:00:{2 * i:02},000', 'end_time': f'00:00:{2 * i + 1:02},500',
+        }
+    paragraph = {
+        'index': '1_6', 'start_index': '1_1', 'start_time': 2,
+        'text': '起初，神創造天地。地是空虛混沌，淵面黑暗。神的靈運行在水面上。神說：要有光！就有了光。',
+    }
+    splitter = SentenceSplitter(timeline)
+
+    sentences = splitter.split_sentences(paragraph)
+
+    org_text, sec_indx = splitter.get_original_text_timeline(paragraph)
+    new_text, positions = splitter.get_sentence_positions(paragraph['text'])
+    legacy = []
+    org_idx = new_idx = 0
+    for ele in difflib.Differ().compare(org_text, new_text):
+        if ele.startswith('-'):
+            org_idx += 1
+        elif ele.startswith('+'):
+            new_idx += 1
+        else:
+            legacy.append((org_idx, new_idx))
+            org_idx += 1
+            new_idx += 1
+    expected_ends = [
+        splitter.calcuateTime(sec_indx[m[0]]['index'], sec_indx[m[0]]['end_time'])
+        for pos in positions
+        for i, m in enumerate(legacy)
+        if m[1] == pos and legacy[i - 1][1] == pos - 1 and (i + 1 >= len(legacy) or legacy[i + 1][1] == pos + 1)
+    ]
+    assert [s['end_time'] for s in sentences] == expected_ends
+    assert [s['text'] for s in sentences] == ['起初，神創造天地。', '地是空虛混沌，淵面黑暗。', '神的靈運行在水面上。', '神說：要有光！', '就有了光。']
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from backend.api import scripture, scripture_store
+from backend.api.scripture_store import ScriptureStore
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    local = ScriptureStore(tmp_path / "passages.sqlite3")
+    monkeypatch.setattr(scripture_store, "_store", local)
+    monkeypatch.setattr(scripture, "BIBLE_API_TRANSLATION_ZH", "cuv")
+    monkeypatch.setattr(scripture, "BIBLE_API_TRANSLATION_EN", "kjv")
+    yield local
+    local.close()
+
+
+def _offline(monkeypatch):
+    async def unreachable(*args, **kwargs):
+        raise httpx.ConnectError("upstream down")
+
+    monkeypatch.setattr(scripture, "fetch_bible_api", unreachable)
+
+
+def test_imported_bible_text_serves_without_the_network(store, tmp_path, monkeypatch):
+    text = tmp_path / "cuv.tsv"
+    text.write_text(
+        "# 和合本\n太\t5\t3\t虛心的人有福了！\nMAT\t5\t4\t哀慟的人有福了！\nMatt\t5\t5\t溫柔的人有福了！\n",
+        encoding="utf-8",
+    )
+    assert store.import_verses("cuv", scripture.read_bible_text(text)) == 3
+    _offline(monkeypatch)
+
+    result = asyncio.run(scripture.get_scripture_basic("mat-5-3-5"))
+
+    assert result["passages"]["zh"] == "<p>虛心的人有福了！<br/>哀慟的人有福了！<br/>溫柔的人有福了！</p>"
+    assert result["passages"]["en"] == ""
+    assert store.get_verses("cuv", "Matt", 5, 3, 6) is None
+
+
+def test_read_bible_text_rejects_unknown_books(tmp_path):
+    text = tmp_path / "bad.tsv"
+    text.write_text("Enoch\t1\t1\tAnd Enoch walked\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="unknown book"):
+        list(scripture.read_bible_text(text))
+
+
+def test_misses_fetch_concurrently_and_are_cached(store, monkeypatch):
+    calls: list[str] = []
+
+    async def slow_fetch(client, book_slug, chapter, start, end, translation):
+        calls.append(translation)
+        await asyncio.sleep(0.2)
+        return f"<p>{translation} {book_slug} {chapter}:{start}-{end}</p>"
+
+    monkeypatch.setattr(scripture, "fetch_bible_api", slow_fetch)
+    started = time.perf_counter()
+    fetched = asyncio.run(scripture.get_scripture_basic("jhn-3-16-16"))
+    elapsed = time.perf_counter() - started
+    _offline(monkeypatch)
+    cached = asyncio.run(scripture.get_scripture_basic("jhn-3-16"))
+
+    assert sorted(calls) == ["cuv", "kjv"]
+    assert elapsed < 0.35
+    assert fetched["passages"] == {"zh": "<p>cuv JHN 3:16-16</p>", "en": "<p>kjv JHN 3:16-16</p>"}
+    assert cached["passages"] == fetched["passages"]
+    assert store.get_passage("kjv", "John.3.16") == "<p>kjv JHN 3:16-16</p>"
+
+
+def test_failed_fetches_are_not_cached(store, monkeypatch):
+    _offline(monkeypatch)
+
+    result = asyncio.run(scripture.get_scripture_basic("rom-8-28"))
+
+    assert result["passages"] == {"zh": "", "en": ""}
+    assert store.get_passage("cuv", "Rom.8.28") is None
@@ -49,6 +49,7 @@ def test_series_index_refresh_updates_topic_and_search_indexes(monkeypatch):
     assert calls["topic"]["project_types"] == ["sermon_note", "transcript"]
     assert calls["search"].project_types == ["sermon_note", "transcript"]
     assert calls["search"].include_embeddings is True
+    assert calls["search"].incremental is True
 
 
 def test_only_one_global_index_refresh_can_run_at_a_time():
@@ -1,4 +1,5 @@
 import json
+import threading
 
 from backend.api.sc_api.sermon_comment import SermonCommentManager
 
@@ -13,9 +14,47 @@ def test_sermon_bookmark_round_trip_and_update(tmp_path) -> None:
     manager.set_bookmark(user_id, item, "[10_20]")
     assert manager.get_bookmark(user_id, item) == {"index": "[10_20]"}
 
-    with open(manager.bookmark_file, encoding="utf-8") as handle:
-        stored = json.load(handle)
-    assert stored[manager.get_key(user_id, item)]["index"] == "[10_20]"
+    reopened = SermonCommentManager()
+    reopened.bookmark_file = manager.bookmark_file
+    assert reopened.get_bookmark(user_id, item) == {"index": "[10_20]"}
 
     manager.set_bookmark(user_id, item, "[30_40]")
     assert manager.get_bookmark(user_id, item) == {"index": "[30_40]"}
+    assert reopened.get_bookmark(user_id, item) == {"index": "[30_40]"}
+    assert manager.get_bookmark(user_id, "other") == {}
+
+
+def test_sermon_bookmarks_migrate_from_legacy_json_once(tmp_path) -> None:
+    legacy = tmp_path / "bookmark" / "bookmark.json"
+    legacy.parent.mkdir()
+    legacy.write_text(json.dumps({"a@example.com/講道": {"index": "[1_28]"}}, ensure_ascii=False), encoding="utf-8")
+
+    manager = SermonCommentManager()
+    manager.bookmark_file = str(legacy)
+    assert manager.get_bookmark("a@example.com", "講道") == {"index": "[1_28]"}
+    manager.set_bookmark("a@example.com", "講道", "[2_3]")
+
+    # The legacy file is not re-imported over newer state.
+    reopened = SermonCommentManager()
+    reopened.bookmark_file = str(legacy)
+    assert reopened.get_bookmark("a@example.com", "講道") == {"index": "[2_3]"}
+
+
+def test_concurrent_bookmark_writes_are_not_lost(tmp_path) -> None:
+    managers = [SermonCommentManager() for _ in range(4)]
+    for manager in managers:
+        manager.bookmark_file = str(tmp_path / "bookmark" / "bookmark.json")
+
+    def write(manager, worker):
+        for n in range(25):
+            manager.set_bookmark(f"user{worker}@example.com", f"item{n}", f"[{worker}_{n}]")
+
+    threads = [threading.Thread(target=write, args=(manager, worker)) for worker, manager in enumerate(managers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for worker in range(4):
+        for n in range(25):
+            assert managers[0].get_bookmark(f"user{worker}@example.com", f"item{n}") == {"index": f"[{worker}_{n}]"}
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import sqlite3
 import tempfile
+import threading
+import time
 import unittest
 from pathlib import Path
 
-from backend.api.sermon_search.bible_refs import extract_refs, normalize_ref, refs_overlap
+from backend.api.sermon_search.bible_refs import extract_refs, normalize_ref, ref_interval_key, refs_overlap
 from backend.api.sermon_search.index_store import SermonSearchIndex
 from backend.api.sermon_search.markdown_parser import parse_manuscript
-from backend.api.sermon_search.models import DiscoveredManuscript, SermonSearchRequest
+from backend.api.sermon_search.models import DiscoveredManuscript, SearchFilters, SermonSearchRequest
 from backend.api.sermon_search.service import SermonSearchService
 
 
@@ -26,6 +29,45 @@ class FakeLLM:
         return {"answer": "根據講稿，這是快速回答。", "citations": [], "related_questions": []}
 
 
+class FakeEmbeddingClient:
+    available = True
+    provider = "fake"
+    model = "fake-embedding"
+    dimensions = 8
+
+    def __init__(self, vocabulary: tuple[str, ...] = ("新郎", "婚姻", "天國", "鑰匙", "受苦", "捨己", "僕人", "家譜")) -> None:
+        self.vocabulary = vocabulary
+        self.query_calls = 0
+        self.embedded_texts: list[str] = []
+
+    def _vector(self, text: str) -> list[float]:
+        return [float(text.count(word)) + 0.01 * index for index, word in enumerate(self.vocabulary)]
+
+    def embed_documents(self, texts):
+        self.embedded_texts.extend(texts)
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text):
+        self.query_calls += 1
+        return self._vector(text)
+
+
+class FanOutPlannerLLM(FakeLLM):
+    def generate_json(self, messages, mode="normal"):
+        if "agentic search planner" in messages[0]["content"]:
+            self.planner_calls += 1
+            return {
+                "intent": "fan_out",
+                "searches": [
+                    {"tool": "multi_index_search", "query": "天國的鑰匙"},
+                    {"tool": "document_lookup", "document_query": "16章"},
+                    {"tool": "multi_index_search", "query": "受苦 捨己"},
+                    {"tool": "multi_index_search", "query": "耶和華的僕人"},
+                ],
+            }
+        return super().generate_json(messages, mode)
+
+
 def _manuscript(path: Path, project_id: str = "project-1", title: str = "1章-耶穌的來歷", bible_verse: str | None = None) -> DiscoveredManuscript:
     return DiscoveredManuscript(
         series_id="series-1",
@@ -62,6 +104,22 @@ class SermonSearchTests(unittest.TestCase):
         self.assertTrue(refs_overlap(broad, inside))
         self.assertFalse(refs_overlap(broad, outside))
 
+    def test_ref_interval_keys_agree_with_refs_overlap(self):
+        raws = [
+            "太 16:20-17:5", "太 17:1", "太 18:1", "太 16", "可 16:19", "太 16:19", "賽 54:5-6", "賽 54",
+            # Reversed ranges, as transcripts sometimes write them.
+            "太 17:5-16:20", "太 16:25-21", "太 16:24",
+        ]
+        refs = [normalize_ref(raw) for raw in raws]
+        for a in refs:
+            for b in refs:
+                a_key, b_key = ref_interval_key(a), ref_interval_key(b)
+                overlaps = a_key[0] <= b_key[1] and b_key[0] <= a_key[1]
+                self.assertEqual(overlaps, refs_overlap(a, b), (a.osis, b.osis))
+        reversed_range, verse = normalize_ref("太 16:25-21"), normalize_ref("太 16:24")
+        self.assertTrue(refs_overlap(reversed_range, verse))
+        self.assertTrue(refs_overlap(verse, reversed_range))
+
     def test_parser_allows_topic_only_units_without_passage_refs(self):
         with tempfile.TemporaryDirectory() as tmp:
             path = Path(tmp) / "final.md"
@@ -214,6 +272,365 @@ class SermonSearchTests(unittest.TestCase):
         self.assertEqual(fake_llm.planner_calls, 0)
         self.assertEqual(fake_llm.answer_calls, 1)
 
+    def test_packed_vector_matrix_matches_json_scan_ranking(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            bodies = [
+                "## 新郎\n\n新郎與婚姻的意象，新郎在場。",
+                "## 鑰匙\n\n天國的鑰匙交給彼得，天國。",
+                "## 捨己\n\n受苦與捨己的道路。",
+                "## 僕人\n\n耶和華的僕人受苦。",
+            ]
+            manuscripts = []
+            for index, body in enumerate(bodies):
+                path = root / f"doc-{index}.md"
+                path.write_text(body, encoding="utf-8")
+                manuscripts.append(_manuscript(path, project_id=f"project-{index}", title=f"{index}章釋經"))
+            search_index = SermonSearchIndex(root / "search.sqlite3")
+            search_index.embedding_client = FakeEmbeddingClient()
+            search_index.rebuild_from_manuscripts(manuscripts, include_embeddings=True)
+
+            matrix_files = list(search_index.vector_dir.glob("*.npy"))
+            with search_index.connect() as conn:
+                packed = search_index._load_vector_matrix(conn)
+                query_vector = search_index.embedding_client.embed_query("受苦 捨己 僕人")
+                scanned = search_index._scan_vector_candidates(conn, query_vector)
+            matrix_scores = search_index._matrix_vector_candidates(packed, query_vector)
+
+            search_index.rebuild_from_manuscripts(manuscripts[:2], include_embeddings=True)
+            rebuilt_files = list(search_index.vector_dir.glob("*.npy"))
+
+        self.assertEqual(len(matrix_files), 1)
+        self.assertIsNotNone(packed)
+        self.assertEqual(list(matrix_scores), list(scanned))
+        for source_id, score in scanned.items():
+            self.assertAlmostEqual(matrix_scores[source_id], score, places=4)
+        self.assertEqual(len(rebuilt_files), 1)
+        self.assertNotEqual(rebuilt_files[0].name, matrix_files[0].name)
+
+    def test_search_falls_back_to_json_scan_without_packed_matrix(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            path = root / "final.md"
+            path.write_text("## 新郎\n\n新郎與婚姻的意象。", encoding="utf-8")
+            search_index = SermonSearchIndex(root / "search.sqlite3")
+            search_index.embedding_client = FakeEmbeddingClient()
+            search_index.rebuild_from_manuscripts([_manuscript(path)], include_embeddings=True)
+            for matrix_path in search_index.vector_dir.glob("*.npy"):
+                matrix_path.unlink()
+
+            cards, tools = search_index.search("婚姻", limit=5)
+
+        self.assertIn("semantic_vector", tools)
+        self.assertTrue(cards)
+
+    def test_incremental_reindex_only_reparses_changed_documents(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            paths = [root / f"doc-{index}.md" for index in range(3)]
+            paths[0].write_text("## 新郎\n\n新郎與婚姻的意象。\n\n## 天國\n\n天國的鑰匙。", encoding="utf-8")
+            paths[1].write_text("## 捨己\n\n受苦與捨己的道路。", encoding="utf-8")
+            paths[2].write_text("## 僕人\n\n耶和華的僕人。", encoding="utf-8")
+            manuscripts = [
+                _manuscript(path, project_id=f"project-{index}", title=f"{index}章釋經")
+                for index, path in enumerate(paths)
+            ]
+            search_index = SermonSearchIndex(root / "search.sqlite3")
+            embeddings = FakeEmbeddingClient()
+            search_index.embedding_client = embeddings
+            search_index.rebuild_from_manuscripts(manuscripts[:2], include_embeddings=True)
+            embeddings.embedded_texts.clear()
+
+            paths[0].write_text("## 新郎\n\n新郎與婚姻的意象。\n\n## 天國\n\n天國的鑰匙交給彼得。", encoding="utf-8")
+            edited = manuscripts[0].model_copy(update={"content_hash": "hash-2"})
+            response = search_index.update_from_manuscripts([edited, manuscripts[2]], include_embeddings=True)
+            edited_texts = [unit.text for unit in search_index.find_document_units("0章釋經")]
+            with search_index.connect() as conn:
+                embedded_ids = {row[0] for row in conn.execute("SELECT source_id FROM source_unit_embeddings")}
+                unit_ids = {row[0] for row in conn.execute("SELECT source_id FROM source_units")}
+            cards, tools = search_index.search("天國 鑰匙", limit=5)
+
+            full_index = SermonSearchIndex(root / "full.sqlite3")
+            full_index.rebuild_from_manuscripts([edited, manuscripts[2]])
+            with full_index.connect() as conn:
+                full_unit_ids = {row[0] for row in conn.execute("SELECT source_id FROM source_units")}
+
+        self.assertEqual(response.status, "ok")
+        self.assertEqual(response.documents_indexed, 2)
+        self.assertEqual(response.documents_reparsed, 2)
+        self.assertEqual(response.documents_removed, 1)
+        self.assertEqual(response.embeddings_reused, 1)
+        self.assertEqual(len(embeddings.embedded_texts), 2)
+        self.assertEqual(unit_ids, full_unit_ids)
+        self.assertEqual(embedded_ids, unit_ids)
+        self.assertIn("天國的鑰匙交給彼得。", edited_texts)
+        self.assertIn("semantic_vector", tools)
+        self.assertTrue(cards)
+
+    def test_incremental_reindex_skips_unchanged_documents(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            path = root / "final.md"
+            path.write_text("## 太 1:1\n\n耶穌基督的家譜。", encoding="utf-8")
+            search_index = SermonSearchIndex(root / "search.sqlite3")
+            embeddings = FakeEmbeddingClient()
+            search_index.embedding_client = embeddings
+            search_index.rebuild_from_manuscripts([_manuscript(path)], include_embeddings=True)
+            embeddings.embedded_texts.clear()
+
+            touched = _manuscript(path).model_copy(update={"modified_time": 2.0})
+            response = search_index.update_from_manuscripts([touched], include_embeddings=True)
+            retitled = _manuscript(path, title="1章-家譜")
+            retitled_response = search_index.update_from_manuscripts([retitled], include_embeddings=True)
+            titles = [doc["project_title"] for doc in search_index.list_documents()]
+
+        self.assertEqual(response.documents_unchanged, 1)
+        self.assertEqual(response.documents_reparsed, 0)
+        self.assertEqual(retitled_response.documents_reparsed, 1)
+        self.assertEqual(len(embeddings.embedded_texts), 1)
+        self.assertEqual(titles, ["1章-家譜"])
+
+    def test_search_filters_are_applied_in_one_hydration_query(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            note = root / "note.md"
+            transcript = root / "transcript.md"
+            note.write_text("## 太 16:19 釋經\n\n天國的鑰匙，希臘文的詞義。", encoding="utf-8")
+            transcript.write_text("## 太 16:19 應用\n\n天國的鑰匙與生活應用。", encoding="utf-8")
+            search_index = SermonSearchIndex(root / "search.sqlite3")
+            search_index.rebuild_from_manuscripts(
+                [
+                    _manuscript(note, project_id="note", title="16章釋經"),
+                    _manuscript(transcript, project_id="talk", title="16章講道").model_copy(
+                        update={"project_type": "transcript", "series_id": "series-2"}
+                    ),
+                ]
+            )
+            statements: list[str] = []
+            original_connect = search_index.connect
+
+            def traced_connect():
+                conn = original_connect()
+                conn.set_trace_callback(statements.append)
+                return conn
+
+            search_index.connect = traced_connect
+            by_type, _ = search_index.search("太 16:19", SearchFilters(project_types=["transcript"]))
+            by_series, _ = search_index.search("太 16:19", SearchFilters(series_ids=["series-1"]))
+            by_content, _ = search_index.search("太 16:19", SearchFilters(content_types=["原文分析"]))
+            unfiltered, _ = search_index.search("太 16:19")
+
+        self.assertEqual([card.content_id for card in by_type], ["talk"])
+        self.assertEqual([card.content_id for card in by_series], ["note"])
+        self.assertEqual([card.content_id for card in by_content], ["note"])
+        self.assertEqual({card.content_id for card in unfiltered}, {"note", "talk"})
+        self.assertFalse([sql for sql in statements if "FROM source_units WHERE source_id =" in sql])
+
+    def test_interval_index_matches_book_scan(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            manuscripts = []
+            headings = ["太 16:13-20", "太 16:19", "太 16:21-17:3", "太 17", "可 16:19", "太 5:3"]
+            for index, heading in enumerate(headings):
+                path = root / f"doc-{index}.md"
+                path.write_text(f"## {heading}\n\n參照太 16:18 與賽 22:22。", encoding="utf-8")
+                manuscripts.append(_manuscript(path, project_id=f"project-{index}", title=f"{index}章釋經"))
+            search_index = SermonSearchIndex(root / "search.sqlite3")
+            search_index.rebuild_from_manuscripts(manuscripts)
+            with search_index.connect() as conn:
+                stored = conn.execute("SELECT * FROM source_unit_refs").fetchall()
+                results = {}
+                for raw in ["太 16:19", "太 17:1", "太 16", "可 16", "賽 22:22", "太 28:1"]:
+                    query = normalize_ref(raw)
+                    indexed = search_index._ref_candidates(conn, query)
+                    scanned = [
+                        (row["source_id"], row["role"])
+                        for row in stored
+                        if refs_overlap(query, search_index._row_ref(row))
+                    ]
+                    results[raw] = (sorted(indexed), sorted(scanned))
+                plan = conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT source_id FROM source_unit_ref_intervals WHERE start_key <= 1 AND end_key >= 0"
+                ).fetchall()
+
+        for raw, (indexed, scanned) in results.items():
+            self.assertEqual(indexed, scanned, raw)
+        self.assertTrue(results["太 16:19"][0])
+        self.assertFalse(results["太 28:1"][0])
+        self.assertIn("VIRTUAL TABLE INDEX", " ".join(str(row[-1]) for row in plan))
+
+    def test_full_text_terms_match_like_recall(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            bodies = [
+                "天國好像芥菜種，是人拿去種在田裡的。",
+                "耶穌說，你們要悔改，因為天國近了。",
+                "彼得承認耶穌是基督，是永生神的兒子。",
+                "論到聖靈的恩賜，我不願意你們不明白。",
+                "Grace and truth came through Jesus Christ.",
+                "The agape meal of the Christian church.",
+            ]
+            manuscripts = []
+            for index, body in enumerate(bodies):
+                path = root / f"doc-{index}.md"
+                path.write_text(f"## 第{index}段\n\n{body}", encoding="utf-8")
+                manuscripts.append(_manuscript(path, project_id=f"project-{index}", title=f"{index}章釋經"))
+            search_index = SermonSearchIndex(root / "search.sqlite3")
+            search_index.rebuild_from_manuscripts(manuscripts)
+            results = {}
+            with search_index.connect() as conn:
+                # "福音" is only in the series title, which the scan never read.
+                terms = ["天國", "芥菜", "耶穌", "基督", "聖靈的恩賜", "悔改", "Grace", "國", "福音"]
+                # Partial Latin words are substrings, not FTS tokens.
+                terms += ["Chris", "Christ", "agap", "grace", "hurch"]
+                for term in terms:
+                    like = f"%{term}%"
+                    scanned = {
+                        row["source_id"]
+                        for row in conn.execute(
+                            "SELECT source_id FROM source_units WHERE text LIKE ? OR project_title LIKE ? OR heading_path_json LIKE ?",
+                            (like, like, like),
+                        )
+                    }
+                    results[term] = (set(search_index._term_matches(conn, term)), scanned)
+
+        for term, (indexed, scanned) in results.items():
+            self.assertEqual(indexed, scanned, term)
+        self.assertEqual(len(results["Christ"][0]), 2)
+        self.assertEqual(results["福音"][0], set())
+
+    def test_full_text_index_retokenizes_legacy_rows_once(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            path = root / "doc.md"
+            path.write_text("## 比喻\n\n天國好像芥菜種。", encoding="utf-8")
+            search_index = SermonSearchIndex(root / "search.sqlite3")
+            search_index.rebuild_from_manuscripts([_manuscript(path)])
+            with search_index.connect() as conn:
+                conn.execute("UPDATE source_units_fts SET search_text = '天國好像芥菜種。'")
+                conn.execute("DELETE FROM index_metadata WHERE key = 'fts_tokenization'")
+                self.assertEqual(search_index._term_matches(conn, "芥菜"), [])
+            reopened = SermonSearchIndex(root / "search.sqlite3")
+            reopened.initialize()
+            with reopened.connect() as conn:
+                matches = reopened._term_matches(conn, "芥菜")
+
+        self.assertEqual(len(matches), 1)
+
+    def test_search_results_are_cached_until_the_index_is_rebuilt(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            path = root / "final.md"
+            path.write_text("## 新郎\n\n新郎與婚姻的意象。", encoding="utf-8")
+            search_index = SermonSearchIndex(root / "search.sqlite3")
+            embeddings = FakeEmbeddingClient()
+            search_index.embedding_client = embeddings
+            search_index.rebuild_from_manuscripts([_manuscript(path)], include_embeddings=True)
+
+            first, first_tools = search_index.search("婚姻", limit=5)
+            first[0].score = -1.0
+            second, second_tools = search_index.search("  婚姻 ", limit=5)
+            filtered, _ = search_index.search("婚姻", SearchFilters(topics=["國度"]), limit=5)
+            cached_status = SermonSearchService(index=search_index, llm=FakeLLM()).status()
+
+            path.write_text("## 新郎\n\n新郎與婚姻的意象。\n\n## 婚姻\n\n婚姻的奧秘。", encoding="utf-8")
+            search_index.rebuild_from_manuscripts(
+                [_manuscript(path).model_copy(update={"content_hash": "hash-2"})], include_embeddings=True
+            )
+            rebuilt, _ = search_index.search("婚姻", limit=5)
+
+        self.assertEqual([card.source_id for card in second], [card.source_id for card in first])
+        self.assertEqual(second_tools, first_tools)
+        self.assertGreater(second[0].score, 0)
+        self.assertEqual(filtered, [])
+        self.assertEqual(embeddings.query_calls, 1)
+        self.assertEqual(cached_status.search_cache.hits, 1)
+        self.assertEqual(cached_status.search_cache.misses, 2)
+        self.assertEqual(cached_status.query_embedding_cache.hits, 1)
+        self.assertEqual(cached_status.search_cache.generation, cached_status.indexed_at)
+        self.assertGreater(len(rebuilt), len(first))
+        self.assertEqual(embeddings.query_calls, 1)
+
+    def test_deep_mode_runs_round_searches_concurrently_with_identical_ranking(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            bodies = ["## 太 16:19\n\n天國的鑰匙給你。", "## 太 16:24\n\n受苦與捨己的道路。", "## 賽 42:1\n\n耶和華的僕人。"]
+            manuscripts = []
+            for index, body in enumerate(bodies):
+                path = root / f"doc-{index}.md"
+                path.write_text(body, encoding="utf-8")
+                manuscripts.append(_manuscript(path, project_id=f"project-{index}", title=f"{16 + index}章釋經"))
+            search_index = SermonSearchIndex(root / "search.sqlite3")
+            search_index.rebuild_from_manuscripts(manuscripts)
+            search = search_index.search
+            threads: set[int] = set()
+
+            def slow_search(*args, **kwargs):
+                threads.add(threading.get_ident())
+                time.sleep(0.05)
+                return search(*args, **kwargs)
+
+            search_index.search = slow_search
+            request = SermonSearchRequest(question="天國的鑰匙與受苦", mode="deep")
+            sequential = SermonSearchService(index=search_index, llm=FanOutPlannerLLM())
+            sequential.max_search_workers = 1
+            expected = sequential.query(request)
+            threads.clear()
+            parallel = SermonSearchService(index=search_index, llm=FanOutPlannerLLM())
+            response = parallel.query(request)
+
+        self.assertEqual(
+            [(card.source_id, card.score) for card in response.sources],
+            [(card.source_id, card.score) for card in expected.sources],
+        )
+        self.assertEqual(response.search_trace.tools_used, expected.search_trace.tools_used)
+        self.assertGreater(len(threads), 1)
+        first_round = response.search_trace.round_traces[0]
+        self.assertEqual(
+            [timing.tool for timing in first_round.tool_timings],
+            ["multi_index_search", "document_lookup", "multi_index_search", "multi_index_search"],
+        )
+        self.assertEqual(first_round.tool_timings[1].query, "16章")
+        self.assertLess(first_round.elapsed_ms, sum(timing.elapsed_ms for timing in first_round.tool_timings))
+        later_timings = [timing for trace in response.search_trace.round_traces[1:] for timing in trace.tool_timings]
+        self.assertTrue(all(timing.cached for timing in later_timings if timing.tool == "multi_index_search"))
+
+    def test_read_connections_are_pooled_per_thread_and_follow_swaps(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            path = root / "final.md"
+            path.write_text("## 新郎\n\n新郎與婚姻的意象。", encoding="utf-8")
+            search_index = SermonSearchIndex(root / "search.sqlite3")
+            search_index.rebuild_from_manuscripts([_manuscript(path)])
+            schema_runs = []
+            initialize_schema = search_index._initialize_schema
+            search_index._initialize_schema = lambda: (schema_runs.append(1), initialize_schema())[1]
+
+            first = search_index.read_connection()
+            search_index.search("婚姻")
+            search_index.status()
+            same = search_index.read_connection()
+            other: list = []
+            worker = threading.Thread(target=lambda: other.append(search_index.read_connection()))
+            worker.start()
+            worker.join()
+            with self.assertRaises(sqlite3.OperationalError):
+                first.execute("DELETE FROM documents")
+            runs_before_swap = len(schema_runs)
+
+            path.write_text("## 新郎\n\n新郎與婚姻的意象。\n\n## 僕人\n\n耶和華的僕人。", encoding="utf-8")
+            search_index.rebuild_from_manuscripts([_manuscript(path).model_copy(update={"content_hash": "hash-2"})])
+            cards, _ = search_index.search("僕人")
+            search_index.search("新郎")
+            swapped = search_index.read_connection()
+
+        self.assertIs(same, first)
+        self.assertIsNot(other[0], first)
+        self.assertIsNot(swapped, first)
+        self.assertTrue(cards)
+        self.assertEqual(runs_before_swap, 1)
+        self.assertEqual(len(schema_runs), 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+from backend.api.sermon_search.embedding_client import EmbeddingClient
+from backend.api.sermon_search.index_store import SermonSearchIndex
+from backend.api.sermon_search.models import DiscoveredManuscript
+
+
+class TransientError(Exception):
+    code = 503
+
+
+class RecordingClient(EmbeddingClient):
+    def __init__(self, cache_path: Path, failures: list[Exception] | None = None) -> None:
+        super().__init__(cache_path=cache_path)
+        self.retry_base_delay = 0.0
+        self.failures = list(failures or [])
+        self.calls: list[list[str]] = []
+        self.threads: set[int] = set()
+        self._calls_lock = threading.Lock()
+
+    def _call_provider(self, texts, task_type):
+        with self._calls_lock:
+            self.calls.append(list(texts))
+            self.threads.add(threading.get_ident())
+            if self.failures:
+                raise self.failures.pop(0)
+        return [[float(len(text)), float(index), 0.5] for index, text in enumerate(texts)]
+
+
+def _env(**values: str):
+    base = {
+        "SERMON_SEARCH_EMBEDDING_PROVIDER": "google",
+        "SERMON_SEARCH_EMBEDDING_BATCH_SIZE": "2",
+        "SERMON_SEARCH_EMBEDDING_CONCURRENCY": "3",
+    }
+    return mock.patch.dict(os.environ, {**base, **values})
+
+
+class EmbeddingClientTests(unittest.TestCase):
+    def test_hashing_provider_is_deterministic_and_normalized(self):
+        with _env(SERMON_SEARCH_EMBEDDING_PROVIDER="hashing", SERMON_SEARCH_EMBEDDING_DIMENSIONS="64"):
+            first = EmbeddingClient()
+            second = EmbeddingClient()
+
+        query = first.embed_query("天國的鑰匙")
+        self.assertTrue(first.available)
+        self.assertIsNone(first.cache)
+        self.assertEqual(query, second.embed_query("天國的鑰匙"))
+        self.assertEqual(len(query), 64)
+        self.assertAlmostEqual(float(np.linalg.norm(query)), 1.0, places=5)
+        related, unrelated = first.embed_documents(["天國 鑰匙 交給彼得", "Marriage feast"])
+        self.assertGreater(float(np.dot(query, related)), float(np.dot(query, unrelated)))
+
+    def test_remote_vectors_are_cached_on_disk_and_batched_concurrently(self):
+        with tempfile.TemporaryDirectory() as tmp, _env():
+            cache_path = Path(tmp) / "embeddings.sqlite3"
+            texts = ["甲", "乙乙", "丙丙丙", "甲", "丁丁丁丁", "戊"]
+            client = RecordingClient(cache_path)
+            vectors = client.embed_documents(texts)
+            reopened = RecordingClient(cache_path)
+            cached = reopened.embed_documents(texts)
+            query = reopened.embed_query("甲")
+
+        self.assertEqual(len(vectors), len(texts))
+        self.assertEqual(vectors[0], vectors[3])
+        self.assertEqual([vector[0] for vector in vectors], [1.0, 2.0, 3.0, 1.0, 4.0, 1.0])
+        self.assertEqual(sorted(text for call in client.calls for text in call), ["丁丁丁丁", "丙丙丙", "乙乙", "戊", "甲"])
+        self.assertEqual(len(client.calls), 3)
+        self.assertEqual(cached, vectors)
+        self.assertEqual(reopened.calls, [["甲"]])
+        self.assertEqual(query[0], 1.0)
+
+    def test_transient_failures_are_retried_with_backoff(self):
+        with tempfile.TemporaryDirectory() as tmp, _env(SERMON_SEARCH_EMBEDDING_CACHE="0"):
+            client = RecordingClient(Path(tmp) / "unused.sqlite3", failures=[TransientError(), ConnectionError()])
+            vector = client.embed_query("天國")
+            failing = RecordingClient(Path(tmp) / "unused.sqlite3", failures=[ValueError("bad request")])
+            with self.assertRaises(ValueError):
+                failing.embed_query("天國")
+
+        self.assertIsNone(client.cache)
+        self.assertEqual(vector[0], 2.0)
+        self.assertEqual(len(client.calls), 3)
+        self.assertEqual(len(failing.calls), 1)
+
+    def test_a_short_provider_batch_raises_instead_of_shifting_vectors(self):
+        class ShortClient(RecordingClient):
+            def _call_provider(self, texts, task_type):
+                return super()._call_provider(texts, task_type)[:-1]
+
+        with tempfile.TemporaryDirectory() as tmp, _env():
+            client = ShortClient(Path(tmp) / "embeddings.sqlite3")
+            with self.assertRaises(ValueError):
+                client.embed_documents(["甲", "乙乙", "丙丙丙"])
+            with self.assertRaises(ValueError):
+                client.embed_query("丁")
+
+    def test_only_the_most_recent_query_vectors_stay_on_disk(self):
+        with tempfile.TemporaryDirectory() as tmp, _env(SERMON_SEARCH_EMBEDDING_CACHE_MAX_QUERIES="2"):
+            cache_path = Path(tmp) / "embeddings.sqlite3"
+            client = RecordingClient(cache_path)
+            client.embed_documents(["甲", "乙乙", "丙丙丙"])
+            for query in ["一", "二二", "三三三"]:
+                client.embed_query(query)
+            reopened = RecordingClient(cache_path)
+            reopened.embed_documents(["甲", "乙乙", "丙丙丙"])
+            for query in ["三三三", "二二", "一"]:
+                reopened.embed_query(query)
+
+        self.assertEqual(reopened.calls, [["一"]])
+
+    def test_hashing_provider_drives_the_semantic_vector_path_offline(self):
+        with tempfile.TemporaryDirectory() as tmp, _env(SERMON_SEARCH_EMBEDDING_PROVIDER="hashing"):
+            root = Path(tmp)
+            path = root / "final.md"
+            path.write_text("## 新郎\n\n新郎與婚姻的意象。\n\n## 鑰匙\n\n天國的鑰匙交給彼得。", encoding="utf-8")
+            manuscript = DiscoveredManuscript(
+                series_id="matthew",
+                series_title="馬太福音",
+                lecture_id="lecture-1",
+                lecture_title="第一講",
+                project_id="project-1",
+                project_title="16章釋經",
+                project_type="sermon_note",
+                manuscript_path=path,
+                content_hash="hash-1",
+                modified_time=1.0,
+            )
+            search_index = SermonSearchIndex(root / "search.sqlite3")
+            response = search_index.rebuild_from_manuscripts([manuscript], include_embeddings=True)
+            cards, tools = search_index.search("彼得 鑰匙", limit=5)
+
+        self.assertEqual(response.status, "ok")
+        self.assertIn("semantic_vector", tools)
+        self.assertIn("鑰匙", cards[0].heading_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import os
+
+import cv2
+import numpy as np
+
+from backend.api.sc_api import image_to_text
+from backend.api.sc_api.image_to_text import ImageToText
+
+
+def _write_video(path, shades=(0, 120, 240), seconds_per_slide=3, fps=10):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"mp4v"), fps, (64, 48))
+    for shade in shades:
+        for _ in range(seconds_per_slide * fps):
+            writer.write(np.full((48, 64, 3), shade, np.uint8))
+    writer.release()
+
+
+def _extractor(monkeypatch, tmp_path):
+    monkeypatch.setattr(image_to_text, "DATA_BASE_PATH", tmp_path)
+    _write_video(tmp_path / "video" / "sermon.mp4")
+    extractor = ImageToText("sermon")
+    calls = []
+
+    def fake_ocr(frame, *, as_markdown=True):
+        calls.append(int(frame.mean()))
+        return f"slide {len(calls)}"
+
+    monkeypatch.setattr(extractor, "extract_text_from_frame", fake_ocr)
+    return extractor, calls
+
+
+def test_slide_text_is_cached_per_timestamp_until_scenes_are_known(monkeypatch, tmp_path):
+    extractor, calls = _extractor(monkeypatch, tmp_path)
+
+    assert extractor.extract_slide(1000) == "slide 1"
+    assert extractor.extract_slide(1000) == "slide 1"
+    assert len(calls) == 1
+
+    again = ImageToText("sermon")
+    again._decode_frame = lambda timestamp: (_ for _ in ()).throw(AssertionError("decoded on a cache hit"))
+    assert again.extract_slide(1000) == "slide 1"
+    assert again.extract_slide_image(1000) is not None
+
+
+def test_prewarm_keys_entries_by_scene(monkeypatch, tmp_path):
+    extractor, calls = _extractor(monkeypatch, tmp_path)
+
+    with extractor:
+        scenes = extractor.prewarm(sample_ms=500)
+
+    assert scenes == [0, 3000, 6000]
+    assert len(calls) == 3
+    assert extractor.extract_slide(4200) == extractor.extract_slide(3000) == "slide 2"
+    assert len(calls) == 3
+
+    review = tmp_path / "script" / "script_review"
+    review.mkdir(parents=True)
+    assert extractor.get_slide_image_url(str(tmp_path / "script"), 7500) == "data/script_review/sermon-7500.jpg"
+    assert cv2.imread(str(review / "sermon-7500.jpg")).mean() > 200
+
+
+def test_cache_resets_when_the_video_changes(monkeypatch, tmp_path):
+    extractor, calls = _extractor(monkeypatch, tmp_path)
+    extractor.prewarm(sample_ms=500)
+
+    video = tmp_path / "video" / "sermon.mp4"
+    _write_video(video, shades=(60, 180))
+    stat = video.stat()
+    os.utime(video, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    fresh = ImageToText("sermon")
+    monkeypatch.setattr(fresh, "extract_text_from_frame", lambda frame, as_markdown=True: "new video")
+    assert fresh.cache.scenes() == []
+    assert fresh.extract_slide(4000) == "new video"
+
+
+def test_video_capture_is_released_when_the_extractor_closes(monkeypatch, tmp_path):
+    extractor, _ = _extractor(monkeypatch, tmp_path)
+
+    with extractor:
+        extractor.extract_slide(1000)
+        capture = extractor._capture
+        assert capture is not None and capture.isOpened()
+
+    assert extractor._capture is None
+    assert not capture.isOpened()
@@ -1,4 +1,6 @@
 import json
+import threading
+import time
 from types import SimpleNamespace
 
 from backend.pipeline import stage1
@@ -638,3 +640,64 @@ def test_generated_units_do_not_overwrite_existing_human_draft_chunks(monkeypatc
     monkeypatch.setattr(service, "NOTES_TO_SERMON_DIR", tmp_path)
 
     assert service._should_sync_draft_chunks_from_generated_units(project_id) is False
+
+
+class _SlowStage1Client:
+    def __init__(self, **_kwargs):
+        self.in_flight = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def generate_json(self, system_prompt, user_prompt, json_schema, **_kwargs):
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(0.05)
+        with self.lock:
+            self.in_flight -= 1
+        if json_schema["name"] == "stage1_unit_split_v1":
+            return {"units": [
+                {
+                    "unit_id": f"u{line:03d}", "chapter_title": "", "section_title": "",
+                    "unit_title": f"第{line}段", "scripture_range": "", "start_line": line,
+                    "end_line": line, "split_reason": "", "prev_unit_id": None, "next_unit_id": None,
+                }
+                for line in range(1, 9)
+            ]}
+        if json_schema["name"] == "stage1_unit_generation_v1":
+            return {"points": [{"point_id": "p001", "category": "釋經", "content": "要點"}]}
+        return {
+            "manuscript_sections": {
+                "exegesis": "這一段經文說明了神的作為。", "theological_significance": None,
+                "application": None, "appendix": None,
+            },
+            "coverage_checks": [{"point_id": "p001", "status": "covered", "note": "已涵蓋"}],
+            "coverage_summary": {"covered_count": 1, "total_points": 1, "missing_point_ids": []},
+        }
+
+
+def test_stage1_generates_units_concurrently_with_ordered_progress(monkeypatch, tmp_path):
+    monkeypatch.setattr(stage1, "Stage1OpenAIClient", _SlowStage1Client)
+    source = tmp_path / "notes.md"
+    source.write_text("\n".join(f"第{line}行筆記" for line in range(1, 9)), encoding="utf-8")
+
+    runs = {}
+    for concurrency in (1, 3):
+        progress = []
+        pipeline = stage1.Stage1Pipeline(
+            progress_callback=lambda stage, value: progress.append((stage, value)),
+            unit_concurrency=concurrency,
+        )
+        summary = pipeline.run(source, tmp_path / f"out{concurrency}")
+        runs[concurrency] = (progress, summary, pipeline.llm.peak)
+
+    sequential, parallel = runs[1], runs[3]
+    assert sequential[2] == 1 and parallel[2] == 3
+    assert parallel[0] == sequential[0]
+    assert [unit.unit_id for unit in parallel[1].generated_units] == [f"u{n:03d}" for n in range(1, 9)]
+    assert parallel[1].combined_markdown == sequential[1].combined_markdown
+
+    manifest = json.loads((tmp_path / "out3" / "stage1_manifest.json").read_text(encoding="utf-8"))
+    assert list(manifest["units"]) == [f"u{n:03d}" for n in range(1, 9)]
+    assert {entry["status"] for entry in manifest["units"].values()} == {"completed"}
+    assert manifest["status"] == "completed"
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from backend.api.sermon_search.topic_index_store import TopicIndexStore
+
+
+def _source(series_id: str, project_title: str, lun_dian: list[str]) -> dict:
+    return {
+        "series_id": series_id,
+        "project_id": project_title,
+        "project_title": project_title,
+        "lecture_title": "講座",
+        "source_sections": ["天國的比喻 ＞ 芥菜種"],
+        "lun_dian": lun_dian,
+    }
+
+
+TOPICS = {
+    "generated_at": "2026-01-01T00:00:00Z",
+    "topics": [
+        {
+            "id": "kingdom",
+            "name": "天國",
+            "type": "concept",
+            "size": "large",
+            "taxonomy_aliases": ["神的國"],
+            "sources": [
+                _source("matthew", "13章釋經", ["天國像芥菜種"]),
+                _source("romans", "14章釋經", ["神的國不在乎吃喝"]),
+            ],
+        },
+        {
+            "id": "parable",
+            "name": "撒種的比喻",
+            "type": "passage",
+            "size": "medium",
+            "sources": [_source("romans", "13章釋經", ["Seed and Soil"])],
+        },
+        {
+            "id": "kingdom",
+            "name": "重複的天國",
+            "type": "concept",
+            "size": "small",
+            "sources": [_source("john", "3章釋經", ["重生進神的國"])],
+        },
+    ],
+}
+
+
+class TopicIndexStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "topic_index.json"
+        self.path.write_text(json.dumps(TOPICS, ensure_ascii=False), encoding="utf-8")
+        self.store = TopicIndexStore(self.path)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_filters_by_series_type_and_query(self):
+        everything = self.store.list_topics()
+        romans = self.store.list_topics(series_id="romans")
+        passages = self.store.list_topics(series_id="romans", topic_type="passage")
+        by_alias = self.store.list_topics(q=" 神的國 ")
+        by_lun_dian = self.store.list_topics(q="seed and")
+        scoped_out = self.store.list_topics(series_id="matthew", q="吃喝")
+
+        self.assertEqual([card.name for card in everything.topics], ["天國", "撒種的比喻", "重複的天國"])
+        self.assertEqual([card.id for card in romans.topics], ["kingdom", "parable"])
+        self.assertEqual([source.project_title for source in romans.topics[0].sources], ["14章釋經"])
+        self.assertEqual(romans.topics[1].chapter, 13)
+        self.assertEqual([card.id for card in passages.topics], ["parable"])
+        self.assertEqual([card.name for card in by_alias.topics], ["天國", "重複的天國"])
+        self.assertEqual([card.id for card in by_lun_dian.topics], ["parable"])
+        self.assertEqual(scoped_out.count, 0)
+        self.assertEqual(everything.topics[0].sources[0].section_anchors, ["天國的比喻"])
+
+    def test_get_topic_uses_first_topic_with_the_id(self):
+        self.assertEqual(self.store.get_topic("kingdom").name, "天國")
+        self.assertIsNone(self.store.get_topic("kingdom", series_id="john"))
+        self.assertEqual(self.store.get_topic("kingdom", series_id="romans").sources[0].project_title, "14章釋經")
+        self.assertIsNone(self.store.get_topic("missing"))
+
+    def test_recompiles_when_the_file_changes(self):
+        first = self.store.list_topics()
+        self.assertIs(self.store.list_topics().topics[0], first.topics[0])
+
+        updated = dict(TOPICS, topics=TOPICS["topics"][1:2])
+        self.path.write_text(json.dumps(updated, ensure_ascii=False), encoding="utf-8")
+        stat = self.path.stat()
+        os.utime(self.path, (stat.st_atime, stat.st_mtime + 5))
+
+        self.assertEqual([card.id for card in self.store.list_topics().topics], ["parable"])
+        status = self.store.status()
+        self.assertEqual((status.passage_count, status.concept_count), (1, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()